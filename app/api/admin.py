@@ -4,7 +4,7 @@
 """
 
 from fastapi import APIRouter, HTTPException, Depends, status, Request
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Literal
 import uuid
 
 from models.auth import UserApproval, UserResponse, UserDetailResponse
@@ -12,6 +12,7 @@ from models.notice import (
     NoticeCreate, NoticeUpdate, NoticeResponse, NoticeList, NoticeFilter
 )
 from services.admin_service import AdminService
+from utils.pagination import InvalidCursorError
 from auth.middleware import get_admin_user_required
 
 
@@ -80,6 +81,8 @@ async def get_notices(
     search: str = None,
     page: int = 1,
     per_page: int = 20,
+    cursor: Optional[str] = None,
+    total_mode: Optional[Literal["exact", "estimate", "none"]] = None,
     admin_user: Dict[str, Any] = Depends(get_admin_user_required)
 ):
     """공지사항 목록 조회 (관리자용)"""
@@ -89,12 +92,16 @@ async def get_notices(
             created_by=created_by,
             search=search,
             page=page,
-            per_page=per_page
+            per_page=per_page,
+            cursor=cursor,
+            total_mode=total_mode
         )
         
         result = await AdminService.get_notices(filter_data)
         return NoticeList(**result)
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
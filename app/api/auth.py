@@ -16,8 +16,9 @@ from models.auth import (
 )
 from utils.jwt_utils import (
     create_access_token, create_refresh_token, verify_token, 
-    revoke_token, TokenValidationError
+    revoke_token, TokenValidationError, RevocationStoreUnavailableError
 )
+from utils.principal_cache import principal_cache
 from services.auth_service import AuthService
 from auth.middleware import (
     get_current_user_required, get_admin_user_required
@@ -137,7 +138,7 @@ async def refresh_token(token_data: TokenRefresh, response: Response):
     """토큰 갱신"""
     try:
         # Refresh 토큰 검증
-        verified_token = verify_token(token_data.refresh_token, "refresh")
+        verified_token = await verify_token(token_data.refresh_token, "refresh")
         
         # 사용자 정보 조회
         user = await AuthService.get_user_by_id(verified_token.user_id)
@@ -159,7 +160,7 @@ async def refresh_token(token_data: TokenRefresh, response: Response):
         new_refresh_token = create_refresh_token(new_token_data)
         
         # 기존 Refresh 토큰 폐기
-        revoke_token(token_data.refresh_token)
+        await revoke_token(token_data.refresh_token)
         
         # 새 쿠키 설정
         set_auth_cookies(response, new_access_token, new_refresh_token)
@@ -172,6 +173,12 @@ async def refresh_token(token_data: TokenRefresh, response: Response):
             user=UserResponse(**user)
         )
         
+    except RevocationStoreUnavailableError as e:
+        # 토큰 자체는 유효할 수 있으므로 재로그인 대신 재시도 유도
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        )
     except TokenValidationError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -198,7 +205,8 @@ async def logout(
         
         # 토큰 폐기
         if token:
-            revoke_token(token)
+            await revoke_token(token)
+        principal_cache.invalidate(str(current_user["id"]))
         
         # 쿠키 삭제
         response.delete_cookie("access_token")
@@ -18,6 +18,8 @@ from models.chat import (
 )
 from services.chat_service import ChatService, NotificationService, connection_manager
 from services.company_service import CompanyService
+from database import execute_sql
+from utils.pagination import InvalidCursorError
 
 logger = logging.getLogger(__name__)
 
@@ -111,6 +113,8 @@ async def get_chat_messages(
     room_id: str,
     page: int = Query(1, ge=1, description="페이지 번호"),
     size: int = Query(50, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, max_length=500, description="다음 페이지 커서 (지정 시 page 무시)"),
+    total_mode: Optional[str] = Query(None, regex="^(exact|estimate|none)$", description="총 개수 계산 방식"),
     current_user: dict = Depends(get_current_user_required)
 ) -> ChatMessageListResponse:
     """채팅방 메시지 목록 조회"""
@@ -118,7 +122,9 @@ async def get_chat_messages(
         search_filter = ChatMessageSearchFilter(
             room_id=room_id,
             page=page,
-            size=size
+            size=size,
+            cursor=cursor,
+            total_mode=total_mode
         )
         
         messages = await ChatService.get_room_messages(
@@ -132,6 +138,8 @@ async def get_chat_messages(
         
         return messages
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
     except Exception as e:
@@ -222,6 +230,8 @@ async def search_chat_messages(
     keyword: str = Query(..., min_length=1, max_length=100, description="검색 키워드"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     size: int = Query(20, ge=1, le=50, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, max_length=500, description="다음 페이지 커서 (지정 시 page 무시)"),
+    total_mode: Optional[str] = Query(None, regex="^(exact|estimate|none)$", description="총 개수 계산 방식"),
     current_user: dict = Depends(get_current_user_required)
 ) -> ChatMessageListResponse:
     """채팅방 메시지 검색"""
@@ -231,11 +241,15 @@ async def search_chat_messages(
             str(current_user["id"]), 
             keyword, 
             page, 
-            size
+            size,
+            cursor=cursor,
+            total_mode=total_mode
         )
         
         return messages
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
     except Exception as e:
@@ -434,7 +448,9 @@ async def websocket_endpoint(
                         room_id=room_id,
                         sender_id=user_id
                     )
-                    await connection_manager.send_to_room(room_id, typing_message.model_dump())
+                    await connection_manager.send_to_room(
+                        room_id, typing_message.model_dump(), coalesce_key=f"typing:{user_id}"
+                    )
                 
             except WebSocketDisconnect:
                 break
@@ -491,9 +507,7 @@ async def get_chat_room_info(
             )
         
         # 채팅방 및 업체 정보 조회
-        result = await real_supabase_service.execute_sql(
-            project_id=real_supabase_service.project_id,
-            query=f"""
+        result = await execute_sql("""
             SELECT 
                 cr.id, cr.created_at,
                 wc.id as wholesale_id, wc.name as wholesale_name, wc.address as wholesale_address,
@@ -501,8 +515,8 @@ async def get_chat_room_info(
             FROM chat_rooms cr
             LEFT JOIN companies wc ON cr.wholesale_company_id = wc.id
             LEFT JOIN companies rc ON cr.retail_company_id = rc.id
-            WHERE cr.id = '{room_id}'
-        """)
+            WHERE cr.id = $1
+        """, room_id)
         
         if not result:
             raise HTTPException(
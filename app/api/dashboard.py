@@ -1,91 +1,117 @@
 """
 대시보드 API 라우터
-통합 통계 및 대시보드 데이터 제공
+통합 통계 및 대시보드 데이터 제공, 실시간 변경은 SSE(/sse/dashboard)로 전달
 """
 
 from fastapi import APIRouter, HTTPException, Depends, status, Request
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
 from datetime import datetime, timedelta
+import asyncio
 import logging
 
-from models.dashboard import DashboardStats, DashboardResponse
+import config
+from models.dashboard import DashboardStats
 from models.order import OrderSearchFilter
 from services.order_service import OrderService
 from services.inventory_service import InventoryService
 from services.chat_service import ChatService
+from services.company_service import CompanyService
 from auth.middleware import get_current_user_required
+from utils.snapshot_cache import dashboard_cache
+from utils.event_bus import SSE_HEARTBEAT, encode_sse, event_bus
 
 
 router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
+sse_router = APIRouter(prefix="/sse", tags=["dashboard"])
 logger = logging.getLogger(__name__)
 templates = Jinja2Templates(directory="templates")
 
 
-@router.get("/stats", response_model=DashboardResponse)
+async def _load_dashboard_stats(user_id: str, company_id: str, company_type: str) -> DashboardStats:
+    """대시보드 통계 스냅샷 생성 (모든 통계 병렬 조회)"""
+    # 오늘 날짜 기준 주문 수 조회
+    today = datetime.now().date()
+    today_start = datetime.combine(today, datetime.min.time())
+    today_end = datetime.combine(today, datetime.max.time())
+    
+    # 오늘 주문 검색 조건 설정 (개수는 total 로 확인하므로 1건만 조회)
+    today_order_filter = OrderSearchFilter(
+        start_date=today_start,
+        end_date=today_end,
+        page=1,
+        size=1
+    )
+    
+    # 최근 주문 5개 조회 조건 (총 개수 불필요)
+    recent_order_filter = OrderSearchFilter(page=1, size=5, total_mode="none")
+    
+    # 병렬로 모든 통계 조회
+    (
+        order_stats,
+        inventory_stats,
+        chat_stats,
+        today_orders_result,
+        recent_orders_result,
+        low_stock_alerts
+    ) = await asyncio.gather(
+        OrderService.get_order_stats(company_id, company_type),
+        InventoryService.get_inventory_stats(company_id),
+        ChatService.get_chat_stats(user_id),
+        OrderService.get_orders(today_order_filter, company_id, company_type, include_items=False),
+        OrderService.get_orders(recent_order_filter, company_id, company_type, include_items=False),
+        InventoryService.get_low_stock_alerts(company_id)
+    )
+    
+    # 대시보드 통계 구성 (재고 부족 알림은 최대 5개만)
+    return DashboardStats(
+        today_orders=today_orders_result.total,
+        low_stock_count=inventory_stats.low_stock_products,
+        unread_messages=chat_stats.unread_messages,
+        order_stats=order_stats,
+        inventory_stats=inventory_stats,
+        chat_stats=chat_stats,
+        recent_orders=recent_orders_result.orders,
+        low_stock_alerts=low_stock_alerts[:5]
+    )
+
+
+async def _resolve_company(current_user: dict) -> tuple:
+    """요청 사용자의 소속 회사 (company_id, company_type) 조회"""
+    company = await CompanyService.get_company_by_user_id(str(current_user["id"]))
+    if not company:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="소속 회사를 찾을 수 없습니다"
+        )
+    return str(company.id), current_user.get("company_type") or company.company_type
+
+
+def _stats_payload(dashboard_stats: DashboardStats) -> dict:
+    """대시보드 카운터 (JavaScript 가 기대하는 형식, SSE 스냅샷과 공통)"""
+    return {
+        "todayOrders": dashboard_stats.today_orders,
+        "lowStock": dashboard_stats.low_stock_count,
+        "newMessages": dashboard_stats.unread_messages,
+        "activePartners": 0,  # TODO: 거래처 통계 구현 필요
+        "pendingPartners": 0  # TODO: 거래처 통계 구현 필요
+    }
+
+
+@router.get("/stats")
 async def get_dashboard_stats(current_user: dict = Depends(get_current_user_required)):
     """대시보드 통계 조회"""
     try:
         user_id = str(current_user["id"])
-        company_id = str(current_user.get("company_id", ""))
-        company_type = current_user.get("company_type", "")
-        
-        if not company_id:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="사용자에게 연결된 회사 정보가 없습니다"
-            )
-        
-        # 오늘 날짜 기준 주문 수 조회
-        today = datetime.now().date()
-        today_start = datetime.combine(today, datetime.min.time())
-        today_end = datetime.combine(today, datetime.max.time())
-        
-        # 오늘 주문 검색 조건 설정
-        today_order_filter = OrderSearchFilter(
-            start_date=today_start,
-            end_date=today_end,
-            page=1,
-            size=1000  # 하루 주문 수는 많지 않을 것으로 예상
-        )
-        
-        # 병렬로 모든 통계 조회
-        order_stats = await OrderService.get_order_stats(company_id, company_type)
-        inventory_stats = await InventoryService.get_inventory_stats(company_id)
-        chat_stats = await ChatService.get_chat_stats(user_id)
-        
-        # 오늘 주문 목록 조회
-        today_orders_result = await OrderService.get_orders(today_order_filter, company_id, company_type)
-        today_orders_count = len(today_orders_result.orders)
-        
-        # 최근 주문 5개 조회
-        recent_order_filter = OrderSearchFilter(page=1, size=5)
-        recent_orders_result = await OrderService.get_orders(recent_order_filter, company_id, company_type)
+        company_id, company_type = await _resolve_company(current_user)
         
-        # 재고 부족 알림 5개 조회
-        low_stock_alerts = await InventoryService.get_low_stock_alerts(company_id)
-        low_stock_alerts_limited = low_stock_alerts[:5]  # 최대 5개만
-        
-        # 대시보드 통계 구성
-        dashboard_stats = DashboardStats(
-            today_orders=today_orders_count,
-            low_stock_count=inventory_stats.low_stock_products,
-            unread_messages=chat_stats.unread_messages,
-            order_stats=order_stats,
-            inventory_stats=inventory_stats,
-            chat_stats=chat_stats,
-            recent_orders=recent_orders_result.orders,
-            low_stock_alerts=low_stock_alerts_limited
+        dashboard_stats = await dashboard_cache.get_or_load(
+            company_id, user_id,
+            lambda: _load_dashboard_stats(user_id, company_id, company_type)
         )
         
         # JavaScript가 기대하는 형식으로 직접 반환
-        return {
-            "todayOrders": dashboard_stats.today_orders,
-            "lowStock": dashboard_stats.low_stock_count,
-            "newMessages": dashboard_stats.unread_messages,
-            "activePartners": 0,  # TODO: 거래처 통계 구현 필요
-            "pendingPartners": 0  # TODO: 거래처 통계 구현 필요
-        }
+        return _stats_payload(dashboard_stats)
         
     except HTTPException:
         raise
@@ -112,8 +138,10 @@ async def get_recent_orders(
             return """<div class="text-red-500 text-sm">회사 정보가 없습니다</div>"""
         
         # 최근 주문 조회
-        filter_params = OrderSearchFilter(page=1, size=limit)
-        orders_result = await OrderService.get_orders(filter_params, company_id, company_type)
+        filter_params = OrderSearchFilter(page=1, size=limit, total_mode="none")
+        orders_result = await OrderService.get_orders(
+            filter_params, company_id, company_type, include_items=False
+        )
         
         if not orders_result.orders:
             return """<div class="text-gray-500 text-sm text-center py-4">최근 주문이 없습니다</div>"""
@@ -195,4 +223,49 @@ async def get_low_stock_alerts(
         
     except Exception as e:
         logger.error(f"재고 부족 알림 조회 오류: {str(e)}")
-        return f"""<div class="text-red-500 text-sm">오류: {str(e)}</div>"""
\ No newline at end of file
+        return f"""<div class="text-red-500 text-sm">오류: {str(e)}</div>"""
+
+
+@sse_router.get("/dashboard")
+async def dashboard_events(request: Request, current_user: dict = Depends(get_current_user_required)):
+    """
+    대시보드 실시간 이벤트 스트림 (SSE)
+
+    연결 직후 현재 카운터를 snapshot 이벤트로 보내고, 이후 발생하는
+    dashboard(카운터 증감), notification, order(주문 생성/상태 변경), low_stock 이벤트를 전달.
+    이벤트가 없으면 SSE_HEARTBEAT_SECONDS 마다 주석 프레임으로 연결을 유지함.
+    재연결 시 snapshot 으로 다시 맞추므로 Last-Event-ID 이후 이벤트를 재전송하지 않음.
+    """
+    user_id = str(current_user["id"])
+    company_id, company_type = await _resolve_company(current_user)
+
+    heartbeat_seconds = config.settings.SSE_HEARTBEAT_SECONDS
+
+    async def event_stream():
+        # 스냅샷 적재 중 발생한 이벤트를 놓치지 않도록 먼저 구독
+        subscription = event_bus.subscribe(user_id, company_id)
+        try:
+            yield "retry: 5000\n\n"
+            try:
+                dashboard_stats = await dashboard_cache.get_or_load(
+                    company_id, user_id,
+                    lambda: _load_dashboard_stats(user_id, company_id, company_type)
+                )
+                yield encode_sse("snapshot", _stats_payload(dashboard_stats))
+            except Exception as e:
+                logger.error(f"대시보드 SSE 스냅샷 조회 오류: {str(e)}")
+
+            while not await request.is_disconnected():
+                event = await subscription.get(heartbeat_seconds)
+                if event is None:
+                    yield SSE_HEARTBEAT
+                    continue
+                yield encode_sse(event["event"], event["data"], event["id"])
+        finally:
+            subscription.close()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
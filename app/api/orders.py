@@ -4,7 +4,9 @@
 """
 
 from fastapi import APIRouter, HTTPException, Depends, Query, status
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
+from datetime import datetime
 import logging
 
 from auth.middleware import get_current_user_required
@@ -16,6 +18,9 @@ from models.order import (
 )
 from services.order_service import OrderService
 from services.company_service import CompanyService
+from utils.pagination import InvalidCursorError
+from utils.export import EXPORT_FORMATS, encode_rows
+import config
 
 logger = logging.getLogger(__name__)
 
@@ -130,6 +135,8 @@ async def get_orders(
     max_amount: Optional[int] = Query(None, ge=0, description="최대 주문 금액"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     size: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, max_length=500, description="다음 페이지 커서 (지정 시 page 무시)"),
+    total_mode: Optional[str] = Query(None, regex="^(exact|estimate|none)$", description="총 개수 계산 방식"),
     current_user: dict = Depends(get_current_user_required)
 ) -> OrderListResponse:
     """주문 목록 조회 (검색 및 필터링 지원)"""
@@ -151,7 +158,9 @@ async def get_orders(
             min_amount=min_amount,
             max_amount=max_amount,
             page=page,
-            size=size
+            size=size,
+            cursor=cursor,
+            total_mode=total_mode
         )
         
         # 회사 유형에 따른 주문 조회
@@ -167,6 +176,8 @@ async def get_orders(
         
     except HTTPException:
         raise
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"주문 목록 조회 오류: {str(e)}")
         raise HTTPException(
@@ -175,6 +186,58 @@ async def get_orders(
         )
 
 
+@router.get("/export")
+async def export_orders(
+    export_format: str = Query("csv", alias="format", regex="^(csv|ndjson)$", description="내보내기 형식"),
+    status_filter: Optional[str] = Query(None, regex="^(pending|confirmed|preparing|shipped|delivered|cancelled)$"),
+    order_number: Optional[str] = Query(None, max_length=50, description="주문 번호"),
+    start_date: Optional[datetime] = Query(None, description="주문 시작 날짜"),
+    end_date: Optional[datetime] = Query(None, description="주문 종료 날짜"),
+    min_amount: Optional[int] = Query(None, ge=0, description="최소 주문 금액"),
+    max_amount: Optional[int] = Query(None, ge=0, description="최대 주문 금액"),
+    current_user: dict = Depends(get_current_user_required)
+) -> StreamingResponse:
+    """주문 내보내기 (CSV/NDJSON 스트리밍, 목록 조회와 같은 필터, 페이지 제한 없음)"""
+    try:
+        company = await CompanyService.get_company_by_user_id(str(current_user["id"]))
+        if not company:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="소속 회사를 찾을 수 없습니다"
+            )
+        
+        search_filter = OrderSearchFilter(
+            status=status_filter,
+            order_number=order_number,
+            start_date=start_date,
+            end_date=end_date,
+            min_amount=min_amount,
+            max_amount=max_amount
+        )
+        
+        rows = OrderService.export_orders(
+            search_filter, str(company.id), current_user.get("company_type"),
+            batch_size=config.settings.EXPORT_BATCH_SIZE
+        )
+        filename = f"orders_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{export_format}"
+        return StreamingResponse(
+            encode_rows(rows, OrderService.EXPORT_COLUMNS, export_format, config.settings.EXPORT_BATCH_SIZE),
+            media_type=EXPORT_FORMATS[export_format],
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+        )
+        
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"주문 내보내기 오류: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="주문 내보내기에 실패했습니다"
+        )
+
+
 @router.get("/{order_id}", response_model=OrderResponse)
 async def get_order_detail(
     order_id: str,
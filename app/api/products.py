@@ -3,20 +3,28 @@
 상품, 카테고리, 재고 관리 시스템
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Query, status
+from fastapi import APIRouter, HTTPException, Depends, Query, File, UploadFile, status
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
+from datetime import datetime
 import logging
+import os
+import tempfile
 
 from auth.middleware import get_current_user_required
 from models.auth import UserResponse
 from models.product import (
     CategoryCreate, CategoryUpdate, CategoryResponse,
     ProductCreate, ProductUpdate, ProductResponse, ProductListResponse,
-    ProductSearchFilter, InventoryResponse, InventoryUpdate,
-    InventoryTransactionResponse, StockAdjustment, StockIn
+    ProductSearchFilter, ProductSuggestion, InventoryResponse, InventoryUpdate,
+    InventoryTransactionResponse, StockAdjustment, StockIn, ProductImportJobResponse
 )
 from services.product_service import ProductService
+from services.product_import_service import ProductImportService
 from services.inventory_service import InventoryService
+from utils.pagination import InvalidCursorError
+from utils.export import EXPORT_FORMATS, encode_rows
+import config
 
 logger = logging.getLogger(__name__)
 
@@ -199,6 +207,8 @@ async def get_products(
     is_active: Optional[bool] = Query(None, description="활성 상품만"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     size: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, max_length=500, description="다음 페이지 커서 (지정 시 page 무시)"),
+    total_mode: Optional[str] = Query(None, regex="^(exact|estimate|none)$", description="총 개수 계산 방식"),
     current_user: dict = Depends(get_current_user_required)
 ) -> ProductListResponse:
     """상품 목록 조회 (회사 유형별 접근 제어)"""
@@ -213,7 +223,9 @@ async def get_products(
             is_active=is_active,
             company_type=current_user.get("company_type"),
             page=page,
-            size=size
+            size=size,
+            cursor=cursor,
+            total_mode=total_mode
         )
         
         # 회사 유형에 따른 상품 조회
@@ -249,6 +261,8 @@ async def get_products(
         
     except HTTPException:
         raise
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"상품 목록 조회 오류: {str(e)}")
         raise HTTPException(
@@ -257,6 +271,136 @@ async def get_products(
         )
 
 
+@router.get("/autocomplete", response_model=List[ProductSuggestion])
+async def autocomplete_products(
+    q: str = Query(..., min_length=1, max_length=50, description="입력 중인 상품명/상품코드 (초성 가능)"),
+    limit: int = Query(10, ge=1, le=30, description="최대 항목 수"),
+    company_id: Optional[str] = Query(None, description="도매업체 ID (관리자는 필수)"),
+    current_user: dict = Depends(get_current_user_required)
+) -> List[ProductSuggestion]:
+    """상품 자동완성 (도매업체는 자사 상품, 소매업체는 거래 승인된 도매업체 상품)"""
+    try:
+        if current_user.get("company_type") in ("wholesale", "retail"):
+            from services.company_service import CompanyService
+            company = await CompanyService.get_company_by_user_id(str(current_user["id"]))
+            if not company:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="소속 회사를 찾을 수 없습니다"
+                )
+            
+            if current_user.get("company_type") == "wholesale":
+                company_ids = [str(company.id)]
+            else:
+                company_ids = await ProductService.get_partner_company_ids(str(company.id))
+            
+            if company_id:
+                if company_id not in company_ids:
+                    raise HTTPException(
+                        status_code=status.HTTP_403_FORBIDDEN,
+                        detail="상품을 조회할 권한이 없습니다"
+                    )
+                company_ids = [company_id]
+        
+        else:
+            # 관리자: 전체 회사 색인을 적재하지 않도록 회사 지정 필요
+            if not company_id:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="company_id 를 지정해야 합니다"
+                )
+            company_ids = [company_id]
+        
+        return await ProductService.autocomplete_products(company_ids, q, limit)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"상품 자동완성 오류: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="상품 자동완성에 실패했습니다"
+        )
+
+
+@router.post("/import", response_model=ProductImportJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def import_products(
+    file: UploadFile = File(..., description="상품 목록 CSV/XLSX (첫 행 헤더)"),
+    current_user: dict = Depends(get_current_user_required)
+) -> ProductImportJobResponse:
+    """상품 일괄 등록 시작 (도매업체만 가능, 진행 상황은 작업 ID 로 조회)"""
+    try:
+        # 도매업체 권한 확인
+        if current_user.get("company_type") != "wholesale":
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="상품은 도매업체만 생성할 수 있습니다"
+            )
+        
+        # 사용자의 회사 ID 조회
+        from services.company_service import CompanyService
+        company = await CompanyService.get_company_by_user_id(str(current_user["id"]))
+        if not company:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="소속 회사를 찾을 수 없습니다"
+            )
+        
+        file_name = file.filename or ""
+        if not file_name.lower().endswith((".csv", ".xlsx")):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="CSV 또는 XLSX 파일만 등록할 수 있습니다"
+            )
+        
+        max_bytes = config.settings.PRODUCT_IMPORT_MAX_FILE_SIZE_MB * 1024 * 1024
+        content = await file.read(max_bytes + 1)
+        if len(content) > max_bytes:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"파일 크기는 {config.settings.PRODUCT_IMPORT_MAX_FILE_SIZE_MB}MB 이하여야 합니다"
+            )
+        
+        return ProductImportService.start_import(content, file_name, str(company.id), str(current_user["id"]))
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"상품 일괄 등록 시작 오류: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="상품 일괄 등록을 시작하지 못했습니다"
+        )
+
+
+@router.get("/import/{job_id}", response_model=ProductImportJobResponse)
+async def get_product_import_job(
+    job_id: str,
+    current_user: dict = Depends(get_current_user_required)
+) -> ProductImportJobResponse:
+    """상품 일괄 등록 진행 상황/행 오류 조회"""
+    try:
+        from services.company_service import CompanyService
+        company = await CompanyService.get_company_by_user_id(str(current_user["id"]))
+        job = ProductImportService.get_job(job_id, str(company.id)) if company else None
+        if not job:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="일괄 등록 작업을 찾을 수 없습니다"
+            )
+        
+        return job
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"상품 일괄 등록 작업 조회 오류: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="일괄 등록 작업 조회에 실패했습니다"
+        )
+
+
 @router.get("/{product_id}", response_model=ProductResponse)
 async def get_product_detail(
     product_id: str,
@@ -434,6 +578,71 @@ async def delete_product(
 
 
 # 재고 관리 엔드포인트
+async def _spool_upload(file: UploadFile, path: str, max_bytes: int) -> None:
+    """업로드를 1MB 단위로 임시 파일에 기록 (전체를 메모리에 올리지 않음, 크기 초과 시 413)"""
+    written = 0
+    with open(path, "wb") as out:
+        while True:
+            chunk = await file.read(1024 * 1024)
+            if not chunk:
+                break
+            written += len(chunk)
+            if written > max_bytes:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"파일 크기는 {config.settings.MAX_FILE_SIZE_MB}MB 이하여야 합니다"
+                )
+            out.write(chunk)
+
+
+@router.post("/{product_id}/images", status_code=status.HTTP_201_CREATED)
+async def upload_product_image(
+    product_id: str,
+    file: UploadFile = File(..., description="상품 이미지 (jpg, png, gif, webp)"),
+    current_user: dict = Depends(get_current_user_required)
+) -> dict:
+    """상품 이미지 업로드 (도매업체만 가능, 목록용/썸네일 WebP 변형 자동 생성)"""
+    try:
+        # 도매업체 권한 확인
+        if current_user.get("company_type") != "wholesale":
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="상품 이미지는 도매업체만 등록할 수 있습니다"
+            )
+        
+        extension = (file.filename or "").rsplit(".", 1)[-1].lower()
+        if extension not in config.settings.get_allowed_image_types():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"허용되지 않는 이미지 형식입니다 ({config.settings.ALLOWED_IMAGE_TYPES})"
+            )
+        
+        # 사용자의 회사 ID 조회
+        from services.company_service import CompanyService
+        company = await CompanyService.get_company_by_user_id(str(current_user["id"]))
+        if not company:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="소속 회사를 찾을 수 없습니다"
+            )
+        
+        with tempfile.TemporaryDirectory(prefix="product-image-") as work_dir:
+            source_path = os.path.join(work_dir, "source")
+            await _spool_upload(file, source_path, config.settings.get_max_file_size_bytes())
+            return await ProductService.add_product_image(product_id, str(company.id), source_path, work_dir)
+        
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"상품 이미지 업로드 오류: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="상품 이미지 업로드에 실패했습니다"
+        )
+
+
 @router.get("/{product_id}/inventory", response_model=InventoryResponse)
 async def get_product_inventory(
     product_id: str,
@@ -919,6 +1128,65 @@ async def get_all_inventory_transactions(
         )
 
 
+@inventory_router.get("/transactions/export")
+async def export_inventory_transactions(
+    export_format: str = Query("csv", alias="format", regex="^(csv|ndjson)$", description="내보내기 형식"),
+    product_id: Optional[str] = Query(None, description="상품 ID"),
+    transaction_type: Optional[str] = Query(None, regex="^(in|out|adjustment)$", description="거래 유형"),
+    start_date: Optional[datetime] = Query(None, description="시작 일시"),
+    end_date: Optional[datetime] = Query(None, description="종료 일시"),
+    current_user: dict = Depends(get_current_user_required)
+) -> StreamingResponse:
+    """재고 거래내역 내보내기 (CSV/NDJSON 스트리밍, 도매업체만 가능)"""
+    try:
+        # 도매업체 권한 확인
+        if current_user.get("company_type") != "wholesale":
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="재고 거래내역은 도매업체만 조회할 수 있습니다"
+            )
+        
+        if start_date and end_date and end_date < start_date:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="종료 일시는 시작 일시보다 늦어야 합니다"
+            )
+        
+        # 사용자의 회사 ID 조회
+        from services.company_service import CompanyService
+        company = await CompanyService.get_company_by_user_id(str(current_user["id"]))
+        if not company:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="소속 회사를 찾을 수 없습니다"
+            )
+        
+        rows = InventoryService.export_inventory_transactions(
+            str(company.id),
+            product_id=product_id,
+            transaction_type=transaction_type,
+            start_date=start_date,
+            end_date=end_date,
+            batch_size=config.settings.EXPORT_BATCH_SIZE
+        )
+        filename = f"inventory_transactions_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{export_format}"
+        return StreamingResponse(
+            encode_rows(rows, InventoryService.TRANSACTION_EXPORT_COLUMNS, export_format,
+                        config.settings.EXPORT_BATCH_SIZE),
+            media_type=EXPORT_FORMATS[export_format],
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"재고 거래내역 내보내기 오류: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="재고 거래내역 내보내기에 실패했습니다"
+        )
+
+
 # 카테고리 관리 독립 라우터 (categories 전용)
 categories_router = APIRouter(prefix="/categories", tags=["categories"])
 
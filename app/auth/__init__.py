@@ -7,6 +7,8 @@ from .middleware import (
     auth_middleware,
     get_current_user_optional,
     get_current_user_required,
+    get_current_user_claims_optional,
+    get_current_user_claims_required,
     get_admin_user_required,
     get_approved_user_required,
     AuthMiddleware
@@ -16,6 +18,8 @@ __all__ = [
     "auth_middleware",
     "get_current_user_optional",
     "get_current_user_required", 
+    "get_current_user_claims_optional",
+    "get_current_user_claims_required",
     "get_admin_user_required",
     "get_approved_user_required",
     "AuthMiddleware"
@@ -8,6 +8,7 @@ from typing import Optional, Dict, Any
 import logging
 
 from utils.jwt_utils import verify_token, TokenValidationError
+from utils.principal_cache import principal_cache
 from services.auth_service import AuthService
 
 
@@ -27,12 +28,14 @@ class AuthMiddleware:
         }
         self.excluded_exact_paths = set()  # 빈 집합 - 홈 경로도 인증 확인
     
-    async def authenticate_request(self, request: Request) -> Optional[Dict[str, Any]]:
+    async def authenticate_request(self, request: Request, claims_only: bool = False) -> Optional[Dict[str, Any]]:
         """
         요청에서 인증 정보 추출 및 검증
         
         Args:
             request: FastAPI Request 객체
+            claims_only: True 이면 캐시에 없을 때 DB 조회 없이 서명된 토큰 클레임만 사용
+                (id, email, role, company_type 만 포함되므로 approved 확인이 필요한 경로에는 사용 불가)
             
         Returns:
             Optional[Dict[str, Any]]: 인증된 사용자 정보 또는 None
@@ -56,7 +59,15 @@ class AuthMiddleware:
         
         try:
             # 토큰 검증
-            token_data = verify_token(token, "access")
+            token_data = await verify_token(token, "access")
+            
+            # 캐시된 사용자 정보 우선 사용
+            user = principal_cache.get(token_data.user_id)
+            if user:
+                return user
+            
+            if claims_only:
+                return self._principal_from_claims(token_data)
             
             # 사용자 정보 조회
             user = await AuthService.get_user_by_id(token_data.user_id)
@@ -64,6 +75,7 @@ class AuthMiddleware:
                 logger.warning(f"Token valid but user not found: {token_data.user_id}")
                 return None
             
+            principal_cache.set(token_data.user_id, user)
             return user
             
         except TokenValidationError as e:
@@ -73,6 +85,17 @@ class AuthMiddleware:
             logger.error(f"Authentication error: {str(e)}")
             return None
     
+    @staticmethod
+    def _principal_from_claims(token_data) -> Dict[str, Any]:
+        """서명된 토큰 클레임으로 사용자 정보 구성 (DB 조회 없음)"""
+        return {
+            "id": token_data.user_id,
+            "email": token_data.email,
+            "role": token_data.role,
+            "company_type": token_data.company_type,
+            "claims_only": True
+        }
+    
     def _is_excluded_path(self, path: str) -> bool:
         """경로가 인증 제외 대상인지 확인"""
         # 정확히 일치하는 경로 확인
@@ -104,6 +127,43 @@ async def get_current_user_optional(request: Request) -> Optional[Dict[str, Any]
     return await auth_middleware.authenticate_request(request)
 
 
+async def get_current_user_claims_optional(request: Request) -> Optional[Dict[str, Any]]:
+    """
+    현재 사용자 정보 추출 (선택적 인증, 토큰 클레임 신뢰)
+    역할/업체 유형만 필요한 읽기 경로용으로 사용자 조회 쿼리를 생략함
+    
+    Args:
+        request: FastAPI Request 객체
+        
+    Returns:
+        Optional[Dict[str, Any]]: 사용자 정보 (id, email, role, company_type) 또는 None
+    """
+    return await auth_middleware.authenticate_request(request, claims_only=True)
+
+
+async def get_current_user_claims_required(request: Request) -> Dict[str, Any]:
+    """
+    현재 사용자 정보 추출 (필수 인증, 토큰 클레임 신뢰)
+    
+    Args:
+        request: FastAPI Request 객체
+        
+    Returns:
+        Dict[str, Any]: 사용자 정보 (id, email, role, company_type)
+        
+    Raises:
+        HTTPException: 인증 실패 시
+    """
+    user = await get_current_user_claims_optional(request)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="인증이 필요합니다",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+    return user
+
+
 async def get_current_user_required(request: Request) -> Dict[str, Any]:
     """
     현재 사용자 정보 추출 (필수 인증)
@@ -5,7 +5,7 @@
 
 from pydantic_settings import BaseSettings
 from pydantic import ConfigDict
-from typing import List, Optional
+from typing import List, Optional, Literal
 from datetime import datetime
 import os
 
@@ -26,7 +26,23 @@ class Settings(BaseSettings):
     SUPABASE_JWT_SECRET: str = "temp_secret_for_railway"
     SUPABASE_SERVICE_ROLE_KEY: str = "temp_service_key_for_railway"
     SUPABASE_PROJECT_ID: str = "vrsbmygqyfvvuaixibrh"
+
+    # PostgreSQL 커넥션 풀 설정 (DATABASE_URL 미설정 시 Mock 서비스 사용)
+    DATABASE_URL: Optional[str] = None
+    DB_POOL_MIN_SIZE: int = 2
+    DB_POOL_MAX_SIZE: int = 10
+    DB_STATEMENT_CACHE_SIZE: int = 100  # Supabase 트랜잭션 풀러(6543 포트) 사용 시 0
+    DB_POOL_ACQUIRE_TIMEOUT: float = 5.0  # 초
+    DB_COMMAND_TIMEOUT: float = 30.0  # 초
+    DB_POOL_MAX_INACTIVE_LIFETIME: float = 300.0  # 초
+    DB_HEALTH_CHECK_INTERVAL: float = 30.0  # 초 (유휴 커넥션 재사용 전 ping 주기)
     
+    # SQL 실행 계측 (느린 쿼리 로그 기준, 요청당 쿼리 수 경고 기준 (0 이면 사용 안 함), 집계할 쿼리 지문 수 상한)
+    SQL_SLOW_QUERY_MS: float = 200.0
+    SQL_REQUEST_QUERY_WARN_COUNT: int = 30
+    SQL_FINGERPRINT_MAX: int = 500
+    SQL_SERVER_TIMING: bool = True  # 응답에 Server-Timing: db;dur=..;desc="N queries" 헤더 추가
+
     # JWT 토큰 설정 (Railway 환경에서 Optional 처리)
     SESSION_SECRET: str = "temp_session_secret_for_railway_deployment"
     JWT_ACCESS_EXPIRE_MINUTES: int = 15
@@ -50,6 +66,78 @@ class Settings(BaseSettings):
     WASABI_BUCKET: str = "magic-wardrobe-files"
     WASABI_ENDPOINT: str = "https://s3.ap-northeast-1.wasabisys.com"
     WASABI_REGION: str = "ap-northeast-1"
+    WASABI_PUBLIC_BASE_URL: Optional[str] = None  # CDN 등 공개 URL 접두어 (미설정 시 {ENDPOINT}/{BUCKET})
+    WASABI_MAX_POOL_CONNECTIONS: int = 20
+    WASABI_MULTIPART_THRESHOLD_MB: int = 8  # 이 크기 이상은 멀티파트 업로드
+    WASABI_MULTIPART_CHUNK_MB: int = 8
+    
+    # 상품 이미지 변형 (긴 변 픽셀, WebP 품질, 프로세스 풀 워커 수)
+    PRODUCT_IMAGE_THUMBNAIL_SIZE: int = 200
+    PRODUCT_IMAGE_LIST_SIZE: int = 600
+    PRODUCT_IMAGE_WEBP_QUALITY: int = 80
+    PRODUCT_IMAGE_MAX_PIXELS: int = 40_000_000  # 원본 해상도 상한 (압축 폭탄 방지)
+    PRODUCT_IMAGE_MAX_COUNT: int = 10  # 상품당 이미지 수
+    IMAGE_PROCESS_WORKERS: int = 2
+    
+    # 대시보드 통계 스냅샷 캐시 (0 이면 캐시 사용 안 함)
+    DASHBOARD_CACHE_TTL_SECONDS: float = 30.0
+    
+    # 주문 번호 할당 (워커가 일별 카운터에서 한 번에 예약하는 번호 수, 1 이면 워커 간에도 순서대로 발급)
+    ORDER_NUMBER_BLOCK_SIZE: int = 10
+    
+    # 대시보드 SSE (/sse/dashboard) 연결 유지 주기와 연결별 이벤트 큐 크기
+    SSE_HEARTBEAT_SECONDS: float = 15.0
+    SSE_QUEUE_SIZE: int = 100
+    
+    # /metrics 워커 간 합산 (워커별 스냅샷 파일 디렉터리, 미설정 시 요청을 받은 워커 값만 노출)
+    METRICS_MULTIPROC_DIR: Optional[str] = None
+    METRICS_FLUSH_SECONDS: float = 5.0
+    
+    # 재고 집계(inventory_stats) 드리프트 검사 주기 (초, 0 이면 사용 안 함)
+    INVENTORY_STATS_RECONCILE_INTERVAL_SECONDS: float = 3600.0
+    
+    # 채팅 WebSocket 워커 간 전달 (redis:// 또는 postgresql://, 미설정 시 프로세스 내)
+    CHAT_BROKER_URL: Optional[str] = None
+    CHAT_BROKER_CHANNEL: str = "chat_fanout"
+    CHAT_BROKER_RECONNECT_MAX_SECONDS: float = 30.0  # 연결이 끊겼을 때 재연결 백오프 상한
+    
+    # 채팅 WebSocket 연결별 송신 큐
+    CHAT_WS_QUEUE_SIZE: int = 100
+    CHAT_WS_SLOW_CONSUMER_POLICY: Literal["drop_oldest", "coalesce", "disconnect"] = "coalesce"
+    CHAT_WS_SEND_TIMEOUT: float = 10.0  # 초 (프레임 하나 전송 제한 시간)
+    
+    # 검증된 JWT 캐시 (토큰 다이제스트 → TokenData, 0 이면 사용 안 함)
+    JWT_VERIFIED_CACHE_MAX_SIZE: int = 10000
+    
+    # 토큰 폐기 저장소 (설정 시 워커 간 공유, 미설정 시 프로세스 내 저장소 최대 항목 수)
+    TOKEN_REVOCATION_REDIS_URL: Optional[str] = None
+    TOKEN_REVOCATION_MAX_SIZE: int = 100000
+    TOKEN_REVOCATION_TIMEOUT_SECONDS: float = 0.5  # 폐기 여부 조회 제한 시간
+    TOKEN_REVOCATION_FAIL_OPEN: bool = False  # 저장소 장애 시 True 면 폐기 확인 생략, False 면 토큰 거부
+    
+    # 비밀번호 해싱 (bcrypt 비용, 전용 스레드 수 0 이면 CPU 코어 수, 로그인 시 비용이 다른 해시 재저장)
+    PASSWORD_BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 0
+    PASSWORD_REHASH_ON_LOGIN: bool = True
+    
+    # 인증 사용자 캐시 (0 이면 캐시 사용 안 함)
+    AUTH_USER_CACHE_TTL_SECONDS: float = 60.0
+    AUTH_USER_CACHE_MAX_SIZE: int = 10000
+    
+    # 상품 자동완성 색인 (회사별 인메모리 접두어 트리, TTL 0 이면 매 조회마다 적재)
+    PRODUCT_AUTOCOMPLETE_TTL_SECONDS: float = 300.0
+    PRODUCT_AUTOCOMPLETE_MAX_COMPANIES: int = 500
+    PRODUCT_AUTOCOMPLETE_MAX_KEY_LENGTH: int = 32  # 자모 기준 키 길이 상한
+    
+    # CSV/NDJSON 내보내기 (서버 측 커서 prefetch 행 수 = 응답 청크당 행 수)
+    EXPORT_BATCH_SIZE: int = 1000
+    
+    # 상품 일괄 등록 (CSV/XLSX)
+    PRODUCT_IMPORT_MAX_FILE_SIZE_MB: int = 10
+    PRODUCT_IMPORT_MAX_ROWS: int = 20000
+    PRODUCT_IMPORT_BATCH_SIZE: int = 1000  # 적재 쿼리 한 번에 넣는 행 수
+    PRODUCT_IMPORT_MAX_ERRORS: int = 500  # 작업 결과에 남기는 행 오류 수 상한
+    PRODUCT_IMPORT_JOB_TTL_SECONDS: float = 3600.0  # 완료된 작업 상태 보관 시간
     
     # 파일 업로드 제한
     MAX_FILE_SIZE_MB: int = 5
@@ -58,6 +146,8 @@ class Settings(BaseSettings):
     # Rate Limiting 설정
     RATE_LIMIT_REQUESTS_PER_MINUTE: int = 60
     RATE_LIMIT_AUTH_REQUESTS_PER_MINUTE: int = 10
+    RATE_LIMIT_REDIS_URL: Optional[str] = None  # 설정 시 워커 간 공유 (예: redis://localhost:6379/0)
+    RATE_LIMIT_MAX_KEYS: int = 100000  # 프로세스 내 저장소 최대 키 수
     
     # 이메일 설정 (선택사항)
     SMTP_HOST: Optional[str] = None
@@ -132,6 +222,19 @@ class Settings(BaseSettings):
             "jwt_secret": self.SUPABASE_JWT_SECRET
         }
     
+    def get_database_pool_config(self) -> dict:
+        """PostgreSQL 커넥션 풀 설정 반환"""
+        return {
+            "dsn": self.DATABASE_URL,
+            "min_size": self.DB_POOL_MIN_SIZE,
+            "max_size": self.DB_POOL_MAX_SIZE,
+            "statement_cache_size": self.DB_STATEMENT_CACHE_SIZE,
+            "acquire_timeout": self.DB_POOL_ACQUIRE_TIMEOUT,
+            "command_timeout": self.DB_COMMAND_TIMEOUT,
+            "max_inactive_lifetime": self.DB_POOL_MAX_INACTIVE_LIFETIME,
+            "health_check_interval": self.DB_HEALTH_CHECK_INTERVAL
+        }
+
     def get_wasabi_config(self) -> dict:
         """Wasabi 설정 반환"""
         return {
@@ -5,13 +5,24 @@ Supabase MCP 클라이언트 연동
 
 import config
 import logging
-from typing import Optional, Callable, Any
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Optional, Callable, Any, AsyncIterator
 import uuid
 from datetime import datetime
 
+from utils.query_stats import query_stats
+
 # Supabase MCP 실행 함수 (외부에서 주입받음)
 _supabase_execute_fn: Optional[Callable] = None
 
+# asyncpg 커넥션 풀 실행기 (DATABASE_URL 설정 시 사용)
+_db_executor: Optional[Any] = None
+
+# 현재 태스크의 트랜잭션에 고정된 커넥션
+_transaction_connection: ContextVar[Optional[Any]] = ContextVar("transaction_connection", default=None)
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,6 +33,18 @@ def set_supabase_execute_function(execute_fn: Callable) -> None:
     logger.info("Supabase MCP 실행 함수가 설정되었습니다")
 
 
+def set_database_executor(executor: Any) -> None:
+    """커넥션 풀 실행기 설정 (실행기의 execute_sql 을 실행 함수로 주입)"""
+    global _db_executor
+    _db_executor = executor
+    set_supabase_execute_function(executor.execute_sql)
+
+
+def get_database_executor() -> Optional[Any]:
+    """현재 설정된 커넥션 풀 실행기 반환 (Mock 사용 시 None)"""
+    return _db_executor
+
+
 async def init_db() -> None:
     """데이터베이스 연결 초기화 (Supabase MCP 사용)"""
     try:
@@ -47,48 +70,202 @@ async def init_db() -> None:
         raise
 
 
-async def _execute_sql(query: str) -> Optional[list]:
-    """Supabase MCP를 통해 SQL 실행"""
+async def _execute_sql(query: str, *params: Any) -> Optional[list]:
+    """
+    Supabase MCP를 통해 SQL 실행
+    
+    Args:
+        query: 실행할 SQL 쿼리 ($1, $2 ... 위치 파라미터 사용 가능)
+        *params: 위치 파라미터 값 (쿼리 텍스트가 고정되어 prepared statement 재사용)
+        
+    Returns:
+        Optional[list]: 결과 행 목록 또는 None (실행 실패 시)
+    """
+    connection = _transaction_connection.get()
+    started = time.perf_counter()
+    failed = False
     try:
+        if connection is not None:
+            # 트랜잭션 내부: 고정된 커넥션으로 실행
+            return await _db_executor.fetch(connection, query, params)
+        
         if not _supabase_execute_fn:
             logger.error("Supabase MCP 함수가 설정되지 않았습니다")
             return None
-            
-        result = await _supabase_execute_fn(
-            project_id=config.settings.SUPABASE_PROJECT_ID,
-            query=query
-        )
         
-        return result if isinstance(result, list) else [result] if result else None
+        if params:
+            result = await _supabase_execute_fn(
+                project_id=config.settings.SUPABASE_PROJECT_ID,
+                query=query,
+                params=list(params)
+            )
+        else:
+            result = await _supabase_execute_fn(
+                project_id=config.settings.SUPABASE_PROJECT_ID,
+                query=query
+            )
+        
+        return _normalize_result(result)
         
     except Exception as e:
+        failed = True
         logger.error(f"SQL 실행 오류: {str(e)}")
+        if connection is not None:
+            # 트랜잭션 내부 오류는 ROLLBACK 되도록 전파
+            raise
         return None
+    finally:
+        # 쿼리 지문별 지연, 요청당 쿼리 수 기록 (느린 쿼리 로그)
+        query_stats.record(query, time.perf_counter() - started, error=failed)
+
+
+@asynccontextmanager
+async def transaction() -> AsyncIterator[None]:
+    """
+    트랜잭션 컨텍스트 매니저
+    
+    블록 안의 execute_sql 호출은 모두 풀에서 고정한 커넥션 하나로
+    BEGIN/COMMIT 사이에서 실행되며, 예외 발생 시 ROLLBACK 됨.
+    중첩 호출은 SAVEPOINT 로 처리됨.
+    
+    같은 커넥션을 공유하므로 블록 안에서 asyncio.gather 로
+    쿼리를 동시에 실행하면 안 됨.
+    
+    커넥션 풀 실행기가 없는 경우(Mock, MCP)에는 쿼리를 순차 실행만 함.
+    """
+    connection = _transaction_connection.get()
+    if connection is not None:
+        async with connection.transaction():
+            yield
+        return
+    
+    if _db_executor is None or not hasattr(_db_executor, "transaction"):
+        logger.debug("커넥션 풀 실행기가 없어 트랜잭션 없이 순차 실행합니다")
+        yield
+        return
+    
+    async with _db_executor.transaction() as connection:
+        token = _transaction_connection.set(connection)
+        try:
+            yield
+        finally:
+            _transaction_connection.reset(token)
+
+
+@asynccontextmanager
+async def outside_transaction() -> AsyncIterator[None]:
+    """
+    진행 중인 트랜잭션과 분리된 실행 구간
+    
+    블록 안의 execute_sql 은 현재 태스크의 트랜잭션 커넥션 대신 풀의 다른 커넥션에서
+    자동 커밋으로 실행됨. 호출자 트랜잭션이 ROLLBACK 되어도 결과가 유지되고,
+    갱신한 행의 락을 호출자 트랜잭션이 끝날 때까지 잡고 있지 않음 (카운터 등에 사용).
+    """
+    token = _transaction_connection.set(None)
+    try:
+        yield
+    finally:
+        _transaction_connection.reset(token)
+
+
+async def stream_sql(query: str, *params: Any, batch_size: int = 1000) -> AsyncIterator[Any]:
+    """
+    대용량 결과를 한 행씩 스트리밍 (CSV/NDJSON 내보내기용)
+    
+    커넥션 풀 실행기가 있으면 서버 측 커서로 batch_size 행씩 가져오므로
+    결과 크기와 무관하게 메모리 사용량이 일정함.
+    Mock/MCP 실행기는 커서가 없어 전체 결과를 한 번에 조회한 뒤 순서대로 반환함.
+    
+    오류는 None 으로 삼키지 않고 호출자에게 전파함 (스트림 도중 중단 감지용).
+    query_stats 에는 행을 가져오는 데 걸린 시간만 기록함 (소비자 처리 시간 제외).
+    """
+    if _db_executor is not None and hasattr(_db_executor, "stream"):
+        rows = _db_executor.stream(query, params, prefetch=batch_size)
+        elapsed = 0.0
+        failed = False
+        try:
+            while True:
+                started = time.perf_counter()
+                try:
+                    row = await rows.__anext__()
+                except StopAsyncIteration:
+                    break
+                except Exception:
+                    failed = True
+                    raise
+                finally:
+                    elapsed += time.perf_counter() - started
+                yield row
+        finally:
+            # 소비자가 중간에 멈춰도 커서/커넥션을 바로 반환
+            await rows.aclose()
+            query_stats.record(query, elapsed, error=failed)
+        return
+    
+    # _execute_sql 이 트랜잭션 밖에서는 오류를 None 으로 반환하므로 여기서 전파
+    result = await _execute_sql(query, *params)
+    if result is None:
+        raise RuntimeError("스트리밍 쿼리 실행에 실패했습니다")
+    for row in result:
+        yield row
+
+
+class QueryParams:
+    """
+    위치 파라미터 누적 헬퍼
+    
+    동적 WHERE 절을 구성할 때 값은 파라미터 목록에 쌓고
+    쿼리에는 $1, $2 ... 자리표시자만 넣도록 함
+    """
+    
+    def __init__(self, *initial: Any):
+        self.values: list = list(initial)
+    
+    def add(self, value: Any) -> str:
+        """값을 추가하고 자리표시자 반환"""
+        self.values.append(value)
+        return f"${len(self.values)}"
+    
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+def _normalize_result(result: Any) -> Optional[list]:
+    """실행 함수별 결과 형식을 행 목록으로 통일"""
+    # RealSupabaseService 는 Supabase MCP 호환 형식 {"data": [...]} 반환
+    if isinstance(result, dict) and "data" in result:
+        result = result["data"]
+    
+    if isinstance(result, list):
+        return result
+    return [result] if result else None
 
 
 async def create_admin_user() -> None:
     """초기 관리자 계정 생성 (Supabase MCP 사용)"""
     try:
         # 관리자 계정 존재 확인
-        result = await _execute_sql(f"""
-            SELECT * FROM users WHERE email = '{config.settings.ADMIN_EMAIL}'
-        """)
+        result = await _execute_sql(
+            "SELECT * FROM users WHERE email = $1",
+            config.settings.ADMIN_EMAIL
+        )
         
         if not result or len(result) == 0:
             # 관리자 계정 생성
-            from passlib.context import CryptContext
-            pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-            hashed_password = pwd_context.hash(config.settings.ADMIN_PASSWORD)
+            from utils.password_hasher import password_hasher
+            hashed_password = await password_hasher.hash(config.settings.ADMIN_PASSWORD)
             
             # UUID 생성
             admin_id = str(uuid.uuid4())
             
             # 관리자 사용자 생성
-            await _execute_sql(f"""
+            await _execute_sql(
+                """
                 INSERT INTO users (id, email, password_hash, name, role, approved, company_type)
-                VALUES ('{admin_id}', '{config.settings.ADMIN_EMAIL}', '{hashed_password}', 
-                        '{config.settings.ADMIN_NAME}', 'admin', true, 'wholesale')
-            """)
+                VALUES ($1, $2, $3, $4, 'admin', true, 'wholesale')
+                """,
+                admin_id, config.settings.ADMIN_EMAIL, hashed_password, config.settings.ADMIN_NAME
+            )
             
             logger.info(f"초기 관리자 계정 생성 완료: {config.settings.ADMIN_EMAIL}")
         else:
@@ -100,8 +277,11 @@ async def create_admin_user() -> None:
 
 
 async def close_db() -> None:
-    """데이터베이스 연결 종료 (Supabase MCP에서는 별도 작업 불필요)"""
-    global _supabase_execute_fn
+    """데이터베이스 연결 종료 (커넥션 풀 사용 시 풀 종료)"""
+    global _supabase_execute_fn, _db_executor
+    if _db_executor is not None:
+        await _db_executor.close()
+        _db_executor = None
     _supabase_execute_fn = None
     logger.info("Supabase MCP 연결이 정리되었습니다")
 
@@ -114,12 +294,12 @@ class DatabaseHelper:
     async def execute_transaction(queries: list) -> bool:
         """트랜잭션 실행 (여러 쿼리를 원자적으로 실행)"""
         try:
-            # Supabase MCP에서는 각 쿼리를 순차적으로 실행
-            for query_data in queries:
-                sql = query_data["sql"]
-                result = await _execute_sql(sql)
-                if result is None:
-                    raise Exception(f"쿼리 실행 실패: {sql}")
+            async with transaction():
+                for query_data in queries:
+                    sql = query_data["sql"]
+                    result = await _execute_sql(sql, *query_data.get("params", ()))
+                    if result is None:
+                        raise Exception(f"쿼리 실행 실패: {sql}")
                         
             return True
             
@@ -129,11 +309,12 @@ class DatabaseHelper:
     
     @staticmethod
     async def check_record_exists(table: str, field: str, value: str) -> bool:
-        """레코드 존재 여부 확인"""
+        """레코드 존재 여부 확인 (table, field 는 코드에서 지정한 식별자만 사용)"""
         try:
-            result = await _execute_sql(f"""
-                SELECT EXISTS(SELECT 1 FROM {table} WHERE {field} = '{value}')
-            """)
+            result = await _execute_sql(
+                f"SELECT EXISTS(SELECT 1 FROM {table} WHERE {field} = $1)",
+                value
+            )
             
             if result and len(result) > 0:
                 return list(result[0].values())[0]  # EXISTS 결과는 첫 번째 값
@@ -147,9 +328,7 @@ class DatabaseHelper:
     async def get_user_by_email(email: str) -> Optional[dict]:
         """이메일로 사용자 조회"""
         try:
-            result = await _execute_sql(f"""
-                SELECT * FROM users WHERE email = '{email}'
-            """)
+            result = await _execute_sql("SELECT * FROM users WHERE email = $1", email)
             
             return result[0] if result and len(result) > 0 else None
                 
@@ -161,9 +340,7 @@ class DatabaseHelper:
     async def get_user_by_id(user_id: str) -> Optional[dict]:
         """ID로 사용자 조회"""
         try:
-            result = await _execute_sql(f"""
-                SELECT * FROM users WHERE id = '{user_id}'
-            """)
+            result = await _execute_sql("SELECT * FROM users WHERE id = $1", user_id)
             
             return result[0] if result and len(result) > 0 else None
                 
@@ -8,48 +8,18 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import RedirectResponse
+from fastapi.responses import RedirectResponse, PlainTextResponse
 from contextlib import asynccontextmanager
 import logging
-import time
-from collections import defaultdict
 import asyncio
 
 import config
 import database
 import startup
-from auth.middleware import get_current_user_optional
-
-
-# Rate Limiting 클래스 (간단한 메모리 기반)
-class RateLimiter:
-    def __init__(self):
-        self.requests = defaultdict(list)
-        self.auth_requests = defaultdict(list)
-    
-    def is_allowed(self, client_ip: str, endpoint_type: str = "api") -> bool:
-        now = time.time()
-        window = 60  # 1분
-        
-        if endpoint_type == "auth":
-            limit = 10  # 인증: 분당 10회
-            request_list = self.auth_requests[client_ip]
-        else:
-            limit = 60  # API: 분당 60회
-            request_list = self.requests[client_ip]
-        
-        # 1분 이전 요청들 제거
-        while request_list and request_list[0] <= now - window:
-            request_list.pop(0)
-        
-        if len(request_list) >= limit:
-            return False
-        
-        request_list.append(now)
-        return True
-
-
-rate_limiter = RateLimiter()
+from auth.middleware import get_current_user_claims_optional
+from utils.rate_limiter import rate_limiter
+from utils.metrics import metrics, metrics_snapshot_writer, MetricsMiddleware
+from utils.query_stats import query_stats, track_queries, log_query_storm
 
 
 # 보안 헤더 미들웨어
@@ -74,39 +44,106 @@ async def rate_limit_middleware(request: Request, call_next):
     client_ip = request.client.host
     path = request.url.path
     
-    # 헬스체크는 Rate Limiting 제외
-    if path.startswith("/health"):
+    # 헬스체크/지표 수집은 Rate Limiting 제외
+    if path.startswith("/health") or path == "/metrics":
         return await call_next(request)
     
     # 엔드포인트 타입 결정
     endpoint_type = "auth" if path.startswith("/api/auth") else "api"
     
-    if not rate_limiter.is_allowed(client_ip, endpoint_type):
+    if not await rate_limiter.is_allowed(client_ip, endpoint_type):
         from fastapi import HTTPException
         raise HTTPException(status_code=429, detail="Rate limit exceeded")
     
     return await call_next(request)
 
 
+# SQL 실행 계측 미들웨어 (요청당 쿼리 수/시간 → Server-Timing 헤더, 쿼리 폭주 로그)
+async def query_stats_middleware(request: Request, call_next):
+    with track_queries() as stats:
+        response = await call_next(request)
+    
+    # 스트리밍 응답은 헤더 전송 이후의 쿼리가 포함되지 않음
+    if config.settings.SQL_SERVER_TIMING and stats.count:
+        response.headers.append("Server-Timing", stats.server_timing())
+    log_query_storm(stats, request.method, request.url.path)
+    return response
+
+
+# /metrics 런타임 지표 수집기 (노출 시점에만 호출)
+def collect_runtime_metrics():
+    from services.chat_service import connection_manager
+
+    for endpoint_type, count in rate_limiter.rejections.items():
+        yield "rate_limit_rejections_total", {"endpoint_type": endpoint_type}, count
+
+    websocket = connection_manager.get_stats()
+    yield "websocket_connections", {}, websocket["connections"]
+    yield "websocket_rooms", {}, websocket["rooms"]
+    yield "websocket_queue_depth", {}, websocket["queue_depth"]
+    yield "websocket_dropped_frames_total", {}, websocket["dropped_frames"]
+
+    yield "sql_statements_total", {}, query_stats.queries
+    yield "sql_slow_statements_total", {}, query_stats.slow_queries
+
+    executor = database.get_database_executor()
+    if executor is not None:
+        pool = executor.get_stats()
+        yield "db_pool_connections", {"state": "idle"}, pool["idle"]
+        yield "db_pool_connections", {"state": "in_use"}, pool["size"] - pool["idle"]
+        yield "db_queries_total", {}, pool["queries"]
+        yield "db_errors_total", {}, pool["errors"]
+        yield "db_acquire_timeouts_total", {}, pool["acquire_timeouts"]
+        yield "db_transactions_total", {}, pool["transactions"]
+        yield "db_rollbacks_total", {}, pool["rollbacks"]
+
+
+metrics.register_collector(collect_runtime_metrics)
+
+
 # 애플리케이션 시작/종료 이벤트 관리
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # 시작 시 실행
     logging.info("마법옷장 애플리케이션 시작")
     
-    # Supabase MCP 초기화 시도 (실제 MCP가 없으면 Mock으로 fallback)
+    # 데이터베이스 초기화 (DATABASE_URL 이 있으면 커넥션 풀, 없으면 Mock으로 fallback)
     try:
-        # 실제 운영에서는 여기서 실제 Supabase MCP 함수를 주입받아야 함
-        # 현재는 테스트용 Mock으로 초기화
-        await startup.initialize_with_mock()
+        if config.settings.DATABASE_URL:
+            await startup.initialize_with_asyncpg()
+        else:
+            # 테스트용 Mock으로 초기화
+            await startup.initialize_with_mock()
         logging.info("데이터베이스 초기화 완료")
     except Exception as e:
         logging.error(f"데이터베이스 초기화 실패: {e}")
         # 초기화 실패해도 애플리케이션은 시작 (임시 방조치)
     
+    # 채팅 워커 간 전달 브로커 시작
+    from services.chat_service import connection_manager
+    try:
+        await connection_manager.start()
+    except Exception as e:
+        logging.error(f"채팅 브로커 시작 실패 - 현재 워커에만 전달: {e}")
+    
+    # 재고 집계 드리프트 주기 검사 (PostgreSQL 사용 시)
+    from services.inventory_service import inventory_stats_reconciler
+    if database.get_database_executor() is not None:
+        await inventory_stats_reconciler.start()
+    
+    # 워커 간 지표 합산용 스냅샷 갱신 (METRICS_MULTIPROC_DIR 설정 시)
+    await metrics_snapshot_writer.start()
+    
     yield
     # 종료 시 실행
     logging.info("마법옷장 애플리케이션 종료")
+    await inventory_stats_reconciler.stop()
+    await metrics_snapshot_writer.stop()
+    from utils.image_pipeline import image_processor
+    from utils.password_hasher import password_hasher
+    image_processor.shutdown()
+    password_hasher.shutdown()
+    await connection_manager.stop()
     await database.close_db()
 
 
@@ -125,6 +162,9 @@ app.middleware("http")(add_security_headers)
 # Rate Limiting 미들웨어 
 app.middleware("http")(rate_limit_middleware)
 
+# SQL 실행 계측 미들웨어
+app.middleware("http")(query_stats_middleware)
+
 # Railway 도메인 허용 (railway.app 하위도메인)
 app.add_middleware(
     TrustedHostMiddleware, 
@@ -154,6 +194,9 @@ app.add_middleware(
     expose_headers=["*"]
 )
 
+# 요청 지표 미들웨어 (가장 바깥에서 Rate Limiting 거부까지 포함해 측정)
+app.add_middleware(MetricsMiddleware)
+
 # 정적 파일 및 템플릿 설정
 app.mount("/static", StaticFiles(directory="static"), name="static")
 templates = Jinja2Templates(directory="templates")
@@ -178,22 +221,63 @@ async def readiness_check():
         "timestamp": config.settings.get_current_time()
     }
 
+@app.get("/health/chat")
+async def chat_health():
+    """채팅 WebSocket 연결 및 송신 큐, 워커 간 브로커 연결, 대시보드 SSE 구독 상태 확인"""
+    from services.chat_service import connection_manager
+    from utils.event_bus import event_bus
+    return {
+        "status": "healthy",
+        "websocket": connection_manager.get_stats(),
+        "sse": event_bus.get_stats(),
+        "timestamp": config.settings.get_current_time()
+    }
+
+@app.get("/health/auth")
+async def auth_health():
+    """비밀번호 해싱 풀 대기열 및 인증 사용자 캐시 상태 확인"""
+    from utils.password_hasher import password_hasher
+    from utils.principal_cache import principal_cache
+    return {
+        "status": "healthy",
+        "password_hasher": password_hasher.get_stats(),
+        "principal_cache": principal_cache.get_stats(),
+        "timestamp": config.settings.get_current_time()
+    }
+
 @app.get("/health/db")
 async def database_health():
-    """데이터베이스 상태 확인"""
+    """데이터베이스 상태 확인 (커넥션 풀, 쿼리 지문별 실행 시간 상위 목록)"""
+    executor = database.get_database_executor()
+    if executor is not None:
+        return {
+            "status": "healthy" if executor.is_started else "unavailable",
+            "database": "postgresql",
+            "pool": executor.get_stats(),
+            "queries": query_stats.get_stats(),
+            "timestamp": config.settings.get_current_time()
+        }
+
     return {
         "status": "temporarily_disabled",
         "database": "configuration_pending",
         "note": "PostgreSQL 연결 설정 수정 중",
         "expected_tables": 12,
+        "queries": query_stats.get_stats(),
         "timestamp": config.settings.get_current_time()
     }
 
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics():
+    """Prometheus 지표 (요청 수/지연 히스토그램, Rate Limit 거부, WebSocket, DB 풀)"""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
 # 메인 페이지 라우트
 @app.get("/")
 async def main_page(request: Request):
     """메인 페이지 - 로그인 상태에 따른 리다이렉트"""
-    current_user = await get_current_user_optional(request)
+    # 역할만 필요하므로 토큰 클레임으로 판단 (사용자 조회 생략)
+    current_user = await get_current_user_claims_optional(request)
     
     if current_user:
         if current_user.get("role") == "admin":
@@ -375,16 +459,20 @@ async def admin_user_detail_page(request: Request, user_id: str):
     )
 
 # Public notices API endpoint
+from typing import Optional, Literal
 from fastapi import HTTPException
 from services.admin_service import AdminService
 from models.notice import NoticeFilter, NoticeList
+from utils.pagination import InvalidCursorError
 
 @app.get("/api/notices", response_model=NoticeList)
 async def get_public_notices(
     is_important: bool = None,
     search: str = None,
     page: int = 1,
-    per_page: int = 20
+    per_page: int = 20,
+    cursor: Optional[str] = None,
+    total_mode: Optional[Literal["exact", "estimate", "none"]] = None
 ):
     """공지사항 목록 조회 (모든 사용자)"""
     try:
@@ -392,12 +480,16 @@ async def get_public_notices(
             is_important=is_important,
             search=search,
             page=page,
-            per_page=per_page
+            per_page=per_page,
+            cursor=cursor,
+            total_mode=total_mode
         )
         
         result = await AdminService.get_notices(filter_data)
         return NoticeList(**result)
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -414,6 +506,7 @@ app.include_router(products.categories_router, prefix="/api", tags=["카테고
 app.include_router(orders.router, prefix="/api", tags=["주문"])
 app.include_router(chat.router, prefix="/api/chat", tags=["채팅"])
 app.include_router(dashboard.router, tags=["대시보드"])
+app.include_router(dashboard.sse_router, tags=["대시보드"])
 app.include_router(admin.router, prefix="/api", tags=["관리자"])
 
 if __name__ == "__main__":
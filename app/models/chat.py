@@ -8,6 +8,8 @@ from datetime import datetime
 from typing import List, Optional, Literal
 from pydantic import BaseModel, Field, ConfigDict
 
+from models.pagination import CursorPageParams, CursorPageInfo
+
 
 class ChatRoomBase(BaseModel):
     """채팅방 기본 정보"""
@@ -59,6 +61,9 @@ class ChatMessageResponse(ChatMessageBase):
     sender_company: Optional[str] = None
     order_info: Optional[dict] = None
     
+    # 메시지 검색 시 일치 구간을 <mark> 로 감싼 HTML 조각
+    snippet: Optional[str] = None
+    
     model_config = ConfigDict(from_attributes=True)
 
 
@@ -68,16 +73,16 @@ class ChatRoomListResponse(BaseModel):
     total: int = 0
 
 
-class ChatMessageListResponse(BaseModel):
+class ChatMessageListResponse(CursorPageInfo):
     """채팅 메시지 목록 응답"""
     messages: List[ChatMessageResponse] = []
-    total: int = 0
+    total: Optional[int] = 0
     page: int = 1
     size: int = 50
     has_next: bool = False
 
 
-class ChatMessageSearchFilter(BaseModel):
+class ChatMessageSearchFilter(CursorPageParams):
     """채팅 메시지 검색 필터"""
     room_id: Optional[uuid.UUID] = None
     message_type: Optional[str] = None
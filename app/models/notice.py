@@ -8,6 +8,8 @@ from typing import Optional
 from datetime import datetime
 import uuid
 
+from models.pagination import CursorPageParams, CursorPageInfo
+
 
 class NoticeBase(BaseModel):
     """공지사항 기본 정보"""
@@ -44,16 +46,16 @@ class NoticeInDB(NoticeResponse):
     pass
 
 
-class NoticeList(BaseModel):
+class NoticeList(CursorPageInfo):
     """공지사항 목록 응답"""
     items: list[NoticeResponse]
-    total: int
+    total: Optional[int] = None
     page: int
     per_page: int
     has_next: bool
 
 
-class NoticeFilter(BaseModel):
+class NoticeFilter(CursorPageParams):
     """공지사항 필터링 조건"""
     is_important: Optional[bool] = None
     created_by: Optional[uuid.UUID] = None
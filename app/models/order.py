@@ -8,6 +8,8 @@ from typing import List, Optional, Literal
 from datetime import datetime
 import uuid
 
+from models.pagination import CursorPageParams, CursorPageInfo
+
 
 class OrderItemBase(BaseModel):
     """주문 상품 기본 정보"""
@@ -93,16 +95,16 @@ class OrderResponse(OrderBase):
     model_config = ConfigDict(from_attributes=True)
 
 
-class OrderListResponse(BaseModel):
+class OrderListResponse(CursorPageInfo):
     """주문 목록 응답"""
     orders: List[OrderResponse]
-    total: int
+    total: Optional[int] = None
     page: int
     size: int
     has_next: bool
 
 
-class OrderSearchFilter(BaseModel):
+class OrderSearchFilter(CursorPageParams):
     """주문 검색 필터"""
     status: Optional[Literal["pending", "confirmed", "preparing", "shipped", "delivered", "cancelled"]] = None
     wholesale_company_id: Optional[uuid.UUID] = None
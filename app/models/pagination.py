@@ -0,0 +1,21 @@
+"""
+마법옷장 페이지네이션 공통 Pydantic 모델
+page/size 방식과 키셋(커서) 방식을 함께 지원
+"""
+
+from pydantic import BaseModel, Field
+from typing import Optional, Literal
+
+
+class CursorPageParams(BaseModel):
+    """커서 페이지네이션 요청 파라미터"""
+    cursor: Optional[str] = Field(None, max_length=500, description="다음 페이지 커서 (지정 시 page 무시)")
+    total_mode: Optional[Literal["exact", "estimate", "none"]] = Field(
+        None, description="총 개수 계산 방식 (기본: page 방식 exact, 커서 방식 none)"
+    )
+
+
+class CursorPageInfo(BaseModel):
+    """커서 페이지네이션 응답 정보"""
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서")
+    total_estimated: bool = Field(False, description="total 이 추정치인지 여부")
@@ -4,10 +4,12 @@
 """
 
 from pydantic import BaseModel, Field, ConfigDict, validator
-from typing import List, Optional, Literal
+from typing import Dict, List, Optional, Literal
 from datetime import datetime
 import uuid
 
+from models.pagination import CursorPageParams, CursorPageInfo
+
 
 class CategoryBase(BaseModel):
     """카테고리 기본 정보"""
@@ -84,6 +86,9 @@ class ProductResponse(ProductBase):
     id: uuid.UUID
     company_id: uuid.UUID
     images: List[str] = Field(default_factory=list, description="상품 이미지 URL 목록")
+    image_variants: List[Dict[str, str]] = Field(
+        default_factory=list, description="이미지별 변형 URL (original/list/thumbnail, images 와 같은 순서)"
+    )
     created_at: datetime
     updated_at: datetime
     
@@ -92,19 +97,30 @@ class ProductResponse(ProductBase):
     company_name: Optional[str] = None
     current_stock: Optional[int] = None
     
+    # 상품명 검색 시 유사도 (0~1)
+    search_rank: Optional[float] = None
+    
     model_config = ConfigDict(from_attributes=True)
 
 
-class ProductListResponse(BaseModel):
+class ProductListResponse(CursorPageInfo):
     """상품 목록 응답"""
     products: List[ProductResponse]
-    total: int
+    total: Optional[int] = None
     page: int
     size: int
     has_next: bool
 
 
-class ProductSearchFilter(BaseModel):
+class ProductSuggestion(BaseModel):
+    """상품 자동완성 항목"""
+    id: uuid.UUID
+    company_id: uuid.UUID
+    code: str
+    name: str
+
+
+class ProductSearchFilter(CursorPageParams):
     """상품 검색 필터"""
     name: Optional[str] = Field(None, max_length=200, description="상품명 검색")
     category_id: Optional[uuid.UUID] = Field(None, description="카테고리 필터")
@@ -231,4 +247,25 @@ class ProductImage(BaseModel):
 class ProductImageUpload(BaseModel):
     """상품 이미지 업로드 요청"""
     product_id: uuid.UUID = Field(..., description="상품 ID")
-    images: List[ProductImage] = Field(..., max_items=10, description="업로드할 이미지 목록")
\ No newline at end of file
+    images: List[ProductImage] = Field(..., max_items=10, description="업로드할 이미지 목록")
+
+class ProductImportRowError(BaseModel):
+    """상품 일괄 등록 행 오류"""
+    row: int = Field(..., description="파일 행 번호 (헤더 = 1)")
+    code: Optional[str] = Field(None, description="상품 코드")
+    message: str = Field(..., description="오류 내용")
+
+
+class ProductImportJobResponse(BaseModel):
+    """상품 일괄 등록 작업 상태"""
+    job_id: uuid.UUID
+    status: Literal["pending", "running", "completed", "failed"]
+    file_name: str
+    total_rows: int = Field(0, description="읽은 데이터 행 수")
+    processed_rows: int = Field(0, description="검증/적재를 마친 행 수 (진행률, 커밋 전 포함)")
+    imported_rows: int = Field(0, description="등록된 상품 수")
+    failed_rows: int = Field(0, description="오류 행 수")
+    errors: List[ProductImportRowError] = Field(default_factory=list, description="행 오류 (최대 IMPORT_MAX_ERRORS 건)")
+    message: Optional[str] = Field(None, description="작업 실패 사유")
+    created_at: datetime
+    finished_at: Optional[datetime] = None
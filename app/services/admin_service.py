@@ -10,7 +10,12 @@ from datetime import datetime
 
 from models.auth import UserApproval, UserDetailResponse
 from models.notice import NoticeCreate, NoticeUpdate, NoticeFilter
-from services.real_supabase_service import real_supabase_service
+from database import execute_sql, QueryParams
+from utils.pagination import (
+    InvalidCursorError, keyset_condition, split_page, resolve_total_mode, count_total
+)
+from services.auth_service import AuthService
+from utils.principal_cache import principal_cache
 
 logger = logging.getLogger(__name__)
 
@@ -31,8 +36,8 @@ class AdminService:
                 WHERE u.approved = false
                 ORDER BY u.created_at DESC
             """
-            result = await real_supabase_service.execute_sql(project_id="vrsbmygqyfvvuaixibrh", query=query)
-            return result.get('data', [])
+            result = await execute_sql(query)
+            return result or []
             
         except Exception as e:
             logger.error(f"승인 대기 사용자 조회 실패: {str(e)}")
@@ -45,7 +50,7 @@ class AdminService:
             user_id = str(approval_data.user_id)
             
             # 사용자 존재 확인
-            user = await real_supabase_service.get_user_by_id(user_id)
+            user = await AuthService.get_user_by_id(user_id)
             if not user:
                 raise ValueError("존재하지 않는 사용자입니다")
             
@@ -63,16 +68,17 @@ class AdminService:
             }
             
             # 사용자 승인 상태 업데이트
-            query = f"""
+            query = """
                 UPDATE users 
-                SET approved = {approval_data.approved}, 
-                    approved_at = '{current_time.isoformat()}',
-                    approved_by = '{admin_user_id}',
-                    updated_at = '{current_time.isoformat()}'
-                WHERE id = '{user_id}'
+                SET approved = $1, 
+                    approved_at = $2,
+                    approved_by = $3,
+                    updated_at = $2
+                WHERE id = $4
                 RETURNING *
             """
-            result = await real_supabase_service.execute_sql(project_id="vrsbmygqyfvvuaixibrh", query=query)
+            result = await execute_sql(query, approval_data.approved, current_time, admin_user_id, user_id)
+            principal_cache.invalidate(user_id)
             
             if approval_data.approved:
                 logger.info(f"사용자 승인 완료: {user_id} by {admin_user_id}")
@@ -99,42 +105,60 @@ class AdminService:
             
             # 필터 조건 추가
             conditions = []
+            params = QueryParams()
             if filter_data.is_important is not None:
-                conditions.append(f"n.is_important = {filter_data.is_important}")
+                conditions.append(f"n.is_important = {params.add(filter_data.is_important)}")
             if filter_data.created_by:
-                conditions.append(f"n.created_by = '{filter_data.created_by}'")
+                conditions.append(f"n.created_by = {params.add(str(filter_data.created_by))}")
             if filter_data.search:
-                search_term = filter_data.search.replace("'", "''")  # SQL injection 방지
-                conditions.append(f"(n.title ILIKE '%{search_term}%' OR n.content ILIKE '%{search_term}%')")
+                search_param = params.add(filter_data.search)
+                conditions.append(f"(n.title ILIKE '%' || {search_param} || '%' OR n.content ILIKE '%' || {search_param} || '%')")
             
             where_clause = ""
             if conditions:
                 where_clause = " WHERE " + " AND ".join(conditions)
+            total_mode = resolve_total_mode(filter_data.total_mode, filter_data.cursor)
+            filter_params = list(params.values)
+            
+            # 커서가 있으면 정렬 키 (is_important, created_at, id) 기준 키셋 조건 추가
+            offset = 0
+            if filter_data.cursor:
+                conditions.append(keyset_condition(
+                    params, ["n.is_important", "n.created_at", "n.id"], filter_data.cursor
+                ))
+            else:
+                offset = (filter_data.page - 1) * filter_data.per_page
+            page_where_clause = " WHERE " + " AND ".join(conditions) if conditions else ""
             
             # 총 개수 조회
-            count_query = f"SELECT COUNT(*) as total FROM notices n{where_clause}"
-            count_result = await real_supabase_service.execute_sql(project_id="vrsbmygqyfvvuaixibrh", query=count_query)
-            total = count_result.get('data', [{}])[0].get('total', 0)
+            total, total_estimated = await count_total(
+                execute_sql, f"FROM notices n{where_clause}", filter_params, total_mode
+            )
             
-            # 페이징된 데이터 조회
-            offset = (filter_data.page - 1) * filter_data.per_page
+            # 페이징된 데이터 조회 (다음 페이지 여부 확인을 위해 per_page + 1 건)
             data_query = f"""
-                {base_query}{where_clause}
-                ORDER BY n.is_important DESC, n.created_at DESC
-                LIMIT {filter_data.per_page} OFFSET {offset}
+                {base_query}{page_where_clause}
+                ORDER BY n.is_important DESC, n.created_at DESC, n.id DESC
+                LIMIT {params.add(filter_data.per_page + 1)} OFFSET {params.add(offset)}
             """
             
-            result = await real_supabase_service.execute_sql(project_id="vrsbmygqyfvvuaixibrh", query=data_query)
-            notices = result.get('data', [])
+            result = await execute_sql(data_query, *params.values)
+            notices, has_next, next_cursor = split_page(
+                result, filter_data.per_page, ["is_important", "created_at", "id"]
+            )
             
             return {
                 "items": notices,
                 "total": total,
                 "page": filter_data.page,
                 "per_page": filter_data.per_page,
-                "has_next": total > filter_data.page * filter_data.per_page
+                "has_next": has_next,
+                "next_cursor": next_cursor,
+                "total_estimated": total_estimated
             }
             
+        except InvalidCursorError:
+            raise
         except Exception as e:
             logger.error(f"공지사항 목록 조회 실패: {str(e)}")
             raise RuntimeError(f"공지사항 조회에 실패했습니다: {str(e)}")
@@ -146,35 +170,32 @@ class AdminService:
             notice_id = str(uuid.uuid4())
             current_time = datetime.now()
             
-            escaped_title = notice_data.title.replace("'", "''")
-            escaped_content = notice_data.content.replace("'", "''")
-            
-            insert_query = f"""
+            insert_query = """
                 INSERT INTO notices (id, title, content, is_important, created_by, created_at, updated_at)
-                VALUES ('{notice_id}', '{escaped_title}', 
-                        '{escaped_content}', {notice_data.is_important},
-                        '{admin_user_id}', '{current_time.isoformat()}', '{current_time.isoformat()}')
+                VALUES ($1, $2, $3, $4, $5, $6, $6)
             """
             
-            await real_supabase_service.execute_sql(project_id="vrsbmygqyfvvuaixibrh", query=insert_query)
+            await execute_sql(
+                insert_query, notice_id, notice_data.title, notice_data.content,
+                notice_data.is_important, admin_user_id, current_time
+            )
             
             # 생성된 공지사항을 사용자 정보와 함께 조회
-            select_query = f"""
+            select_query = """
                 SELECT n.id, n.title, n.content, n.is_important, n.created_by, n.created_at, n.updated_at,
                        u.name as created_by_name
                 FROM notices n
                 LEFT JOIN users u ON n.created_by = u.id
-                WHERE n.id = '{notice_id}'
+                WHERE n.id = $1
             """
             
-            result = await real_supabase_service.execute_sql(project_id="vrsbmygqyfvvuaixibrh", query=select_query)
-            notices = result.get('data', [])
+            result = await execute_sql(select_query, notice_id)
+            notices = result or []
             
             if not notices:
                 # 직접 생성된 데이터 반환 (SELECT 실패 시)
-                admin_query = f"SELECT name FROM users WHERE id = '{admin_user_id}'"
-                admin_result = await real_supabase_service.execute_sql(project_id="vrsbmygqyfvvuaixibrh", query=admin_query)
-                admin_data = admin_result.get('data', [])
+                admin_query = "SELECT name FROM users WHERE id = $1"
+                admin_data = await execute_sql(admin_query, admin_user_id) or []
                 admin_name = admin_data[0].get('name', '관리자') if admin_data else '관리자'
                 
                 notice = {
@@ -201,16 +222,16 @@ class AdminService:
     async def get_notice_by_id(notice_id: str) -> Optional[Dict[str, Any]]:
         """공지사항 상세 조회"""
         try:
-            query = f"""
+            query = """
                 SELECT n.id, n.title, n.content, n.is_important, n.created_by, n.created_at, n.updated_at,
                        u.name as created_by_name
                 FROM notices n
                 LEFT JOIN users u ON n.created_by = u.id
-                WHERE n.id = '{notice_id}'
+                WHERE n.id = $1
             """
             
-            result = await real_supabase_service.execute_sql(project_id="vrsbmygqyfvvuaixibrh", query=query)
-            notices = result.get('data', [])
+            result = await execute_sql(query, notice_id)
+            notices = result or []
             
             return notices[0] if notices else None
             
@@ -229,30 +250,29 @@ class AdminService:
             
             # 수정할 필드만 추출
             update_fields = []
+            params = QueryParams(notice_id)
             if notice_data.title is not None:
-                escaped_title = notice_data.title.replace("'", "''")
-                update_fields.append(f"title = '{escaped_title}'")
+                update_fields.append(f"title = {params.add(notice_data.title)}")
             if notice_data.content is not None:
-                escaped_content = notice_data.content.replace("'", "''")
-                update_fields.append(f"content = '{escaped_content}'")
+                update_fields.append(f"content = {params.add(notice_data.content)}")
             if notice_data.is_important is not None:
-                update_fields.append(f"is_important = {notice_data.is_important}")
+                update_fields.append(f"is_important = {params.add(notice_data.is_important)}")
             
             if not update_fields:
                 return existing_notice  # 변경사항 없음
             
             current_time = datetime.now()
-            update_fields.append(f"updated_at = '{current_time.isoformat()}'")
+            update_fields.append(f"updated_at = {params.add(current_time)}")
             
             query = f"""
                 UPDATE notices 
                 SET {', '.join(update_fields)}
-                WHERE id = '{notice_id}'
+                WHERE id = $1
                 RETURNING *
             """
             
-            result = await real_supabase_service.execute_sql(project_id="vrsbmygqyfvvuaixibrh", query=query)
-            notice = result.get('data', [{}])[0]
+            result = await execute_sql(query, *params.values)
+            notice = result[0] if result else {}
             
             logger.info(f"공지사항 수정 완료: {notice_id} by {admin_user_id}")
             return notice
@@ -270,8 +290,8 @@ class AdminService:
             if not existing_notice:
                 raise ValueError("존재하지 않는 공지사항입니다")
             
-            query = f"DELETE FROM notices WHERE id = '{notice_id}'"
-            await real_supabase_service.execute_sql(project_id="vrsbmygqyfvvuaixibrh", query=query)
+            query = "DELETE FROM notices WHERE id = $1"
+            await execute_sql(query, notice_id)
             
             logger.info(f"공지사항 삭제 완료: {notice_id} by {admin_user_id}")
             return True
@@ -295,8 +315,8 @@ class AdminService:
                 FROM users
             """
             
-            result = await real_supabase_service.execute_sql(project_id="vrsbmygqyfvvuaixibrh", query=query)
-            stats = result.get('data', [{}])[0]
+            result = await execute_sql(query)
+            stats = result[0] if result else {}
             
             return stats
             
@@ -318,15 +338,10 @@ class AdminService:
                     c.created_at as company_created_at
                 FROM users u
                 LEFT JOIN companies c ON u.id = c.user_id
-                WHERE u.id = %s
+                WHERE u.id = $1
             """
             
-            result = await real_supabase_service.execute_sql(
-                project_id="vrsbmygqyfvvuaixibrh", 
-                query=query.replace('%s', f"'{user_id}'")
-            )
-            
-            users = result.get('data', [])
+            users = await execute_sql(query, user_id)
             if not users:
                 return None
             
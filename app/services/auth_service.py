@@ -1,52 +1,50 @@
 """
 인증 서비스 클래스
-Supabase MCP를 통한 데이터베이스 연동
+database.execute_sql 을 통한 데이터베이스 연동 (DATABASE_URL 설정 시 커넥션 풀, 미설정 시 Mock)
 """
 
 import uuid
 import logging
 from typing import Optional
-from passlib.context import CryptContext
 
+import config
+from database import execute_sql
 from models.auth import UserCreate
-from services.real_supabase_service import real_supabase_service
+from utils.principal_cache import principal_cache
+from utils.password_hasher import password_hasher
 
 logger = logging.getLogger(__name__)
 
-# 비밀번호 해싱
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 비밀번호 해시를 제외한 사용자 컬럼
+USER_COLUMNS = "id, email, name, phone, company_type, approved, role, created_at, updated_at"
 
 
 class AuthService:
-    """인증 서비스 클래스 (Supabase MCP 연동)"""
+    """인증 서비스 클래스"""
     
     @staticmethod
     async def create_user(user_data: UserCreate) -> dict:
         """새 사용자 생성"""
         try:
             # 이메일 중복 확인
-            existing_user = await real_supabase_service.get_user_by_email(user_data.email)
+            existing_user = await AuthService.get_user_by_email(user_data.email)
             if existing_user:
                 raise ValueError("이미 존재하는 이메일입니다")
             
-            # 비밀번호 해싱
-            hashed_password = pwd_context.hash(user_data.password)
+            # 비밀번호 해싱 (전용 스레드 풀)
+            hashed_password = await password_hasher.hash(user_data.password)
             
             # 새 사용자 ID 생성
             user_id = str(uuid.uuid4())
             
-            # 사용자 데이터 준비
-            new_user_data = {
-                'id': user_id,
-                'email': user_data.email,
-                'password_hash': hashed_password,
-                'name': user_data.name,
-                'phone': user_data.phone,
-                'company_type': user_data.company_type
-            }
-            
             # 사용자 생성
-            user = await real_supabase_service.create_user(new_user_data)
+            result = await execute_sql(
+                f"INSERT INTO users (id, email, password_hash, name, phone, company_type, approved) "
+                f"VALUES ($1, $2, $3, $4, $5, $6, false) RETURNING {USER_COLUMNS}",
+                user_id, user_data.email, hashed_password,
+                user_data.name, user_data.phone, user_data.company_type
+            )
+            user = result[0] if result else None
             
             if user:
                 # 회사 정보도 생성
@@ -62,15 +60,21 @@ class AuthService:
     async def authenticate_user(email: str, password: str) -> Optional[dict]:
         """사용자 인증"""
         try:
-            # 이메일로 사용자 조회
-            user = await real_supabase_service.get_user_by_email(email)
+            # 이메일로 사용자 조회 (비밀번호 해시 포함)
+            user = await AuthService.get_user_by_email(email)
             if not user:
                 return None
             
-            # 비밀번호 검증
-            if not pwd_context.verify(password, user["password_hash"]):
+            # 비밀번호 검증 (전용 스레드 풀)
+            valid, new_hash = await password_hasher.verify_and_update(password, user["password_hash"])
+            if not valid:
                 return None
             
+            # bcrypt 비용 설정이 바뀐 해시는 로그인 시 새 비용으로 재저장 (실패해도 로그인은 진행)
+            if new_hash and config.settings.PASSWORD_REHASH_ON_LOGIN:
+                if not await AuthService._update_password_hash(str(user["id"]), new_hash):
+                    logger.warning(f"비밀번호 재해싱 저장 실패: {user['id']}")
+            
             # 비밀번호 해시 제거 후 반환
             user_info = {k: v for k, v in user.items() if k != "password_hash"}
             return user_info
@@ -80,43 +84,57 @@ class AuthService:
     
     @staticmethod
     async def get_user_by_id(user_id: str) -> Optional[dict]:
-        """사용자 ID로 사용자 조회"""
+        """사용자 ID로 사용자 조회 (비밀번호 해시 제외)"""
         try:
-            return await real_supabase_service.get_user_by_id(user_id)
+            result = await execute_sql(f"SELECT {USER_COLUMNS} FROM users WHERE id = $1", str(user_id))
+            return result[0] if result else None
         except Exception:
             return None
     
     @staticmethod
     async def get_user_by_email(email: str) -> Optional[dict]:
-        """이메일로 사용자 조회"""
+        """이메일로 사용자 조회 (로그인 검증용으로 비밀번호 해시 포함)"""
         try:
-            return await real_supabase_service.get_user_by_email(email)
+            result = await execute_sql("SELECT * FROM users WHERE email = $1", email)
+            return result[0] if result else None
         except Exception:
             return None
     
+    @staticmethod
+    async def _update_password_hash(user_id: str, password_hash: str) -> bool:
+        """비밀번호 해시 저장 (갱신된 행이 있으면 True)"""
+        result = await execute_sql(
+            "UPDATE users SET password_hash = $1, updated_at = NOW() WHERE id = $2 RETURNING id",
+            password_hash, user_id
+        )
+        return bool(result)
+    
     @staticmethod
     async def change_user_password(user_id: str, current_password: str, new_password: str) -> bool:
         """사용자 비밀번호 변경"""
         try:
             # 현재 사용자 조회
-            user = await real_supabase_service.get_user_by_id(user_id)
+            user = await AuthService.get_user_by_id(user_id)
             if not user:
                 return False
             
             # 전체 사용자 정보(비밀번호 포함) 조회
-            user_with_password = await real_supabase_service.get_user_by_email(user["email"])
+            user_with_password = await AuthService.get_user_by_email(user["email"])
             if not user_with_password:
                 return False
             
             # 현재 비밀번호 확인
-            if not pwd_context.verify(current_password, user_with_password["password_hash"]):
+            if not await password_hasher.verify(current_password, user_with_password["password_hash"]):
                 return False
             
             # 새 비밀번호 해싱
-            new_hashed_password = pwd_context.hash(new_password)
+            new_hashed_password = await password_hasher.hash(new_password)
             
             # 비밀번호 업데이트
-            return await real_supabase_service.update_user_password(user_id, new_hashed_password)
+            updated = await AuthService._update_password_hash(user_id, new_hashed_password)
+            if updated:
+                principal_cache.invalidate(user_id)
+            return updated
             
         except Exception:
             return False
@@ -136,7 +154,7 @@ class AuthService:
             logger.info(f"비밀번호 재설정 토큰: {token}")
             
             # 현재는 간단히 새 비밀번호만 설정
-            new_hashed_password = pwd_context.hash(new_password)
+            new_hashed_password = await password_hasher.hash(new_password)
             logger.info(f"새 비밀번호 해싱 완료: {len(new_hashed_password)} 문자")
             
             # TODO: 실제 구현에서는 토큰에서 사용자 정보 추출 필요
@@ -154,10 +172,15 @@ class AuthService:
                 logger.info(f"사용자 승인 이유: {reason}")
             
             # 사용자 승인 상태 업데이트
-            result = await real_supabase_service.approve_user(user_id, approved)
+            result = await execute_sql(
+                f"UPDATE users SET approved = $1, approved_at = CASE WHEN $1 THEN NOW() ELSE NULL END, "
+                f"updated_at = NOW() WHERE id = $2 RETURNING {USER_COLUMNS}",
+                approved, user_id
+            )
+            principal_cache.invalidate(user_id)
             
             if result:
-                return result
+                return result[0]
             else:
                 raise ValueError("사용자를 찾을 수 없습니다")
                 
@@ -168,12 +191,13 @@ class AuthService:
     async def _create_company_for_user(user_id: str, user_data: UserCreate) -> None:
         """사용자를 위한 회사 정보 생성"""
         try:
-            await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"INSERT INTO companies (id, user_id, name, business_number, company_type, address, status) VALUES ('{str(uuid.uuid4())}', '{user_id}', '{user_data.company_name}', '{user_data.business_number}', '{user_data.company_type}', '{user_data.address}', 'active')"
+            await execute_sql(
+                "INSERT INTO companies (id, user_id, name, business_number, company_type, address, status) "
+                "VALUES ($1, $2, $3, $4, $5, $6, 'active')",
+                str(uuid.uuid4()), user_id, user_data.company_name, user_data.business_number,
+                user_data.company_type, user_data.address
             )
             
         except Exception as e:
             # 회사 생성 실패는 로그만 남기고 계속 진행
-            import logging
-            logging.error(f"회사 정보 생성 실패: {str(e)}")
\ No newline at end of file
+            logger.error(f"회사 정보 생성 실패: {str(e)}")
\ No newline at end of file
@@ -3,17 +3,28 @@
 실시간 채팅방 및 메시지 관리 시스템
 """
 
+import asyncio
+import json
 import logging
 import uuid
-from typing import List, Optional, Dict, Any, Tuple
+from collections import deque
+from typing import List, Optional, Dict, Any, Tuple, Callable, Deque, Set
 from datetime import datetime, timedelta
 
+import config
 from models.chat import (
     ChatRoomCreate, ChatRoomResponse, ChatRoomListResponse,
     ChatMessageCreate, ChatMessageResponse, ChatMessageListResponse,
     ChatMessageSearchFilter, ChatStats, NotificationCreate, NotificationResponse
 )
-from services.real_supabase_service import real_supabase_service
+from database import execute_sql, QueryParams
+from utils.snapshot_cache import dashboard_cache
+from utils.event_bus import event_bus
+from utils.chat_broker import InProcessBroker, create_chat_broker
+from utils.pagination import (
+    InvalidCursorError, keyset_condition, split_page, resolve_total_mode, count_total
+)
+from utils.text_search import bigrams, can_use_index, highlight_snippet
 from services.company_service import CompanyService
 
 logger = logging.getLogger(__name__)
@@ -27,9 +38,7 @@ class ChatService:
         """채팅방 생성 또는 기존 방 조회"""
         try:
             # 기존 채팅방 확인
-            existing_room = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            existing_room = await execute_sql("""
                 SELECT 
                     cr.id, cr.wholesale_company_id, cr.retail_company_id, 
                     cr.last_message_at, cr.created_at,
@@ -40,30 +49,28 @@ class ChatService:
                 FROM chat_rooms cr
                 LEFT JOIN companies wc ON cr.wholesale_company_id = wc.id
                 LEFT JOIN companies rc ON cr.retail_company_id = rc.id
-                WHERE cr.wholesale_company_id = '{wholesale_company_id}' 
-                AND cr.retail_company_id = '{retail_company_id}'
-            """)
+                WHERE cr.wholesale_company_id = $1 
+                AND cr.retail_company_id = $2
+            """, wholesale_company_id, retail_company_id)
             
             if existing_room:
                 return ChatRoomResponse(**dict(existing_room[0]))
             
             # 새 채팅방 생성
             room_id = str(uuid.uuid4())
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            result = await execute_sql("""
                 INSERT INTO chat_rooms (id, wholesale_company_id, retail_company_id, last_message_at)
-                VALUES ('{room_id}', '{wholesale_company_id}', '{retail_company_id}', NOW())
+                VALUES ($1, $2, $3, NOW())
                 RETURNING id, wholesale_company_id, retail_company_id, last_message_at, created_at
-            """)
+            """, room_id, wholesale_company_id, retail_company_id)
             
             if not result:
                 return None
             
+            dashboard_cache.invalidate(wholesale_company_id, retail_company_id)
+            
             # 회사 정보와 함께 반환
-            room_with_company_info = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            room_with_company_info = await execute_sql("""
                 SELECT 
                     cr.id, cr.wholesale_company_id, cr.retail_company_id, 
                     cr.last_message_at, cr.created_at,
@@ -72,8 +79,8 @@ class ChatService:
                 FROM chat_rooms cr
                 LEFT JOIN companies wc ON cr.wholesale_company_id = wc.id
                 LEFT JOIN companies rc ON cr.retail_company_id = rc.id
-                WHERE cr.id = '{room_id}'
-            """)
+                WHERE cr.id = $1
+            """, room_id)
             
             if room_with_company_info:
                 room_dict = dict(room_with_company_info[0])
@@ -98,15 +105,13 @@ class ChatService:
             
             # 회사 유형에 따른 조건 설정
             if company_type == "wholesale":
-                company_condition = f"cr.wholesale_company_id = '{company.id}'"
+                company_condition = "cr.wholesale_company_id = $2"
                 other_company_name = "rc.name as other_company_name"
             else:  # retail
-                company_condition = f"cr.retail_company_id = '{company.id}'"
+                company_condition = "cr.retail_company_id = $2"
                 other_company_name = "wc.name as other_company_name"
             
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            result = await execute_sql(f"""
                 SELECT 
                     cr.id, cr.wholesale_company_id, cr.retail_company_id, 
                     cr.last_message_at, cr.created_at,
@@ -115,15 +120,15 @@ class ChatService:
                     {other_company_name},
                     (SELECT message FROM chat_messages WHERE room_id = cr.id ORDER BY created_at DESC LIMIT 1) as last_message,
                     (SELECT COUNT(*) FROM chat_messages WHERE room_id = cr.id 
-                     AND sender_id != '{user_id}' 
-                     AND created_at > COALESCE((SELECT last_read_at FROM chat_room_users WHERE room_id = cr.id AND user_id = '{user_id}'), cr.created_at)
+                     AND sender_id != $1 
+                     AND created_at > COALESCE((SELECT last_read_at FROM chat_room_users WHERE room_id = cr.id AND user_id = $1), cr.created_at)
                     ) as unread_count
                 FROM chat_rooms cr
                 LEFT JOIN companies wc ON cr.wholesale_company_id = wc.id
                 LEFT JOIN companies rc ON cr.retail_company_id = rc.id
                 WHERE {company_condition}
                 ORDER BY cr.last_message_at DESC
-            """)
+            """, user_id, str(company.id))
             
             rooms = []
             if result:
@@ -148,30 +153,30 @@ class ChatService:
             message_id = str(uuid.uuid4())
             
             # 메시지 저장
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            result = await execute_sql("""
                 INSERT INTO chat_messages (id, room_id, sender_id, message, message_type, order_id)
-                VALUES ('{message_id}', '{message_data.room_id}', '{sender_id}', '{message_data.message}', '{message_data.message_type}', {f"'{message_data.order_id}'" if message_data.order_id else "NULL"})
+                VALUES ($1, $2, $3, $4, $5, $6)
                 RETURNING id, room_id, sender_id, message, message_type, order_id, created_at
-            """)
+            """, message_id, str(message_data.room_id), sender_id, message_data.message,
+                message_data.message_type, str(message_data.order_id) if message_data.order_id else None)
             
             if not result:
                 return None
             
             # 채팅방 최종 메시지 시간 업데이트
-            await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            room_result = await execute_sql("""
                 UPDATE chat_rooms 
                 SET last_message_at = NOW() 
-                WHERE id = '{message_data.room_id}'
-            """)
+                WHERE id = $1
+                RETURNING wholesale_company_id, retail_company_id
+            """, str(message_data.room_id))
+            
+            if room_result:
+                room = room_result[0]
+                dashboard_cache.invalidate(str(room['wholesale_company_id']), str(room['retail_company_id']))
             
             # 발신자 정보와 함께 메시지 반환
-            message_with_sender = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            message_with_sender = await execute_sql("""
                 SELECT 
                     cm.id, cm.room_id, cm.sender_id, cm.message, cm.message_type, cm.order_id, cm.created_at,
                     u.name as sender_name,
@@ -179,8 +184,8 @@ class ChatService:
                 FROM chat_messages cm
                 LEFT JOIN users u ON cm.sender_id = u.id
                 LEFT JOIN companies c ON u.id = c.user_id
-                WHERE cm.id = '{message_id}'
-            """)
+                WHERE cm.id = $1
+            """, message_id)
             
             if message_with_sender:
                 message_dict = dict(message_with_sender[0])
@@ -204,56 +209,73 @@ class ChatService:
             if not has_access:
                 raise ValueError("채팅방에 접근할 권한이 없습니다")
             
-            # 총 메시지 수 조회
-            count_result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"SELECT COUNT(*) as total FROM chat_messages WHERE room_id = '{room_id}'"
-            )
-            
-            total = count_result[0]['total'] if count_result else 0
-            
-            # OFFSET, LIMIT 계산
-            offset = (search_filter.page - 1) * search_filter.size
-            
-            # 메시지 조회 (최신순)
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
-                SELECT 
-                    cm.id, cm.room_id, cm.sender_id, cm.message, cm.message_type, cm.order_id, cm.created_at,
-                    u.name as sender_name,
-                    c.name as sender_company
-                FROM chat_messages cm
-                LEFT JOIN users u ON cm.sender_id = u.id
-                LEFT JOIN companies c ON u.id = c.user_id
-                WHERE cm.room_id = '{room_id}'
-                ORDER BY cm.created_at DESC
-                LIMIT {search_filter.size} OFFSET {offset}
-            """)
+            params = QueryParams()
+            conditions = [f"cm.room_id = {params.add(room_id)}"]
             
-            messages = []
-            if result:
-                for row in result:
-                    message_dict = dict(row)
-                    # 주문 정보가 있으면 추가
-                    if message_dict.get('order_id'):
-                        message_dict['order_info'] = await ChatService._get_order_info(str(message_dict['order_id']))
-                    messages.append(ChatMessageResponse(**message_dict))
-            
-            has_next = (offset + search_filter.size) < total
-            
-            return ChatMessageListResponse(
-                messages=messages,
-                total=total,
-                page=search_filter.page,
-                size=search_filter.size,
-                has_next=has_next
+            return await ChatService._get_message_page(
+                conditions, params, search_filter.page, search_filter.size,
+                search_filter.cursor, search_filter.total_mode
             )
             
+        except InvalidCursorError:
+            raise
         except Exception as e:
             logger.error(f"채팅 메시지 조회 오류: {str(e)}")
             return ChatMessageListResponse(messages=[], total=0, page=1, size=50, has_next=False)
     
+    @staticmethod
+    async def _get_message_page(conditions: List[str], params: QueryParams, page: int, size: int,
+                                cursor: Optional[str], total_mode: Optional[str]) -> ChatMessageListResponse:
+        """메시지 목록 페이지 조회 (page/size 방식과 (created_at, id) 커서 방식 공통, 최신순)"""
+        where_clause = "WHERE " + " AND ".join(conditions)
+        total_mode = resolve_total_mode(total_mode, cursor)
+        filter_params = list(params.values)
+        
+        page_conditions = list(conditions)
+        offset = 0
+        if cursor:
+            page_conditions.append(keyset_condition(params, ["cm.created_at", "cm.id"], cursor))
+        else:
+            offset = (page - 1) * size
+        
+        total, total_estimated = await count_total(
+            execute_sql, f"FROM chat_messages cm {where_clause}", filter_params, total_mode
+        )
+        
+        # 다음 페이지 여부 확인을 위해 size + 1 건 조회
+        result = await execute_sql(f"""
+            SELECT 
+                cm.id, cm.room_id, cm.sender_id, cm.message, cm.message_type, cm.order_id, cm.created_at,
+                u.name as sender_name,
+                c.name as sender_company
+            FROM chat_messages cm
+            LEFT JOIN users u ON cm.sender_id = u.id
+            LEFT JOIN companies c ON u.id = c.user_id
+            WHERE {" AND ".join(page_conditions)}
+            ORDER BY cm.created_at DESC, cm.id DESC
+            LIMIT {params.add(size + 1)} OFFSET {params.add(offset)}
+        """, *params.values)
+        
+        rows, has_next, next_cursor = split_page(result, size, ["created_at", "id"])
+        
+        messages = []
+        for row in rows:
+            message_dict = dict(row)
+            # 주문 정보가 있으면 추가
+            if message_dict.get('order_id'):
+                message_dict['order_info'] = await ChatService._get_order_info(str(message_dict['order_id']))
+            messages.append(ChatMessageResponse(**message_dict))
+        
+        return ChatMessageListResponse(
+            messages=messages,
+            total=total,
+            page=page,
+            size=size,
+            has_next=has_next,
+            next_cursor=next_cursor,
+            total_estimated=total_estimated
+        )
+    
     @staticmethod
     async def check_room_access(room_id: str, user_id: str) -> bool:
         """채팅방 접근 권한 확인"""
@@ -264,13 +286,11 @@ class ChatService:
                 return False
             
             # 채팅방에 해당 회사가 포함되어 있는지 확인
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            result = await execute_sql("""
                 SELECT id FROM chat_rooms 
-                WHERE id = '{room_id}' 
-                AND (wholesale_company_id = '{company.id}' OR retail_company_id = '{company.id}')
-            """)
+                WHERE id = $1 
+                AND (wholesale_company_id = $2 OR retail_company_id = $2)
+            """, room_id, str(company.id))
             
             return bool(result)
             
@@ -289,23 +309,21 @@ class ChatService:
             
             # 회사 유형에 따른 조건 설정
             if company.company_type == "wholesale":
-                company_condition = f"cr.wholesale_company_id = '{company.id}'"
+                company_condition = "cr.wholesale_company_id = $2"
             else:  # retail
-                company_condition = f"cr.retail_company_id = '{company.id}'"
+                company_condition = "cr.retail_company_id = $2"
             
             # 채팅 통계 조회
-            stats_result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            stats_result = await execute_sql(f"""
                 SELECT 
                     COUNT(DISTINCT cr.id) as total_rooms,
                     COUNT(DISTINCT CASE WHEN cr.last_message_at > NOW() - INTERVAL '7 days' THEN cr.id END) as active_rooms,
                     COUNT(CASE WHEN cm.created_at >= CURRENT_DATE THEN cm.id END) as total_messages_today,
-                    COUNT(CASE WHEN cm.sender_id != '{user_id}' AND cm.created_at > NOW() - INTERVAL '1 hour' THEN cm.id END) as unread_messages
+                    COUNT(CASE WHEN cm.sender_id != $1 AND cm.created_at > NOW() - INTERVAL '1 hour' THEN cm.id END) as unread_messages
                 FROM chat_rooms cr
                 LEFT JOIN chat_messages cm ON cr.id = cm.room_id
                 WHERE {company_condition}
-            """)
+            """, user_id, str(company.id))
             
             if stats_result:
                 return ChatStats(**dict(stats_result[0]))
@@ -321,14 +339,12 @@ class ChatService:
         """메시지 읽음 처리 (채팅방 입장 시)"""
         try:
             # 사용자의 마지막 읽은 시간 업데이트
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            result = await execute_sql("""
                 INSERT INTO chat_room_users (room_id, user_id, last_read_at)
-                VALUES ('{room_id}', '{user_id}', NOW())
+                VALUES ($1, $2, NOW())
                 ON CONFLICT (room_id, user_id) 
                 DO UPDATE SET last_read_at = NOW()
-            """)
+            """, room_id, user_id)
             
             return result is not None
             
@@ -341,26 +357,22 @@ class ChatService:
         """메시지 삭제 (발신자만 가능, 1시간 이내)"""
         try:
             # 메시지 소유권 및 시간 확인
-            message_check = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            message_check = await execute_sql("""
                 SELECT id FROM chat_messages 
-                WHERE id = '{message_id}' 
-                AND sender_id = '{user_id}'
+                WHERE id = $1 
+                AND sender_id = $2
                 AND created_at > NOW() - INTERVAL '1 hour'
-            """)
+            """, message_id, user_id)
             
             if not message_check:
                 return False
             
             # 메시지 삭제 (실제로는 내용만 삭제하고 "[삭제된 메시지]"로 표시)
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            result = await execute_sql("""
                 UPDATE chat_messages 
                 SET message = '[삭제된 메시지]', message_type = 'text'
-                WHERE id = '{message_id}'
-            """)
+                WHERE id = $1
+            """, message_id)
             
             return result is not None
             
@@ -370,8 +382,14 @@ class ChatService:
     
     @staticmethod
     async def search_messages(room_id: str, user_id: str, keyword: str, 
-                            page: int = 1, size: int = 20) -> ChatMessageListResponse:
-        """채팅방 내 메시지 검색"""
+                            page: int = 1, size: int = 20, cursor: Optional[str] = None,
+                            total_mode: Optional[str] = None) -> ChatMessageListResponse:
+        """
+        채팅방 내 메시지 검색
+        
+        바이그램 tsvector GIN 인덱스(database/chat_message_fts.sql)로 후보를 좁힌 뒤
+        원문 부분 일치로 재확인하고, 결과마다 일치 구간을 강조한 snippet 을 채움
+        """
         try:
             # 채팅방 접근 권한 확인
             has_access = await ChatService.check_room_access(room_id, user_id)
@@ -379,58 +397,24 @@ class ChatService:
                 raise ValueError("채팅방에 접근할 권한이 없습니다")
             
             # 검색 조건
-            where_conditions = [
-                f"cm.room_id = '{room_id}'",
-                f"cm.message ILIKE '%{keyword}%'",
+            params = QueryParams()
+            conditions = [f"cm.room_id = {params.add(room_id)}"]
+            if can_use_index(keyword):
+                conditions.append(
+                    f"cm.message_tsv @@ plainto_tsquery('simple', {params.add(' '.join(bigrams(keyword)))})"
+                )
+            conditions += [
+                f"cm.message ILIKE '%' || {params.add(keyword)} || '%'",
                 "cm.message != '[삭제된 메시지]'"
             ]
-            where_clause = "WHERE " + " AND ".join(where_conditions)
             
-            # 총 개수 조회
-            count_result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"SELECT COUNT(*) as total FROM chat_messages cm {where_clause}"
-            )
-            
-            total = count_result[0]['total'] if count_result else 0
-            
-            # OFFSET, LIMIT 계산
-            offset = (page - 1) * size
-            
-            # 메시지 검색
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
-                SELECT 
-                    cm.id, cm.room_id, cm.sender_id, cm.message, cm.message_type, cm.order_id, cm.created_at,
-                    u.name as sender_name,
-                    c.name as sender_company
-                FROM chat_messages cm
-                LEFT JOIN users u ON cm.sender_id = u.id
-                LEFT JOIN companies c ON u.id = c.user_id
-                {where_clause}
-                ORDER BY cm.created_at DESC
-                LIMIT {size} OFFSET {offset}
-            """)
-            
-            messages = []
-            if result:
-                for row in result:
-                    message_dict = dict(row)
-                    if message_dict.get('order_id'):
-                        message_dict['order_info'] = await ChatService._get_order_info(str(message_dict['order_id']))
-                    messages.append(ChatMessageResponse(**message_dict))
-            
-            has_next = (offset + size) < total
-            
-            return ChatMessageListResponse(
-                messages=messages,
-                total=total,
-                page=page,
-                size=size,
-                has_next=has_next
-            )
+            result = await ChatService._get_message_page(conditions, params, page, size, cursor, total_mode)
+            for message in result.messages:
+                message.snippet = highlight_snippet(message.message, keyword)
+            return result
             
+        except InvalidCursorError:
+            raise
         except Exception as e:
             logger.error(f"메시지 검색 오류: {str(e)}")
             return ChatMessageListResponse(messages=[], total=0, page=1, size=20, has_next=False)
@@ -439,13 +423,11 @@ class ChatService:
     async def _get_order_info(order_id: str) -> Optional[Dict[str, Any]]:
         """주문 정보 조회 (메시지에 첨부된 주문용)"""
         try:
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            result = await execute_sql("""
                 SELECT id, order_number, status, total_amount, created_at
                 FROM orders 
-                WHERE id = '{order_id}'
-            """)
+                WHERE id = $1
+            """, order_id)
             
             return dict(result[0]) if result else None
             
@@ -463,16 +445,20 @@ class NotificationService:
         try:
             notification_id = str(uuid.uuid4())
             
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            result = await execute_sql("""
                 INSERT INTO notifications (id, user_id, title, message, notification_type, reference_id, is_read)
-                VALUES ('{notification_id}', '{notification_data.user_id}', '{notification_data.title}', '{notification_data.message}', '{notification_data.notification_type}', {f"'{notification_data.reference_id}'" if notification_data.reference_id else "NULL"}, false)
+                VALUES ($1, $2, $3, $4, $5, $6, false)
                 RETURNING id, user_id, title, message, notification_type, reference_id, is_read, created_at
-            """)
+            """, notification_id, str(notification_data.user_id), notification_data.title,
+                notification_data.message, notification_data.notification_type,
+                str(notification_data.reference_id) if notification_data.reference_id else None)
             
             if result:
-                return NotificationResponse(**dict(result[0]))
+                notification = NotificationResponse(**dict(result[0]))
+                # 대시보드 SSE 로 수신자에게 즉시 전달
+                event_bus.publish("notification", notification.model_dump(mode="json"),
+                                  user_ids=[str(notification.user_id)])
+                return notification
             return None
             
         except Exception as e:
@@ -484,7 +470,7 @@ class NotificationService:
                                    page: int = 1, size: int = 20) -> List[NotificationResponse]:
         """사용자 알림 목록 조회"""
         try:
-            conditions = [f"user_id = '{user_id}'"]
+            conditions = ["user_id = $1"]
             
             if unread_only:
                 conditions.append("is_read = false")
@@ -494,15 +480,13 @@ class NotificationService:
             # OFFSET, LIMIT 계산
             offset = (page - 1) * size
             
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            result = await execute_sql(f"""
                 SELECT id, user_id, title, message, notification_type, reference_id, is_read, created_at
                 FROM notifications
                 {where_clause}
                 ORDER BY created_at DESC
-                LIMIT {size} OFFSET {offset}
-            """)
+                LIMIT $2 OFFSET $3
+            """, user_id, size, offset)
             
             notifications = []
             if result:
@@ -519,13 +503,11 @@ class NotificationService:
     async def mark_notification_read(notification_id: str, user_id: str) -> bool:
         """알림 읽음 처리"""
         try:
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            result = await execute_sql("""
                 UPDATE notifications 
                 SET is_read = true 
-                WHERE id = '{notification_id}' AND user_id = '{user_id}'
-            """)
+                WHERE id = $1 AND user_id = $2
+            """, notification_id, user_id)
             
             return result is not None
             
@@ -537,13 +519,11 @@ class NotificationService:
     async def mark_all_notifications_read(user_id: str) -> bool:
         """모든 알림 읽음 처리"""
         try:
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            result = await execute_sql("""
                 UPDATE notifications 
                 SET is_read = true 
-                WHERE user_id = '{user_id}' AND is_read = false
-            """)
+                WHERE user_id = $1 AND is_read = false
+            """, user_id)
             
             return result is not None
             
@@ -556,13 +536,11 @@ class NotificationService:
         """주문 관련 알림 전송"""
         try:
             # 주문 정보 조회
-            order_info = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            order_info = await execute_sql("""
                 SELECT order_number, status, total_amount
                 FROM orders 
-                WHERE id = '{order_id}'
-            """)
+                WHERE id = $1
+            """, order_id)
             
             if not order_info:
                 return
@@ -596,19 +574,157 @@ class NotificationService:
             logger.error(f"주문 알림 전송 오류: {str(e)}")
 
 
+# 느린 소비자 처리 정책
+SLOW_CONSUMER_POLICIES = ("drop_oldest", "coalesce", "disconnect")
+
+
+class OutboundConnection:
+    """
+    WebSocket 연결별 송신 큐
+    
+    브로드캐스트는 직렬화된 프레임을 큐에 넣기만 하고(대기 없음) 전용 writer 태스크가 전송함.
+    큐가 가득 차면 정책에 따라 처리:
+    - drop_oldest: 가장 오래된 프레임을 버림
+    - coalesce: 같은 coalesce_key 프레임(예: 타이핑 상태)을 최신 값으로 교체, 없으면 가장 오래된 프레임을 버림
+    - disconnect: 연결을 끊음 (클라이언트가 재접속 후 이력 조회)
+    """
+    
+    def __init__(self, websocket, max_queue: int = 100, policy: str = "drop_oldest",
+                 send_timeout: float = 10.0, on_close: Optional[Callable[[Any], None]] = None):
+        if policy not in SLOW_CONSUMER_POLICIES:
+            raise ValueError(f"지원하지 않는 느린 소비자 정책입니다: {policy}")
+        self.websocket = websocket
+        self.max_queue = max_queue
+        self.policy = policy
+        self.send_timeout = send_timeout
+        self._on_close = on_close
+        self._queue: Deque[Tuple[Optional[str], str]] = deque()
+        self._ready = asyncio.Event()
+        self.closed = False
+        self.dropped = 0
+        self.coalesced = 0
+        self.sent = 0
+        self._writer = asyncio.create_task(self._write_loop())
+    
+    @property
+    def depth(self) -> int:
+        """대기 중인 프레임 수"""
+        return len(self._queue)
+    
+    def enqueue(self, payload: str, coalesce_key: Optional[str] = None) -> bool:
+        """프레임 추가 (대기하지 않음, 연결이 끊긴 경우 False)"""
+        if self.closed:
+            return False
+        
+        if coalesce_key is not None and self.policy == "coalesce":
+            for index, (queued_key, _) in enumerate(self._queue):
+                if queued_key == coalesce_key:
+                    self._queue[index] = (coalesce_key, payload)
+                    self.coalesced += 1
+                    return True
+        
+        if len(self._queue) >= self.max_queue:
+            if self.policy == "disconnect":
+                logger.warning(f"느린 WebSocket 소비자 연결 종료 (대기 {len(self._queue)}건)")
+                self.dropped += len(self._queue) + 1
+                self.close(code=1013)
+                return False
+            self._queue.popleft()
+            self.dropped += 1
+        
+        self._queue.append((coalesce_key, payload))
+        self._ready.set()
+        return True
+    
+    async def _write_loop(self) -> None:
+        """큐의 프레임을 순서대로 전송 (전송 실패/시간 초과 시 연결 종료)"""
+        try:
+            while True:
+                await self._ready.wait()
+                while self._queue:
+                    _, payload = self._queue.popleft()
+                    async with asyncio.timeout(self.send_timeout):
+                        await self.websocket.send_text(payload)
+                    self.sent += 1
+                self._ready.clear()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.info(f"WebSocket 전송 실패 - 연결 정리: {str(e)}")
+            self.close()
+    
+    def close(self, code: Optional[int] = None) -> None:
+        """writer 종료 및 연결 정리 (code 지정 시 소켓도 닫음)"""
+        if self.closed:
+            return
+        self.closed = True
+        self._queue.clear()
+        if self._writer is not asyncio.current_task():
+            self._writer.cancel()
+        if code is not None:
+            task = asyncio.create_task(self._close_socket(code))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
+        if self._on_close is not None:
+            self._on_close(self.websocket)
+    
+    async def _close_socket(self, code: int) -> None:
+        try:
+            await self.websocket.close(code=code)
+        except Exception:
+            pass
+
+
+# close() 에서 만든 소켓 종료 태스크 참조 유지
+_background_tasks: Set[asyncio.Task] = set()
+
+
 # WebSocket 연결 관리자
 class ConnectionManager:
-    """WebSocket 연결 관리"""
+    """
+    WebSocket 연결 관리
+    
+    send_to_room/send_to_user 는 브로커로 발행하고, 모든 워커가 수신한 메시지를
+    자신에게 연결된 소켓의 송신 큐에만 넣음 (sticky session 없이 워커 간 전달,
+    느린 클라이언트가 다른 클라이언트나 발신 요청을 막지 않음)
+    """
     
-    def __init__(self):
+    def __init__(self, broker: Optional[Any] = None, max_queue: int = 100,
+                 slow_consumer_policy: str = "drop_oldest", send_timeout: float = 10.0):
         # room_id -> List[WebSocket] 연결 관리
         self.room_connections: Dict[str, List[Any]] = {}
         # user_id -> WebSocket 연결 관리  
         self.user_connections: Dict[str, Any] = {}
+        # WebSocket -> 송신 큐
+        self.outbound: Dict[Any, OutboundConnection] = {}
+        self.broker = broker or InProcessBroker()
+        self.max_queue = max_queue
+        self.slow_consumer_policy = slow_consumer_policy
+        self.send_timeout = send_timeout
+        self._broker_started = False
+        # 종료된 연결의 누적 통계
+        self._closed_stats = {"dropped": 0, "coalesced": 0, "sent": 0}
+    
+    async def start(self) -> None:
+        """브로커 수신 시작 (시작 전에는 현재 워커 소켓에만 전달)"""
+        if self._broker_started:
+            return
+        await self.broker.start(self._on_broker_message)
+        self._broker_started = True
+    
+    async def stop(self) -> None:
+        """브로커 수신 종료"""
+        if self._broker_started:
+            self._broker_started = False
+            await self.broker.stop()
     
     async def connect(self, websocket, room_id: str, user_id: str):
         """WebSocket 연결 추가"""
         await websocket.accept()
+        self.outbound[websocket] = OutboundConnection(
+            websocket, self.max_queue, self.slow_consumer_policy,
+            self.send_timeout, on_close=self._remove_socket
+        )
         
         # 룸별 연결 관리
         if room_id not in self.room_connections:
@@ -635,33 +751,100 @@ class ConnectionManager:
         if user_id in self.user_connections and self.user_connections[user_id] == websocket:
             del self.user_connections[user_id]
         
+        outbound = self.outbound.get(websocket)
+        if outbound is not None:
+            outbound.close()
+        
         logger.info(f"WebSocket 연결 해제: room={room_id}, user={user_id}")
     
-    async def send_to_room(self, room_id: str, message: dict):
-        """채팅방의 모든 연결에 메시지 전송"""
-        if room_id in self.room_connections:
-            disconnected = []
-            for websocket in self.room_connections[room_id]:
-                try:
-                    await websocket.send_json(message)
-                except:
-                    disconnected.append(websocket)
-            
-            # 연결이 끊어진 소켓 정리
-            for websocket in disconnected:
-                try:
-                    self.room_connections[room_id].remove(websocket)
-                except ValueError:
-                    pass
+    def _remove_socket(self, websocket) -> None:
+        """송신 큐가 종료된 소켓을 모든 룸/사용자 연결에서 제거"""
+        outbound = self.outbound.pop(websocket, None)
+        if outbound is not None:
+            for key in self._closed_stats:
+                self._closed_stats[key] += getattr(outbound, key)
+        
+        for room_id in list(self.room_connections):
+            connections = self.room_connections[room_id]
+            if websocket in connections:
+                connections.remove(websocket)
+                if not connections:
+                    del self.room_connections[room_id]
+        
+        for user_id in [uid for uid, ws in self.user_connections.items() if ws is websocket]:
+            del self.user_connections[user_id]
+    
+    async def send_to_room(self, room_id: str, message: dict, coalesce_key: Optional[str] = None):
+        """
+        채팅방의 모든 연결에 메시지 전송 (모든 워커)
+        
+        Args:
+            room_id: 채팅방 ID
+            message: 전송할 메시지
+            coalesce_key: coalesce 정책에서 최신 값만 남길 프레임 키 (예: 사용자별 타이핑 상태)
+        """
+        await self._publish("room", room_id, message, coalesce_key)
     
     async def send_to_user(self, user_id: str, message: dict):
-        """특정 사용자에게 메시지 전송"""
-        if user_id in self.user_connections:
+        """특정 사용자에게 메시지 전송 (모든 워커)"""
+        await self._publish("user", user_id, message)
+    
+    async def _publish(self, target: str, key: str, message: dict, coalesce_key: Optional[str] = None) -> None:
+        """
+        팬아웃 메시지 발행
+        
+        대상 유형, 대상 ID, coalesce 키, 메시지 JSON 을 줄바꿈으로 이어 붙여 발행
+        (메시지는 한 번만 직렬화하며 수신 측에서 다시 직렬화하지 않음)
+        """
+        payload = json.dumps(message, default=str, ensure_ascii=False)
+        if self._broker_started:
             try:
-                await self.user_connections[user_id].send_json(message)
-            except:
-                del self.user_connections[user_id]
+                await self.broker.publish(f"{target}\n{key}\n{coalesce_key or ''}\n{payload}")
+                return
+            except Exception as e:
+                logger.error(f"채팅 브로커 발행 오류 - 현재 워커에만 전달: {str(e)}")
+        self._deliver_local(target, key, payload, coalesce_key)
+    
+    async def _on_broker_message(self, data: str) -> None:
+        """브로커 수신 메시지를 현재 워커의 소켓에 전달"""
+        target, key, coalesce_key, payload = data.split("\n", 3)
+        self._deliver_local(target, key, payload, coalesce_key or None)
+    
+    def _deliver_local(self, target: str, key: str, payload: str, coalesce_key: Optional[str] = None) -> None:
+        """현재 워커에 연결된 소켓의 송신 큐에 추가 (전송을 기다리지 않음)"""
+        if target == "room":
+            websockets = list(self.room_connections.get(key, []))
+        elif target == "user":
+            websockets = [self.user_connections[key]] if key in self.user_connections else []
+        else:
+            return
+        
+        for websocket in websockets:
+            outbound = self.outbound.get(websocket)
+            if outbound is not None:
+                outbound.enqueue(payload, coalesce_key)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """연결/송신 큐 통계 조회"""
+        connections = list(self.outbound.values())
+        return {
+            "connections": len(connections),
+            "rooms": len(self.room_connections),
+            "queue_depth": sum(c.depth for c in connections),
+            "max_queue_depth": max((c.depth for c in connections), default=0),
+            "dropped_frames": self._closed_stats["dropped"] + sum(c.dropped for c in connections),
+            "coalesced_frames": self._closed_stats["coalesced"] + sum(c.coalesced for c in connections),
+            "sent_frames": self._closed_stats["sent"] + sum(c.sent for c in connections),
+            "max_queue": self.max_queue,
+            "slow_consumer_policy": self.slow_consumer_policy,
+            "broker": self.broker.get_stats()
+        }
 
 
 # 전역 연결 관리자 인스턴스
-connection_manager = ConnectionManager()
\ No newline at end of file
+connection_manager = ConnectionManager(
+    create_chat_broker(),
+    max_queue=config.settings.CHAT_WS_QUEUE_SIZE,
+    slow_consumer_policy=config.settings.CHAT_WS_SLOW_CONSUMER_POLICY,
+    send_timeout=config.settings.CHAT_WS_SEND_TIMEOUT
+)
@@ -13,10 +13,12 @@ from models.company import (
     CompanyRelationshipCreate, CompanyRelationshipUpdate, CompanyRelationshipResponse,
     CompanySearchFilter, CompanyPermission, CompanyStats
 )
-from services.real_supabase_service import real_supabase_service
+from database import execute_sql, QueryParams
 
 logger = logging.getLogger(__name__)
 
+COMPANY_COLUMNS = "id, user_id, name, business_number, company_type, address, description, status, created_at, updated_at"
+
 
 class CompanyService:
     """회사 관리 서비스 (도매업체-소매업체 관계 관리)"""
@@ -27,9 +29,11 @@ class CompanyService:
         try:
             company_id = str(uuid.uuid4())
             
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"INSERT INTO companies (id, user_id, name, business_number, company_type, address, description, status) VALUES ('{company_id}', '{company_data.user_id}', '{company_data.name}', '{company_data.business_number}', '{company_data.company_type}', '{company_data.address}', '{company_data.description}', 'active') RETURNING id, user_id, name, business_number, company_type, address, description, status, created_at, updated_at"
+            result = await execute_sql(
+                "INSERT INTO companies (id, user_id, name, business_number, company_type, address, description, status) "
+                f"VALUES ($1, $2, $3, $4, $5, $6, $7, 'active') RETURNING {COMPANY_COLUMNS}",
+                company_id, str(company_data.user_id), company_data.name, company_data.business_number,
+                company_data.company_type, company_data.address, company_data.description
             )
             
             if result and len(result) > 0:
@@ -44,10 +48,7 @@ class CompanyService:
     async def get_company_by_id(company_id: str) -> Optional[CompanyResponse]:
         """회사 ID로 조회"""
         try:
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"SELECT id, user_id, name, business_number, company_type, address, description, status, created_at, updated_at FROM companies WHERE id = '{company_id}'"
-            )
+            result = await execute_sql(f"SELECT {COMPANY_COLUMNS} FROM companies WHERE id = $1", str(company_id))
             
             if result and len(result) > 0:
                 return CompanyResponse(**result[0])
@@ -61,9 +62,8 @@ class CompanyService:
     async def get_company_by_user_id(user_id: str) -> Optional[CompanyResponse]:
         """사용자 ID로 소속 회사 조회"""
         try:
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"SELECT id, user_id, name, business_number, company_type, address, description, status, created_at, updated_at FROM companies WHERE user_id = '{user_id}' AND status = 'active'"
+            result = await execute_sql(
+                f"SELECT {COMPANY_COLUMNS} FROM companies WHERE user_id = $1 AND status = 'active'", str(user_id)
             )
             
             if result and len(result) > 0:
@@ -78,16 +78,17 @@ class CompanyService:
     async def update_company(company_id: str, company_data: CompanyUpdate) -> Optional[CompanyResponse]:
         """회사 정보 수정"""
         try:
-            # 수정할 필드만 동적으로 구성
+            # 수정할 필드만 동적으로 구성 (값은 위치 파라미터)
+            params = QueryParams()
             update_fields = []
             if company_data.name is not None:
-                update_fields.append(f"name = '{company_data.name}'")
+                update_fields.append(f"name = {params.add(company_data.name)}")
             if company_data.business_number is not None:
-                update_fields.append(f"business_number = '{company_data.business_number}'")
+                update_fields.append(f"business_number = {params.add(company_data.business_number)}")
             if company_data.address is not None:
-                update_fields.append(f"address = '{company_data.address}'")
+                update_fields.append(f"address = {params.add(company_data.address)}")
             if company_data.description is not None:
-                update_fields.append(f"description = '{company_data.description}'")
+                update_fields.append(f"description = {params.add(company_data.description)}")
             
             if not update_fields:
                 # 수정할 내용이 없으면 기존 데이터 반환
@@ -96,9 +97,9 @@ class CompanyService:
             update_fields.append("updated_at = NOW()")
             update_clause = ", ".join(update_fields)
             
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"UPDATE companies SET {update_clause} WHERE id = '{company_id}' RETURNING id, user_id, name, business_number, company_type, address, description, status, created_at, updated_at"
+            result = await execute_sql(
+                f"UPDATE companies SET {update_clause} WHERE id = {params.add(str(company_id))} RETURNING {COMPANY_COLUMNS}",
+                *params.values
             )
             
             if result and len(result) > 0:
@@ -113,25 +114,27 @@ class CompanyService:
     async def search_companies(search_filter: CompanySearchFilter) -> List[CompanyResponse]:
         """회사 검색"""
         try:
-            # WHERE 조건 구성
+            # WHERE 조건 구성 (값은 위치 파라미터)
+            params = QueryParams()
             where_conditions = []
             if search_filter.company_type:
-                where_conditions.append(f"company_type = '{search_filter.company_type}'")
+                where_conditions.append(f"company_type = {params.add(search_filter.company_type)}")
             if search_filter.status:
-                where_conditions.append(f"status = '{search_filter.status}'")
+                where_conditions.append(f"status = {params.add(search_filter.status)}")
             else:
                 where_conditions.append("status = 'active'")  # 기본적으로 활성 상태만
             if search_filter.name:
-                where_conditions.append(f"name ILIKE '%{search_filter.name}%'")
+                where_conditions.append(f"name ILIKE '%' || {params.add(search_filter.name)} || '%'")
             
             where_clause = "WHERE " + " AND ".join(where_conditions) if where_conditions else ""
             
             # 페이지네이션
             offset = (search_filter.page - 1) * search_filter.size
             
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"SELECT id, user_id, name, business_number, company_type, address, description, status, created_at, updated_at FROM companies {where_clause} ORDER BY created_at DESC LIMIT {search_filter.size} OFFSET {offset}"
+            result = await execute_sql(
+                f"SELECT {COMPANY_COLUMNS} FROM companies {where_clause} ORDER BY created_at DESC "
+                f"LIMIT {params.add(search_filter.size)} OFFSET {params.add(offset)}",
+                *params.values
             )
             
             if result:
@@ -146,9 +149,8 @@ class CompanyService:
     async def get_wholesale_companies() -> List[CompanyResponse]:
         """도매업체 목록 조회 (소매업체가 거래 신청할 때 사용)"""
         try:
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query="SELECT id, user_id, name, business_number, company_type, address, description, status, created_at, updated_at FROM companies WHERE company_type = 'wholesale' AND status = 'active' ORDER BY name ASC"
+            result = await execute_sql(
+                f"SELECT {COMPANY_COLUMNS} FROM companies WHERE company_type = 'wholesale' AND status = 'active' ORDER BY name ASC"
             )
             
             if result:
@@ -164,9 +166,9 @@ class CompanyService:
         """거래 관계 신청 (소매업체가 도매업체에 신청)"""
         try:
             # 중복 관계 확인
-            existing = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"SELECT id FROM company_relationships WHERE wholesale_company_id = '{relationship_data.wholesale_company_id}' AND retail_company_id = '{relationship_data.retail_company_id}'"
+            existing = await execute_sql(
+                "SELECT id FROM company_relationships WHERE wholesale_company_id = $1 AND retail_company_id = $2",
+                str(relationship_data.wholesale_company_id), str(relationship_data.retail_company_id)
             )
             
             if existing and len(existing) > 0:
@@ -174,9 +176,10 @@ class CompanyService:
             
             relationship_id = str(uuid.uuid4())
             
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"INSERT INTO company_relationships (id, wholesale_company_id, retail_company_id, status) VALUES ('{relationship_id}', '{relationship_data.wholesale_company_id}', '{relationship_data.retail_company_id}', 'pending') RETURNING id, wholesale_company_id, retail_company_id, status, created_at"
+            result = await execute_sql(
+                "INSERT INTO company_relationships (id, wholesale_company_id, retail_company_id, status) "
+                "VALUES ($1, $2, $3, 'pending') RETURNING id, wholesale_company_id, retail_company_id, status, created_at",
+                relationship_id, str(relationship_data.wholesale_company_id), str(relationship_data.retail_company_id)
             )
             
             if result and len(result) > 0:
@@ -191,9 +194,10 @@ class CompanyService:
     async def update_relationship_status(relationship_id: str, update_data: CompanyRelationshipUpdate) -> Optional[CompanyRelationshipResponse]:
         """거래 관계 승인/거부 (도매업체가 처리)"""
         try:
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"UPDATE company_relationships SET status = '{update_data.status}', updated_at = NOW() WHERE id = '{relationship_id}' RETURNING id, wholesale_company_id, retail_company_id, status, created_at"
+            result = await execute_sql(
+                "UPDATE company_relationships SET status = $1, updated_at = NOW() WHERE id = $2 "
+                "RETURNING id, wholesale_company_id, retail_company_id, status, created_at",
+                update_data.status, str(relationship_id)
             )
             
             if result and len(result) > 0:
@@ -210,29 +214,26 @@ class CompanyService:
         try:
             if company_type == "wholesale":
                 # 도매업체: 자신을 도매업체로 하는 관계들
-                query = f"""
+                query = """
                     SELECT cr.id, cr.wholesale_company_id, cr.retail_company_id, cr.status, cr.created_at,
                            c.name as retail_company_name, c.business_number as retail_business_number
                     FROM company_relationships cr
                     JOIN companies c ON c.id = cr.retail_company_id
-                    WHERE cr.wholesale_company_id = '{company_id}'
+                    WHERE cr.wholesale_company_id = $1
                     ORDER BY cr.created_at DESC
                 """
             else:
                 # 소매업체: 자신을 소매업체로 하는 관계들
-                query = f"""
+                query = """
                     SELECT cr.id, cr.wholesale_company_id, cr.retail_company_id, cr.status, cr.created_at,
                            c.name as wholesale_company_name, c.business_number as wholesale_business_number
                     FROM company_relationships cr
                     JOIN companies c ON c.id = cr.wholesale_company_id
-                    WHERE cr.retail_company_id = '{company_id}'
+                    WHERE cr.retail_company_id = $1
                     ORDER BY cr.created_at DESC
                 """
             
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=query
-            )
+            result = await execute_sql(query, str(company_id))
             
             if result:
                 return [CompanyRelationshipResponse(**rel) for rel in result]
@@ -247,9 +248,9 @@ class CompanyService:
         """회사 권한 확인"""
         try:
             # 사용자가 해당 회사의 소유자인지 확인
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"SELECT id FROM companies WHERE id = '{company_id}' AND user_id = '{user_id}' AND status = 'active'"
+            result = await execute_sql(
+                "SELECT id FROM companies WHERE id = $1 AND user_id = $2 AND status = 'active'",
+                str(company_id), str(user_id)
             )
             
             return bool(result and len(result) > 0)
@@ -262,9 +263,10 @@ class CompanyService:
     async def check_trading_relationship(wholesale_company_id: str, retail_company_id: str) -> bool:
         """거래 관계 승인 여부 확인"""
         try:
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"SELECT id FROM company_relationships WHERE wholesale_company_id = '{wholesale_company_id}' AND retail_company_id = '{retail_company_id}' AND status = 'approved'"
+            result = await execute_sql(
+                "SELECT id FROM company_relationships WHERE wholesale_company_id = $1 AND retail_company_id = $2 "
+                "AND status = 'approved'",
+                str(wholesale_company_id), str(retail_company_id)
             )
             
             return bool(result and len(result) > 0)
@@ -278,9 +280,10 @@ class CompanyService:
         """회사 통계 정보 조회"""
         try:
             # 기본 통계 (현재는 관계만 조회, 나중에 상품/주문 통계 추가)
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"SELECT COUNT(*) as total_relationships, COUNT(CASE WHEN status = 'pending' THEN 1 END) as pending_relationships FROM company_relationships WHERE wholesale_company_id = '{company_id}' OR retail_company_id = '{company_id}'"
+            result = await execute_sql(
+                "SELECT COUNT(*) as total_relationships, COUNT(CASE WHEN status = 'pending' THEN 1 END) as pending_relationships "
+                "FROM company_relationships WHERE wholesale_company_id = $1 OR retail_company_id = $1",
+                str(company_id)
             )
             
             if result and len(result) > 0:
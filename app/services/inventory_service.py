@@ -1,11 +1,12 @@
 """
 재고 관리 서비스
-PostgreSQL Row-level 락킹을 통한 동시성 제어 구현
+PostgreSQL 단일 UPDATE 행 락과 트랜잭션을 통한 동시성 제어 구현
 """
 
+import asyncio
 import logging
 import uuid
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, AsyncIterator
 from datetime import datetime
 
 from models.product import (
@@ -13,7 +14,10 @@ from models.product import (
     InventoryTransactionResponse, StockAdjustment, StockIn, 
     LowStockAlert, InventoryStats
 )
-from services.real_supabase_service import real_supabase_service
+import config
+from database import execute_sql, stream_sql, transaction, QueryParams
+from utils.snapshot_cache import dashboard_cache
+from utils.event_bus import event_bus
 
 logger = logging.getLogger(__name__)
 
@@ -25,9 +29,9 @@ class InventoryService:
     async def get_inventory_by_product_id(product_id: str) -> Optional[InventoryResponse]:
         """상품별 재고 조회"""
         try:
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"SELECT inv.id, inv.product_id, inv.current_stock, inv.minimum_stock, inv.last_updated, p.name as product_name, p.code as product_code FROM inventory inv JOIN products p ON inv.product_id = p.id WHERE inv.product_id = '{product_id}'"
+            result = await execute_sql(
+                "SELECT inv.id, inv.product_id, inv.current_stock, inv.minimum_stock, inv.last_updated, p.name as product_name, p.code as product_code FROM inventory inv JOIN products p ON inv.product_id = p.id WHERE inv.product_id = $1",
+                product_id
             )
             
             if not result:
@@ -46,17 +50,15 @@ class InventoryService:
     async def get_company_inventory(company_id: str) -> List[InventoryResponse]:
         """회사별 재고 목록 조회"""
         try:
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            result = await execute_sql("""
                 SELECT 
                     inv.id, inv.product_id, inv.current_stock, inv.minimum_stock, inv.last_updated,
                     p.name as product_name, p.code as product_code
                 FROM inventory inv
                 JOIN products p ON inv.product_id = p.id
-                WHERE p.company_id = '{company_id}' AND p.is_active = true
+                WHERE p.company_id = $1 AND p.is_active = true
                 ORDER BY p.name ASC
-            """)
+            """, company_id)
             
             inventories = []
             if result:
@@ -75,9 +77,13 @@ class InventoryService:
     async def update_stock_with_lock(product_id: str, quantity_change: int, 
                                    transaction_type: str, reference_type: Optional[str] = None,
                                    reference_id: Optional[str] = None, notes: Optional[str] = None,
-                                   created_by: str = None) -> Tuple[bool, Optional[str]]:
+                                   created_by: str = None, company_id: Optional[str] = None) -> Tuple[bool, Optional[str]]:
         """
-        재고 업데이트 (PostgreSQL Row-level 락킹 사용)
+        재고 업데이트 (단일 UPDATE ... RETURNING 으로 원자적 증감)
+        
+        재고 증감과 거래내역 기록을 하나의 트랜잭션으로 실행함.
+        UPDATE 가 행 락을 잡은 상태에서 재고 부족 여부를 함께 검사하므로
+        별도의 SELECT ... FOR UPDATE 왕복이 필요 없음.
         
         Args:
             product_id: 상품 ID
@@ -87,85 +93,116 @@ class InventoryService:
             reference_id: 참조 ID
             notes: 메모
             created_by: 생성자 ID
+            company_id: 상품 소유 회사 ID (지정 시 커밋 후 대시보드 재고 부족 이벤트 발행)
             
         Returns:
             Tuple[bool, Optional[str]]: (성공 여부, 오류 메시지)
         """
         try:
-            # 트랜잭션 시작 및 Row-level 락킹
-            lock_result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
-                SELECT current_stock, minimum_stock 
-                FROM inventory 
-                WHERE product_id = '{product_id}' 
-                FOR UPDATE
-            """)
-            
-            if not lock_result:
-                return False, "재고 정보를 찾을 수 없습니다"
-            
-            current_stock = lock_result[0]['current_stock']
-            minimum_stock = lock_result[0]['minimum_stock']
-            new_stock = current_stock + quantity_change
-            
-            # 재고 부족 확인 (출고 시)
-            if new_stock < 0:
-                return False, f"재고가 부족합니다 (현재: {current_stock}, 요청: {abs(quantity_change)})"
-            
-            # 재고 업데이트
-            update_result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
-                UPDATE inventory 
-                SET current_stock = {new_stock}, last_updated = NOW()
-                WHERE product_id = '{product_id}'
-            """)
-            
-            if not update_result:
-                return False, "재고 업데이트에 실패했습니다"
-            
-            # 재고 거래내역 기록
-            transaction_id = str(uuid.uuid4())
-            await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
-                INSERT INTO inventory_transactions (
-                    id, product_id, transaction_type, quantity, 
-                    previous_stock, current_stock, reference_type, reference_id, 
-                    notes, created_by
-                )
-                VALUES (
-                    '{transaction_id}', '{product_id}', '{transaction_type}', {abs(quantity_change)},
-                    {current_stock}, {new_stock}, 
-                    {f"'{reference_type}'" if reference_type else "NULL"},
-                    {f"'{reference_id}'" if reference_id else "NULL"},
-                    {f"'{notes}'" if notes else "NULL"},
-                    {f"'{created_by}'" if created_by else "NULL"}
-                )
-            """)
+            async with transaction():
+                # 재고 증감 (재고 부족 시 갱신되는 행 없음)
+                update_result = await execute_sql("""
+                    UPDATE inventory 
+                    SET current_stock = current_stock + $2, last_updated = NOW()
+                    WHERE product_id = $1 AND current_stock + $2 >= 0
+                    RETURNING current_stock - $2 AS previous_stock, current_stock, minimum_stock
+                """, product_id, quantity_change)
+                
+                if not update_result:
+                    return False, await InventoryService._stock_update_failure_reason(product_id, quantity_change)
+                
+                previous_stock = update_result[0]['previous_stock']
+                new_stock = update_result[0]['current_stock']
+                minimum_stock = update_result[0]['minimum_stock']
+                
+                # 재고 거래내역 기록
+                transaction_id = str(uuid.uuid4())
+                await execute_sql("""
+                    INSERT INTO inventory_transactions (
+                        id, product_id, transaction_type, quantity, 
+                        previous_stock, current_stock, reference_type, reference_id, 
+                        notes, created_by
+                    )
+                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
+                """, transaction_id, product_id, transaction_type, abs(quantity_change),
+                    previous_stock, new_stock, reference_type or None, reference_id or None,
+                    notes or None, created_by or None)
             
             # 안전재고 알림 확인
             if new_stock <= minimum_stock and minimum_stock > 0:
                 logger.warning(f"안전재고 알림: 상품 {product_id}, 현재재고: {new_stock}, 최소재고: {minimum_stock}")
             
+            if company_id:
+                InventoryService.publish_stock_changes(company_id, [{
+                    'product_id': product_id,
+                    'previous_stock': previous_stock,
+                    'current_stock': new_stock,
+                    'minimum_stock': minimum_stock
+                }])
+            
             return True, None
             
         except Exception as e:
             logger.error(f"재고 업데이트 오류: {str(e)}")
             return False, f"재고 업데이트 중 오류가 발생했습니다: {str(e)}"
     
+    @staticmethod
+    def _low_stock_delta(previous_stock: int, current_stock: int, minimum_stock: int) -> int:
+        """재고 부족 상품 수 변화 (-1, 0, 1 / 재고 통계와 같은 기준: 최소재고 > 0 이고 현재고 <= 최소재고)"""
+        if minimum_stock <= 0:
+            return 0
+        return int(current_stock <= minimum_stock) - int(previous_stock <= minimum_stock)
+    
+    @staticmethod
+    def publish_stock_changes(company_id: str, changes: List[Dict[str, Any]]) -> None:
+        """
+        재고 변화에 따른 대시보드 이벤트 발행 (커밋 이후 호출)
+        
+        안전재고 경계를 넘은 상품만 lowStock 증감으로 합산하고,
+        새로 재고 부족이 된 상품은 low_stock 알림을 함께 발행함.
+        
+        Args:
+            company_id: 상품 소유 회사 ID
+            changes: product_id, previous_stock, current_stock, minimum_stock 목록
+        """
+        low_stock_delta = 0
+        for change in changes:
+            delta = InventoryService._low_stock_delta(
+                change['previous_stock'], change['current_stock'], change['minimum_stock']
+            )
+            low_stock_delta += delta
+            if delta > 0:
+                event_bus.publish("low_stock", {
+                    "product_id": str(change['product_id']),
+                    "current_stock": change['current_stock'],
+                    "minimum_stock": change['minimum_stock']
+                }, company_ids=[company_id])
+        
+        if low_stock_delta:
+            event_bus.publish("dashboard", {"lowStock": low_stock_delta}, company_ids=[company_id])
+    
+    @staticmethod
+    async def _stock_update_failure_reason(product_id: str, quantity_change: int) -> str:
+        """재고 증감 실패 사유 조회 (재고 정보 없음 / 재고 부족)"""
+        result = await execute_sql(
+            "SELECT current_stock FROM inventory WHERE product_id = $1",
+            product_id
+        )
+        if not result:
+            return "재고 정보를 찾을 수 없습니다"
+        
+        current_stock = result[0]['current_stock']
+        return f"재고가 부족합니다 (현재: {current_stock}, 요청: {abs(quantity_change)})"
+    
     @staticmethod
     async def stock_adjustment(adjustment: StockAdjustment, user_id: str, company_id: str) -> Tuple[bool, Optional[str]]:
         """재고 조정"""
         try:
             # 상품 소유권 확인
-            ownership_check = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            ownership_check = await execute_sql("""
                 SELECT id FROM products 
-                WHERE id = '{adjustment.product_id}' AND company_id = '{company_id}'
-            """)
+                WHERE id = $1 AND company_id = $2
+            """, str(adjustment.product_id), company_id)
             
             if not ownership_check:
                 return False, "재고 조정 권한이 없는 상품입니다"
@@ -177,9 +214,13 @@ class InventoryService:
                 transaction_type="adjustment",
                 reference_type="adjustment",
                 notes=adjustment.reason,
-                created_by=user_id
+                created_by=user_id,
+                company_id=company_id
             )
             
+            if success:
+                dashboard_cache.invalidate(company_id)
+            
             return success, error
             
         except Exception as e:
@@ -191,12 +232,10 @@ class InventoryService:
         """입고 등록"""
         try:
             # 상품 소유권 확인
-            ownership_check = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            ownership_check = await execute_sql("""
                 SELECT id FROM products 
-                WHERE id = '{stock_in_data.product_id}' AND company_id = '{company_id}'
-            """)
+                WHERE id = $1 AND company_id = $2
+            """, str(stock_in_data.product_id), company_id)
             
             if not ownership_check:
                 return False, "입고 등록 권한이 없는 상품입니다"
@@ -208,9 +247,13 @@ class InventoryService:
                 transaction_type="in",
                 reference_type="initial",
                 notes=stock_in_data.notes,
-                created_by=user_id
+                created_by=user_id,
+                company_id=company_id
             )
             
+            if success:
+                dashboard_cache.invalidate(company_id)
+            
             return success, error
             
         except Exception as e:
@@ -238,8 +281,120 @@ class InventoryService:
             return False, f"재고 예약 중 오류가 발생했습니다: {str(e)}"
     
     @staticmethod
-    async def cancel_stock_reservation(product_id: str, quantity: int, order_id: str) -> Tuple[bool, Optional[str]]:
-        """재고 예약 취소 (주문 취소 시)"""
+    async def bulk_reserve_stock(items: List[Dict[str, Any]], order_id: str,
+                                 created_by: Optional[str] = None) -> Tuple[bool, List[Dict[str, Any]]]:
+        """
+        여러 상품 재고 일괄 예약 (전부 성공 또는 전부 실패)
+        
+        단일 SQL 문에서 요청 상품의 재고 행을 product_id 순으로 잠그고,
+        모든 상품의 재고가 충분한 경우에만 재고 차감과 거래내역 기록을 함께 수행함.
+        하나라도 부족하거나 재고 정보가 없으면 어떤 행도 변경되지 않음.
+        
+        Args:
+            items: [{"product_id": str, "quantity": int}, ...]
+            order_id: 주문 ID (거래내역 참조 ID)
+            created_by: 생성자 ID
+            
+        Returns:
+            Tuple[bool, List[Dict]]: (예약 성공 여부, 각 상품별 재고 정보)
+            
+        Raises:
+            Exception: 쿼리 실행 실패 (재고 부족으로 보고하지 않고 호출자의 트랜잭션이 롤백되도록 전파)
+        """
+        try:
+            # 같은 상품이 여러 번 요청된 경우 수량 합산
+            quantities: Dict[str, int] = {}
+            for item in items:
+                product_id = str(item['product_id'])
+                quantities[product_id] = quantities.get(product_id, 0) + item['quantity']
+            
+            result = await execute_sql("""
+                WITH requested AS (
+                    SELECT product_id, quantity
+                    FROM unnest($1::uuid[], $2::int[]) AS r(product_id, quantity)
+                ),
+                locked AS (
+                    SELECT inv.product_id, inv.current_stock, inv.minimum_stock, r.quantity
+                    FROM inventory inv
+                    JOIN requested r ON inv.product_id = r.product_id
+                    ORDER BY inv.product_id
+                    FOR UPDATE OF inv
+                ),
+                availability AS (
+                    SELECT COUNT(*) = (SELECT COUNT(*) FROM requested)
+                           AND COALESCE(bool_and(current_stock >= quantity), false) AS reserved
+                    FROM locked
+                ),
+                updated AS (
+                    UPDATE inventory inv
+                    SET current_stock = inv.current_stock - l.quantity, last_updated = NOW()
+                    FROM locked l, availability a
+                    WHERE inv.product_id = l.product_id AND a.reserved
+                    RETURNING inv.product_id, inv.current_stock + l.quantity AS previous_stock,
+                              inv.current_stock, l.quantity
+                ),
+                ledger AS (
+                    INSERT INTO inventory_transactions (
+                        id, product_id, transaction_type, quantity,
+                        previous_stock, current_stock, reference_type, reference_id,
+                        notes, created_by
+                    )
+                    SELECT gen_random_uuid(), u.product_id, 'out', u.quantity,
+                           u.previous_stock, u.current_stock, 'order', $3,
+                           '주문으로 인한 재고 예약', $4
+                    FROM updated u
+                    RETURNING product_id
+                )
+                SELECT l.product_id, p.name as product_name, p.code as product_code,
+                       l.current_stock, l.minimum_stock, l.quantity as required_quantity,
+                       (SELECT reserved FROM availability) as reserved
+                FROM locked l
+                JOIN products p ON l.product_id = p.id
+            """, list(quantities.keys()), list(quantities.values()), order_id, created_by or None)
+            
+            if result is None:
+                # 트랜잭션 밖에서는 execute_sql 이 오류 시 None 반환 (빈 목록은 재고 정보 없음)
+                raise RuntimeError("재고 예약 쿼리 실행에 실패했습니다")
+            
+            stock_info = {str(row['product_id']): row for row in result}
+            reserved = bool(result) and bool(result[0]['reserved']) and len(stock_info) == len(quantities)
+            
+            availability_results = []
+            for product_id, required_quantity in quantities.items():
+                row = stock_info.get(product_id)
+                if row is None:
+                    # 재고 정보를 찾을 수 없음
+                    availability_results.append({
+                        'product_id': product_id,
+                        'product_name': 'Unknown',
+                        'product_code': 'Unknown',
+                        'current_stock': 0,
+                        'required_quantity': required_quantity,
+                        'is_available': False
+                    })
+                    continue
+                
+                # 예약 성공 시 current_stock 은 차감 전 재고
+                availability_results.append({
+                    'product_id': product_id,
+                    'product_name': row['product_name'],
+                    'product_code': row['product_code'],
+                    'current_stock': row['current_stock'],
+                    'minimum_stock': row.get('minimum_stock', 0),
+                    'required_quantity': required_quantity,
+                    'is_available': row['current_stock'] >= required_quantity
+                })
+            
+            return reserved, availability_results
+            
+        except Exception as e:
+            logger.error(f"일괄 재고 예약 오류: {str(e)}")
+            raise
+    
+    @staticmethod
+    async def cancel_stock_reservation(product_id: str, quantity: int, order_id: str,
+                                       company_id: Optional[str] = None) -> Tuple[bool, Optional[str]]:
+        """재고 예약 취소 (주문 취소 시, company_id 는 도매업체 ID)"""
         try:
             # 재고 복원 (Row-level 락킹 적용)
             success, error = await InventoryService.update_stock_with_lock(
@@ -248,7 +403,8 @@ class InventoryService:
                 transaction_type="in",
                 reference_type="order",
                 reference_id=order_id,
-                notes="주문 취소로 인한 재고 복원"
+                notes="주문 취소로 인한 재고 복원",
+                company_id=company_id
             )
             
             return success, error
@@ -264,18 +420,17 @@ class InventoryService:
         """재고 거래내역 조회"""
         try:
             conditions = []
+            params = QueryParams()
             
             if product_id:
-                conditions.append(f"it.product_id = '{product_id}'")
+                conditions.append(f"it.product_id = {params.add(product_id)}")
             
             if company_id:
-                conditions.append(f"p.company_id = '{company_id}'")
+                conditions.append(f"p.company_id = {params.add(company_id)}")
             
             where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
             
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            result = await execute_sql(f"""
                 SELECT 
                     it.id, it.product_id, it.transaction_type, it.quantity,
                     it.previous_stock, it.current_stock, it.reference_type, it.reference_id,
@@ -287,8 +442,8 @@ class InventoryService:
                 LEFT JOIN users u ON it.created_by = u.id
                 {where_clause}
                 ORDER BY it.created_at DESC
-                LIMIT {limit}
-            """)
+                LIMIT {params.add(limit)}
+            """, *params.values)
             
             transactions = []
             if result:
@@ -301,25 +456,68 @@ class InventoryService:
             logger.error(f"재고 거래내역 조회 오류: {str(e)}")
             return []
     
+    # 재고 거래내역 내보내기 컬럼 (순서대로 CSV 헤더/NDJSON 키)
+    TRANSACTION_EXPORT_COLUMNS = [
+        "id", "created_at", "product_id", "product_code", "product_name",
+        "transaction_type", "quantity", "previous_stock", "current_stock",
+        "reference_type", "reference_id", "notes", "created_by_name"
+    ]
+    
+    @staticmethod
+    def export_inventory_transactions(company_id: str, product_id: Optional[str] = None,
+                                      transaction_type: Optional[str] = None,
+                                      start_date: Optional[datetime] = None,
+                                      end_date: Optional[datetime] = None,
+                                      batch_size: int = 1000) -> AsyncIterator[Any]:
+        """
+        재고 거래내역 내보내기 행 스트림 (회사 전체, 기간/상품/유형 필터)
+        
+        서버 측 커서로 읽으며 행마다 모델 객체를 만들지 않음
+        """
+        params = QueryParams()
+        conditions = [f"p.company_id = {params.add(company_id)}"]
+        
+        if product_id:
+            conditions.append(f"it.product_id = {params.add(product_id)}")
+        
+        if transaction_type:
+            conditions.append(f"it.transaction_type = {params.add(transaction_type)}")
+        
+        if start_date:
+            conditions.append(f"it.created_at >= {params.add(start_date)}")
+        
+        if end_date:
+            conditions.append(f"it.created_at <= {params.add(end_date)}")
+        
+        return stream_sql(f"""
+            SELECT 
+                it.id, it.created_at, it.product_id, p.code as product_code, p.name as product_name,
+                it.transaction_type, it.quantity, it.previous_stock, it.current_stock,
+                it.reference_type, it.reference_id, it.notes, u.name as created_by_name
+            FROM inventory_transactions it
+            JOIN products p ON it.product_id = p.id
+            LEFT JOIN users u ON it.created_by = u.id
+            WHERE {" AND ".join(conditions)}
+            ORDER BY it.created_at, it.id
+        """, *params.values, batch_size=batch_size)
+    
     @staticmethod
     async def get_low_stock_alerts(company_id: str) -> List[LowStockAlert]:
         """안전재고 미달 알림 조회"""
         try:
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            result = await execute_sql("""
                 SELECT 
                     p.id as product_id, p.name as product_name, p.code as product_code,
                     inv.current_stock, inv.minimum_stock,
                     (inv.minimum_stock - inv.current_stock) as shortage
                 FROM inventory inv
                 JOIN products p ON inv.product_id = p.id
-                WHERE p.company_id = '{company_id}' 
+                WHERE p.company_id = $1 
                 AND p.is_active = true
                 AND inv.current_stock <= inv.minimum_stock
                 AND inv.minimum_stock > 0
                 ORDER BY shortage DESC
-            """)
+            """, company_id)
             
             alerts = []
             if result:
@@ -334,30 +532,32 @@ class InventoryService:
     
     @staticmethod
     async def get_inventory_stats(company_id: str) -> InventoryStats:
-        """재고 통계 조회"""
+        """
+        재고 통계 조회
+        
+        트리거로 증분 유지되는 회사별 집계 행(database/inventory_stats.sql)의 합계만 읽으므로
+        상품 수와 무관하게 샤드 수만큼의 행만 조회함.
+        집계 행이 없으면 (마이그레이션 전 또는 재고 없는 회사) 재고 테이블에서 직접 계산
+        """
         try:
-            # 기본 통계 조회
-            stats_result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            stats_result = await execute_sql("""
                 SELECT 
-                    COUNT(*) as total_products,
-                    COUNT(*) FILTER (WHERE p.is_active = true) as active_products,
-                    COUNT(*) FILTER (WHERE inv.current_stock <= inv.minimum_stock AND inv.minimum_stock > 0) as low_stock_products,
-                    COUNT(*) FILTER (WHERE inv.current_stock = 0) as out_of_stock_products,
-                    COALESCE(SUM(inv.current_stock * p.wholesale_price), 0) as total_inventory_value
-                FROM inventory inv
-                JOIN products p ON inv.product_id = p.id
-                WHERE p.company_id = '{company_id}'
-            """)
-            
-            if stats_result:
-                return InventoryStats(**dict(stats_result[0]))
-            else:
-                return InventoryStats(
-                    total_products=0, active_products=0, low_stock_products=0,
-                    out_of_stock_products=0, total_inventory_value=0
-                )
+                    COUNT(*) as shards,
+                    COALESCE(SUM(total_products), 0)::bigint as total_products,
+                    COALESCE(SUM(active_products), 0)::bigint as active_products,
+                    COALESCE(SUM(low_stock_products), 0)::bigint as low_stock_products,
+                    COALESCE(SUM(out_of_stock_products), 0)::bigint as out_of_stock_products,
+                    COALESCE(SUM(total_inventory_value), 0)::bigint as total_inventory_value
+                FROM inventory_stats
+                WHERE company_id = $1
+            """, company_id)
+            
+            if stats_result and stats_result[0].get('shards'):
+                stats_dict = dict(stats_result[0])
+                stats_dict.pop('shards')
+                return InventoryStats(**stats_dict)
+            
+            return await InventoryService._compute_inventory_stats(company_id)
             
         except Exception as e:
             logger.error(f"재고 통계 조회 오류: {str(e)}")
@@ -366,28 +566,162 @@ class InventoryService:
                 out_of_stock_products=0, total_inventory_value=0
             )
     
+    @staticmethod
+    async def _compute_inventory_stats(company_id: str) -> InventoryStats:
+        """재고 통계 직접 계산 (회사 전체 상품 집계)"""
+        stats_result = await execute_sql("""
+            SELECT 
+                COUNT(*) as total_products,
+                COUNT(*) FILTER (WHERE p.is_active = true) as active_products,
+                COUNT(*) FILTER (WHERE inv.current_stock <= inv.minimum_stock AND inv.minimum_stock > 0) as low_stock_products,
+                COUNT(*) FILTER (WHERE inv.current_stock = 0) as out_of_stock_products,
+                COALESCE(SUM(inv.current_stock::bigint * p.wholesale_price), 0) as total_inventory_value
+            FROM inventory inv
+            JOIN products p ON inv.product_id = p.id
+            WHERE p.company_id = $1
+        """, company_id)
+        
+        if stats_result:
+            return InventoryStats(**dict(stats_result[0]))
+        return InventoryStats(
+            total_products=0, active_products=0, low_stock_products=0,
+            out_of_stock_products=0, total_inventory_value=0
+        )
+    
+    @staticmethod
+    async def reconcile_inventory_stats(repair: bool = True) -> List[Dict[str, Any]]:
+        """
+        재고 집계 드리프트 검사 (주기 작업)
+        
+        재고 테이블에서 직접 계산한 회사별 통계와 집계 행 합계를 비교하고,
+        repair 이면 어긋난 회사의 샤드를 잠근 뒤 다시 계산해 덮어씀.
+        샤드를 먼저 잠그므로 진행 중인 재고 변경은 보정이 끝난 뒤 증분을 반영함.
+        
+        Returns:
+            List[Dict]: 어긋난 회사별 {"company_id", "expected", "stored"}
+        """
+        columns = [
+            "total_products", "active_products", "low_stock_products",
+            "out_of_stock_products", "total_inventory_value"
+        ]
+        result = await execute_sql(f"""
+            WITH actual AS (
+                SELECT 
+                    p.company_id,
+                    COUNT(*) as total_products,
+                    COUNT(*) FILTER (WHERE p.is_active = true) as active_products,
+                    COUNT(*) FILTER (WHERE inv.current_stock <= inv.minimum_stock AND inv.minimum_stock > 0) as low_stock_products,
+                    COUNT(*) FILTER (WHERE inv.current_stock = 0) as out_of_stock_products,
+                    COALESCE(SUM(inv.current_stock::bigint * p.wholesale_price), 0) as total_inventory_value
+                FROM inventory inv
+                JOIN products p ON inv.product_id = p.id
+                GROUP BY p.company_id
+            ),
+            stored AS (
+                SELECT company_id, {", ".join(f"SUM({column}) as {column}" for column in columns)}
+                FROM inventory_stats
+                GROUP BY company_id
+            )
+            SELECT 
+                COALESCE(a.company_id, s.company_id) as company_id,
+                {", ".join(f"COALESCE(a.{column}, 0)::bigint as expected_{column}, COALESCE(s.{column}, 0)::bigint as stored_{column}" for column in columns)}
+            FROM actual a
+            FULL JOIN stored s ON a.company_id = s.company_id
+            WHERE ({", ".join(f"COALESCE(a.{column}, 0)" for column in columns)})
+                IS DISTINCT FROM ({", ".join(f"COALESCE(s.{column}, 0)" for column in columns)})
+        """)
+        
+        drifts = []
+        for row in result or []:
+            company_id = str(row['company_id'])
+            drift = {
+                "company_id": company_id,
+                "expected": {column: row[f"expected_{column}"] for column in columns},
+                "stored": {column: row[f"stored_{column}"] for column in columns}
+            }
+            drifts.append(drift)
+            logger.warning(f"재고 집계 드리프트: 회사 {company_id}, 기대값 {drift['expected']}, 저장값 {drift['stored']}")
+            
+            if repair:
+                await InventoryService._rebuild_inventory_stats(company_id)
+                dashboard_cache.invalidate(company_id)
+        
+        return drifts
+    
+    @staticmethod
+    async def _rebuild_inventory_stats(company_id: str) -> None:
+        """회사 재고 집계 샤드 재계산 (샤드 행을 잠근 뒤 최신 스냅샷으로 덮어씀)"""
+        async with transaction():
+            # 모든 샤드 행을 만들어 둔 뒤 잠가야 보정 중 새 샤드 INSERT 와 엇갈리지 않음
+            await execute_sql("""
+                INSERT INTO inventory_stats (company_id, shard)
+                SELECT $1, shard FROM generate_series(0, 15) AS shard
+                ON CONFLICT (company_id, shard) DO NOTHING
+            """, company_id)
+            await execute_sql("""
+                SELECT shard FROM inventory_stats 
+                WHERE company_id = $1 
+                FOR UPDATE
+            """, company_id)
+            
+            await execute_sql("""
+                WITH actual AS (
+                    SELECT 
+                        inventory_stats_shard(p.id) as shard,
+                        COUNT(*) as total_products,
+                        COUNT(*) FILTER (WHERE p.is_active = true) as active_products,
+                        COUNT(*) FILTER (WHERE inv.current_stock <= inv.minimum_stock AND inv.minimum_stock > 0) as low_stock_products,
+                        COUNT(*) FILTER (WHERE inv.current_stock = 0) as out_of_stock_products,
+                        COALESCE(SUM(inv.current_stock::bigint * p.wholesale_price), 0) as total_inventory_value
+                    FROM inventory inv
+                    JOIN products p ON inv.product_id = p.id
+                    WHERE p.company_id = $1
+                    GROUP BY inventory_stats_shard(p.id)
+                ),
+                cleared AS (
+                    UPDATE inventory_stats s
+                    SET total_products = 0, active_products = 0, low_stock_products = 0,
+                        out_of_stock_products = 0, total_inventory_value = 0, updated_at = NOW()
+                    WHERE s.company_id = $1 
+                    AND s.shard NOT IN (SELECT shard FROM actual)
+                )
+                INSERT INTO inventory_stats (
+                    company_id, shard, total_products, active_products,
+                    low_stock_products, out_of_stock_products, total_inventory_value
+                )
+                SELECT $1, shard, total_products, active_products,
+                       low_stock_products, out_of_stock_products, total_inventory_value
+                FROM actual
+                ON CONFLICT (company_id, shard) DO UPDATE SET
+                    total_products = EXCLUDED.total_products,
+                    active_products = EXCLUDED.active_products,
+                    low_stock_products = EXCLUDED.low_stock_products,
+                    out_of_stock_products = EXCLUDED.out_of_stock_products,
+                    total_inventory_value = EXCLUDED.total_inventory_value,
+                    updated_at = NOW()
+            """, company_id)
+    
     @staticmethod
     async def update_minimum_stock(product_id: str, minimum_stock: int, company_id: str) -> bool:
         """최소 재고량 설정"""
         try:
             # 상품 소유권 확인
-            ownership_check = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            ownership_check = await execute_sql("""
                 SELECT id FROM products 
-                WHERE id = '{product_id}' AND company_id = '{company_id}'
-            """)
+                WHERE id = $1 AND company_id = $2
+            """, product_id, company_id)
             
             if not ownership_check:
                 return False
             
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            result = await execute_sql("""
                 UPDATE inventory 
-                SET minimum_stock = {minimum_stock}, last_updated = NOW()
-                WHERE product_id = '{product_id}'
-            """)
+                SET minimum_stock = $1, last_updated = NOW()
+                WHERE product_id = $2
+            """, minimum_stock, product_id)
+            
+            if result is not None:
+                dashboard_cache.invalidate(company_id)
             
             return result is not None
             
@@ -408,13 +742,11 @@ class InventoryService:
             Tuple[bool, int]: (가용 여부, 현재 재고량)
         """
         try:
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            result = await execute_sql("""
                 SELECT current_stock 
                 FROM inventory 
-                WHERE product_id = '{product_id}'
-            """)
+                WHERE product_id = $1
+            """, product_id)
             
             if not result:
                 return False, 0
@@ -441,18 +773,14 @@ class InventoryService:
         """
         try:
             product_ids = [item['product_id'] for item in items]
-            product_ids_str = "', '".join(product_ids)
-            
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            result = await execute_sql("""
                 SELECT 
                     p.id as product_id, p.name as product_name, p.code as product_code,
                     inv.current_stock
                 FROM inventory inv
                 JOIN products p ON inv.product_id = p.id
-                WHERE p.id IN ('{product_ids_str}')
-            """)
+                WHERE p.id = ANY($1::uuid[])
+            """, product_ids)
             
             if not result:
                 return False, []
@@ -506,9 +834,7 @@ class InventoryService:
     async def get_stock_movements(product_id: str, days: int = 30) -> List[InventoryTransactionResponse]:
         """재고 변동 내역 조회 (최근 N일)"""
         try:
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            result = await execute_sql("""
                 SELECT 
                     it.id, it.product_id, it.transaction_type, it.quantity,
                     it.previous_stock, it.current_stock, it.reference_type, it.reference_id,
@@ -518,10 +844,10 @@ class InventoryService:
                 FROM inventory_transactions it
                 JOIN products p ON it.product_id = p.id
                 LEFT JOIN users u ON it.created_by = u.id
-                WHERE it.product_id = '{product_id}'
-                AND it.created_at >= NOW() - INTERVAL '{days} days'
+                WHERE it.product_id = $1
+                AND it.created_at >= NOW() - make_interval(days => $2)
                 ORDER BY it.created_at DESC
-            """)
+            """, product_id, days)
             
             transactions = []
             if result:
@@ -538,20 +864,18 @@ class InventoryService:
     async def get_low_stock_products(company_id: str) -> List[InventoryResponse]:
         """안전재고 미달 상품 조회"""
         try:
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            result = await execute_sql("""
                 SELECT 
                     inv.id, inv.product_id, inv.current_stock, inv.minimum_stock, inv.last_updated,
                     p.name as product_name, p.code as product_code
                 FROM inventory inv
                 JOIN products p ON inv.product_id = p.id
-                WHERE p.company_id = '{company_id}' 
+                WHERE p.company_id = $1 
                 AND p.is_active = true
                 AND inv.current_stock <= inv.minimum_stock
                 AND inv.minimum_stock > 0
                 ORDER BY (inv.minimum_stock - inv.current_stock) DESC
-            """)
+            """, company_id)
             
             inventories = []
             if result:
@@ -564,4 +888,51 @@ class InventoryService:
             
         except Exception as e:
             logger.error(f"안전재고 미달 상품 조회 오류: {str(e)}")
-            return []
\ No newline at end of file
+            return []
+
+
+class InventoryStatsReconciler:
+    """
+    재고 집계 드리프트 주기 검사 작업
+    
+    트리거 밖에서 재고/상품이 변경된 경우(수동 SQL, 트리거 비활성화 등)를 찾아 보정함
+    """
+    
+    def __init__(self, interval_seconds: float):
+        self.interval_seconds = interval_seconds
+        self._task: Optional[asyncio.Task] = None
+        self.last_run_at: Optional[datetime] = None
+        self.last_drift_count = 0
+    
+    async def start(self) -> None:
+        """주기 작업 시작 (interval 0 이면 사용 안 함)"""
+        if self.interval_seconds <= 0 or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """주기 작업 종료"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+    
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                drifts = await InventoryService.reconcile_inventory_stats()
+                self.last_run_at = datetime.utcnow()
+                self.last_drift_count = len(drifts)
+            except Exception as e:
+                logger.error(f"재고 집계 드리프트 검사 오류: {str(e)}")
+
+
+# 재고 집계 드리프트 검사 작업
+inventory_stats_reconciler = InventoryStatsReconciler(
+    interval_seconds=config.settings.INVENTORY_STATS_RECONCILE_INTERVAL_SECONDS
+)
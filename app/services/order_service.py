@@ -3,10 +3,13 @@
 도매업체-소매업체 간 주문 처리 및 재고 연동
 """
 
+import asyncio
 import logging
 import uuid
-from typing import List, Optional, Dict, Any, Tuple
-from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple, AsyncIterator
+from datetime import date, datetime
+
+import config
 
 from models.order import (
     OrderCreate, OrderUpdate, OrderStatusUpdate, OrderResponse,
@@ -15,11 +18,74 @@ from models.order import (
 )
 from services.inventory_service import InventoryService
 from services.company_service import CompanyService
-from database import execute_sql
+from database import execute_sql, stream_sql, transaction, outside_transaction, QueryParams
+from utils.snapshot_cache import dashboard_cache
+from utils.event_bus import event_bus
+from utils.pagination import (
+    InvalidCursorError, keyset_condition, split_page, resolve_total_mode, count_total
+)
 
 logger = logging.getLogger(__name__)
 
 
+class OrderNumberAllocator:
+    """
+    일별 주문 번호 할당기 (YYYYMMDD-XXXX)
+    
+    - order_number_counters 의 날짜별 카운터를 UPSERT ... RETURNING 으로 block_size 만큼 올리고
+      받은 구간을 워커 메모리에서 하나씩 발급함 (주문마다 주문 테이블 스캔/충돌 재시도 없음)
+    - 카운터 갱신은 주문 트랜잭션 밖(트랜잭션 시작 전)에서 자동 커밋으로 실행되어 카운터 행 락을 바로 해제하고,
+      주문 트랜잭션 커넥션을 쥔 채 두 번째 풀 커넥션을 기다리지 않음
+    - 구간 예약은 워커당 하나만 진행하고 동시에 구간이 바닥난 요청은 같은 예약을 기다림 (락을 쥔 채 풀 대기 없음)
+    - 워커마다 다른 구간을 받으므로 번호는 유일하지만 생성 순서와 어긋날 수 있고,
+      재시작/롤백/재고 부족으로 쓰지 않은 번호는 건너뜀
+    """
+    
+    _RESERVE_SQL = """
+        INSERT INTO order_number_counters (order_date, last_value)
+        VALUES ($1, $2)
+        ON CONFLICT (order_date) DO UPDATE
+            SET last_value = order_number_counters.last_value + EXCLUDED.last_value,
+                updated_at = NOW()
+        RETURNING last_value
+    """
+    
+    def __init__(self, block_size: int):
+        self.block_size = max(block_size, 1)
+        self._day: Optional[date] = None
+        self._next = 1
+        self._last = 0
+        self._reserving: Optional[asyncio.Task] = None
+    
+    async def allocate(self, day: Optional[date] = None) -> str:
+        """다음 주문 번호 발급 (현재 구간을 다 쓰면 카운터에서 새 구간 예약)"""
+        day = day or datetime.now().date()
+        while day != self._day or self._next > self._last:
+            # 진행 중인 예약이 있으면 함께 기다리고, 없거나 끝났으면 새로 예약
+            if self._reserving is None or self._reserving.done():
+                self._reserving = asyncio.ensure_future(self._reserve_block(day))
+            await asyncio.shield(self._reserving)
+        # 검사와 증가 사이에 await 가 없으므로 이벤트 루프 안에서 원자적
+        number = self._next
+        self._next += 1
+        return f"{day:%Y%m%d}-{number:04d}"
+    
+    async def _reserve_block(self, day: date) -> None:
+        async with outside_transaction():
+            result = await execute_sql(self._RESERVE_SQL, day, self.block_size)
+        if not result:
+            raise RuntimeError("주문 번호 할당에 실패했습니다")
+        
+        last_value = result[0]['last_value']
+        self._day = day
+        self._next = last_value - self.block_size + 1
+        self._last = last_value
+
+
+# 주문 번호 할당기 (워커별 번호 구간 보관)
+order_number_allocator = OrderNumberAllocator(config.settings.ORDER_NUMBER_BLOCK_SIZE)
+
+
 class OrderService:
     """주문 관리 서비스"""
     
@@ -45,92 +111,87 @@ class OrderService:
             if not relationship_exists:
                 return None, "승인되지 않은 도매업체입니다"
             
-            # 주문 상품들의 재고 가용성 일괄 확인
-            items_for_check = [
-                {"product_id": str(item.product_id), "quantity": item.quantity}
-                for item in order_data.items
-            ]
-            
-            all_available, availability_results = await InventoryService.bulk_check_stock_availability(items_for_check)
-            
-            if not all_available:
-                unavailable_items = [
-                    f"{item['product_name']}(재고:{item['current_stock']}, 요청:{item['required_quantity']})"
-                    for item in availability_results if not item['is_available']
-                ]
-                return None, f"재고 부족: {', '.join(unavailable_items)}"
-            
-            # 주문 번호 생성 (YYYYMMDD-XXXX 형식)
-            today = datetime.now().strftime("%Y%m%d")
-            order_count_result = await execute_sql(f"""
-                SELECT COUNT(*) as count 
-                FROM orders 
-                WHERE order_number LIKE '{today}-%'
-            """)
-            
-            order_count = order_count_result[0]['count'] if order_count_result else 0
-            order_number = f"{today}-{order_count + 1:04d}"
-            
-            # 주문 생성
             order_id = str(uuid.uuid4())
             total_amount = sum(item.quantity * item.unit_price for item in order_data.items)
             
-            order_result = await execute_sql(f"""
-                INSERT INTO orders (
-                    id, order_number, wholesale_company_id, retail_company_id,
-                    status, total_amount, notes, created_by
-                )
-                VALUES (
-                    '{order_id}', '{order_number}', '{order_data.wholesale_company_id}', 
-                    '{retail_company_id}', 'pending', {total_amount}, 
-                    {f"'{order_data.notes}'" if order_data.notes else "NULL"}, '{user_id}'
-                )
-                RETURNING id, order_number, wholesale_company_id, retail_company_id,
-                         status, total_amount, notes, created_by, created_at, updated_at
-            """)
-            
-            if not order_result:
-                return None, "주문 생성에 실패했습니다"
-            
-            # 주문 상품들 생성 및 재고 예약
-            order_items = []
-            for item in order_data.items:
-                # 재고 예약
-                success, error = await InventoryService.reserve_stock(
-                    str(item.product_id), item.quantity, order_id
+            # 주문 번호 발급 (YYYYMMDD-XXXX 형식, 일별 카운터 구간에서 할당)
+            # 구간 예약이 풀 커넥션을 쓰므로 트랜잭션 커넥션을 잡기 전에 발급
+            order_number = await order_number_allocator.allocate()
+            
+            async with transaction():
+                # 전체 상품 재고 일괄 예약 (하나라도 부족하면 변경 없음)
+                reserved, availability_results = await InventoryService.bulk_reserve_stock(
+                    [
+                        {"product_id": str(item.product_id), "quantity": item.quantity}
+                        for item in order_data.items
+                    ],
+                    order_id,
+                    created_by=user_id
                 )
                 
-                if not success:
-                    # 실패 시 이전 예약들 모두 취소
-                    for prev_item in order_items:
-                        await InventoryService.cancel_stock_reservation(
-                            str(prev_item.product_id), prev_item.quantity, order_id
-                        )
-                    
-                    # 주문도 삭제
-                    await execute_sql(f"DELETE FROM orders WHERE id = '{order_id}'")
-                    return None, f"재고 예약 실패: {error}"
+                if not reserved:
+                    unavailable_items = [
+                        f"{item['product_name']}(재고:{item['current_stock']}, 요청:{item['required_quantity']})"
+                        for item in availability_results if not item['is_available']
+                    ]
+                    if not unavailable_items:
+                        return None, "재고 예약에 실패했습니다"
+                    return None, f"재고 부족: {', '.join(unavailable_items)}"
+                
+                # 주문 생성
+                order_result = await execute_sql("""
+                    INSERT INTO orders (
+                        id, order_number, wholesale_company_id, retail_company_id,
+                        status, total_amount, notes, created_by
+                    )
+                    VALUES ($1, $2, $3, $4, 'pending', $5, $6, $7)
+                    RETURNING id, order_number, wholesale_company_id, retail_company_id,
+                             status, total_amount, notes, created_by, created_at, updated_at
+                """, order_id, order_number, str(order_data.wholesale_company_id),
+                    retail_company_id, total_amount, order_data.notes or None, user_id)
                 
-                # 주문 상품 생성
-                item_id = str(uuid.uuid4())
-                total_price = item.quantity * item.unit_price
+                if not order_result:
+                    # 예약된 재고까지 함께 ROLLBACK
+                    raise RuntimeError("주문 생성에 실패했습니다")
                 
-                item_result = await execute_sql(f"""
+                # 주문 상품 일괄 생성 (상품 수와 관계없이 동일한 쿼리)
+                items_result = await execute_sql("""
                     INSERT INTO order_items (
                         id, order_id, product_id, quantity, unit_price, total_price
                     )
-                    VALUES (
-                        '{item_id}', '{order_id}', '{item.product_id}', 
-                        {item.quantity}, {item.unit_price}, {total_price}
-                    )
+                    SELECT item.id, $1, item.product_id, item.quantity, item.unit_price,
+                           item.quantity * item.unit_price
+                    FROM unnest($2::uuid[], $3::uuid[], $4::int[], $5::int[])
+                         AS item(id, product_id, quantity, unit_price)
                     RETURNING id, order_id, product_id, quantity, unit_price, total_price, created_at
-                """)
+                """, order_id,
+                    [str(uuid.uuid4()) for _ in order_data.items],
+                    [str(item.product_id) for item in order_data.items],
+                    [item.quantity for item in order_data.items],
+                    [item.unit_price for item in order_data.items])
+                
+                if not items_result or len(items_result) != len(order_data.items):
+                    raise RuntimeError("주문 상품 생성에 실패했습니다")
                 
-                if item_result:
-                    order_items.append(OrderItemResponse(**item_result[0]))
+                order_items = [OrderItemResponse(**dict(row)) for row in items_result]
             
-            # 완성된 주문 정보 반환
+            # 양쪽 회사 대시보드 스냅샷 무효화
+            wholesale_company_id = str(order_data.wholesale_company_id)
+            dashboard_cache.invalidate(wholesale_company_id, retail_company_id)
+            
+            # 실시간 대시보드 이벤트 (오늘 주문 수 증가, 도매업체 재고 부족 수 변화)
             order_dict = dict(order_result[0])
+            OrderService._publish_order_event(order_dict)
+            event_bus.publish("dashboard", {"todayOrders": 1},
+                              company_ids=[wholesale_company_id, retail_company_id])
+            InventoryService.publish_stock_changes(wholesale_company_id, [{
+                'product_id': item['product_id'],
+                'previous_stock': item['current_stock'],
+                'current_stock': item['current_stock'] - item['required_quantity'],
+                'minimum_stock': item.get('minimum_stock', 0)
+            } for item in availability_results])
+            
+            # 완성된 주문 정보 반환
             order_dict['items'] = order_items
             
             return OrderResponse(**order_dict), None
@@ -140,53 +201,83 @@ class OrderService:
             return None, f"주문 생성 중 오류가 발생했습니다: {str(e)}"
     
     @staticmethod
-    async def get_orders(search_filter: OrderSearchFilter, company_id: str, company_type: str) -> OrderListResponse:
-        """주문 목록 조회"""
+    def _publish_order_event(order: Dict[str, Any]) -> None:
+        """주문 생성/상태 변경 이벤트를 양쪽 회사에 발행 (커밋 이후 호출)"""
+        event_bus.publish("order", {
+            "id": str(order['id']),
+            "order_number": order.get('order_number'),
+            "status": order['status'],
+            "wholesale_company_id": str(order['wholesale_company_id']),
+            "retail_company_id": str(order['retail_company_id']),
+            "total_amount": order.get('total_amount'),
+            "updated_at": order.get('updated_at')
+        }, company_ids=[str(order['wholesale_company_id']), str(order['retail_company_id'])])
+    
+    @staticmethod
+    def _order_conditions(search_filter: OrderSearchFilter, company_id: str, company_type: str,
+                          params: QueryParams) -> List[str]:
+        """주문 검색 조건 구성 (목록 조회와 내보내기 공통, 회사 유형별 접근 제어 포함)"""
+        conditions = []
+        
+        # 회사 유형별 접근 제어
+        if company_type == "wholesale":
+            conditions.append(f"o.wholesale_company_id = {params.add(company_id)}")
+        elif company_type == "retail":
+            conditions.append(f"o.retail_company_id = {params.add(company_id)}")
+        
+        if search_filter.status:
+            conditions.append(f"o.status = {params.add(search_filter.status)}")
+        
+        if search_filter.order_number:
+            conditions.append(f"o.order_number ILIKE '%' || {params.add(search_filter.order_number)} || '%'")
+        
+        if search_filter.start_date:
+            conditions.append(f"o.created_at >= {params.add(search_filter.start_date)}")
+        
+        if search_filter.end_date:
+            conditions.append(f"o.created_at <= {params.add(search_filter.end_date)}")
+        
+        if search_filter.min_amount is not None:
+            conditions.append(f"o.total_amount >= {params.add(search_filter.min_amount)}")
+        
+        if search_filter.max_amount is not None:
+            conditions.append(f"o.total_amount <= {params.add(search_filter.max_amount)}")
+        
+        return conditions
+    
+    @staticmethod
+    async def get_orders(search_filter: OrderSearchFilter, company_id: str, company_type: str,
+                         include_items: bool = True) -> OrderListResponse:
+        """
+        주문 목록 조회
+        
+        Args:
+            search_filter: 검색 조건
+            company_id: 회사 ID
+            company_type: 회사 유형 (wholesale, retail)
+            include_items: 주문 상품 목록 포함 여부 (개수만 필요한 경우 False)
+        """
         try:
             # WHERE 조건 구성
-            conditions = []
-            
-            # 회사 유형별 접근 제어
-            if company_type == "wholesale":
-                conditions.append(f"o.wholesale_company_id = '{company_id}'")
-            elif company_type == "retail":
-                conditions.append(f"o.retail_company_id = '{company_id}'")
-            
-            if search_filter.status:
-                conditions.append(f"o.status = '{search_filter.status}'")
-            
-            if search_filter.order_number:
-                conditions.append(f"o.order_number ILIKE '%{search_filter.order_number}%'")
-            
-            if search_filter.start_date:
-                conditions.append(f"o.created_at >= '{search_filter.start_date.isoformat()}'")
-            
-            if search_filter.end_date:
-                conditions.append(f"o.created_at <= '{search_filter.end_date.isoformat()}'")
-            
-            if search_filter.min_amount is not None:
-                conditions.append(f"o.total_amount >= {search_filter.min_amount}")
-            
-            if search_filter.max_amount is not None:
-                conditions.append(f"o.total_amount <= {search_filter.max_amount}")
+            params = QueryParams()
+            conditions = OrderService._order_conditions(search_filter, company_id, company_type, params)
             
             where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
+            total_mode = resolve_total_mode(search_filter.total_mode, search_filter.cursor)
+            filter_params = list(params.values)
             
-            # 총 개수 조회
-            count_result = await execute_sql(f"""
-                SELECT COUNT(*) as total
-                FROM orders o
-                LEFT JOIN companies wc ON o.wholesale_company_id = wc.id
-                LEFT JOIN companies rc ON o.retail_company_id = rc.id
-                {where_clause}
-            """)
-            
-            total = count_result[0]['total'] if count_result else 0
+            # 커서가 있으면 (created_at, id) 키셋 조건으로 OFFSET 없이 다음 페이지 조회
+            offset = 0
+            if search_filter.cursor:
+                conditions.append(keyset_condition(params, ["o.created_at", "o.id"], search_filter.cursor))
+            else:
+                offset = (search_filter.page - 1) * search_filter.size
+            page_where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
             
-            # OFFSET, LIMIT 계산
-            offset = (search_filter.page - 1) * search_filter.size
+            # 총 개수 조회 (조건은 orders 컬럼만 사용)
+            total, total_estimated = await count_total(execute_sql, f"FROM orders o {where_clause}", filter_params, total_mode)
             
-            # 주문 목록 조회
+            # 주문 목록 조회 (다음 페이지 여부 확인을 위해 size + 1 건)
             result = await execute_sql(f"""
                 SELECT 
                     o.id, o.order_number, o.wholesale_company_id, o.retail_company_id,
@@ -198,53 +289,108 @@ class OrderService:
                 LEFT JOIN companies wc ON o.wholesale_company_id = wc.id
                 LEFT JOIN companies rc ON o.retail_company_id = rc.id
                 LEFT JOIN users u ON o.created_by = u.id
-                {where_clause}
-                ORDER BY o.created_at DESC
-                LIMIT {search_filter.size} OFFSET {offset}
-            """)
+                {page_where_clause}
+                ORDER BY o.created_at DESC, o.id DESC
+                LIMIT {params.add(search_filter.size + 1)} OFFSET {params.add(offset)}
+            """, *params.values)
+            
+            rows, has_next, next_cursor = split_page(result, search_filter.size, ["created_at", "id"])
             
             orders = []
-            if result:
-                for row in result:
+            if rows:
+                # 페이지 전체 주문 상품을 한 번에 조회
+                items_by_order = {}
+                if include_items:
+                    items_by_order = await OrderService._get_items_by_order_ids(
+                        [str(row['id']) for row in rows]
+                    )
+                
+                for row in rows:
                     order_dict = dict(row)
-                    
-                    # 주문 상품 목록 조회
-                    items_result = await execute_sql(f"""
-                        SELECT 
-                            oi.id, oi.order_id, oi.product_id, oi.quantity, oi.unit_price, oi.total_price, oi.created_at,
-                            p.name as product_name, p.code as product_code
-                        FROM order_items oi
-                        JOIN products p ON oi.product_id = p.id
-                        WHERE oi.order_id = '{row['id']}'
-                        ORDER BY oi.created_at ASC
-                    """)
-                    
-                    items = []
-                    if items_result:
-                        items = [OrderItemResponse(**dict(item_row)) for item_row in items_result]
-                    
-                    order_dict['items'] = items
+                    order_dict['items'] = items_by_order.get(str(row['id']), [])
                     orders.append(OrderResponse(**order_dict))
             
-            has_next = (offset + search_filter.size) < total
-            
             return OrderListResponse(
                 orders=orders,
                 total=total,
                 page=search_filter.page,
                 size=search_filter.size,
-                has_next=has_next
+                has_next=has_next,
+                next_cursor=next_cursor,
+                total_estimated=total_estimated
             )
             
+        except InvalidCursorError:
+            raise
         except Exception as e:
             logger.error(f"주문 목록 조회 오류: {str(e)}")
             return OrderListResponse(orders=[], total=0, page=1, size=20, has_next=False)
     
+    # 주문 내보내기 컬럼 (순서대로 CSV 헤더/NDJSON 키)
+    EXPORT_COLUMNS = [
+        "id", "order_number", "status", "total_amount",
+        "wholesale_company_id", "wholesale_company_name",
+        "retail_company_id", "retail_company_name",
+        "item_count", "total_quantity", "notes", "created_by_name", "created_at", "updated_at"
+    ]
+    
+    @staticmethod
+    def export_orders(search_filter: OrderSearchFilter, company_id: str, company_type: str,
+                      batch_size: int = 1000) -> AsyncIterator[Any]:
+        """
+        주문 내보내기 행 스트림 (목록 조회와 같은 필터, 페이지 크기/커서는 무시)
+        
+        서버 측 커서로 읽으며 행마다 모델 객체를 만들지 않음.
+        주문 상품은 행을 늘리지 않도록 상품 수/총 수량으로 집계함
+        """
+        params = QueryParams()
+        conditions = OrderService._order_conditions(search_filter, company_id, company_type, params)
+        where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
+        
+        return stream_sql(f"""
+            SELECT 
+                o.id, o.order_number, o.status, o.total_amount,
+                o.wholesale_company_id, wc.name as wholesale_company_name,
+                o.retail_company_id, rc.name as retail_company_name,
+                (SELECT COUNT(*) FROM order_items oi WHERE oi.order_id = o.id) as item_count,
+                (SELECT COALESCE(SUM(oi.quantity), 0) FROM order_items oi WHERE oi.order_id = o.id) as total_quantity,
+                o.notes, u.name as created_by_name, o.created_at, o.updated_at
+            FROM orders o
+            LEFT JOIN companies wc ON o.wholesale_company_id = wc.id
+            LEFT JOIN companies rc ON o.retail_company_id = rc.id
+            LEFT JOIN users u ON o.created_by = u.id
+            {where_clause}
+            ORDER BY o.created_at, o.id
+        """, *params.values, batch_size=batch_size)
+    
+    @staticmethod
+    async def _get_items_by_order_ids(order_ids: List[str]) -> Dict[str, List[OrderItemResponse]]:
+        """여러 주문의 상품 목록을 단일 쿼리로 조회하여 주문 ID별로 그룹화"""
+        items_by_order: Dict[str, List[OrderItemResponse]] = {}
+        if not order_ids:
+            return items_by_order
+        
+        items_result = await execute_sql("""
+            SELECT 
+                oi.id, oi.order_id, oi.product_id, oi.quantity, oi.unit_price, oi.total_price, oi.created_at,
+                p.name as product_name, p.code as product_code
+            FROM order_items oi
+            JOIN products p ON oi.product_id = p.id
+            WHERE oi.order_id = ANY($1::uuid[])
+            ORDER BY oi.order_id, oi.created_at ASC
+        """, order_ids)
+        
+        for item_row in items_result or []:
+            item = OrderItemResponse(**dict(item_row))
+            items_by_order.setdefault(str(item_row['order_id']), []).append(item)
+        
+        return items_by_order
+    
     @staticmethod
     async def get_order_by_id(order_id: str) -> Optional[OrderResponse]:
         """주문 상세 조회"""
         try:
-            result = await execute_sql(f"""
+            result = await execute_sql("""
                 SELECT 
                     o.id, o.order_number, o.wholesale_company_id, o.retail_company_id,
                     o.status, o.total_amount, o.notes, o.created_by, o.created_at, o.updated_at,
@@ -255,8 +401,8 @@ class OrderService:
                 LEFT JOIN companies wc ON o.wholesale_company_id = wc.id
                 LEFT JOIN companies rc ON o.retail_company_id = rc.id
                 LEFT JOIN users u ON o.created_by = u.id
-                WHERE o.id = '{order_id}'
-            """)
+                WHERE o.id = $1
+            """, order_id)
             
             if not result:
                 return None
@@ -264,15 +410,15 @@ class OrderService:
             order_dict = dict(result[0])
             
             # 주문 상품 목록 조회
-            items_result = await execute_sql(f"""
+            items_result = await execute_sql("""
                 SELECT 
                     oi.id, oi.order_id, oi.product_id, oi.quantity, oi.unit_price, oi.total_price, oi.created_at,
                     p.name as product_name, p.code as product_code
                 FROM order_items oi
                 JOIN products p ON oi.product_id = p.id
-                WHERE oi.order_id = '{order_id}'
+                WHERE oi.order_id = $1
                 ORDER BY oi.created_at ASC
-            """)
+            """, order_id)
             
             items = []
             if items_result:
@@ -291,7 +437,7 @@ class OrderService:
         """주문 상태 변경"""
         try:
             # 주문 정보 및 권한 확인
-            order_info = await execute_sql(f"""
+            order_info = await execute_sql("""
                 SELECT 
                     o.id, o.status, o.wholesale_company_id, o.retail_company_id,
                     wc.name as wholesale_company_name,
@@ -299,8 +445,8 @@ class OrderService:
                 FROM orders o
                 LEFT JOIN companies wc ON o.wholesale_company_id = wc.id
                 LEFT JOIN companies rc ON o.retail_company_id = rc.id
-                WHERE o.id = '{order_id}'
-            """)
+                WHERE o.id = $1
+            """, order_id)
             
             if not order_info:
                 return None, "주문을 찾을 수 없습니다"
@@ -337,37 +483,42 @@ class OrderService:
             # 주문 취소 시 재고 복원
             if status_update.status == 'cancelled':
                 # 주문 상품들의 재고 복원
-                items_result = await execute_sql(f"""
+                items_result = await execute_sql("""
                     SELECT product_id, quantity 
                     FROM order_items 
-                    WHERE order_id = '{order_id}'
-                """)
+                    WHERE order_id = $1
+                """, order_id)
                 
                 if items_result:
                     for item in items_result:
                         success, error = await InventoryService.cancel_stock_reservation(
-                            str(item['product_id']), item['quantity'], order_id
+                            str(item['product_id']), item['quantity'], order_id,
+                            company_id=str(order['wholesale_company_id'])
                         )
                         
                         if not success:
                             logger.warning(f"재고 복원 실패: {error}")
             
             # 주문 상태 업데이트
-            update_result = await execute_sql(f"""
+            update_result = await execute_sql("""
                 UPDATE orders 
-                SET status = '{status_update.status}', 
+                SET status = $1, 
                     notes = COALESCE(notes, '') || 
                            CASE WHEN notes IS NOT NULL AND notes != '' THEN '\\n' ELSE '' END ||
-                           '[{status_update.status.upper()}] {status_update.notes or ""}',
+                           $2::text,
                     updated_at = NOW()
-                WHERE id = '{order_id}'
+                WHERE id = $3
                 RETURNING id, order_number, wholesale_company_id, retail_company_id,
                          status, total_amount, notes, created_by, created_at, updated_at
-            """)
+            """, status_update.status,
+                f"[{status_update.status.upper()}] {status_update.notes or ''}", order_id)
             
             if not update_result:
                 return None, "주문 상태 업데이트에 실패했습니다"
             
+            dashboard_cache.invalidate(str(order['wholesale_company_id']), str(order['retail_company_id']))
+            OrderService._publish_order_event({**order, **dict(update_result[0])})
+            
             # 업데이트된 주문 정보 반환
             updated_order = await OrderService.get_order_by_id(order_id)
             return updated_order, None
@@ -382,10 +533,11 @@ class OrderService:
         try:
             # 회사 유형별 조건
             company_condition = ""
+            params = QueryParams()
             if company_type == "wholesale":
-                company_condition = f"WHERE wholesale_company_id = '{company_id}'"
+                company_condition = f"WHERE wholesale_company_id = {params.add(company_id)}"
             elif company_type == "retail":
-                company_condition = f"WHERE retail_company_id = '{company_id}'"
+                company_condition = f"WHERE retail_company_id = {params.add(company_id)}"
             
             result = await execute_sql(f"""
                 SELECT 
@@ -399,7 +551,7 @@ class OrderService:
                     COALESCE(AVG(total_amount), 0) as average_order_value
                 FROM orders 
                 {company_condition}
-            """)
+            """, *params.values)
             
             if result:
                 return OrderStats(**dict(result[0]))
@@ -432,15 +584,14 @@ class OrderService:
             
             # 상품 코드로 상품 정보 조회
             product_codes = [item.product_code for item in quick_order.items]
-            codes_str = "', '".join(product_codes)
             
-            products_result = await execute_sql(f"""
+            products_result = await execute_sql("""
                 SELECT id, code, name, wholesale_price
                 FROM products 
-                WHERE code IN ('{codes_str}') 
-                AND company_id = '{quick_order.wholesale_company_id}'
+                WHERE code = ANY($1::text[]) 
+                AND company_id = $2
                 AND is_active = true
-            """)
+            """, product_codes, str(quick_order.wholesale_company_id))
             
             if not products_result or len(products_result) != len(quick_order.items):
                 found_codes = [p['code'] for p in products_result] if products_result else []
@@ -512,16 +663,16 @@ class OrderService:
         try:
             condition = ""
             if company_type == "wholesale":
-                condition = f"wholesale_company_id = '{company_id}'"
+                condition = "wholesale_company_id = $2"
             elif company_type == "retail":
-                condition = f"retail_company_id = '{company_id}'"
+                condition = "retail_company_id = $2"
             else:
                 return False
             
             result = await execute_sql(f"""
                 SELECT id FROM orders 
-                WHERE id = '{order_id}' AND {condition}
-            """)
+                WHERE id = $1 AND {condition}
+            """, order_id, company_id)
             
             return bool(result)
             
@@ -0,0 +1,441 @@
+"""
+상품 일괄 등록 서비스
+CSV/XLSX 상품 목록을 배치 단위로 검증한 뒤 상품/초기 재고를 한 트랜잭션으로 적재
+"""
+
+import asyncio
+import csv
+import io
+import json
+import logging
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+import config
+from database import execute_sql, transaction
+from models.product import ProductCreate, ProductImportJobResponse
+from services.product_service import ProductService
+from utils.autocomplete_index import product_autocomplete
+
+logger = logging.getLogger(__name__)
+
+# 헤더 → 필드 (영문 필드명 또는 한글 헤더)
+IMPORT_HEADERS: Dict[str, str] = {
+    "code": "code", "상품코드": "code", "코드": "code",
+    "name": "name", "상품명": "name",
+    "category_id": "category_id", "카테고리id": "category_id",
+    "category": "category", "카테고리": "category",
+    "age_group": "age_group", "연령대": "age_group",
+    "gender": "gender", "성별": "gender",
+    "wholesale_price": "wholesale_price", "도매가": "wholesale_price", "도매가격": "wholesale_price",
+    "retail_price": "retail_price", "소매가": "retail_price", "소매가격": "retail_price",
+    "description": "description", "설명": "description", "상품설명": "description",
+    "is_active": "is_active", "판매여부": "is_active",
+    "initial_stock": "initial_stock", "초기재고": "initial_stock", "재고": "initial_stock",
+    "minimum_stock": "minimum_stock", "안전재고": "minimum_stock", "최소재고": "minimum_stock",
+}
+
+_NUMBER_FIELDS = ("wholesale_price", "retail_price", "initial_stock", "minimum_stock")
+_TRUE_VALUES = {"true", "1", "y", "yes", "o", "예", "판매"}
+_FALSE_VALUES = {"false", "0", "n", "no", "x", "아니오", "중지"}
+
+# 배치 적재 쿼리 (WITH import_rows 로 시작, 인메모리 백엔드도 같은 이름으로 분기)
+# - 행 목록을 jsonb 파라미터 하나로 전달해 배치 크기와 관계없이 같은 쿼리 텍스트 유지
+# - 코드 중복은 ON CONFLICT (code) DO NOTHING 으로 걸러 동시 등록과도 경합하지 않고,
+#   INSERT 되지 않은 행을 duplicate_code 로 돌려줌 (트랜잭션 전체 실패 방지)
+# - 없는 카테고리는 INSERT 하지 않고 unknown_category 로 돌려줌
+# - 상품, 재고, 초기 입고 내역을 한 구문으로 적재
+_IMPORT_BATCH_SQL = """
+    WITH import_rows AS (
+        SELECT * FROM jsonb_to_recordset($1::jsonb) AS r(
+            row_number int, id uuid, code text, name text, category_id uuid,
+            age_group text, gender text, wholesale_price int, retail_price int,
+            description text, is_active boolean, initial_stock int, minimum_stock int
+        )
+    ),
+    checked AS (
+        SELECT r.*,
+            CASE
+                WHEN r.category_id IS NOT NULL
+                     AND NOT EXISTS (SELECT 1 FROM categories c WHERE c.id = r.category_id) THEN 'unknown_category'
+            END AS error
+        FROM import_rows r
+    ),
+    inserted AS (
+        INSERT INTO products (
+            id, company_id, code, name, category_id, age_group, gender,
+            wholesale_price, retail_price, description, is_active
+        )
+        SELECT id, $2, code, name, category_id, age_group, gender,
+               wholesale_price, retail_price, description, is_active
+        FROM checked
+        WHERE error IS NULL
+        ON CONFLICT (code) DO NOTHING
+        RETURNING id
+    ),
+    stock AS (
+        INSERT INTO inventory (id, product_id, current_stock, minimum_stock)
+        SELECT gen_random_uuid(), c.id, c.initial_stock, c.minimum_stock
+        FROM checked c
+        JOIN inserted i ON i.id = c.id
+        RETURNING product_id, current_stock
+    ),
+    movements AS (
+        INSERT INTO inventory_transactions (
+            id, product_id, transaction_type, quantity,
+            previous_stock, current_stock, reference_type, reference_id, notes, created_by
+        )
+        SELECT gen_random_uuid(), s.product_id, 'in', s.current_stock,
+               0, s.current_stock, 'initial', $3, '상품 일괄 등록', $4
+        FROM stock s
+        WHERE s.current_stock > 0
+    )
+    SELECT c.row_number, c.id, c.code, c.name, c.is_active,
+           COALESCE(c.error, CASE WHEN i.id IS NULL THEN 'duplicate_code' END) AS error
+    FROM checked c
+    LEFT JOIN inserted i ON i.id = c.id
+"""
+
+_BATCH_ERRORS = {
+    "duplicate_code": "이미 존재하는 상품 코드입니다",
+    "unknown_category": "존재하지 않는 카테고리입니다",
+}
+
+
+class ProductImportError(ValueError):
+    """파일 전체를 처리할 수 없는 오류 (형식, 헤더, 행 수 초과)"""
+
+
+def _normalize_header(header: Any) -> str:
+    return str(header or "").strip().lower().replace(" ", "")
+
+
+def _read_csv(content: bytes) -> Iterator[List[Any]]:
+    """CSV 행 생성 (UTF-8, 실패 시 엑셀 기본 인코딩 CP949)"""
+    try:
+        text = content.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        try:
+            text = content.decode("cp949")
+        except UnicodeDecodeError:
+            raise ProductImportError("CSV 인코딩을 확인할 수 없습니다 (UTF-8 또는 CP949)")
+    yield from csv.reader(io.StringIO(text, newline=""))
+
+
+def _read_xlsx(content: bytes) -> Iterator[List[Any]]:
+    """XLSX 첫 시트 행 생성 (read-only 모드로 행 단위 읽기)"""
+    try:
+        import openpyxl
+    except ImportError:
+        raise ProductImportError("XLSX 파일을 읽으려면 openpyxl 패키지가 필요합니다")
+
+    try:
+        workbook = openpyxl.load_workbook(io.BytesIO(content), read_only=True, data_only=True)
+    except Exception:
+        raise ProductImportError("XLSX 파일을 읽을 수 없습니다")
+    try:
+        for values in workbook.active.iter_rows(values_only=True):
+            yield list(values)
+    finally:
+        workbook.close()
+
+
+def iter_import_rows(content: bytes, file_name: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    파일 형식별 (행 번호, 필드 dict) 생성
+
+    행 번호는 헤더를 1행으로 하는 스프레드시트 기준이며 빈 행은 건너뜀.
+    알 수 없는 헤더 열은 무시함
+    """
+    extension = file_name.rsplit(".", 1)[-1].lower() if "." in file_name else ""
+    if extension == "csv":
+        rows = _read_csv(content)
+    elif extension == "xlsx":
+        rows = _read_xlsx(content)
+    else:
+        raise ProductImportError("CSV 또는 XLSX 파일만 등록할 수 있습니다")
+
+    header = next(rows, None)
+    if header is None:
+        raise ProductImportError("빈 파일입니다")
+    fields = [IMPORT_HEADERS.get(_normalize_header(column)) for column in header]
+    missing = {"code", "name", "age_group", "gender", "wholesale_price"} - set(fields)
+    if missing:
+        raise ProductImportError(f"필수 열이 없습니다: {', '.join(sorted(missing))}")
+
+    for row_number, values in enumerate(rows, start=2):
+        row = {
+            field: value.strip() if isinstance(value, str) else value
+            for field, value in zip(fields, values) if field
+        }
+        row = {field: value for field, value in row.items() if value not in (None, "")}
+        if row:
+            yield row_number, row
+
+
+def _coerce(row: Dict[str, Any], categories: Dict[str, str]) -> Dict[str, Any]:
+    """스프레드시트 표기 정리 (천 단위 쉼표, 판매여부 Y/N, 카테고리명 → ID)"""
+    values = dict(row)
+    for field in _NUMBER_FIELDS:
+        if isinstance(values.get(field), str):
+            values[field] = values[field].replace(",", "").replace("원", "").strip()
+    if isinstance(values.get("is_active"), str):
+        flag = values["is_active"].lower()
+        if flag in _TRUE_VALUES:
+            values["is_active"] = True
+        elif flag in _FALSE_VALUES:
+            values["is_active"] = False
+    category = values.pop("category", None)
+    if category is not None and "category_id" not in values:
+        category_id = categories.get(str(category).strip())
+        if category_id is None:
+            raise ValueError(f"존재하지 않는 카테고리입니다: {category}")
+        values["category_id"] = category_id
+    return values
+
+
+def _stock_value(values: Dict[str, Any], field: str, label: str) -> int:
+    value = values.pop(field, 0)
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{label}는 0 이상의 정수여야 합니다")
+    if number < 0 or number != int(number):
+        raise ValueError(f"{label}는 0 이상의 정수여야 합니다")
+    return int(number)
+
+
+def validate_import_row(row: Dict[str, Any], categories: Dict[str, str]) -> Dict[str, Any]:
+    """
+    ProductCreate 규칙으로 한 행 검증 후 적재용 dict 반환
+
+    Raises:
+        ValueError: 행 오류 (메시지는 그대로 작업 결과에 기록)
+    """
+    values = _coerce(row, categories)
+    initial_stock = _stock_value(values, "initial_stock", "초기 재고")
+    minimum_stock = _stock_value(values, "minimum_stock", "안전재고")
+    try:
+        product = ProductCreate(**values)
+    except ValidationError as e:
+        raise ValueError("; ".join(
+            f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in e.errors()
+        ))
+
+    return {
+        "id": str(uuid.uuid4()),
+        "code": product.code,
+        "name": product.name,
+        "category_id": str(product.category_id) if product.category_id else None,
+        "age_group": product.age_group,
+        "gender": product.gender,
+        "wholesale_price": product.wholesale_price,
+        "retail_price": product.retail_price,
+        "description": product.description or "",
+        "is_active": product.is_active,
+        "initial_stock": initial_stock,
+        "minimum_stock": minimum_stock,
+    }
+
+
+def prepare_import(content: bytes, file_name: str, categories: Dict[str, str],
+                   batch_size: int) -> Tuple[int, List[List[Dict[str, Any]]], List[Tuple[int, Optional[str], str]]]:
+    """
+    파일 읽기와 행 검증 (디코딩/XLSX 파싱/Pydantic 검증은 CPU 작업이라 asyncio.to_thread 로 실행)
+
+    Returns:
+        (전체 행 수, 적재 배치 목록, 행 오류 (행 번호, 상품 코드, 메시지) 목록)
+
+    Raises:
+        ProductImportError: 파일 형식/헤더 오류 또는 최대 행 수 초과
+    """
+    total_rows = 0
+    batches: List[List[Dict[str, Any]]] = [[]]
+    errors: List[Tuple[int, Optional[str], str]] = []
+    seen_codes = set()
+
+    for row_number, row in iter_import_rows(content, file_name):
+        total_rows += 1
+        if total_rows > config.settings.PRODUCT_IMPORT_MAX_ROWS:
+            raise ProductImportError(
+                f"한 번에 최대 {config.settings.PRODUCT_IMPORT_MAX_ROWS}행까지 등록할 수 있습니다"
+            )
+
+        # 파일 안 중복은 오류 행 포함 첫 행만 인정 (오류 행을 고쳐 다시 올릴 때 충돌 방지)
+        code = str(row.get("code")) if row.get("code") is not None else None
+        if code in seen_codes:
+            errors.append((row_number, code, "파일 안에서 중복된 상품 코드입니다"))
+            continue
+        seen_codes.add(code)
+        try:
+            item = validate_import_row(row, categories)
+        except ValueError as e:
+            errors.append((row_number, code, str(e)))
+            continue
+
+        batches[-1].append({"row_number": row_number, **item})
+        if len(batches[-1]) >= batch_size:
+            batches.append([])
+
+    return total_rows, [batch for batch in batches if batch], errors
+
+
+class ProductImportJobs:
+    """
+    상품 일괄 등록 작업 상태 저장소 (프로세스 내)
+
+    완료 후 ttl_seconds 동안 조회 가능하며 max_jobs 를 넘으면 오래된 작업부터 제거.
+    워커가 여러 개면 작업을 시작한 워커에서만 조회됨
+    """
+
+    def __init__(self, ttl_seconds: float, max_jobs: int = 1000):
+        self.ttl_seconds = ttl_seconds
+        self.max_jobs = max_jobs
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def create(self, company_id: str, file_name: str) -> Dict[str, Any]:
+        """대기 상태 작업 생성"""
+        self._prune()
+        job = {
+            "job_id": str(uuid.uuid4()),
+            "company_id": str(company_id),
+            "status": "pending",
+            "file_name": file_name,
+            "total_rows": 0,
+            "processed_rows": 0,
+            "imported_rows": 0,
+            "failed_rows": 0,
+            "errors": [],
+            "message": None,
+            "created_at": datetime.utcnow(),
+            "finished_at": None,
+        }
+        self._jobs[job["job_id"]] = job
+        return job
+
+    def get(self, job_id: str, company_id: str) -> Optional[Dict[str, Any]]:
+        """작업 조회 (다른 회사 작업은 None)"""
+        job = self._jobs.get(str(job_id))
+        if job is None or job["company_id"] != str(company_id):
+            return None
+        return job
+
+    def run(self, job: Dict[str, Any], coroutine) -> None:
+        """작업 실행 태스크 등록 (완료 시 참조 해제)"""
+        task = asyncio.create_task(coroutine)
+        self._tasks[job["job_id"]] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job["job_id"], None))
+
+    def _prune(self) -> None:
+        now = datetime.utcnow()
+        for job_id, job in list(self._jobs.items()):
+            finished_at = job["finished_at"]
+            if finished_at is not None and (now - finished_at).total_seconds() > self.ttl_seconds:
+                del self._jobs[job_id]
+        while len(self._jobs) >= self.max_jobs:
+            job_id = next((job_id for job_id, job in self._jobs.items()
+                           if job["finished_at"] is not None), None)
+            if job_id is None:
+                break
+            del self._jobs[job_id]
+
+
+class ProductImportService:
+    """상품 일괄 등록 서비스"""
+
+    @staticmethod
+    def start_import(content: bytes, file_name: str, company_id: str, user_id: str) -> ProductImportJobResponse:
+        """작업 생성 후 백그라운드로 등록 시작 (즉시 대기 상태 반환)"""
+        job = product_import_jobs.create(company_id, file_name)
+        product_import_jobs.run(job, ProductImportService.run_import(job, content, user_id))
+        return ProductImportService.job_response(job)
+
+    @staticmethod
+    def get_job(job_id: str, company_id: str) -> Optional[ProductImportJobResponse]:
+        """작업 상태 조회"""
+        job = product_import_jobs.get(job_id, company_id)
+        return ProductImportService.job_response(job) if job else None
+
+    @staticmethod
+    def job_response(job: Dict[str, Any]) -> ProductImportJobResponse:
+        return ProductImportJobResponse(**{key: value for key, value in job.items() if key != "company_id"})
+
+    @staticmethod
+    def _add_error(job: Dict[str, Any], row_number: int, code: Optional[str], message: str) -> None:
+        job["failed_rows"] += 1
+        if len(job["errors"]) < config.settings.PRODUCT_IMPORT_MAX_ERRORS:
+            job["errors"].append({"row": row_number, "code": code, "message": message})
+
+    @staticmethod
+    async def run_import(job: Dict[str, Any], content: bytes, user_id: str,
+                         batch_size: Optional[int] = None) -> Dict[str, Any]:
+        """
+        파일 읽기 → 배치 검증 → 단일 트랜잭션 적재
+
+        파일 읽기와 검증은 워커 스레드에서 실행해 이벤트 루프를 막지 않고,
+        검증을 먼저 끝내고 적재 배치만 트랜잭션으로 실행해 커넥션 점유 시간을 줄임.
+        검증 실패 행은 건너뛰고 나머지를 등록하며, 적재 중 오류가 나면 전체 ROLLBACK
+        """
+        batch_size = batch_size or config.settings.PRODUCT_IMPORT_BATCH_SIZE
+        job["status"] = "running"
+        try:
+            categories = {category.name: str(category.id) for category in await ProductService.get_categories()}
+            total_rows, batches, errors = await asyncio.to_thread(
+                prepare_import, content, job["file_name"], categories, batch_size
+            )
+            job["total_rows"] = total_rows
+            for row_number, code, message in errors:
+                ProductImportService._add_error(job, row_number, code, message)
+            # 검증에서 걸러진 행은 처리 완료, 이후 배치마다 진행률 갱신
+            job["processed_rows"] = total_rows - sum(len(batch) for batch in batches)
+
+            imported: List[Dict[str, Any]] = []
+            rejected: List[Dict[str, Any]] = []
+            async with transaction():
+                for batch in batches:
+                    result = await execute_sql(
+                        _IMPORT_BATCH_SQL, json.dumps(batch, ensure_ascii=False),
+                        job["company_id"], job["job_id"], user_id
+                    )
+                    if result is None:
+                        raise RuntimeError("상품 적재 쿼리 실행에 실패했습니다")
+                    for row in result:
+                        (rejected if row.get("error") else imported).append(dict(row))
+                    job["processed_rows"] += len(batch)
+
+            # 커밋 이후에만 결과/색인 반영
+            for row in rejected:
+                ProductImportService._add_error(
+                    job, row["row_number"], row["code"], _BATCH_ERRORS.get(row["error"], row["error"])
+                )
+            for row in imported:
+                product_autocomplete.upsert(job["company_id"], {**row, "company_id": job["company_id"]})
+            job["imported_rows"] = len(imported)
+            job["errors"].sort(key=lambda error: error["row"])
+            job["status"] = "completed"
+
+        except ProductImportError as e:
+            job["status"] = "failed"
+            job["message"] = str(e)
+        except Exception as e:
+            logger.error(f"상품 일괄 등록 오류: {str(e)}")
+            job["status"] = "failed"
+            job["imported_rows"] = 0
+            job["message"] = "상품 일괄 등록 중 오류가 발생해 등록을 취소했습니다"
+        finally:
+            job["finished_at"] = datetime.utcnow()
+
+        logger.info(
+            f"상품 일괄 등록 {job['status']}: {job['file_name']} "
+            f"(행 {job['total_rows']}, 등록 {job['imported_rows']}, 오류 {job['failed_rows']})"
+        )
+        return job
+
+
+# 상품 일괄 등록 작업 저장소
+product_import_jobs = ProductImportJobs(ttl_seconds=config.settings.PRODUCT_IMPORT_JOB_TTL_SECONDS)
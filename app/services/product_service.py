@@ -3,21 +3,37 @@
 아동복 상품 CRUD 및 비즈니스 로직 구현
 """
 
+import asyncio
+import json
 import logging
 import uuid
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 
 from models.product import (
     CategoryCreate, CategoryUpdate, CategoryResponse,
     ProductCreate, ProductUpdate, ProductResponse, ProductSearchFilter,
-    ProductListResponse, ProductImageUpload
+    ProductListResponse, ProductImageUpload, ProductSuggestion
 )
-from services.real_supabase_service import real_supabase_service
+from database import execute_sql, transaction, QueryParams
+from utils.pagination import (
+    InvalidCursorError, keyset_condition, split_page, resolve_total_mode, count_total
+)
+from utils.autocomplete_index import product_autocomplete
+from utils.image_pipeline import image_processor
+from utils.object_storage import object_storage
+import config
 
 logger = logging.getLogger(__name__)
 
 
+def _json_list(value: Any) -> list:
+    """jsonb 배열 컬럼 값 정규화 (NULL → [], asyncpg 문자열 → 파싱)"""
+    if value is None:
+        return []
+    return json.loads(value) if isinstance(value, str) else value
+
+
 class ProductService:
     """상품 관리 서비스"""
     
@@ -27,9 +43,9 @@ class ProductService:
         try:
             category_id = str(uuid.uuid4())
             
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"INSERT INTO categories (id, name, description) VALUES ('{category_id}', '{category_data.name}', '{category_data.description or ""}') RETURNING id, name, description, created_at"
+            result = await execute_sql(
+                "INSERT INTO categories (id, name, description) VALUES ($1, $2, $3) RETURNING id, name, description, created_at",
+                category_id, category_data.name, category_data.description or ""
             )
             
             if not result or len(result) == 0:
@@ -45,9 +61,8 @@ class ProductService:
     async def get_categories() -> List[CategoryResponse]:
         """카테고리 목록 조회"""
         try:
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query="SELECT id, name, description, created_at FROM categories ORDER BY name ASC"
+            result = await execute_sql(
+                "SELECT id, name, description, created_at FROM categories ORDER BY name ASC"
             )
             
             return [CategoryResponse(**row) for row in result] if result else []
@@ -62,22 +77,23 @@ class ProductService:
         try:
             # 업데이트할 필드만 추출
             update_fields = []
+            params = QueryParams(category_id)
             if update_data.name is not None:
-                update_fields.append(f"name = '{update_data.name}'")
+                update_fields.append(f"name = {params.add(update_data.name)}")
             if update_data.description is not None:
-                update_fields.append(f"description = '{update_data.description}'")
+                update_fields.append(f"description = {params.add(update_data.description)}")
             
             if not update_fields:
                 # 수정할 필드가 없으면 현재 데이터 반환
-                result = await real_supabase_service.execute_sql(
-                    project_id=real_supabase_service.project_id,
-                    query=f"SELECT id, name, description, created_at FROM categories WHERE id = '{category_id}'"
+                result = await execute_sql(
+                    "SELECT id, name, description, created_at FROM categories WHERE id = $1",
+                    category_id
                 )
                 return CategoryResponse(**result[0]) if result else None
             
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"UPDATE categories SET {', '.join(update_fields)} WHERE id = '{category_id}' RETURNING id, name, description, created_at"
+            result = await execute_sql(
+                f"UPDATE categories SET {', '.join(update_fields)} WHERE id = $1 RETURNING id, name, description, created_at",
+                *params.values
             )
             
             return CategoryResponse(**result[0]) if result else None
@@ -91,17 +107,17 @@ class ProductService:
         """카테고리 삭제"""
         try:
             # 해당 카테고리를 사용하는 상품이 있는지 확인
-            check_result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"SELECT COUNT(*) as count FROM products WHERE category_id = '{category_id}'"
+            check_result = await execute_sql(
+                "SELECT COUNT(*) as count FROM products WHERE category_id = $1",
+                category_id
             )
             
             if check_result and check_result[0]['count'] > 0:
                 raise ValueError("해당 카테고리를 사용하는 상품이 있어 삭제할 수 없습니다")
             
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"DELETE FROM categories WHERE id = '{category_id}'"
+            result = await execute_sql(
+                "DELETE FROM categories WHERE id = $1",
+                category_id
             )
             
             return result is not None
@@ -117,30 +133,34 @@ class ProductService:
             product_id = str(uuid.uuid4())
             
             # 상품 코드 중복 확인
-            existing = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"SELECT id FROM products WHERE code = '{product_data.code}'"
+            existing = await execute_sql(
+                "SELECT id FROM products WHERE code = $1",
+                product_data.code
             )
             
             if existing:
                 raise ValueError("이미 존재하는 상품 코드입니다")
             
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"INSERT INTO products (id, company_id, code, name, category_id, age_group, gender, wholesale_price, retail_price, description, is_active) VALUES ('{product_id}', '{company_id}', '{product_data.code}', '{product_data.name}', {f"'{product_data.category_id}'" if product_data.category_id else "NULL"}, '{product_data.age_group}', '{product_data.gender}', {product_data.wholesale_price}, {product_data.retail_price or "NULL"}, '{product_data.description or ""}', {product_data.is_active}) RETURNING id, company_id, code, name, category_id, age_group, gender, wholesale_price, retail_price, description, is_active, created_at, updated_at"
+            result = await execute_sql(
+                "INSERT INTO products (id, company_id, code, name, category_id, age_group, gender, wholesale_price, retail_price, description, is_active) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11) RETURNING id, company_id, code, name, category_id, age_group, gender, wholesale_price, retail_price, description, is_active, created_at, updated_at",
+                product_id, company_id, product_data.code, product_data.name,
+                str(product_data.category_id) if product_data.category_id else None,
+                product_data.age_group, product_data.gender, product_data.wholesale_price,
+                product_data.retail_price or None, product_data.description or "", product_data.is_active
             )
             
             if not result or len(result) == 0:
                 raise ValueError("상품 생성에 실패했습니다")
             
             # 초기 재고 생성
-            await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"INSERT INTO inventory (id, product_id, current_stock, minimum_stock) VALUES ('{str(uuid.uuid4())}', '{product_id}', 0, 0)"
+            await execute_sql(
+                "INSERT INTO inventory (id, product_id, current_stock, minimum_stock) VALUES ($1, $2, 0, 0)",
+                str(uuid.uuid4()), product_id
             )
             
             product_data_dict = result[0]
             product_data_dict['images'] = []
+            product_autocomplete.upsert(company_id, product_data_dict)
             
             return ProductResponse(**product_data_dict)
             
@@ -154,85 +174,136 @@ class ProductService:
         try:
             # WHERE 조건 구성
             conditions = []
+            params = QueryParams()
             
             if company_id:
-                conditions.append(f"p.company_id = '{company_id}'")
+                conditions.append(f"p.company_id = {params.add(company_id)}")
             
+            rank_expr = None
             if search_filter.name:
-                conditions.append(f"p.name ILIKE '%{search_filter.name}%'")
+                name_condition, rank_expr = ProductService._name_search(params, search_filter.name)
+                conditions.append(name_condition)
             
             if search_filter.category_id:
-                conditions.append(f"p.category_id = '{search_filter.category_id}'")
+                conditions.append(f"p.category_id = {params.add(str(search_filter.category_id))}")
             
             if search_filter.age_group:
-                conditions.append(f"p.age_group = '{search_filter.age_group}'")
+                conditions.append(f"p.age_group = {params.add(search_filter.age_group)}")
             
             if search_filter.gender:
-                conditions.append(f"p.gender = '{search_filter.gender}'")
+                conditions.append(f"p.gender = {params.add(search_filter.gender)}")
             
             if search_filter.min_price is not None:
-                conditions.append(f"p.wholesale_price >= {search_filter.min_price}")
+                conditions.append(f"p.wholesale_price >= {params.add(search_filter.min_price)}")
             
             if search_filter.max_price is not None:
-                conditions.append(f"p.wholesale_price <= {search_filter.max_price}")
+                conditions.append(f"p.wholesale_price <= {params.add(search_filter.max_price)}")
             
             if search_filter.is_active is not None:
-                conditions.append(f"p.is_active = {search_filter.is_active}")
+                conditions.append(f"p.is_active = {params.add(search_filter.is_active)}")
             
             if search_filter.company_type:
-                conditions.append(f"c.company_type = '{search_filter.company_type}'")
-            
-            where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
-            
-            # 총 개수 조회
-            count_result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"SELECT COUNT(*) as total FROM products p LEFT JOIN companies c ON p.company_id = c.id {where_clause}"
-            )
-            
-            total = count_result[0]['total'] if count_result else 0
-            
-            # OFFSET, LIMIT 계산
-            offset = (search_filter.page - 1) * search_filter.size
-            
-            # 상품 목록 조회
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"SELECT p.id, p.company_id, p.code, p.name, p.category_id, p.age_group, p.gender, p.wholesale_price, p.retail_price, p.description, p.images, p.is_active, p.created_at, p.updated_at, cat.name as category_name, c.name as company_name, inv.current_stock FROM products p LEFT JOIN categories cat ON p.category_id = cat.id LEFT JOIN companies c ON p.company_id = c.id LEFT JOIN inventory inv ON p.id = inv.product_id {where_clause} ORDER BY p.created_at DESC LIMIT {search_filter.size} OFFSET {offset}"
-            )
-            
-            products = []
-            if result:
-                for row in result:
-                    product_dict = dict(row)
-                    if product_dict.get('images') is None:
-                        product_dict['images'] = []
-                    products.append(ProductResponse(**product_dict))
-            
-            has_next = (offset + search_filter.size) < total
+                conditions.append(f"c.company_type = {params.add(search_filter.company_type)}")
             
-            return ProductListResponse(
-                products=products,
-                total=total,
-                page=search_filter.page,
-                size=search_filter.size,
-                has_next=has_next
+            return await ProductService._get_product_page(
+                "FROM products p LEFT JOIN companies c ON p.company_id = c.id",
+                conditions, params, search_filter, rank_expr
             )
             
+        except InvalidCursorError:
+            raise
         except Exception as e:
             logger.error(f"상품 목록 조회 오류: {str(e)}")
             return ProductListResponse(products=[], total=0, page=1, size=20, has_next=False)
     
+    @staticmethod
+    def _name_search(params: QueryParams, name: str) -> Tuple[str, str]:
+        """
+        상품명 검색 조건과 유사도 정렬식 생성
+        
+        부분 일치(ILIKE)와 오타 허용 유사 일치(<%) 모두 pg_trgm GIN 인덱스
+        (database/product_search_trgm.sql)로 처리되어 순차 스캔하지 않음
+        
+        Returns:
+            Tuple[str, str]: (WHERE 조건, 유사도 정렬식)
+        """
+        name_param = params.add(name)
+        condition = f"(p.name ILIKE '%' || {name_param} || '%' OR {name_param} <% p.name)"
+        return condition, f"word_similarity({name_param}, p.name)"
+    
+    @staticmethod
+    async def _get_product_page(from_clause: str, conditions: List[str], params: QueryParams,
+                                search_filter: ProductSearchFilter,
+                                rank_expr: Optional[str] = None) -> ProductListResponse:
+        """
+        상품 목록 페이지 조회 (page/size 방식과 커서 방식 공통)
+        
+        Args:
+            from_clause: products p, companies c 를 포함한 FROM 절
+            conditions: WHERE 조건 목록
+            params: conditions 에 사용된 파라미터
+            search_filter: 페이지/커서 정보가 담긴 검색 필터
+            rank_expr: 상품명 검색 유사도 정렬식 (있으면 유사도 순으로 정렬)
+        """
+        where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
+        total_mode = resolve_total_mode(search_filter.total_mode, search_filter.cursor)
+        filter_params = list(params.values)
+        
+        # 상품명 검색 시 (유사도, created_at, id), 그 외에는 (created_at, id) 순 정렬
+        sort_columns = ["p.created_at", "p.id"]
+        sort_keys = ["created_at", "id"]
+        rank_select = ""
+        if rank_expr:
+            sort_columns.insert(0, rank_expr)
+            sort_keys.insert(0, "search_rank")
+            rank_select = f", {rank_expr} AS search_rank"
+        
+        # 커서가 있으면 정렬 키 기준 키셋 조건으로 OFFSET 없이 다음 페이지 조회
+        page_conditions = list(conditions)
+        offset = 0
+        if search_filter.cursor:
+            page_conditions.append(keyset_condition(params, sort_columns, search_filter.cursor))
+        else:
+            offset = (search_filter.page - 1) * search_filter.size
+        page_where_clause = "WHERE " + " AND ".join(page_conditions) if page_conditions else ""
+        order_by = ", ".join(f"{column} DESC" for column in sort_columns)
+        
+        total, total_estimated = await count_total(execute_sql, f"{from_clause} {where_clause}", filter_params, total_mode)
+        
+        # 다음 페이지 여부 확인을 위해 size + 1 건 조회
+        result = await execute_sql(
+            f"SELECT p.id, p.company_id, p.code, p.name, p.category_id, p.age_group, p.gender, p.wholesale_price, p.retail_price, p.description, p.images, p.image_variants, p.is_active, p.created_at, p.updated_at, cat.name as category_name, c.name as company_name, inv.current_stock{rank_select} {from_clause} LEFT JOIN categories cat ON p.category_id = cat.id LEFT JOIN inventory inv ON p.id = inv.product_id {page_where_clause} ORDER BY {order_by} LIMIT {params.add(search_filter.size + 1)} OFFSET {params.add(offset)}",
+            *params.values
+        )
+        
+        rows, has_next, next_cursor = split_page(result, search_filter.size, sort_keys)
+        
+        products = []
+        for row in rows:
+            product_dict = dict(row)
+            if product_dict.get('images') is None:
+                product_dict['images'] = []
+            product_dict['image_variants'] = _json_list(product_dict.get('image_variants'))
+            products.append(ProductResponse(**product_dict))
+        
+        return ProductListResponse(
+            products=products,
+            total=total,
+            page=search_filter.page,
+            size=search_filter.size,
+            has_next=has_next,
+            next_cursor=next_cursor,
+            total_estimated=total_estimated
+        )
+    
     @staticmethod
     async def get_product_by_id(product_id: str) -> Optional[ProductResponse]:
         """상품 상세 조회"""
         try:
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            result = await execute_sql("""
                 SELECT 
                     p.id, p.company_id, p.code, p.name, p.category_id, p.age_group, p.gender,
-                    p.wholesale_price, p.retail_price, p.description, p.images, p.is_active,
+                    p.wholesale_price, p.retail_price, p.description, p.images, p.image_variants, p.is_active,
                     p.created_at, p.updated_at,
                     cat.name as category_name,
                     c.name as company_name,
@@ -241,8 +312,8 @@ class ProductService:
                 LEFT JOIN categories cat ON p.category_id = cat.id
                 LEFT JOIN companies c ON p.company_id = c.id
                 LEFT JOIN inventory inv ON p.id = inv.product_id
-                WHERE p.id = '{product_id}'
-            """)
+                WHERE p.id = $1
+            """, product_id)
             
             if not result:
                 return None
@@ -250,6 +321,7 @@ class ProductService:
             product_dict = dict(result[0])
             if product_dict.get('images') is None:
                 product_dict['images'] = []
+            product_dict['image_variants'] = _json_list(product_dict.get('image_variants'))
             
             return ProductResponse(**product_dict)
             
@@ -262,34 +334,33 @@ class ProductService:
         """상품 수정"""
         try:
             # 상품 소유권 확인
-            ownership_check = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            ownership_check = await execute_sql("""
                 SELECT id FROM products 
-                WHERE id = '{product_id}' AND company_id = '{company_id}'
-            """)
+                WHERE id = $1 AND company_id = $2
+            """, product_id, company_id)
             
             if not ownership_check:
                 raise ValueError("수정 권한이 없는 상품입니다")
             
             # 업데이트할 필드만 추출
             update_fields = []
+            params = QueryParams(product_id)
             if update_data.name is not None:
-                update_fields.append(f"name = '{update_data.name}'")
+                update_fields.append(f"name = {params.add(update_data.name)}")
             if update_data.category_id is not None:
-                update_fields.append(f"category_id = '{update_data.category_id}'")
+                update_fields.append(f"category_id = {params.add(str(update_data.category_id))}")
             if update_data.age_group is not None:
-                update_fields.append(f"age_group = '{update_data.age_group}'")
+                update_fields.append(f"age_group = {params.add(update_data.age_group)}")
             if update_data.gender is not None:
-                update_fields.append(f"gender = '{update_data.gender}'")
+                update_fields.append(f"gender = {params.add(update_data.gender)}")
             if update_data.wholesale_price is not None:
-                update_fields.append(f"wholesale_price = {update_data.wholesale_price}")
+                update_fields.append(f"wholesale_price = {params.add(update_data.wholesale_price)}")
             if update_data.retail_price is not None:
-                update_fields.append(f"retail_price = {update_data.retail_price}")
+                update_fields.append(f"retail_price = {params.add(update_data.retail_price)}")
             if update_data.description is not None:
-                update_fields.append(f"description = '{update_data.description}'")
+                update_fields.append(f"description = {params.add(update_data.description)}")
             if update_data.is_active is not None:
-                update_fields.append(f"is_active = {update_data.is_active}")
+                update_fields.append(f"is_active = {params.add(update_data.is_active)}")
             
             if not update_fields:
                 # 수정할 필드가 없으면 현재 데이터 반환
@@ -297,9 +368,9 @@ class ProductService:
             
             update_fields.append("updated_at = NOW()")
             
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"UPDATE products SET {', '.join(update_fields)} WHERE id = '{product_id}' RETURNING id, company_id, code, name, category_id, age_group, gender, wholesale_price, retail_price, description, images, is_active, created_at, updated_at"
+            result = await execute_sql(
+                f"UPDATE products SET {', '.join(update_fields)} WHERE id = $1 RETURNING id, company_id, code, name, category_id, age_group, gender, wholesale_price, retail_price, description, images, is_active, created_at, updated_at",
+                *params.values
             )
             
             if not result:
@@ -308,6 +379,7 @@ class ProductService:
             product_dict = dict(result[0])
             if product_dict.get('images') is None:
                 product_dict['images'] = []
+            product_autocomplete.upsert(company_id, product_dict)
             
             return ProductResponse(**product_dict)
             
@@ -320,37 +392,39 @@ class ProductService:
         """상품 삭제"""
         try:
             # 상품 소유권 확인
-            ownership_check = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            ownership_check = await execute_sql("""
                 SELECT id FROM products 
-                WHERE id = '{product_id}' AND company_id = '{company_id}'
-            """)
+                WHERE id = $1 AND company_id = $2
+            """, product_id, company_id)
             
             if not ownership_check:
                 raise ValueError("삭제 권한이 없는 상품입니다")
             
             # 주문에 포함된 상품인지 확인
-            order_check = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"SELECT COUNT(*) as count FROM order_items WHERE product_id = '{product_id}'"
+            order_check = await execute_sql(
+                "SELECT COUNT(*) as count FROM order_items WHERE product_id = $1",
+                product_id
             )
             
             if order_check and order_check[0]['count'] > 0:
                 # 주문에 포함된 상품은 비활성화만 가능
-                await real_supabase_service.execute_sql(
-                    project_id=real_supabase_service.project_id,
-                    query=f"UPDATE products SET is_active = false, updated_at = NOW() WHERE id = '{product_id}'"
+                result = await execute_sql(
+                    "UPDATE products SET is_active = false, updated_at = NOW() WHERE id = $1",
+                    product_id
+                )
+            else:
+                # 완전 삭제 (재고도 함께 삭제됨 - CASCADE)
+                result = await execute_sql(
+                    "DELETE FROM products WHERE id = $1",
+                    product_id
                 )
-            return True
             
-            # 완전 삭제 (재고도 함께 삭제됨 - CASCADE)
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"DELETE FROM products WHERE id = '{product_id}'"
-            )
+            if result is None:
+                return False
             
-            return result is not None
+            # 비활성화/삭제된 상품만 자동완성 색인에서 제거
+            product_autocomplete.remove(company_id, product_id)
+            return True
             
         except Exception as e:
             logger.error(f"상품 삭제 오류: {str(e)}")
@@ -361,9 +435,9 @@ class ProductService:
         """상품 이미지 업로드"""
         try:
             # 상품 소유권 확인
-            ownership_check = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"SELECT id FROM products WHERE id = '{upload_data.product_id}' AND company_id = '{company_id}'"
+            ownership_check = await execute_sql(
+                "SELECT id FROM products WHERE id = $1 AND company_id = $2",
+                upload_data.product_id, company_id
             )
             
             if not ownership_check:
@@ -371,11 +445,13 @@ class ProductService:
             
             # 이미지 URL 목록 생성
             image_urls = [img.url for img in upload_data.images]
-            images_json = str(image_urls).replace("'", '"')  # JSON 형식으로 변환
+            images_json = json.dumps(image_urls, ensure_ascii=False)  # JSON 형식으로 변환
+            # URL 만 등록하는 경우 변형 없이 원본 URL 로 순서 유지
+            variants_json = json.dumps([{"original": url} for url in image_urls], ensure_ascii=False)
             
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"UPDATE products SET images = '{images_json}', updated_at = NOW() WHERE id = '{upload_data.product_id}'"
+            result = await execute_sql(
+                "UPDATE products SET images = $1::jsonb, image_variants = $2::jsonb, updated_at = NOW() WHERE id = $3",
+                images_json, variants_json, upload_data.product_id
             )
             
             return result is not None
@@ -384,18 +460,94 @@ class ProductService:
             logger.error(f"상품 이미지 업로드 오류: {str(e)}")
             return False
     
+    @staticmethod
+    async def add_product_image(product_id: str, company_id: str, source_path: str,
+                                work_dir: str) -> Dict[str, str]:
+        """
+        상품 이미지 추가 (원본 + WebP 목록용/썸네일 변형 생성 후 스토리지 업로드)
+        
+        변형 생성은 프로세스 풀, 업로드는 스레드에서 동시에 실행하며
+        상품 행은 업로드가 끝난 뒤 잠금 후 갱신함 (동시 업로드 시 순서 유실 방지).
+        갱신에 실패하면 올린 객체를 삭제함
+        
+        Args:
+            source_path: 임시 저장된 업로드 원본 경로
+            work_dir: 변형 파일을 쓸 임시 디렉터리
+        
+        Returns:
+            Dict[str, str]: 변형 이름 → URL (original, list, thumbnail)
+        
+        Raises:
+            ValueError: 권한 없는 상품, 이미지 수 초과, 읽을 수 없는 이미지
+        """
+        max_count = config.settings.PRODUCT_IMAGE_MAX_COUNT
+        ownership_check = await execute_sql(
+            "SELECT id, images FROM products WHERE id = $1 AND company_id = $2",
+            product_id, company_id
+        )
+        if not ownership_check:
+            raise ValueError("이미지 업로드 권한이 없는 상품입니다")
+        if len(_json_list(ownership_check[0].get("images"))) >= max_count:
+            raise ValueError(f"상품 이미지는 최대 {max_count}개까지 등록할 수 있습니다")
+        
+        processed = await image_processor.process(source_path, work_dir)
+        
+        prefix = f"products/{company_id}/{product_id}/{uuid.uuid4().hex}"
+        uploads = {"original": (source_path, f"{prefix}/original.{processed['extension']}", processed["content_type"])}
+        for name, variant in processed["variants"].items():
+            uploads[name] = (variant["path"], f"{prefix}/{name}.webp", "image/webp")
+        
+        urls = await asyncio.gather(*(
+            object_storage.upload_file(path, key, content_type) for path, key, content_type in uploads.values()
+        ), return_exceptions=True)
+        keys = [key for _, key, _ in uploads.values()]
+        failed = next((url for url in urls if isinstance(url, BaseException)), None)
+        if failed is not None:
+            await object_storage.delete_objects(keys)
+            raise failed
+        variant_urls = dict(zip(uploads, urls))
+        
+        try:
+            async with transaction():
+                current = await execute_sql(
+                    "SELECT images, image_variants FROM products WHERE id = $1 AND company_id = $2 FOR UPDATE",
+                    product_id, company_id
+                )
+                if not current:
+                    raise ValueError("이미지 업로드 권한이 없는 상품입니다")
+                
+                images = _json_list(current[0].get("images"))
+                variants = _json_list(current[0].get("image_variants"))
+                if len(images) >= max_count:
+                    raise ValueError(f"상품 이미지는 최대 {max_count}개까지 등록할 수 있습니다")
+                
+                # 변형 목록은 images 와 같은 순서 (URL 만 등록된 기존 이미지는 원본 URL 로 채움)
+                variants = variants[:len(images)] + [{"original": url} for url in images[len(variants):]]
+                result = await execute_sql(
+                    "UPDATE products SET images = $1::jsonb, image_variants = $2::jsonb, updated_at = NOW() WHERE id = $3",
+                    json.dumps(images + [variant_urls["original"]], ensure_ascii=False),
+                    json.dumps(variants + [variant_urls], ensure_ascii=False),
+                    product_id
+                )
+                if result is None:
+                    raise RuntimeError("상품 이미지 정보를 저장하지 못했습니다")
+        except Exception:
+            await object_storage.delete_objects(keys)
+            raise
+        
+        return variant_urls
+    
     @staticmethod
     async def get_products_by_company(company_id: str, is_active: bool = True) -> List[ProductResponse]:
         """회사별 상품 목록 조회"""
         try:
-            active_condition = f"AND p.is_active = {is_active}" if is_active is not None else ""
+            params = QueryParams(company_id)
+            active_condition = f"AND p.is_active = {params.add(is_active)}" if is_active is not None else ""
             
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+            result = await execute_sql(f"""
                 SELECT 
                     p.id, p.company_id, p.code, p.name, p.category_id, p.age_group, p.gender,
-                    p.wholesale_price, p.retail_price, p.description, p.images, p.is_active,
+                    p.wholesale_price, p.retail_price, p.description, p.images, p.image_variants, p.is_active,
                     p.created_at, p.updated_at,
                     cat.name as category_name,
                     c.name as company_name,
@@ -404,9 +556,9 @@ class ProductService:
                 LEFT JOIN categories cat ON p.category_id = cat.id
                 LEFT JOIN companies c ON p.company_id = c.id
                 LEFT JOIN inventory inv ON p.id = inv.product_id
-                WHERE p.company_id = '{company_id}' {active_condition}
+                WHERE p.company_id = $1 {active_condition}
                 ORDER BY p.created_at DESC
-            """)
+            """, *params.values)
             
             products = []
             if result:
@@ -414,6 +566,7 @@ class ProductService:
                     product_dict = dict(row)
                     if product_dict.get('images') is None:
                         product_dict['images'] = []
+                    product_dict['image_variants'] = _json_list(product_dict.get('image_variants'))
                     products.append(ProductResponse(**product_dict))
             
             return products
@@ -428,26 +581,22 @@ class ProductService:
         try:
             if company_type == "wholesale":
                 # 도매업체는 자사 상품만 접근 가능
-                result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+                result = await execute_sql("""
                     SELECT id FROM products 
-                    WHERE id = '{product_id}' AND company_id = '{user_company_id}'
-                """)
+                    WHERE id = $1 AND company_id = $2
+                """, product_id, user_company_id)
                 return bool(result)
             
             elif company_type == "retail":
                 # 소매업체는 거래 승인된 도매업체 상품만 접근 가능
-                result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
+                result = await execute_sql("""
                     SELECT p.id 
                     FROM products p
                     JOIN company_relationships cr ON p.company_id = cr.wholesale_company_id
-                    WHERE p.id = '{product_id}' 
-                    AND cr.retail_company_id = '{user_company_id}'
+                    WHERE p.id = $1 
+                    AND cr.retail_company_id = $2
                     AND cr.status = 'approved'
-                """)
+                """, product_id, user_company_id)
                 return bool(result)
             
             return False
@@ -461,66 +610,39 @@ class ProductService:
         """회사별 상품 목록 조회 (도매업체용)"""
         try:
             # WHERE 조건 구성
-            conditions = [f"p.company_id = '{company_id}'"]
+            params = QueryParams()
+            conditions = [f"p.company_id = {params.add(company_id)}"]
             
+            rank_expr = None
             if search_filter.name:
-                conditions.append(f"p.name ILIKE '%{search_filter.name}%'")
+                name_condition, rank_expr = ProductService._name_search(params, search_filter.name)
+                conditions.append(name_condition)
             
             if search_filter.category_id:
-                conditions.append(f"p.category_id = '{search_filter.category_id}'")
+                conditions.append(f"p.category_id = {params.add(str(search_filter.category_id))}")
             
             if search_filter.age_group:
-                conditions.append(f"p.age_group = '{search_filter.age_group}'")
+                conditions.append(f"p.age_group = {params.add(search_filter.age_group)}")
             
             if search_filter.gender:
-                conditions.append(f"p.gender = '{search_filter.gender}'")
+                conditions.append(f"p.gender = {params.add(search_filter.gender)}")
             
             if search_filter.min_price is not None:
-                conditions.append(f"p.wholesale_price >= {search_filter.min_price}")
+                conditions.append(f"p.wholesale_price >= {params.add(search_filter.min_price)}")
             
             if search_filter.max_price is not None:
-                conditions.append(f"p.wholesale_price <= {search_filter.max_price}")
+                conditions.append(f"p.wholesale_price <= {params.add(search_filter.max_price)}")
             
             if search_filter.is_active is not None:
-                conditions.append(f"p.is_active = {search_filter.is_active}")
+                conditions.append(f"p.is_active = {params.add(search_filter.is_active)}")
             
-            where_clause = "WHERE " + " AND ".join(conditions)
-            
-            # 총 개수 조회
-            count_result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"SELECT COUNT(*) as total FROM products p LEFT JOIN companies c ON p.company_id = c.id {where_clause}"
-            )
-            
-            total = count_result[0]['total'] if count_result else 0
-            
-            # OFFSET, LIMIT 계산
-            offset = (search_filter.page - 1) * search_filter.size
-            
-            # 상품 목록 조회
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"SELECT p.id, p.company_id, p.code, p.name, p.category_id, p.age_group, p.gender, p.wholesale_price, p.retail_price, p.description, p.images, p.is_active, p.created_at, p.updated_at, cat.name as category_name, c.name as company_name, inv.current_stock FROM products p LEFT JOIN categories cat ON p.category_id = cat.id LEFT JOIN companies c ON p.company_id = c.id LEFT JOIN inventory inv ON p.id = inv.product_id {where_clause} ORDER BY p.created_at DESC LIMIT {search_filter.size} OFFSET {offset}"
-            )
-            
-            products = []
-            if result:
-                for row in result:
-                    product_dict = dict(row)
-                    if product_dict.get('images') is None:
-                        product_dict['images'] = []
-                    products.append(ProductResponse(**product_dict))
-            
-            has_next = (offset + search_filter.size) < total
-            
-            return ProductListResponse(
-                products=products,
-                total=total,
-                page=search_filter.page,
-                size=search_filter.size,
-                has_next=has_next
+            return await ProductService._get_product_page(
+                "FROM products p LEFT JOIN companies c ON p.company_id = c.id",
+                conditions, params, search_filter, rank_expr
             )
             
+        except InvalidCursorError:
+            raise
         except Exception as e:
             logger.error(f"회사 상품 목록 조회 오류: {str(e)}")
             return ProductListResponse(products=[], total=0, page=1, size=20, has_next=False)
@@ -535,88 +657,74 @@ class ProductService:
         """소매업체가 주문 가능한 상품 목록 조회"""
         try:
             # WHERE 조건 구성 (거래 승인된 도매업체 상품만)
+            params = QueryParams()
             conditions = [
-                f"cr.retail_company_id = '{retail_company_id}'",
+                f"cr.retail_company_id = {params.add(retail_company_id)}",
                 "cr.status = 'approved'",
                 "p.is_active = true"
             ]
             
+            rank_expr = None
             if search_filter.name:
-                conditions.append(f"p.name ILIKE '%{search_filter.name}%'")
+                name_condition, rank_expr = ProductService._name_search(params, search_filter.name)
+                conditions.append(name_condition)
             
             if search_filter.category_id:
-                conditions.append(f"p.category_id = '{search_filter.category_id}'")
+                conditions.append(f"p.category_id = {params.add(str(search_filter.category_id))}")
             
             if search_filter.age_group:
-                conditions.append(f"p.age_group = '{search_filter.age_group}'")
+                conditions.append(f"p.age_group = {params.add(search_filter.age_group)}")
             
             if search_filter.gender:
-                conditions.append(f"p.gender = '{search_filter.gender}'")
+                conditions.append(f"p.gender = {params.add(search_filter.gender)}")
             
             if search_filter.min_price is not None:
-                conditions.append(f"p.wholesale_price >= {search_filter.min_price}")
+                conditions.append(f"p.wholesale_price >= {params.add(search_filter.min_price)}")
             
             if search_filter.max_price is not None:
-                conditions.append(f"p.wholesale_price <= {search_filter.max_price}")
-            
-            where_clause = "WHERE " + " AND ".join(conditions)
-            
-            # 총 개수 조회
-            count_result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
-                SELECT COUNT(*) as total
-                FROM products p
-                JOIN company_relationships cr ON p.company_id = cr.wholesale_company_id
-                LEFT JOIN categories cat ON p.category_id = cat.id
-                LEFT JOIN companies c ON p.company_id = c.id
-                {where_clause}
-            """)
-            
-            total = count_result[0]['total'] if count_result else 0
-            
-            # OFFSET, LIMIT 계산
-            offset = (search_filter.page - 1) * search_filter.size
-            
-            # 상품 목록 조회
-            result = await real_supabase_service.execute_sql(
-                project_id=real_supabase_service.project_id,
-                query=f"""
-                SELECT 
-                    p.id, p.company_id, p.code, p.name, p.category_id, p.age_group, p.gender,
-                    p.wholesale_price, p.retail_price, p.description, p.images, p.is_active,
-                    p.created_at, p.updated_at,
-                    cat.name as category_name,
-                    c.name as company_name,
-                    inv.current_stock
-                FROM products p
-                JOIN company_relationships cr ON p.company_id = cr.wholesale_company_id
-                LEFT JOIN categories cat ON p.category_id = cat.id
-                LEFT JOIN companies c ON p.company_id = c.id
-                LEFT JOIN inventory inv ON p.id = inv.product_id
-                {where_clause}
-                ORDER BY p.created_at DESC
-                LIMIT {search_filter.size} OFFSET {offset}
-            """)
+                conditions.append(f"p.wholesale_price <= {params.add(search_filter.max_price)}")
             
-            products = []
-            if result:
-                for row in result:
-                    product_dict = dict(row)
-                    if product_dict.get('images') is None:
-                        product_dict['images'] = []
-                    products.append(ProductResponse(**product_dict))
-            
-            has_next = (offset + search_filter.size) < total
-            
-            return ProductListResponse(
-                products=products,
-                total=total,
-                page=search_filter.page,
-                size=search_filter.size,
-                has_next=has_next
+            return await ProductService._get_product_page(
+                "FROM products p "
+                "JOIN company_relationships cr ON p.company_id = cr.wholesale_company_id "
+                "LEFT JOIN companies c ON p.company_id = c.id",
+                conditions, params, search_filter, rank_expr
             )
             
+        except InvalidCursorError:
+            raise
         except Exception as e:
             logger.error(f"소매업체 상품 목록 조회 오류: {str(e)}")
-            return ProductListResponse(products=[], total=0, page=1, size=20, has_next=False)
\ No newline at end of file
+            return ProductListResponse(products=[], total=0, page=1, size=20, has_next=False)
+    
+    @staticmethod
+    async def get_partner_company_ids(retail_company_id: str) -> List[str]:
+        """소매업체와 거래 승인된 도매업체 ID 목록"""
+        result = await execute_sql(
+            "SELECT wholesale_company_id FROM company_relationships WHERE retail_company_id = $1 AND status = 'approved'",
+            retail_company_id
+        )
+        return [str(row["wholesale_company_id"]) for row in result or []]
+    
+    @staticmethod
+    async def autocomplete_products(company_ids: List[str], query: str, limit: int = 10) -> List[ProductSuggestion]:
+        """
+        상품명/상품코드 자동완성 (자모 접두어, 자음만 입력하면 초성 일치)
+        
+        회사 색인이 없거나 만료된 경우에만 활성 상품을 읽어 적재하고
+        이후에는 인메모리 접두어 트리만 조회
+        """
+        for company_id in company_ids:
+            if product_autocomplete.is_fresh(company_id):
+                continue
+            generation = product_autocomplete.begin_load(company_id)
+            rows = await execute_sql(
+                "SELECT id, company_id, code, name FROM products WHERE company_id = $1 AND is_active = true",
+                company_id
+            )
+            product_autocomplete.load(company_id, rows or [], generation)
+        
+        return [
+            ProductSuggestion(**suggestion)
+            for suggestion in product_autocomplete.search(company_ids, query, limit)
+        ]
@@ -37,8 +37,10 @@ class MockSupabaseMCP:
     """테스트용 Supabase MCP 시뮬레이터"""
     
     @staticmethod
-    async def execute_sql(project_id: str, query: str) -> list:
+    async def execute_sql(project_id: str, query: str, params: list = None) -> list:
         """모의 SQL 실행 (테스트용)"""
+        from services.real_supabase_service import inline_params
+        query = inline_params(query, params)
         logger.warning(f"MockSupabaseMCP: {query}")
         
         # 기본 쿼리들에 대한 모의 응답
@@ -68,7 +70,7 @@ async def initialize_with_real_mcp() -> None:
     logger.info("실제 Supabase MCP로 초기화를 시작합니다")
     
     # 실제 MCP 함수를 시뮬레이션하는 래퍼 생성
-    async def real_mcp_execute(project_id: str, query: str) -> list:
+    async def real_mcp_execute(project_id: str, query: str, params: list = None) -> list:
         """실제 Supabase MCP 호출 래퍼"""
         # 이 부분은 실제로는 외부에서 MCP 함수를 주입받아야 함
         # 현재는 직접 호출할 수 없으므로 임시로 빈 리스트 반환
@@ -78,6 +80,23 @@ async def initialize_with_real_mcp() -> None:
     await initialize_supabase_mcp(real_mcp_execute)
 
 
+async def initialize_with_asyncpg() -> None:
+    """asyncpg 커넥션 풀로 초기화 (DATABASE_URL 필요)"""
+    from utils.db_pool import AsyncpgExecutor
+    
+    executor = AsyncpgExecutor.from_settings()
+    await executor.start()
+    
+    try:
+        database.set_database_executor(executor)
+        await database.init_db()
+    except Exception:
+        await database.close_db()
+        raise
+    
+    logger.info("asyncpg 커넥션 풀로 데이터베이스가 초기화되었습니다")
+
+
 async def initialize_with_mock() -> None:
     """테스트용 모의 MCP로 초기화"""
     from services.real_supabase_service import real_supabase_service
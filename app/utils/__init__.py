@@ -12,6 +12,7 @@ from .jwt_utils import (
     get_token_payload,
     revoke_token,
     TokenValidationError,
+    RevocationStoreUnavailableError,
 )
 
 __all__ = [
@@ -23,4 +24,5 @@ __all__ = [
     "get_token_payload",
     "revoke_token",
     "TokenValidationError",
+    "RevocationStoreUnavailableError",
 ]
\ No newline at end of file
@@ -0,0 +1,319 @@
+"""
+상품 자동완성 색인
+한글 자모/초성 단위 접두어 트라이를 회사별로 유지해 입력 중인 검색어를 DB 조회 없이 완성
+"""
+
+import logging
+import time
+from collections import OrderedDict, deque
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import config
+
+logger = logging.getLogger(__name__)
+
+_SYLLABLE_FIRST = 0xAC00
+_SYLLABLE_LAST = 0xD7A3
+
+_CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+# 겹모음/겹받침은 낱자로 풀어 입력 도중(예: "달" → "닭")에도 접두어가 유지되도록 함
+_JUNGSUNG = (
+    "ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅗㅏ", "ㅗㅐ",
+    "ㅗㅣ", "ㅛ", "ㅜ", "ㅜㅓ", "ㅜㅔ", "ㅜㅣ", "ㅠ", "ㅡ", "ㅡㅣ", "ㅣ"
+)
+_JONGSUNG = (
+    "", "ㄱ", "ㄲ", "ㄱㅅ", "ㄴ", "ㄴㅈ", "ㄴㅎ", "ㄷ", "ㄹ", "ㄹㄱ", "ㄹㅁ",
+    "ㄹㅂ", "ㄹㅅ", "ㄹㅌ", "ㄹㅍ", "ㄹㅎ", "ㅁ", "ㅂ", "ㅂㅅ", "ㅅ", "ㅆ",
+    "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"
+)
+_COMPAT_SPLIT = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ"
+}
+_CONSONANTS = set(_CHOSUNG) | {"ㄳ", "ㄵ", "ㄶ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ", "ㅄ"}
+
+# 상품명에서 접미 키를 만들 최대 단어 수 (단어 중간부터 입력해도 완성되도록)
+_MAX_WORD_SUFFIXES = 4
+
+
+def _is_syllable(char: str) -> bool:
+    return _SYLLABLE_FIRST <= ord(char) <= _SYLLABLE_LAST
+
+
+def jamo(text: str) -> str:
+    """
+    자모 단위 분해 (공백 제거, 소문자)
+
+    예) "아동 복" → "ㅇㅏㄷㅗㅇㅂㅗㄱ"
+    """
+    parts = []
+    for char in "".join((text or "").lower().split()):
+        if _is_syllable(char):
+            offset = ord(char) - _SYLLABLE_FIRST
+            parts.append(_CHOSUNG[offset // 588])
+            parts.append(_JUNGSUNG[(offset % 588) // 28])
+            parts.append(_JONGSUNG[offset % 28])
+        else:
+            parts.append(_COMPAT_SPLIT.get(char, char))
+    return "".join(parts)
+
+
+def chosung(text: str) -> str:
+    """
+    초성 추출 (한글 외 문자는 그대로, 공백 제거, 소문자)
+
+    예) "아동복 A" → "ㅇㄷㅂa"
+    """
+    return "".join(
+        _CHOSUNG[(ord(char) - _SYLLABLE_FIRST) // 588] if _is_syllable(char) else char
+        for char in "".join((text or "").lower().split())
+    )
+
+
+def is_chosung_query(text: str) -> bool:
+    """완성된 음절/모음 없이 자음만으로 된 검색어인지 (예: "ㅇㄷㅂ")"""
+    chars = "".join((text or "").split())
+    return any(char in _CONSONANTS for char in chars) and not any(
+        _is_syllable(char) or "ㅏ" <= char <= "ㅣ" for char in chars
+    )
+
+
+class _TrieNode:
+    __slots__ = ("children", "ids")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.ids: Dict[Any, None] = {}
+
+
+class PrefixTrie:
+    """
+    문자 단위 접두어 트리
+
+    - 조회는 접두어 길이만큼 내려간 뒤 가까운(짧은) 완성부터 너비 우선으로 limit 개만 수집
+    - 제거 시 빈 노드를 정리해 모든 가지 끝에 항목이 남도록 유지 (수집 비용이 limit 에 비례)
+    """
+
+    def __init__(self):
+        self._root = _TrieNode()
+        self.node_count = 1
+
+    def insert(self, key: str, item_id: Any) -> None:
+        node = self._root
+        for char in key:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _TrieNode()
+                self.node_count += 1
+            node = child
+        node.ids[item_id] = None
+
+    def remove(self, key: str, item_id: Any) -> None:
+        path = [self._root]
+        for char in key:
+            child = path[-1].children.get(char)
+            if child is None:
+                return
+            path.append(child)
+        path[-1].ids.pop(item_id, None)
+
+        for depth in range(len(key), 0, -1):
+            node = path[depth]
+            if node.ids or node.children:
+                break
+            del path[depth - 1].children[key[depth - 1]]
+            self.node_count -= 1
+
+    def search(self, prefix: str, limit: int) -> List[Tuple[int, Any]]:
+        """접두어로 시작하는 키의 (남은 길이, 항목 ID) 목록 (가까운 순, 중복 제거)"""
+        node = self._root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return []
+
+        found: Dict[Any, int] = {}
+        queue = deque([(node, 0)])
+        while queue and len(found) < limit:
+            current, depth = queue.popleft()
+            for item_id in current.ids:
+                if item_id not in found:
+                    found[item_id] = depth
+                    if len(found) >= limit:
+                        break
+            queue.extend((child, depth + 1) for child in current.children.values())
+        return [(depth, item_id) for item_id, depth in found.items()]
+
+
+class CompanyAutocomplete:
+    """회사 하나의 상품명/상품코드 자동완성 색인"""
+
+    def __init__(self, max_key_length: int = 32):
+        self.max_key_length = max_key_length
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._keys: Dict[str, Tuple[Set[str], Set[str]]] = {}
+        self._jamo = PrefixTrie()
+        self._chosung = PrefixTrie()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @property
+    def node_count(self) -> int:
+        return self._jamo.node_count + self._chosung.node_count
+
+    def _product_keys(self, name: str, code: str) -> Tuple[Set[str], Set[str]]:
+        words = (name or "").split()
+        suffixes = ["".join(words[start:]) for start in range(min(len(words), _MAX_WORD_SUFFIXES))]
+        jamo_keys = {jamo(suffix)[:self.max_key_length] for suffix in suffixes}
+        if code:
+            jamo_keys.add(jamo(code)[:self.max_key_length])
+        chosung_keys = {chosung(suffix)[:self.max_key_length] for suffix in suffixes}
+        return {key for key in jamo_keys if key}, {key for key in chosung_keys if key}
+
+    def add(self, product: Dict[str, Any]) -> None:
+        """상품 추가 (이미 있으면 교체)"""
+        product_id = str(product["id"])
+        self.remove(product_id)
+
+        entry = {
+            "id": product_id,
+            "company_id": str(product.get("company_id")),
+            "code": product.get("code") or "",
+            "name": product.get("name") or ""
+        }
+        jamo_keys, chosung_keys = self._product_keys(entry["name"], entry["code"])
+        for key in jamo_keys:
+            self._jamo.insert(key, product_id)
+        for key in chosung_keys:
+            self._chosung.insert(key, product_id)
+        self.entries[product_id] = entry
+        self._keys[product_id] = (jamo_keys, chosung_keys)
+
+    def remove(self, product_id: str) -> None:
+        """상품 제거"""
+        self.entries.pop(product_id, None)
+        keys = self._keys.pop(product_id, None)
+        if keys is None:
+            return
+        for key in keys[0]:
+            self._jamo.remove(key, product_id)
+        for key in keys[1]:
+            self._chosung.remove(key, product_id)
+
+    def search(self, query: str, limit: int) -> List[Tuple[int, Dict[str, Any]]]:
+        """(남은 길이, 상품) 목록 - 자음만 입력하면 초성 트리, 그 외는 자모 트리에서 조회"""
+        if is_chosung_query(query):
+            trie, prefix = self._chosung, chosung(query)
+        else:
+            trie, prefix = self._jamo, jamo(query)
+        if not prefix:
+            return []
+        prefix = prefix[:self.max_key_length]
+        return [(depth, self.entries[product_id]) for depth, product_id in trie.search(prefix, limit)]
+
+
+class ProductAutocomplete:
+    """
+    회사 ID 단위 자동완성 색인 저장소 (TTL + LRU)
+
+    - 회사 색인은 처음 조회될 때 적재하고 상품 생성/수정/삭제 시 증분 반영
+    - 다른 워커의 쓰기는 반영되지 않으므로 TTL 이 지나면 다시 적재
+    - max_companies 를 넘으면 가장 오래 사용하지 않은 회사 색인부터 제거해 메모리 상한 유지
+    - 적재 도중 쓰기가 일어나면 적재 결과는 이번 조회에만 쓰고 다음 조회에서 다시 적재
+    """
+
+    def __init__(self, ttl_seconds: float, max_companies: int = 500, max_key_length: int = 32):
+        self.ttl_seconds = ttl_seconds
+        self.max_companies = max_companies
+        self.max_key_length = max_key_length
+        self._indexes: "OrderedDict[str, Tuple[float, CompanyAutocomplete]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._loads = 0
+        self._evictions = 0
+
+    def is_fresh(self, company_id: str) -> bool:
+        """적재된 색인이 있고 만료되지 않았는지"""
+        entry = self._indexes.get(str(company_id))
+        return entry is not None and entry[0] > time.monotonic()
+
+    def begin_load(self, company_id: str) -> int:
+        """적재 시작 시점의 세대 번호 (load 에 그대로 전달)"""
+        return self._generations.get(str(company_id), 0)
+
+    def load(self, company_id: str, products: Iterable[Dict[str, Any]], generation: int) -> None:
+        """DB 에서 읽은 활성 상품으로 회사 색인 교체"""
+        company_id = str(company_id)
+        index = CompanyAutocomplete(self.max_key_length)
+        for product in products:
+            index.add(product)
+
+        expires_at = time.monotonic()
+        if generation == self._generations.get(company_id, 0):
+            expires_at += self.ttl_seconds
+        self._indexes[company_id] = (expires_at, index)
+        self._indexes.move_to_end(company_id)
+        self._loads += 1
+        while len(self._indexes) > self.max_companies:
+            self._indexes.popitem(last=False)
+            self._evictions += 1
+
+    def _written(self, company_id: str) -> Optional[CompanyAutocomplete]:
+        self._generations[company_id] = self._generations.get(company_id, 0) + 1
+        entry = self._indexes.get(company_id)
+        return entry[1] if entry is not None else None
+
+    def upsert(self, company_id: str, product: Dict[str, Any]) -> None:
+        """상품 생성/수정 반영 (비활성 상품은 제거)"""
+        index = self._written(str(company_id))
+        if index is None:
+            return
+        if product.get("is_active", True):
+            index.add(product)
+        else:
+            index.remove(str(product["id"]))
+
+    def remove(self, company_id: str, product_id: str) -> None:
+        """상품 삭제 반영"""
+        index = self._written(str(company_id))
+        if index is not None:
+            index.remove(str(product_id))
+
+    def search(self, company_ids: Iterable[str], query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """적재된 회사 색인들에서 가까운 완성 순으로 limit 개 조회"""
+        matches = []
+        for company_id in company_ids:
+            entry = self._indexes.get(str(company_id))
+            if entry is None:
+                continue
+            self._indexes.move_to_end(str(company_id))
+            matches.extend(entry[1].search(query, limit))
+
+        matches.sort(key=lambda match: (match[0], match[1]["name"]))
+        return [dict(product) for _, product in matches[:limit]]
+
+    def clear(self) -> None:
+        """전체 색인 비우기"""
+        self._indexes.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """색인 통계 조회"""
+        indexes = [index for _, index in self._indexes.values()]
+        return {
+            "companies": len(indexes),
+            "products": sum(len(index) for index in indexes),
+            "nodes": sum(index.node_count for index in indexes),
+            "loads": self._loads,
+            "evictions": self._evictions,
+            "ttl_seconds": self.ttl_seconds,
+            "max_companies": self.max_companies
+        }
+
+
+# 상품 자동완성 색인
+product_autocomplete = ProductAutocomplete(
+    ttl_seconds=config.settings.PRODUCT_AUTOCOMPLETE_TTL_SECONDS,
+    max_companies=config.settings.PRODUCT_AUTOCOMPLETE_MAX_COMPANIES,
+    max_key_length=config.settings.PRODUCT_AUTOCOMPLETE_MAX_KEY_LENGTH
+)
@@ -0,0 +1,267 @@
+"""
+채팅 WebSocket 팬아웃 브로커
+워커 간 채팅 메시지 전달 (프로세스 내 / Redis pub/sub / PostgreSQL LISTEN/NOTIFY)
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+import config
+
+logger = logging.getLogger(__name__)
+
+# 브로커가 수신한 메시지를 전달받는 콜백
+MessageHandler = Callable[[str], Awaitable[None]]
+
+
+async def _dispatch(handler: MessageHandler, data: str) -> None:
+    """수신 메시지 전달 (핸들러 오류가 수신 루프를 중단시키지 않도록 처리)"""
+    try:
+        await handler(data)
+    except Exception as e:
+        logger.error(f"채팅 브로커 메시지 처리 오류: {str(e)}")
+
+
+class InProcessBroker:
+    """프로세스 내 브로커 (단일 워커/테스트용)"""
+
+    def __init__(self):
+        self._handlers: List[MessageHandler] = []
+
+    async def start(self, handler: MessageHandler) -> None:
+        """수신 시작"""
+        self._handlers.append(handler)
+
+    async def publish(self, data: str) -> None:
+        """구독 중인 모든 핸들러에 전달"""
+        for handler in list(self._handlers):
+            await _dispatch(handler, data)
+
+    async def stop(self) -> None:
+        """수신 종료"""
+        self._handlers.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """브로커 상태 조회"""
+        return {"type": "in_process", "state": "connected" if self._handlers else "stopped"}
+
+
+class ReconnectingBroker:
+    """
+    외부 브로커 공통 수신 루프
+
+    - 연결(구독) 후 연결이 끊기거나 수신이 실패하면 지수 백오프(retry_initial → retry_max 초)로 재연결
+    - 연결에 성공하면 백오프를 처음 값으로 되돌림
+    - start 는 첫 연결 시도가 끝날 때까지만 기다리며, 실패해도 예외 없이 백그라운드에서 재시도
+    - 재연결 중 발행은 예외가 나므로 ConnectionManager 가 현재 워커 소켓에만 전달함
+    """
+
+    kind = "external"
+
+    def __init__(self, retry_initial: float = 0.5, retry_max: float = 30.0):
+        self.retry_initial = retry_initial
+        self.retry_max = max(retry_max, retry_initial)
+        self.state = "stopped"
+        self.reconnects = 0
+        self.last_error: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+        self._first_attempt: Optional[asyncio.Event] = None
+
+    async def start(self, handler: MessageHandler) -> None:
+        """수신 루프 시작 (첫 연결 시도까지 대기)"""
+        if self._task is not None:
+            return
+        self.state = "connecting"
+        self._first_attempt = asyncio.Event()
+        self._task = asyncio.create_task(self._run(handler))
+        await self._first_attempt.wait()
+
+    async def _run(self, handler: MessageHandler) -> None:
+        delay = self.retry_initial
+        while True:
+            try:
+                await self._connect(handler)
+                self.state = "connected"
+                self._first_attempt.set()
+                delay = self.retry_initial
+                await self._receive(handler)
+                error = "연결이 종료되었습니다"
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                error = str(e) or type(e).__name__
+
+            self.state = "reconnecting"
+            self.reconnects += 1
+            self.last_error = error
+            self._first_attempt.set()
+            logger.warning(f"{self.kind} 채팅 브로커 연결 끊김 - {delay:.1f}초 후 재연결: {error}")
+            await self._disconnect()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.retry_max)
+
+    async def _connect(self, handler: MessageHandler) -> None:
+        """연결 및 구독 (하위 클래스 구현)"""
+        raise NotImplementedError
+
+    async def _receive(self, handler: MessageHandler) -> None:
+        """연결이 끊길 때까지 수신 (하위 클래스 구현)"""
+        raise NotImplementedError
+
+    async def _disconnect(self) -> None:
+        """연결 자원 정리 (오류 무시, 하위 클래스 구현)"""
+        raise NotImplementedError
+
+    async def stop(self) -> None:
+        """수신 루프 종료 및 연결 해제"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._disconnect()
+        self.state = "stopped"
+
+    def get_stats(self) -> Dict[str, Any]:
+        """브로커 상태 조회 (/health/chat)"""
+        return {
+            "type": self.kind,
+            "state": self.state,
+            "reconnects": self.reconnects,
+            "last_error": self.last_error
+        }
+
+
+class RedisBroker(ReconnectingBroker):
+    """Redis pub/sub 브로커 (redis.asyncio 호환 클라이언트, 끊기면 재구독)"""
+
+    kind = "redis"
+
+    def __init__(self, client: Any, channel: str, retry_initial: float = 0.5, retry_max: float = 30.0):
+        super().__init__(retry_initial, retry_max)
+        self.client = client
+        self.channel = channel
+        self._pubsub: Optional[Any] = None
+
+    async def _connect(self, handler: MessageHandler) -> None:
+        self._pubsub = self.client.pubsub()
+        await self._pubsub.subscribe(self.channel)
+        logger.info(f"Redis 채팅 브로커 구독 시작: {self.channel}")
+
+    async def _receive(self, handler: MessageHandler) -> None:
+        async for message in self._pubsub.listen():
+            if message.get("type") != "message":
+                continue
+            data = message["data"]
+            await _dispatch(handler, data.decode() if isinstance(data, bytes) else data)
+
+    async def _disconnect(self) -> None:
+        pubsub, self._pubsub = self._pubsub, None
+        if pubsub is None:
+            return
+        try:
+            await pubsub.unsubscribe(self.channel)
+            await pubsub.close()
+        except Exception as e:
+            logger.debug(f"Redis 채팅 브로커 구독 해제 오류: {str(e)}")
+
+    async def publish(self, data: str) -> None:
+        """채널에 발행 (발행한 워커도 구독 중이므로 함께 수신)"""
+        await self.client.publish(self.channel, data)
+
+
+class PostgresNotifyBroker(ReconnectingBroker):
+    """
+    PostgreSQL LISTEN/NOTIFY 브로커
+
+    전용 커넥션 하나로 LISTEN 하고 같은 커넥션에서 pg_notify 로 발행.
+    NOTIFY 페이로드는 8000 바이트 미만이어야 하며 초과 시 발행이 실패함.
+    커넥션 종료는 종료 리스너로, 응답 없는 커넥션은 keepalive_seconds 마다 SELECT 1 로 감지해
+    새 커넥션에서 LISTEN 을 다시 실행함.
+    """
+
+    kind = "postgres"
+
+    def __init__(self, dsn: str, channel: str, retry_initial: float = 0.5, retry_max: float = 30.0,
+                 keepalive_seconds: float = 30.0):
+        super().__init__(retry_initial, retry_max)
+        self.dsn = dsn
+        self.channel = channel
+        self.keepalive_seconds = keepalive_seconds
+        self._connection: Optional[Any] = None
+        self._closed: Optional[asyncio.Event] = None
+        self._publish_lock = asyncio.Lock()
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def _connect(self, handler: MessageHandler) -> None:
+        import asyncpg
+
+        def on_notify(connection, pid, channel, payload):
+            task = asyncio.create_task(_dispatch(handler, payload))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        closed = asyncio.Event()
+        connection = await asyncpg.connect(self.dsn)
+        connection.add_termination_listener(lambda _: closed.set())
+        self._connection, self._closed = connection, closed
+        await connection.add_listener(self.channel, on_notify)
+        logger.info(f"PostgreSQL 채팅 브로커 LISTEN 시작: {self.channel}")
+
+    async def _receive(self, handler: MessageHandler) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._closed.wait(), timeout=self.keepalive_seconds)
+                return
+            except asyncio.TimeoutError:
+                async with self._publish_lock:
+                    await self._connection.execute("SELECT 1", timeout=self.keepalive_seconds)
+
+    async def _disconnect(self) -> None:
+        connection, self._connection = self._connection, None
+        if connection is None:
+            return
+        try:
+            await connection.close(timeout=5)
+        except Exception as e:
+            logger.debug(f"PostgreSQL 채팅 브로커 커넥션 종료 오류: {str(e)}")
+            connection.terminate()
+
+    async def publish(self, data: str) -> None:
+        """pg_notify 발행 (커넥션은 동시 쿼리를 허용하지 않으므로 직렬화)"""
+        connection = self._connection
+        if connection is None or connection.is_closed():
+            raise ConnectionError("채팅 브로커 커넥션이 없습니다")
+        async with self._publish_lock:
+            await connection.execute("SELECT pg_notify($1, $2)", self.channel, data)
+
+
+def create_chat_broker() -> Any:
+    """
+    설정에 맞는 브로커 생성
+
+    CHAT_BROKER_URL 이 redis:// 이면 Redis, postgres:// 이면 LISTEN/NOTIFY,
+    없으면 프로세스 내 브로커 사용
+    """
+    url = config.settings.CHAT_BROKER_URL
+    channel = config.settings.CHAT_BROKER_CHANNEL
+    if not url:
+        return InProcessBroker()
+
+    if url.startswith(("redis://", "rediss://")):
+        try:
+            import redis.asyncio as redis_asyncio
+            return RedisBroker(redis_asyncio.from_url(url, decode_responses=True), channel,
+                               retry_max=config.settings.CHAT_BROKER_RECONNECT_MAX_SECONDS)
+        except ImportError:
+            logger.warning("redis 패키지가 없어 프로세스 내 채팅 브로커를 사용합니다")
+            return InProcessBroker()
+
+    if url.startswith(("postgres://", "postgresql://")):
+        return PostgresNotifyBroker(url, channel, retry_max=config.settings.CHAT_BROKER_RECONNECT_MAX_SECONDS)
+
+    logger.warning("지원하지 않는 CHAT_BROKER_URL 입니다 - 프로세스 내 브로커 사용")
+    return InProcessBroker()
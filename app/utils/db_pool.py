@@ -0,0 +1,244 @@
+"""
+asyncpg 커넥션 풀 SQL 실행기
+database.set_supabase_execute_function 에 주입되는 PostgreSQL 직접 연결 실행기
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+
+import asyncpg
+
+import config
+
+logger = logging.getLogger(__name__)
+
+# 커넥션 재획득으로 복구 가능한 연결 오류
+_CONNECTION_ERRORS = (
+    asyncpg.exceptions.ConnectionDoesNotExistError,
+    asyncpg.exceptions.InterfaceError,
+    ConnectionError,
+    OSError,
+)
+
+
+class AsyncpgExecutor:
+    """asyncpg 커넥션 풀 기반 SQL 실행기 (Supabase MCP execute_sql 호환)"""
+
+    def __init__(
+        self,
+        dsn: str,
+        *,
+        min_size: int = 2,
+        max_size: int = 10,
+        statement_cache_size: int = 100,
+        acquire_timeout: float = 5.0,
+        command_timeout: float = 30.0,
+        max_inactive_lifetime: float = 300.0,
+        health_check_interval: float = 30.0
+    ):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError(f"잘못된 커넥션 풀 크기입니다 (min={min_size}, max={max_size})")
+
+        self.dsn = dsn
+        self.min_size = min_size
+        self.max_size = max_size
+        self.statement_cache_size = statement_cache_size
+        self.acquire_timeout = acquire_timeout
+        self.command_timeout = command_timeout
+        self.max_inactive_lifetime = max_inactive_lifetime
+        self.health_check_interval = health_check_interval
+
+        self._pool: Optional[asyncpg.Pool] = None
+        self._start_lock = asyncio.Lock()
+        # 서버 PID -> 마지막 사용 확인 시각 (유휴 커넥션 health check 용)
+        self._last_checked: Dict[int, float] = {}
+
+        # 실행 통계
+        self.stats = {
+            "queries": 0,
+            "errors": 0,
+            "acquire_timeouts": 0,
+            "health_check_failures": 0,
+            "transactions": 0,
+            "rollbacks": 0,
+        }
+
+    @classmethod
+    def from_settings(cls, settings: Optional[config.Settings] = None) -> "AsyncpgExecutor":
+        """애플리케이션 설정으로 실행기 생성"""
+        settings = settings or config.settings
+        pool_config = settings.get_database_pool_config()
+        if not pool_config["dsn"]:
+            raise ValueError("DATABASE_URL이 설정되지 않았습니다")
+        dsn = pool_config.pop("dsn")
+        return cls(dsn, **pool_config)
+
+    @property
+    def is_started(self) -> bool:
+        """커넥션 풀 생성 여부"""
+        return self._pool is not None
+
+    async def start(self) -> None:
+        """커넥션 풀 생성 (min_size 만큼 미리 연결)"""
+        async with self._start_lock:
+            if self._pool is not None:
+                return
+
+            self._pool = await asyncpg.create_pool(
+                dsn=self.dsn,
+                min_size=self.min_size,
+                max_size=self.max_size,
+                statement_cache_size=self.statement_cache_size,
+                command_timeout=self.command_timeout,
+                max_inactive_connection_lifetime=self.max_inactive_lifetime,
+                setup=self._health_check
+            )
+            logger.info(
+                f"PostgreSQL 커넥션 풀 생성 완료 (min={self.min_size}, max={self.max_size}, "
+                f"statement_cache={self.statement_cache_size})"
+            )
+
+    async def close(self) -> None:
+        """커넥션 풀 종료"""
+        async with self._start_lock:
+            if self._pool is None:
+                return
+
+            pool, self._pool = self._pool, None
+            self._last_checked.clear()
+            try:
+                await asyncio.wait_for(pool.close(), timeout=self.command_timeout)
+            except asyncio.TimeoutError:
+                logger.warning("커넥션 풀 종료 시간 초과 - 강제 종료합니다")
+                pool.terminate()
+            logger.info("PostgreSQL 커넥션 풀이 종료되었습니다")
+
+    async def _health_check(self, connection) -> None:
+        """
+        풀에서 꺼낸 커넥션 상태 확인
+
+        health_check_interval 이상 확인되지 않은 커넥션만 ping 하여
+        매 요청마다 왕복이 추가되지 않도록 함. 실패 시 asyncpg가 해당
+        커넥션을 닫고 acquire 예외를 전파함.
+        """
+        server_pid = connection.get_server_pid()
+        now = time.monotonic()
+        last_checked = self._last_checked.get(server_pid)
+
+        if last_checked is None or now - last_checked >= self.health_check_interval:
+            try:
+                await connection.execute("SELECT 1")
+            except Exception:
+                self.stats["health_check_failures"] += 1
+                self._last_checked.pop(server_pid, None)
+                raise
+
+        self._last_checked[server_pid] = now
+
+    async def _acquire(self):
+        """커넥션 획득 (health check 실패 시 새 커넥션으로 1회 재시도)"""
+        if self._pool is None:
+            await self.start()
+
+        for attempt in range(2):
+            try:
+                return await self._pool.acquire(timeout=self.acquire_timeout)
+            except asyncio.TimeoutError:
+                self.stats["acquire_timeouts"] += 1
+                raise
+            except _CONNECTION_ERRORS as e:
+                if attempt == 1:
+                    raise
+                logger.warning(f"비정상 커넥션 감지, 재연결 시도: {str(e)}")
+
+    async def execute_sql(self, *, project_id: str, query: str,
+                          params: Optional[Sequence[Any]] = None) -> List[Dict[str, Any]]:
+        """
+        SQL 실행 (Supabase MCP execute_sql 과 동일한 호출 규약)
+
+        asyncpg는 커넥션마다 statement_cache_size 크기의 prepared statement
+        LRU 캐시를 유지하므로, 파라미터를 분리한 고정 쿼리 텍스트는 재파싱/재계획
+        없이 캐시된 statement로 실행됨.
+
+        Args:
+            project_id: Supabase 프로젝트 ID (호환성 유지용, 사용하지 않음)
+            query: 실행할 SQL 쿼리 ($1, $2 ... 위치 파라미터)
+            params: 위치 파라미터 값 목록
+
+        Returns:
+            List[Dict[str, Any]]: 결과 행 목록 (결과가 없는 명령은 빈 리스트)
+        """
+        connection = await self._acquire()
+        try:
+            return await self.fetch(connection, query, params)
+        finally:
+            await self._pool.release(connection)
+
+    async def fetch(self, connection, query: str,
+                    params: Optional[Sequence[Any]] = None) -> List[Dict[str, Any]]:
+        """지정한 커넥션으로 SQL 실행 (트랜잭션에 고정된 커넥션 용)"""
+        try:
+            records = await connection.fetch(query, *(params or ()))
+            self.stats["queries"] += 1
+            return [dict(record) for record in records]
+        except Exception:
+            self.stats["errors"] += 1
+            raise
+
+    async def stream(self, query: str, params: Optional[Sequence[Any]] = None,
+                     prefetch: int = 1000) -> AsyncIterator[Any]:
+        """
+        서버 측 커서로 prefetch 행씩 가져오며 한 행씩 반환 (대용량 내보내기용)
+
+        커서는 트랜잭션 안에서만 유지되므로 읽기 전용 REPEATABLE READ 트랜잭션으로 감싸
+        내보내기 전체가 같은 스냅샷을 보도록 함. 스트림이 끝나거나 중단될 때까지
+        커넥션 하나를 점유하고, command_timeout 은 prefetch 한 번마다 적용됨.
+        행은 asyncpg Record 그대로 반환 (dict 변환 없음, 키/ get() 접근 가능).
+        """
+        connection = await self._acquire()
+        try:
+            async with connection.transaction(isolation="repeatable_read", readonly=True):
+                self.stats["queries"] += 1
+                async for record in connection.cursor(query, *(params or ()), prefetch=prefetch):
+                    yield record
+        except Exception:
+            self.stats["errors"] += 1
+            raise
+        finally:
+            await self._pool.release(connection)
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[Any]:
+        """
+        커넥션 하나를 고정하여 BEGIN/COMMIT 트랜잭션 실행
+
+        블록이 예외 없이 끝나면 COMMIT, 예외 발생 시 ROLLBACK 후 예외 전파.
+        블록 내부 쿼리는 모두 같은 커넥션을 사용해야 하므로 fetch() 로 실행함.
+        """
+        connection = await self._acquire()
+        try:
+            async with connection.transaction():
+                self.stats["transactions"] += 1
+                yield connection
+        except Exception:
+            self.stats["rollbacks"] += 1
+            raise
+        finally:
+            await self._pool.release(connection)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """커넥션 풀 상태 및 실행 통계 반환"""
+        pool_stats = {
+            "size": 0,
+            "idle": 0,
+            "min_size": self.min_size,
+            "max_size": self.max_size,
+        }
+        if self._pool is not None:
+            pool_stats["size"] = self._pool.get_size()
+            pool_stats["idle"] = self._pool.get_idle_size()
+
+        return {**pool_stats, **self.stats}
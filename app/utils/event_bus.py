@@ -0,0 +1,149 @@
+"""
+대시보드 실시간 이벤트 버스
+서비스 계층이 발행한 이벤트(대시보드 카운터 증감, 알림, 주문 상태 변경)를 SSE 구독자에게 전달
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import time
+from typing import Any, Dict, Iterable, Optional, Set
+
+import config
+
+logger = logging.getLogger(__name__)
+
+
+def encode_sse(event_type: str, data: Any, event_id: Optional[int] = None) -> str:
+    """SSE 프레임 문자열 생성 (data 는 JSON 한 줄)"""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event_type}")
+    lines.append(f"data: {json.dumps(data, ensure_ascii=False, default=str, separators=(',', ':'))}")
+    return "\n".join(lines) + "\n\n"
+
+
+# 연결 유지용 주석 프레임 (프록시 유휴 타임아웃 방지, 클라이언트는 무시)
+SSE_HEARTBEAT = ": ping\n\n"
+
+
+class EventSubscription:
+    """
+    SSE 연결 하나의 수신 큐
+
+    큐가 가득 차면 가장 오래된 이벤트를 버림 (느린 클라이언트가 발행자를 막지 않도록)
+    """
+
+    def __init__(self, bus: "EventBus", user_id: str, company_id: Optional[str], queue_size: int):
+        self.bus = bus
+        self.user_id = user_id
+        self.company_id = company_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max(queue_size, 1))
+        self.dropped = 0
+        self.connected_at = time.monotonic()
+
+    def put(self, event: Dict[str, Any]) -> None:
+        """이벤트 적재 (가득 차면 가장 오래된 이벤트 폐기)"""
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(event)
+
+    async def get(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """다음 이벤트 대기 (timeout 초 동안 없으면 None)"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        """구독 해제"""
+        self.bus.unsubscribe(self)
+
+
+class EventBus:
+    """
+    프로세스 내 이벤트 버스
+
+    - 구독은 사용자 ID 와 회사 ID 양쪽으로 색인되며, 발행 시 지정한 회사/사용자의 구독에만 전달
+    - 한 구독이 회사와 사용자 조건에 모두 해당해도 한 번만 전달
+    - 발행은 동기 함수이므로 쓰기 경로에서 await 없이 호출 가능
+    - 워커(프로세스)마다 독립적이므로 WORKERS>1 이면 같은 워커에 연결된 구독자에게만 전달됨
+    """
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._by_user: Dict[str, Set[EventSubscription]] = {}
+        self._by_company: Dict[str, Set[EventSubscription]] = {}
+        self._sequence = itertools.count(1)
+        self._published = 0
+        self._delivered = 0
+
+    def subscribe(self, user_id: str, company_id: Optional[str] = None) -> EventSubscription:
+        """구독 생성"""
+        subscription = EventSubscription(self, str(user_id), str(company_id) if company_id else None, self.queue_size)
+        self._by_user.setdefault(subscription.user_id, set()).add(subscription)
+        if subscription.company_id:
+            self._by_company.setdefault(subscription.company_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: EventSubscription) -> None:
+        """구독 해제 (중복 호출 허용)"""
+        for index, key in ((self._by_user, subscription.user_id), (self._by_company, subscription.company_id)):
+            subscriptions = index.get(key)
+            if subscriptions is None:
+                continue
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del index[key]
+
+    def publish(self, event_type: str, data: Dict[str, Any],
+                company_ids: Iterable[Optional[str]] = (), user_ids: Iterable[Optional[str]] = ()) -> int:
+        """
+        이벤트 발행
+
+        Args:
+            event_type: SSE event 이름 (dashboard, notification, order, low_stock)
+            data: JSON 으로 직렬화할 데이터
+            company_ids: 대상 회사 ID (해당 회사 사용자 모두)
+            user_ids: 대상 사용자 ID
+
+        Returns:
+            int: 이벤트를 받은 구독 수
+        """
+        targets: Set[EventSubscription] = set()
+        for company_id in company_ids:
+            if company_id:
+                targets.update(self._by_company.get(str(company_id), ()))
+        for user_id in user_ids:
+            if user_id:
+                targets.update(self._by_user.get(str(user_id), ()))
+
+        self._published += 1
+        if not targets:
+            return 0
+
+        event = {"id": next(self._sequence), "event": event_type, "data": data}
+        for subscription in targets:
+            subscription.put(event)
+        self._delivered += len(targets)
+        return len(targets)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """구독/발행 통계"""
+        subscriptions = set().union(*self._by_user.values()) if self._by_user else set()
+        return {
+            "subscriptions": len(subscriptions),
+            "users": len(self._by_user),
+            "companies": len(self._by_company),
+            "published": self._published,
+            "delivered": self._delivered,
+            "dropped": sum(subscription.dropped for subscription in subscriptions),
+            "queue_size": self.queue_size
+        }
+
+
+# 대시보드 SSE 이벤트 버스
+event_bus = EventBus(queue_size=config.settings.SSE_QUEUE_SIZE)
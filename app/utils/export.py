@@ -0,0 +1,74 @@
+"""
+대용량 내보내기 인코더
+DB 행 스트림을 CSV/NDJSON 바이트 청크로 변환 (행마다 모델 객체를 만들지 않고 청크 단위로 메모리 일정 유지)
+"""
+
+import csv
+import io
+import json
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Dict, Sequence
+
+EXPORT_FORMATS: Dict[str, str] = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson"
+}
+
+
+def _plain(value: Any) -> Any:
+    """JSON/CSV 로 옮길 수 있는 값으로 변환 (UUID/Decimal 은 문자열, 날짜는 ISO 8601)"""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+async def csv_chunks(rows: AsyncIterator[Any], columns: Sequence[str],
+                     chunk_rows: int = 1000) -> AsyncIterator[bytes]:
+    """
+    CSV 청크 생성 (첫 청크에 UTF-8 BOM + 헤더)
+
+    BOM 은 엑셀에서 한글이 깨지지 않도록 붙임
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    pending = 0
+    first = True
+
+    async for row in rows:
+        writer.writerow(["" if row.get(column) is None else _plain(row.get(column)) for column in columns])
+        pending += 1
+        if pending >= chunk_rows:
+            yield buffer.getvalue().encode("utf-8-sig" if first else "utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+            first = False
+
+    yield buffer.getvalue().encode("utf-8-sig" if first else "utf-8")
+
+
+async def ndjson_chunks(rows: AsyncIterator[Any], columns: Sequence[str],
+                        chunk_rows: int = 1000) -> AsyncIterator[bytes]:
+    """NDJSON 청크 생성 (한 줄에 한 행)"""
+    lines = []
+    async for row in rows:
+        lines.append(json.dumps({column: _plain(row.get(column)) for column in columns}, ensure_ascii=False))
+        if len(lines) >= chunk_rows:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+            lines = []
+
+    if lines:
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def encode_rows(rows: AsyncIterator[Any], columns: Sequence[str], export_format: str,
+                chunk_rows: int = 1000) -> AsyncIterator[bytes]:
+    """형식(csv/ndjson)에 맞는 청크 생성기 반환"""
+    if export_format == "csv":
+        return csv_chunks(rows, columns, chunk_rows)
+    if export_format == "ndjson":
+        return ndjson_chunks(rows, columns, chunk_rows)
+    raise ValueError(f"지원하지 않는 내보내기 형식입니다: {export_format}")
@@ -0,0 +1,126 @@
+"""
+상품 이미지 처리
+업로드 원본에서 WebP 썸네일/목록용 이미지를 만들어 프로세스 풀에서 실행 (Pillow 가 이벤트 루프를 막지 않도록)
+"""
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Optional
+
+import config
+
+logger = logging.getLogger(__name__)
+
+# Pillow 포맷 → 원본 저장 확장자/Content-Type
+SOURCE_FORMATS: Dict[str, tuple] = {
+    "JPEG": ("jpg", "image/jpeg"),
+    "PNG": ("png", "image/png"),
+    "GIF": ("gif", "image/gif"),
+    "WEBP": ("webp", "image/webp"),
+}
+
+
+class InvalidImageError(ValueError):
+    """이미지로 읽을 수 없거나 허용하지 않는 형식"""
+
+
+def process_image(source_path: str, output_dir: str, sizes: Dict[str, int],
+                  quality: int = 80, max_pixels: int = 40_000_000) -> Dict[str, Any]:
+    """
+    원본 이미지에서 크기별 WebP 변형 생성 (프로세스 풀 워커에서 실행)
+
+    - EXIF 회전 정보를 반영하고, 긴 변 기준으로 sizes 이하로 축소 (확대하지 않음)
+    - 애니메이션 GIF/WebP 는 첫 프레임만 사용
+    - max_pixels 를 넘는 이미지는 디코딩 전에 거부 (압축 폭탄 방지)
+
+    Returns:
+        {"format", "extension", "content_type", "width", "height",
+         "variants": {이름: {"path", "width", "height"}}}
+    """
+    from PIL import Image, ImageOps, UnidentifiedImageError
+
+    try:
+        with Image.open(source_path) as image:
+            if image.format not in SOURCE_FORMATS:
+                raise InvalidImageError(f"지원하지 않는 이미지 형식입니다: {image.format}")
+            if image.width * image.height > max_pixels:
+                raise InvalidImageError("이미지 해상도가 너무 큽니다")
+
+            extension, content_type = SOURCE_FORMATS[image.format]
+            result = {
+                "format": image.format,
+                "extension": extension,
+                "content_type": content_type,
+                "width": image.width,
+                "height": image.height,
+                "variants": {}
+            }
+
+            image = ImageOps.exif_transpose(image)
+            has_alpha = image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info)
+            image = image.convert("RGBA" if has_alpha else "RGB")
+
+            for name, size in sizes.items():
+                variant = image.copy()
+                variant.thumbnail((size, size), Image.LANCZOS)
+                path = os.path.join(output_dir, f"{name}.webp")
+                variant.save(path, "WEBP", quality=quality, method=4)
+                result["variants"][name] = {"path": path, "width": variant.width, "height": variant.height}
+
+            return result
+
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError) as e:
+        raise InvalidImageError(f"이미지를 읽을 수 없습니다: {e}")
+
+
+class ImageProcessor:
+    """
+    이미지 변형 생성 프로세스 풀
+
+    - 풀은 첫 요청 때 만들며 워커 수만큼만 동시에 디코딩/인코딩함 (나머지는 대기열)
+    - 실행 중인 이벤트 루프/스레드를 복제하지 않도록 spawn 방식으로 워커 생성
+    """
+
+    def __init__(self, max_workers: int, sizes: Dict[str, int], quality: int, max_pixels: int):
+        self.max_workers = max_workers
+        self.sizes = dict(sizes)
+        self.quality = quality
+        self.max_pixels = max_pixels
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    async def process(self, source_path: str, output_dir: str) -> Dict[str, Any]:
+        """원본에서 변형 생성 (결과 형식은 process_image 참고)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool(), functools.partial(
+            process_image, source_path, output_dir, self.sizes, self.quality, self.max_pixels
+        ))
+
+    def shutdown(self) -> None:
+        """풀 종료 (대기 중인 작업 취소)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# 상품 이미지 처리 풀 (긴 변 기준 픽셀 크기)
+image_processor = ImageProcessor(
+    max_workers=config.settings.IMAGE_PROCESS_WORKERS,
+    sizes={
+        "thumbnail": config.settings.PRODUCT_IMAGE_THUMBNAIL_SIZE,
+        "list": config.settings.PRODUCT_IMAGE_LIST_SIZE
+    },
+    quality=config.settings.PRODUCT_IMAGE_WEBP_QUALITY,
+    max_pixels=config.settings.PRODUCT_IMAGE_MAX_PIXELS
+)
@@ -4,33 +4,210 @@ JWT 기반 인증 시스템의 핵심 기능
 """
 
 import jwt
+import asyncio
+import hashlib
+import heapq
+import inspect
+import logging
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, List, Optional, Tuple, Union
 import uuid
 from models.auth import TokenData
 import config
 
+logger = logging.getLogger(__name__)
+
 
 class TokenValidationError(Exception):
     """JWT 토큰 검증 실패 예외"""
     pass
 
 
-class MockRedisClient:
-    """Redis 클라이언트 모의 구현 (테스트용)"""
-    _revoked_tokens = set()
+class RevocationStoreUnavailableError(TokenValidationError):
+    """토큰 폐기 저장소 조회 실패 (TOKEN_REVOCATION_FAIL_OPEN=False 일 때 토큰 거부)"""
+    pass
+
+
+class InMemoryRevocationStore:
+    """
+    프로세스 내 토큰 폐기 저장소 (Redis setex/get 호환)
+    
+    - 항목은 TTL(토큰 만료 시각)이 지나면 제거되며, 만료 순서 힙으로 접근 시마다 앞에서부터 정리
+    - max_size 를 넘으면 만료가 가장 가까운 항목부터 제거 (경고 로그)
+    - 같은 키를 다시 저장하면 만료 시각을 갱신 (힙의 이전 항목은 정리 시 무시)
+    """
+    
+    def __init__(self, max_size: int = 100000, clock=time.monotonic):
+        self.max_size = max_size
+        self._clock = clock
+        self._entries: Dict[str, Tuple[float, str]] = {}
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._evicted = 0
     
     def setex(self, key: str, time: int, value: str) -> bool:
-        """토큰을 폐기 목록에 추가"""
-        self._revoked_tokens.add(key)
+        """TTL(초)과 함께 저장"""
+        now = self._clock()
+        expires_at = now + max(time, 1)
+        self._entries[key] = (expires_at, value)
+        heapq.heappush(self._expiry_heap, (expires_at, key))
+        self._purge(now)
         return True
     
     def get(self, key: str) -> Optional[str]:
-        """폐기된 토큰 확인"""
-        return "revoked" if key in self._revoked_tokens else None
+        """저장된 값 조회 (없거나 만료 시 None)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= self._clock():
+            self._purge(self._clock())
+            return None
+        return entry[1]
+    
+    def _purge(self, now: float) -> None:
+        """만료 항목과 상한 초과 항목 제거"""
+        while self._expiry_heap:
+            expires_at, key = self._expiry_heap[0]
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] != expires_at:
+                # 재저장으로 만료 시각이 바뀐 이전 힙 항목
+                heapq.heappop(self._expiry_heap)
+                continue
+            if entry is not None and expires_at > now and len(self._entries) <= self.max_size:
+                break
+            heapq.heappop(self._expiry_heap)
+            if entry is not None:
+                if expires_at > now:
+                    self._evicted += 1
+                    logger.warning("토큰 폐기 저장소 상한 초과 - 만료가 가장 가까운 항목 제거")
+                del self._entries[key]
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def clear(self) -> None:
+        """전체 초기화"""
+        self._entries.clear()
+        self._expiry_heap.clear()
 
 
-redis_client = MockRedisClient()
+class VerifiedTokenCache:
+    """
+    검증된 토큰 캐시 (토큰 다이제스트 → TokenData, LRU)
+    
+    - 서명/클레임 검증을 통과한 토큰만 저장하며 토큰의 exp 가 지나면 조회되지 않음
+    - 원문 토큰 대신 SHA-256 다이제스트를 키로 사용
+    - max_size 를 넘으면 가장 오래 사용하지 않은 항목부터 제거 (0 이면 캐시 사용 안 함)
+    - 폐기 여부는 캐시 적중 시에도 매번 폐기 저장소에서 확인함
+    """
+    
+    def __init__(self, max_size: int = 10000, clock=time.time):
+        self.max_size = max_size
+        self._clock = clock
+        self._entries: "OrderedDict[bytes, TokenData]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+    
+    def get(self, digest: bytes) -> Optional[TokenData]:
+        """캐시된 토큰 데이터 조회 (없거나 만료 시 None)"""
+        token_data = self._entries.get(digest)
+        if token_data is None:
+            self._misses += 1
+            return None
+        if token_data.exp <= self._clock():
+            del self._entries[digest]
+            self._misses += 1
+            return None
+        self._entries.move_to_end(digest)
+        self._hits += 1
+        return token_data
+    
+    def set(self, digest: bytes, token_data: TokenData) -> None:
+        """검증된 토큰 데이터 저장"""
+        if self.max_size <= 0:
+            return
+        self._entries[digest] = token_data
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    def invalidate(self, digest: bytes) -> None:
+        """항목 제거 (토큰 폐기 시)"""
+        self._entries.pop(digest, None)
+    
+    def clear(self) -> None:
+        """전체 캐시 비우기"""
+        self._entries.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 조회"""
+        return {
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "max_size": self.max_size
+        }
+
+
+def create_revocation_store() -> Any:
+    """
+    설정에 맞는 토큰 폐기 저장소 생성
+    
+    TOKEN_REVOCATION_REDIS_URL 이 있으면 redis.asyncio 클라이언트(워커 간 공유, 요청마다 GET 1회,
+    이벤트 루프를 막지 않음), 없거나 redis 패키지가 설치되지 않은 경우 프로세스 내 저장소 사용
+    """
+    redis_url = config.settings.TOKEN_REVOCATION_REDIS_URL
+    if redis_url:
+        try:
+            import redis.asyncio as redis_asyncio
+            timeout = config.settings.TOKEN_REVOCATION_TIMEOUT_SECONDS
+            return redis_asyncio.from_url(
+                redis_url, decode_responses=True, socket_timeout=timeout, socket_connect_timeout=timeout
+            )
+        except ImportError:
+            logger.warning("redis 패키지가 없어 프로세스 내 토큰 폐기 저장소를 사용합니다")
+    return InMemoryRevocationStore(max_size=config.settings.TOKEN_REVOCATION_MAX_SIZE)
+
+
+async def _store_call(result: Any) -> Any:
+    """저장소 호출 결과 (redis.asyncio 는 코루틴, 프로세스 내 저장소는 값)"""
+    if inspect.isawaitable(result):
+        return await asyncio.wait_for(result, timeout=config.settings.TOKEN_REVOCATION_TIMEOUT_SECONDS)
+    return result
+
+
+async def _check_not_revoked(user_id: Any, digest: bytes) -> None:
+    """
+    폐기된 토큰이면 TokenValidationError
+    
+    저장소 장애 시 TOKEN_REVOCATION_FAIL_OPEN 이면 경고 로그 후 통과(서명/만료 검증은 완료된 상태),
+    아니면 RevocationStoreUnavailableError 로 거부
+    """
+    try:
+        revoked = await _store_call(redis_client.get(_revocation_key(user_id, digest)))
+    except Exception as e:
+        if config.settings.TOKEN_REVOCATION_FAIL_OPEN:
+            logger.warning(f"토큰 폐기 저장소 오류 - 폐기 확인 생략: {str(e)}")
+            return
+        logger.error(f"토큰 폐기 저장소 오류 - 토큰 거부: {str(e)}")
+        raise RevocationStoreUnavailableError("토큰 폐기 여부를 확인할 수 없습니다")
+    if revoked:
+        raise TokenValidationError("폐기된 토큰입니다")
+
+
+def _token_digest(token: str) -> bytes:
+    """토큰 SHA-256 다이제스트 (캐시/폐기 키용)"""
+    return hashlib.sha256(token.encode()).digest()
+
+
+def _revocation_key(user_id: Any, digest: bytes) -> str:
+    """폐기 저장소 키"""
+    return f"token:{user_id}:{digest.hex()}"
+
+
+redis_client = create_revocation_store()
+verified_token_cache = VerifiedTokenCache(max_size=config.settings.JWT_VERIFIED_CACHE_MAX_SIZE)
 
 
 def create_access_token(user_data: Dict[str, Any]) -> str:
@@ -107,9 +284,9 @@ def create_refresh_token(user_data: Dict[str, Any]) -> str:
     )
 
 
-def verify_token(token: str, expected_type: str) -> TokenData:
+async def verify_token(token: str, expected_type: str) -> TokenData:
     """
-    JWT 토큰 검증 및 TokenData 반환
+    JWT 토큰 검증 및 TokenData 반환 (폐기 여부는 폐기 저장소에서 비동기 조회)
     
     Args:
         token: JWT 토큰 문자열
@@ -119,8 +296,17 @@ def verify_token(token: str, expected_type: str) -> TokenData:
         TokenData: 검증된 토큰 데이터
         
     Raises:
-        TokenValidationError: 토큰 검증 실패 시
+        TokenValidationError: 토큰 검증 실패 시 (폐기 저장소 장애로 거부하면 RevocationStoreUnavailableError)
     """
+    # 이미 검증한 토큰은 서명/클레임 검증 생략 (타입/폐기 여부는 매번 확인)
+    digest = _token_digest(token)
+    cached = verified_token_cache.get(digest)
+    if cached is not None:
+        if cached.type != expected_type:
+            raise TokenValidationError("토큰 타입이 일치하지 않습니다")
+        await _check_not_revoked(cached.user_id, digest)
+        return cached
+    
     try:
         payload = jwt.decode(
             token,
@@ -143,11 +329,9 @@ def verify_token(token: str, expected_type: str) -> TokenData:
         raise TokenValidationError("토큰 타입이 일치하지 않습니다")
     
     # 폐기된 토큰 확인
-    token_id = f"token:{payload.get('user_id')}:{token}"
-    if redis_client.get(token_id):
-        raise TokenValidationError("폐기된 토큰입니다")
+    await _check_not_revoked(payload.get("user_id"), digest)
     
-    return TokenData(
+    token_data = TokenData(
         user_id=payload["user_id"],
         email=payload["email"],
         role=payload["role"],
@@ -156,6 +340,8 @@ def verify_token(token: str, expected_type: str) -> TokenData:
         iat=payload["iat"],
         type=payload["type"]
     )
+    verified_token_cache.set(digest, token_data)
+    return token_data
 
 
 def decode_token(token: str) -> Dict[str, Any]:
@@ -237,9 +423,9 @@ def get_token_payload(token: str) -> Optional[Dict[str, Any]]:
         return None
 
 
-def revoke_token(token: str) -> bool:
+async def revoke_token(token: str) -> bool:
     """
-    토큰 폐기 처리
+    토큰 폐기 처리 (저장소 오류 시 False)
     
     Args:
         token: 폐기할 JWT 토큰 문자열
@@ -252,16 +438,19 @@ def revoke_token(token: str) -> bool:
         if not payload:
             return False
             
-        # 토큰 고유 키 생성
-        token_id = f"token:{payload.get('user_id')}:{token}"
+        # 토큰 고유 키 생성 (원문 대신 다이제스트)
+        digest = _token_digest(token)
+        token_id = _revocation_key(payload.get("user_id"), digest)
         
-        # 토큰 만료 시간까지 Redis에 저장
+        # 토큰 만료 시간까지 폐기 저장소에 보관
         exp_timestamp = payload.get("exp", 0)
         now_timestamp = int(datetime.now(timezone.utc).timestamp())
         ttl = max(exp_timestamp - now_timestamp, 1)
         
-        redis_client.setex(token_id, ttl, "revoked")
+        verified_token_cache.invalidate(digest)
+        await _store_call(redis_client.setex(token_id, ttl, "revoked"))
         return True
         
-    except Exception:
+    except Exception as e:
+        logger.warning(f"토큰 폐기 실패: {str(e)}")
         return False
\ No newline at end of file
@@ -0,0 +1,136 @@
+"""
+인메모리 테이블 엔진
+로컬 부하 테스트/CI 용 백엔드에서 선형 탐색 대신 기본키/보조 해시 인덱스로 조회
+"""
+
+import logging
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class DuplicateKeyError(ValueError):
+    """기본키 또는 유니크 인덱스 중복"""
+
+
+class MemoryTable:
+    """
+    기본키 + 보조 해시 인덱스를 가진 인메모리 테이블
+
+    - get/find 는 인덱스로 O(1) 조회, 인덱스가 없는 컬럼은 전체 탐색
+    - 모든 연산은 await 없이 끝나므로 같은 이벤트 루프의 코루틴 사이에서 원자적으로 동작
+    - 행은 복사본으로 주고받아 인덱스 컬럼이 update 밖에서 바뀌지 않도록 보호
+    """
+
+    def __init__(self, name: str, primary_key: str = "id",
+                 indexes: Iterable[str] = (), unique: Iterable[str] = ()):
+        self.name = name
+        self.primary_key = primary_key
+        self.unique = set(unique)
+        self._rows: Dict[Any, Dict[str, Any]] = {}
+        self._indexes: Dict[str, Dict[Any, Set[Any]]] = {
+            column: {} for column in set(indexes) | self.unique
+        }
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return (dict(row) for row in list(self._rows.values()))
+
+    def _index_add(self, key: Any, row: Dict[str, Any]) -> None:
+        for column, index in self._indexes.items():
+            index.setdefault(row.get(column), set()).add(key)
+
+    def _index_remove(self, key: Any, row: Dict[str, Any]) -> None:
+        for column, index in self._indexes.items():
+            keys = index.get(row.get(column))
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del index[row.get(column)]
+
+    def _check_unique(self, row: Dict[str, Any], key: Any) -> None:
+        for column in self.unique:
+            value = row.get(column)
+            if value is not None and self._indexes[column].get(value, set()) - {key}:
+                raise DuplicateKeyError(f"{self.name}.{column} 중복: {value}")
+
+    def insert(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """행 추가 (기본키/유니크 컬럼 중복 시 DuplicateKeyError)"""
+        key = row[self.primary_key]
+        if key in self._rows:
+            raise DuplicateKeyError(f"{self.name}.{self.primary_key} 중복: {key}")
+        self._check_unique(row, key)
+
+        stored = dict(row)
+        self._rows[key] = stored
+        self._index_add(key, stored)
+        return dict(stored)
+
+    def get(self, key: Any) -> Optional[Dict[str, Any]]:
+        """기본키로 조회"""
+        row = self._rows.get(key)
+        return dict(row) if row is not None else None
+
+    def find(self, column: str, value: Any) -> List[Dict[str, Any]]:
+        """컬럼 값으로 조회 (인덱스가 있으면 해시 조회)"""
+        if column == self.primary_key:
+            row = self.get(value)
+            return [row] if row is not None else []
+
+        index = self._indexes.get(column)
+        if index is None:
+            return [dict(row) for row in self._rows.values() if row.get(column) == value]
+        return [dict(self._rows[key]) for key in index.get(value, ())]
+
+    def find_one(self, column: str, value: Any) -> Optional[Dict[str, Any]]:
+        """컬럼 값으로 한 건 조회"""
+        rows = self.find(column, value)
+        return rows[0] if rows else None
+
+    def select(self, conditions: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        등호 조건으로 조회
+
+        기본키 또는 인덱스 컬럼 하나로 후보를 찾고 나머지 조건으로 필터링
+        (행에 없는 컬럼 조건은 무시)
+        """
+        lookup = self.primary_key if self.primary_key in conditions else next(
+            (column for column in conditions if column in self._indexes), None
+        )
+        rows = self.find(lookup, conditions[lookup]) if lookup else list(self)
+        return [
+            row for row in rows
+            if all(row.get(column) == value for column, value in conditions.items() if column in row)
+        ]
+
+    def count(self, column: Optional[str] = None, value: Any = None) -> int:
+        """전체 또는 컬럼 값별 행 수"""
+        if column is None:
+            return len(self._rows)
+        index = self._indexes.get(column)
+        if index is None:
+            return len(self.find(column, value))
+        return len(index.get(value, ()))
+
+    def update(self, key: Any, changes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """행 수정 (인덱스 갱신 포함, 없으면 None)"""
+        row = self._rows.get(key)
+        if row is None:
+            return None
+
+        updated = {**row, **changes, self.primary_key: key}
+        self._check_unique(updated, key)
+        self._index_remove(key, row)
+        self._rows[key] = updated
+        self._index_add(key, updated)
+        return dict(updated)
+
+    def delete(self, key: Any) -> bool:
+        """행 삭제"""
+        row = self._rows.pop(key, None)
+        if row is None:
+            return False
+        self._index_remove(key, row)
+        return True
@@ -0,0 +1,423 @@
+"""
+요청 지표 수집과 Prometheus 텍스트 형식 노출
+라우트 템플릿별 요청 수/처리 중 요청 수/지연 히스토그램, 런타임 통계 수집기, 워커 간 합산
+"""
+
+import asyncio
+import glob
+import json
+import logging
+import os
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import config
+
+try:
+    import fcntl
+except ImportError:  # Windows: 파일 락 없이 동작 (다중 워커 스냅샷은 POSIX 환경 기준)
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# 지연 히스토그램 버킷 상한 (초)
+LATENCY_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 수집기 지표 (이름 → (유형, 설명))
+METRIC_TYPES: Dict[str, Tuple[str, str]] = {
+    "rate_limit_rejections_total": ("counter", "Requests rejected by the rate limiter"),
+    "websocket_connections": ("gauge", "Open chat WebSocket connections"),
+    "websocket_rooms": ("gauge", "Chat rooms with at least one connection"),
+    "websocket_queue_depth": ("gauge", "Frames waiting in chat WebSocket send queues"),
+    "websocket_dropped_frames_total": ("counter", "Chat frames dropped for slow consumers"),
+    "db_pool_connections": ("gauge", "Database pool connections by state"),
+    "db_queries_total": ("counter", "Queries executed through the database pool"),
+    "db_errors_total": ("counter", "Failed queries"),
+    "db_acquire_timeouts_total": ("counter", "Timed out pool connection acquisitions"),
+    "db_transactions_total": ("counter", "Committed transactions"),
+    "db_rollbacks_total": ("counter", "Rolled back transactions"),
+    "sql_statements_total": ("counter", "SQL statements executed through execute_sql"),
+    "sql_slow_statements_total": ("counter", "SQL statements slower than SQL_SLOW_QUERY_MS"),
+}
+
+# 수집기 표본: (지표 이름, 레이블, 값)
+Sample = Tuple[str, Dict[str, str], float]
+Collector = Callable[[], Iterable[Sample]]
+
+
+def route_template(scope: Dict[str, Any]) -> str:
+    """
+    매칭된 라우트의 경로 템플릿 (/api/orders/{order_id}), 매칭 실패 시 unmatched
+
+    include_router 의 prefix 를 라우트에 합치지 않는 FastAPI 버전에서는 route.path 가
+    prefix 를 뺀 경로이므로, 요청 경로 앞부분의 세그먼트로 prefix 를 복원
+    (라우터 prefix 에는 경로 파라미터가 없음)
+    """
+    route = scope.get("route")
+    template = getattr(route, "path", None)
+    if not template:
+        return "unmatched"
+    if hasattr(route, "routes") or ":path}" in template:
+        return template
+
+    path = scope.get("path", "")
+    prefix_depth = path.count("/") - template.count("/")
+    if prefix_depth <= 0:
+        return template
+    return "/".join(path.split("/")[:prefix_depth + 1]) + template
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    return repr(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _pid_alive(pid: int) -> bool:
+    """같은 호스트(PID 네임스페이스)의 프로세스 생존 여부"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _counters_only(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """스냅샷에서 누적 값(히스토그램, counter 유형 표본)만 남김 (게이지는 종료/정지된 워커 값이 의미 없음)"""
+    return {
+        "in_flight": 0,
+        "histograms": snapshot["histograms"],
+        "samples": [sample for sample in snapshot["samples"]
+                    if METRIC_TYPES.get(sample[0], ("gauge",))[0] == "counter"]
+    }
+
+
+def _merge(snapshots: Iterable[Dict[str, Any]]) -> Tuple[int, Dict[Tuple[str, str, str], List[float]],
+                                                        Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float]]:
+    """워커 스냅샷 합산 (처리 중 요청 수, 히스토그램, 수집기 표본)"""
+    in_flight = 0
+    histograms: Dict[Tuple[str, str, str], List[float]] = {}
+    samples: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
+
+    for snapshot in snapshots:
+        in_flight += snapshot["in_flight"]
+        for method, route, status, values in snapshot["histograms"]:
+            merged = histograms.get((method, route, status))
+            if merged is None or len(merged) != len(values):
+                histograms[(method, route, status)] = list(values)
+            else:
+                for index, value in enumerate(values):
+                    merged[index] += value
+        for name, labels, value in snapshot["samples"]:
+            key = (name, tuple(sorted(labels.items())))
+            samples[key] = samples.get(key, 0) + value
+    return in_flight, histograms, samples
+
+
+class MetricsRegistry:
+    """
+    워커(프로세스) 단위 지표 저장소
+
+    - 요청 관측은 (method, route, status) 키의 버킷 카운트 목록 하나만 갱신 (이벤트 루프 단일 스레드라 락 없음)
+    - 버킷은 누적하지 않고 저장하고, 노출할 때 누적값으로 변환
+    - 수집기는 노출/스냅샷 시점에만 호출되어 요청 경로에 비용을 더하지 않음
+    - snapshot_dir 를 지정하면 워커마다 스냅샷 파일을 쓰고, /metrics 는 모든 워커 파일을 합산함
+    - 종료된 워커(정상 종료 또는 PID 가 사라진 파일)의 누적 카운터는 보관 합계 파일에 더해 두므로
+      워커가 재시작되어도 카운터가 줄지 않음 (prometheus_client multiprocess 모드와 같은 방식,
+      게이지는 버림). PID 로 생존 여부를 확인하므로 snapshot_dir 는 호스트(컨테이너)별로 지정
+    - stale_seconds 동안 갱신되지 않은 살아 있는 워커 파일은 카운터만 합산 (멈춘 워커의 게이지 제외)
+    """
+
+    RETAINED_FILE = "metrics-retained.snapshot"
+    LOCK_FILE = "metrics.lock"
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS, snapshot_dir: Optional[str] = None,
+                 stale_seconds: float = 60.0, pid_alive: Callable[[int], bool] = _pid_alive):
+        self.buckets = tuple(buckets)
+        self.snapshot_dir = snapshot_dir
+        self.stale_seconds = stale_seconds
+        self.in_flight = 0
+        self._histograms: Dict[Tuple[str, str, str], List[float]] = {}
+        self._collectors: List[Collector] = []
+        self._pid_alive = pid_alive
+
+    def observe(self, method: str, route: str, status: int, seconds: float) -> None:
+        """요청 1건 기록 (버킷별 카운트 + 마지막 칸은 합계)"""
+        key = (method, route, str(status))
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = [0] * (len(self.buckets) + 1) + [0.0]
+        histogram[bisect_left(self.buckets, seconds)] += 1
+        histogram[-1] += seconds
+
+    def register_collector(self, collector: Collector) -> None:
+        """노출 시점에 호출할 수집기 등록"""
+        self._collectors.append(collector)
+
+    def _collect(self) -> List[Sample]:
+        samples: List[Sample] = []
+        for collector in self._collectors:
+            try:
+                samples.extend(collector())
+            except Exception as e:
+                logger.warning(f"지표 수집기 오류: {str(e)}")
+        return samples
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 워커 지표 (JSON 직렬화 가능)"""
+        return {
+            "in_flight": self.in_flight,
+            "histograms": [[*key, list(values)] for key, values in self._histograms.items()],
+            "samples": [[name, labels, value] for name, labels, value in self._collect()]
+        }
+
+    # 워커 간 합산
+    def _snapshot_path(self, pid: Optional[int] = None) -> str:
+        return os.path.join(self.snapshot_dir, f"metrics-{pid or os.getpid()}.json")
+
+    @contextmanager
+    def _locked(self, exclusive: bool) -> Iterator[None]:
+        """스냅샷 디렉터리 락 (보관 합계 갱신은 배타, 합산 읽기는 공유)"""
+        if fcntl is None:
+            yield
+            return
+        with open(os.path.join(self.snapshot_dir, self.LOCK_FILE), "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _write_json(self, path: str, data: Dict[str, Any]) -> None:
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(temp_path, path)
+
+    def _read_retained(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(os.path.join(self.snapshot_dir, self.RETAINED_FILE)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _retain(self, snapshot: Dict[str, Any]) -> None:
+        """스냅샷의 누적 카운터를 보관 합계에 더함 (배타 락 안에서 호출)"""
+        retained = self._read_retained() or {"in_flight": 0, "histograms": [], "samples": []}
+        _, histograms, samples = _merge([retained, _counters_only(snapshot)])
+        self._write_json(os.path.join(self.snapshot_dir, self.RETAINED_FILE), {
+            "in_flight": 0,
+            "histograms": [[*key, values] for key, values in histograms.items()],
+            "samples": [[name, dict(labels), value] for (name, labels), value in samples.items()]
+        })
+
+    def _fold_snapshots(self, paths: List[str]) -> None:
+        """종료된 워커 스냅샷 파일을 보관 합계에 더하고 삭제 (다른 워커가 먼저 처리한 파일은 건너뜀)"""
+        with self._locked(exclusive=True):
+            for path in paths:
+                try:
+                    with open(path) as f:
+                        snapshot = json.load(f)
+                except FileNotFoundError:
+                    continue
+                except (OSError, ValueError) as e:
+                    logger.warning(f"워커 지표 스냅샷 읽기 실패 ({path}): {str(e)}")
+                    continue
+                self._retain(snapshot)
+                os.remove(path)
+                logger.info(f"종료된 워커 지표를 보관 합계에 반영: {os.path.basename(path)}")
+
+    def write_snapshot(self) -> None:
+        """현재 워커 스냅샷 파일 갱신 (임시 파일 후 교체)"""
+        if not self.snapshot_dir:
+            return
+        self._write_json(self._snapshot_path(), self.snapshot())
+
+    def reclaim_snapshot(self) -> None:
+        """시작 시 같은 PID 를 쓰던 이전 프로세스의 스냅샷 파일을 보관 합계에 반영 (덮어쓰기로 인한 유실 방지)"""
+        if self.snapshot_dir and os.path.exists(self._snapshot_path()):
+            self._fold_snapshots([self._snapshot_path()])
+
+    def retire_snapshot(self) -> None:
+        """종료 시 현재 워커 누적 카운터를 보관 합계에 더하고 스냅샷 파일 삭제"""
+        if not self.snapshot_dir:
+            return
+        with self._locked(exclusive=True):
+            self._retain(self.snapshot())
+            try:
+                os.remove(self._snapshot_path())
+            except FileNotFoundError:
+                pass
+
+    def _worker_snapshots(self) -> List[Dict[str, Any]]:
+        """모든 워커 스냅샷 (현재 워커는 메모리 값, 종료된 워커 파일은 보관 합계로 반영)"""
+        snapshots = [self.snapshot()]
+        if not self.snapshot_dir:
+            return snapshots
+
+        own_path = self._snapshot_path()
+        paths = []
+        dead = []
+        for path in glob.glob(os.path.join(self.snapshot_dir, "metrics-*.json")):
+            if path == own_path:
+                continue
+            try:
+                pid = int(os.path.basename(path)[len("metrics-"):-len(".json")])
+            except ValueError:
+                continue
+            (paths if self._pid_alive(pid) else dead).append(path)
+        if dead:
+            self._fold_snapshots(dead)
+
+        stale_before = time.time() - self.stale_seconds
+        with self._locked(exclusive=False):
+            retained = self._read_retained()
+            if retained is not None:
+                snapshots.append(retained)
+            for path in paths:
+                try:
+                    stale = os.path.getmtime(path) < stale_before
+                    with open(path) as f:
+                        snapshot = json.load(f)
+                except FileNotFoundError:
+                    # 읽기 직전에 종료 처리되어 보관 합계에 이미 반영된 파일
+                    continue
+                except (OSError, ValueError) as e:
+                    logger.warning(f"워커 지표 스냅샷 읽기 실패 ({path}): {str(e)}")
+                    continue
+                snapshots.append(_counters_only(snapshot) if stale else snapshot)
+        return snapshots
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 (0.0.4) 출력, 모든 워커 합산"""
+        in_flight, histograms, samples = _merge(self._worker_snapshots())
+
+        lines = [
+            "# HELP http_requests_in_progress HTTP requests currently being served",
+            "# TYPE http_requests_in_progress gauge",
+            f"http_requests_in_progress {in_flight}",
+            "# HELP http_requests_total HTTP requests by method, route template and status",
+            "# TYPE http_requests_total counter",
+        ]
+        ordered = sorted(histograms.items())
+        for (method, route, status), values in ordered:
+            labels = _labels({"method": method, "route": route, "status": status})
+            lines.append(f"http_requests_total{labels} {_number(sum(values[:-1]))}")
+
+        lines.append("# HELP http_request_duration_seconds HTTP request latency by method, route template and status")
+        lines.append("# TYPE http_request_duration_seconds histogram")
+        bounds = [repr(float(bound)) for bound in self.buckets] + ["+Inf"]
+        for (method, route, status), values in ordered:
+            base = {"method": method, "route": route, "status": status}
+            cumulative = 0
+            for bound, count in zip(bounds, values[:-1]):
+                cumulative += count
+                lines.append(f"http_request_duration_seconds_bucket{_labels({**base, 'le': bound})} {_number(cumulative)}")
+            lines.append(f"http_request_duration_seconds_sum{_labels(base)} {_number(values[-1])}")
+            lines.append(f"http_request_duration_seconds_count{_labels(base)} {_number(cumulative)}")
+
+        current = None
+        for (name, labels), value in sorted(samples.items()):
+            if name != current:
+                current = name
+                metric_type, description = METRIC_TYPES.get(name, ("gauge", name))
+                lines.append(f"# HELP {name} {description}")
+                lines.append(f"# TYPE {name} {metric_type}")
+            lines.append(f"{name}{_labels(dict(labels))} {_number(value)}")
+
+        return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """
+    요청 지표 ASGI 미들웨어
+
+    라우팅이 끝난 뒤 scope["route"] 의 경로 템플릿으로 기록하므로 경로 파라미터가
+    레이블 수를 늘리지 않음. 응답 시작 전에 예외가 나면 500 으로 기록.
+    스트리밍 응답(SSE, 내보내기)은 스트림이 끝날 때까지의 시간이 기록됨.
+    """
+
+    def __init__(self, app: Any, registry: Optional[MetricsRegistry] = None):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        registry = self.registry or metrics
+        status_code = 500
+
+        async def send_with_status(message: Dict[str, Any]) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        registry.in_flight += 1
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            registry.in_flight -= 1
+            registry.observe(scope["method"], route_template(scope), status_code, time.perf_counter() - started)
+
+
+class MetricsSnapshotWriter:
+    """워커 스냅샷 파일 주기 갱신 (METRICS_MULTIPROC_DIR 설정 시)"""
+
+    def __init__(self, registry: MetricsRegistry, interval_seconds: float):
+        self.registry = registry
+        self.interval_seconds = interval_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """주기 갱신 시작"""
+        if not self.registry.snapshot_dir or self.interval_seconds <= 0 or self._task is not None:
+            return
+        os.makedirs(self.registry.snapshot_dir, exist_ok=True)
+        self.registry.reclaim_snapshot()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """주기 갱신 중지 및 현재 워커 카운터를 보관 합계로 이전"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            self.registry.retire_snapshot()
+        except Exception as e:
+            logger.warning(f"지표 스냅샷 보관 실패: {str(e)}")
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                self.registry.write_snapshot()
+            except Exception as e:
+                logger.warning(f"지표 스냅샷 저장 실패: {str(e)}")
+            await asyncio.sleep(self.interval_seconds)
+
+
+# 요청 지표 저장소 (워커별)
+metrics = MetricsRegistry(
+    snapshot_dir=config.settings.METRICS_MULTIPROC_DIR,
+    stale_seconds=max(config.settings.METRICS_FLUSH_SECONDS * 6, 30.0)
+)
+metrics_snapshot_writer = MetricsSnapshotWriter(metrics, config.settings.METRICS_FLUSH_SECONDS)
@@ -0,0 +1,84 @@
+"""
+n-gram(트라이그램) 검색 인덱스
+PostgreSQL pg_trgm 인덱스와 같은 방식의 프로세스 내 구현 (로컬 인메모리 백엔드용)
+"""
+
+import re
+from collections import Counter
+from typing import Any, Dict, List, Set, Tuple
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+def ngrams(text: str, n: int = 3) -> Set[str]:
+    """
+    pg_trgm 방식 n-gram 추출
+
+    소문자로 바꾼 뒤 단어마다 앞에 공백 n-1 개, 뒤에 공백 1 개를 붙여 분해
+    예) "셔츠" → {"  셔", " 셔츠", "셔츠 "}
+    """
+    grams: Set[str] = set()
+    for word in _WORD_PATTERN.findall(text.lower()):
+        padded = " " * (n - 1) + word + " "
+        grams.update(padded[i:i + n] for i in range(len(padded) - n + 1))
+    return grams
+
+
+class NgramIndex:
+    """
+    문서 ID → 텍스트 n-gram 역색인
+
+    - 검색어 n-gram 의 게시 목록만 합산하므로 전체 문서를 훑지 않음
+    - 점수는 검색어 n-gram 중 문서에 포함된 비율 (pg_trgm word_similarity 근사),
+      검색어가 그대로 포함된 문서는 1.0
+    - 검색어가 n 글자보다 짧으면 n-gram 이 겹치지 않을 수 있어 부분 문자열 검사로 대체
+    """
+
+    def __init__(self, n: int = 3, threshold: float = 0.3):
+        self.n = n
+        self.threshold = threshold
+        self._postings: Dict[str, Set[Any]] = {}
+        self._docs: Dict[Any, Tuple[str, Set[str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add(self, doc_id: Any, text: str) -> None:
+        """문서 추가 (이미 있으면 교체)"""
+        self.remove(doc_id)
+        grams = ngrams(text or "", self.n)
+        self._docs[doc_id] = ((text or "").lower(), grams)
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(doc_id)
+
+    def remove(self, doc_id: Any) -> None:
+        """문서 제거"""
+        entry = self._docs.pop(doc_id, None)
+        if entry is None:
+            return
+        for gram in entry[1]:
+            doc_ids = self._postings.get(gram)
+            if doc_ids is not None:
+                doc_ids.discard(doc_id)
+                if not doc_ids:
+                    del self._postings[gram]
+
+    def search(self, query: str, limit: int = 0) -> List[Tuple[Any, float]]:
+        """유사도 내림차순 (문서 ID, 점수) 목록 (limit 0 이면 전체)"""
+        text = (query or "").strip().lower()
+        if not text:
+            return []
+
+        if len(text) < self.n:
+            scores = {doc_id: 1.0 for doc_id, (doc_text, _) in self._docs.items() if text in doc_text}
+        else:
+            query_grams = ngrams(text, self.n)
+            shared = Counter(doc_id for gram in query_grams for doc_id in self._postings.get(gram, ()))
+            scores = {}
+            for doc_id, count in shared.items():
+                score = 1.0 if text in self._docs[doc_id][0] else count / len(query_grams)
+                if score >= self.threshold:
+                    scores[doc_id] = score
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return ranked[:limit] if limit else ranked
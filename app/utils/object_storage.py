@@ -0,0 +1,125 @@
+"""
+Wasabi(S3 호환) 오브젝트 스토리지
+boto3 클라이언트 하나를 커넥션 풀과 함께 재사용하고, 큰 파일은 멀티파트로 업로드
+"""
+
+import asyncio
+import logging
+from typing import Any, Iterable, Optional
+from urllib.parse import quote
+
+import config
+
+logger = logging.getLogger(__name__)
+
+_MB = 1024 * 1024
+
+
+class ObjectStorage:
+    """
+    S3 호환 스토리지 업로드/삭제
+
+    - boto3 호출은 블로킹이므로 스레드에서 실행
+    - 클라이언트는 첫 사용 때 한 번 만들어 공유 (max_pool_connections 만큼 HTTP 커넥션 재사용)
+    - multipart_threshold 이상 파일은 multipart_chunksize 단위로 병렬 멀티파트 업로드
+    - path-style 주소를 사용해 MinIO 같은 로컬 S3 호환 서버로도 테스트 가능 (endpoint 만 변경)
+    """
+
+    def __init__(self, endpoint: str, bucket: str, access_key: str, secret_key: str, region: str,
+                 public_base_url: Optional[str] = None, max_pool_connections: int = 20,
+                 multipart_threshold: int = 8 * _MB, multipart_chunksize: int = 8 * _MB,
+                 client: Any = None):
+        self.endpoint = endpoint
+        self.bucket = bucket
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.region = region
+        self.public_base_url = (public_base_url or f"{endpoint.rstrip('/')}/{bucket}").rstrip("/")
+        self.max_pool_connections = max_pool_connections
+        self.multipart_threshold = multipart_threshold
+        self.multipart_chunksize = multipart_chunksize
+        self._client = client
+        self._transfer_config = None
+
+    @classmethod
+    def from_settings(cls, settings: Optional[config.Settings] = None) -> "ObjectStorage":
+        """설정값으로 생성 (Wasabi)"""
+        settings = settings or config.settings
+        wasabi = settings.get_wasabi_config()
+        return cls(
+            endpoint=wasabi["endpoint"],
+            bucket=wasabi["bucket"],
+            access_key=wasabi["access_key"],
+            secret_key=wasabi["secret_key"],
+            region=wasabi["region"],
+            public_base_url=settings.WASABI_PUBLIC_BASE_URL,
+            max_pool_connections=settings.WASABI_MAX_POOL_CONNECTIONS,
+            multipart_threshold=settings.WASABI_MULTIPART_THRESHOLD_MB * _MB,
+            multipart_chunksize=settings.WASABI_MULTIPART_CHUNK_MB * _MB
+        )
+
+    def _get_client(self) -> Any:
+        if self._client is None:
+            import boto3
+            from botocore.config import Config
+
+            self._client = boto3.client(
+                "s3",
+                endpoint_url=self.endpoint,
+                aws_access_key_id=self.access_key,
+                aws_secret_access_key=self.secret_key,
+                region_name=self.region,
+                config=Config(
+                    max_pool_connections=self.max_pool_connections,
+                    retries={"max_attempts": 3, "mode": "standard"},
+                    s3={"addressing_style": "path"}
+                )
+            )
+        return self._client
+
+    def _get_transfer_config(self) -> Any:
+        if self._transfer_config is None:
+            from boto3.s3.transfer import TransferConfig
+
+            self._transfer_config = TransferConfig(
+                multipart_threshold=self.multipart_threshold,
+                multipart_chunksize=self.multipart_chunksize,
+                max_concurrency=4
+            )
+        return self._transfer_config
+
+    def public_url(self, key: str) -> str:
+        """객체 공개 URL"""
+        return f"{self.public_base_url}/{quote(key)}"
+
+    async def upload_file(self, path: str, key: str, content_type: str,
+                          cache_control: str = "public, max-age=31536000, immutable") -> str:
+        """
+        파일 업로드 후 공개 URL 반환
+
+        키마다 내용이 바뀌지 않으므로(업로드마다 새 키) 장기 캐시 헤더를 붙임
+        """
+        client = self._get_client()
+        await asyncio.to_thread(
+            client.upload_file, path, self.bucket, key,
+            ExtraArgs={"ContentType": content_type, "CacheControl": cache_control},
+            Config=self._get_transfer_config()
+        )
+        return self.public_url(key)
+
+    async def delete_objects(self, keys: Iterable[str]) -> None:
+        """객체 일괄 삭제 (실패는 로그만 남김)"""
+        objects = [{"Key": key} for key in keys]
+        if not objects:
+            return
+        try:
+            await asyncio.to_thread(
+                self._get_client().delete_objects,
+                Bucket=self.bucket, Delete={"Objects": objects, "Quiet": True}
+            )
+        except Exception as e:
+            logger.warning(f"스토리지 객체 삭제 실패 ({len(objects)}건): {str(e)}")
+
+
+# Wasabi 스토리지 (클라이언트는 첫 업로드 때 생성)
+object_storage = ObjectStorage.from_settings()
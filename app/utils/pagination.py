@@ -0,0 +1,130 @@
+"""
+키셋(커서) 페이지네이션 유틸리티
+(created_at, id) 등 정렬 키 기반 커서 인코딩과 총 개수 계산 방식 처리
+"""
+
+import base64
+import json
+import logging
+from datetime import datetime
+from typing import Any, Awaitable, Callable, List, Optional, Sequence, Tuple
+
+from database import QueryParams
+
+logger = logging.getLogger(__name__)
+
+
+class InvalidCursorError(ValueError):
+    """잘못된 커서 토큰"""
+    pass
+
+
+def _encode_value(value: Any) -> Any:
+    """커서 값 직렬화 (datetime 은 타입 정보와 함께 저장)"""
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+def _decode_value(value: Any) -> Any:
+    """커서 값 역직렬화"""
+    if isinstance(value, dict):
+        return datetime.fromisoformat(value["dt"])
+    return value
+
+
+def encode_cursor(*values: Any) -> str:
+    """정렬 키 값들을 불투명한 커서 토큰으로 인코딩"""
+    payload = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, key_count: int) -> List[Any]:
+    """
+    커서 토큰을 정렬 키 값 목록으로 디코딩
+
+    Raises:
+        InvalidCursorError: 형식이 잘못되었거나 키 개수가 맞지 않는 경우
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        if not isinstance(values, list) or len(values) != key_count:
+            raise ValueError("키 개수 불일치")
+        return [_decode_value(v) for v in values]
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError("잘못된 페이지 커서입니다") from e
+
+
+def keyset_condition(params: QueryParams, columns: Sequence[str], cursor: str) -> str:
+    """
+    내림차순 정렬 기준 커서 이후 행 조건 생성
+
+    예) (p.created_at, p.id) < ($3, $4)
+    """
+    values = decode_cursor(cursor, len(columns))
+    placeholders = ", ".join(params.add(value) for value in values)
+    return f"({', '.join(columns)}) < ({placeholders})"
+
+
+def split_page(rows: Optional[List[Any]], size: int, keys: Sequence[str]) -> Tuple[List[Any], bool, Optional[str]]:
+    """
+    size + 1 건으로 조회한 결과를 현재 페이지와 다음 커서로 분리
+
+    Args:
+        rows: LIMIT size + 1 로 조회한 행 목록
+        size: 페이지 크기
+        keys: 커서에 담을 정렬 키 컬럼명 (행 딕셔너리 키)
+
+    Returns:
+        Tuple[List, bool, Optional[str]]: (현재 페이지 행, 다음 페이지 여부, 다음 커서)
+    """
+    rows = list(rows or [])
+    has_next = len(rows) > size
+    rows = rows[:size]
+    next_cursor = None
+    if has_next and rows:
+        last_row = rows[-1]
+        next_cursor = encode_cursor(*(last_row[key] for key in keys))
+    return rows, has_next, next_cursor
+
+
+def resolve_total_mode(total_mode: Optional[str], cursor: Optional[str]) -> str:
+    """총 개수 계산 방식 결정 (기본값: page 방식은 exact, 커서 방식은 none)"""
+    if total_mode:
+        return total_mode
+    return "none" if cursor else "exact"
+
+
+async def count_total(execute: Callable[..., Awaitable[Optional[list]]], from_clause: str,
+                      params: Sequence[Any], total_mode: str) -> Tuple[Optional[int], bool]:
+    """
+    총 개수 계산
+
+    Args:
+        execute: SQL 실행 함수 (호출 서비스의 execute_sql)
+        from_clause: "FROM ... WHERE ..." 형태의 쿼리 본문
+        params: from_clause 에 사용된 파라미터
+        total_mode: exact(COUNT), estimate(실행 계획 추정치), none(계산 안 함)
+
+    Returns:
+        Tuple[Optional[int], bool]: (총 개수, 추정치 여부)
+    """
+    if total_mode == "none":
+        return None, False
+
+    if total_mode == "estimate":
+        # 플래너의 행 수 추정치 사용 (COUNT(*) 전체 스캔 회피)
+        result = await execute(f"EXPLAIN (FORMAT JSON) SELECT 1 {from_clause}", *params)
+        try:
+            plan = result[0]["QUERY PLAN"]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]["Plan"]["Plan Rows"]), True
+        except (TypeError, KeyError, IndexError, ValueError):
+            logger.warning("행 수 추정 실패 - 정확한 개수로 대체")
+
+    count_result = await execute(f"SELECT COUNT(*) as total {from_clause}", *params)
+    return (count_result[0]['total'] if count_result else 0), False
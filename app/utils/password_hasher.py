@@ -0,0 +1,106 @@
+"""
+비밀번호 해싱 실행기
+bcrypt 해싱/검증을 전용 스레드 풀에서 실행해 이벤트 루프가 멈추지 않도록 함
+"""
+
+import asyncio
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from passlib.context import CryptContext
+
+import config
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordHasher:
+    """
+    bcrypt 해싱/검증 실행기
+
+    - bcrypt 는 계산 중 GIL 을 놓으므로 스레드 풀로 CPU 코어 수만큼 병렬 실행 가능
+    - 전용 풀을 사용해 기본 실행기(asyncio.to_thread)를 쓰는 다른 작업과 스레드를 다투지 않음
+    - 풀이 가득 차면 요청은 대기열에서 기다리며, 대기 시간을 통계로 남김 (로그인 폭주 감지용)
+    - rounds 가 바뀐 뒤 이전 비용으로 만든 해시는 verify_and_update 가 새 해시를 돌려줌
+    """
+
+    def __init__(self, rounds: int = 12, max_workers: Optional[int] = None):
+        self.rounds = rounds
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._context = CryptContext(
+            schemes=["bcrypt"], deprecated="auto",
+            bcrypt__default_rounds=rounds, bcrypt__min_rounds=rounds, bcrypt__max_rounds=rounds
+        )
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+        self._completed = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="bcrypt")
+        return self._executor
+
+    async def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """풀에서 실행하고 대기열 대기 시간 기록"""
+        submitted = time.monotonic()
+
+        def timed() -> Tuple[float, Any]:
+            return time.monotonic() - submitted, fn(*args)
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            wait, result = await loop.run_in_executor(self._pool(), timed)
+        finally:
+            self._pending -= 1
+
+        self._completed += 1
+        self._wait_total += wait
+        self._wait_max = max(self._wait_max, wait)
+        return result
+
+    async def hash(self, password: str) -> str:
+        """비밀번호 해싱"""
+        return await self._run(self._context.hash, password)
+
+    async def verify(self, password: str, password_hash: str) -> bool:
+        """비밀번호 검증"""
+        return await self._run(self._context.verify, password, password_hash)
+
+    async def verify_and_update(self, password: str, password_hash: str) -> Tuple[bool, Optional[str]]:
+        """
+        비밀번호 검증 + 재해싱 필요 여부 확인
+
+        Returns:
+            Tuple[bool, Optional[str]]: (일치 여부, 비용이 현재 설정과 다를 때 새 해시)
+        """
+        return await self._run(self._context.verify_and_update, password, password_hash)
+
+    def shutdown(self) -> None:
+        """풀 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """대기열/처리 통계"""
+        return {
+            "rounds": self.rounds,
+            "max_workers": self.max_workers,
+            "pending": self._pending,
+            "completed": self._completed,
+            "queue_wait_avg_ms": round(self._wait_total / self._completed * 1000, 2) if self._completed else 0.0,
+            "queue_wait_max_ms": round(self._wait_max * 1000, 2)
+        }
+
+
+# 비밀번호 해싱 실행기 (PASSWORD_HASH_WORKERS 가 0 이면 CPU 코어 수)
+password_hasher = PasswordHasher(
+    rounds=config.settings.PASSWORD_BCRYPT_ROUNDS,
+    max_workers=config.settings.PASSWORD_HASH_WORKERS or None
+)
@@ -0,0 +1,85 @@
+"""
+인증 사용자(principal) 캐시
+JWT 검증 후 매 요청마다 발생하던 사용자 조회 쿼리를 줄이기 위한 TTL + LRU 캐시
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import config
+
+logger = logging.getLogger(__name__)
+
+
+class PrincipalCache:
+    """
+    사용자 ID 단위 TTL + LRU 캐시
+
+    - 항목은 TTL 이 지나면 만료되고, max_size 를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+    - 승인 상태/비밀번호 변경, 로그아웃 시 invalidate 로 즉시 제거
+    - 호출자가 수정해도 캐시가 오염되지 않도록 복사본을 반환
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def get(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """캐시된 사용자 정보 조회 (없거나 만료 시 None)"""
+        entry = self._entries.get(user_id)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        expires_at, user = entry
+        if expires_at <= time.monotonic():
+            del self._entries[user_id]
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(user_id)
+        self._hits += 1
+        return dict(user)
+
+    def set(self, user_id: str, user: Dict[str, Any]) -> None:
+        """사용자 정보 저장"""
+        if self.ttl_seconds <= 0:
+            return
+        self._entries[user_id] = (time.monotonic() + self.ttl_seconds, dict(user))
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, *user_ids: Optional[str]) -> None:
+        """사용자 정보 무효화 (승인/비밀번호 변경/로그아웃 후 호출)"""
+        for user_id in user_ids:
+            if user_id and self._entries.pop(str(user_id), None) is not None:
+                self._invalidations += 1
+
+    def clear(self) -> None:
+        """전체 캐시 비우기"""
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 조회"""
+        return {
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "invalidations": self._invalidations,
+            "ttl_seconds": self.ttl_seconds,
+            "max_size": self.max_size
+        }
+
+
+# 인증 사용자 캐시
+principal_cache = PrincipalCache(
+    ttl_seconds=config.settings.AUTH_USER_CACHE_TTL_SECONDS,
+    max_size=config.settings.AUTH_USER_CACHE_MAX_SIZE
+)
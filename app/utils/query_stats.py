@@ -0,0 +1,177 @@
+"""
+SQL 실행 계측
+쿼리 지문(fingerprint)별 지연 집계, 요청 단위 쿼리 수 카운터, 느린 쿼리/쿼리 폭주 로그
+"""
+
+import logging
+import re
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import config
+
+logger = logging.getLogger(__name__)
+
+_COMMENT_PATTERN = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_STRING_PATTERN = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDER_PATTERN = re.compile(r"\$\d+|\b\d+(?:\.\d+)?\b")
+_IN_LIST_PATTERN = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def fingerprint(query: str) -> str:
+    """
+    쿼리 지문 (값이 달라도 같은 형태의 쿼리는 같은 문자열)
+
+    주석 제거, 문자열/숫자 리터럴과 $n 자리표시자를 ? 로, IN (?, ?, ...) 목록을 (?+) 로,
+    공백을 한 칸으로 정규화. 쿼리 텍스트는 대부분 고정이므로 결과를 캐시.
+    """
+    normalized = _COMMENT_PATTERN.sub(" ", query)
+    normalized = _STRING_PATTERN.sub("?", normalized)
+    normalized = _PLACEHOLDER_PATTERN.sub("?", normalized)
+    normalized = _IN_LIST_PATTERN.sub("(?+)", normalized)
+    return _WHITESPACE_PATTERN.sub(" ", normalized).strip()
+
+
+class RequestQueryStats:
+    """요청 하나에서 실행된 쿼리 수/시간 (같은 요청의 하위 태스크가 공유)"""
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.fingerprints: Counter = Counter()
+
+    def record(self, statement: str, seconds: float, error: bool = False) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        self.fingerprints[statement] += 1
+        if error:
+            self.errors += 1
+
+    def top_fingerprints(self, limit: int = 3) -> List[Tuple[str, int]]:
+        """가장 많이 반복된 쿼리 지문 (N+1 추적용)"""
+        return self.fingerprints.most_common(limit)
+
+    def server_timing(self) -> str:
+        """Server-Timing 헤더 값"""
+        return f'db;dur={self.total_seconds * 1000:.1f};desc="{self.count} queries"'
+
+
+_request_query_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar("request_query_stats", default=None)
+
+
+class QueryStatsRegistry:
+    """
+    쿼리 지문별 누적 통계 (워커별)
+
+    - 지문 수는 max_fingerprints 로 제한하고, 넘으면 새 지문은 overflow 로 합산
+    - slow_query_ms 이상 걸린 쿼리는 지문과 함께 WARNING 로그
+    """
+
+    OVERFLOW = "(other)"
+
+    def __init__(self, slow_query_ms: float = 200.0, max_fingerprints: int = 500):
+        self.slow_query_ms = slow_query_ms
+        self.max_fingerprints = max_fingerprints
+        self._stats: Dict[str, List[float]] = {}
+        self.queries = 0
+        self.slow_queries = 0
+
+    def record(self, query: str, seconds: float, error: bool = False) -> None:
+        """쿼리 1건 기록 (전역 집계 + 현재 요청 카운터)"""
+        statement = fingerprint(query)
+        self.queries += 1
+
+        key = statement if statement in self._stats or len(self._stats) < self.max_fingerprints else self.OVERFLOW
+        entry = self._stats.get(key)
+        if entry is None:
+            # [실행 수, 총 시간, 최대 시간, 오류 수]
+            entry = self._stats[key] = [0, 0.0, 0.0, 0]
+        entry[0] += 1
+        entry[1] += seconds
+        entry[2] = max(entry[2], seconds)
+        if error:
+            entry[3] += 1
+
+        request_stats = _request_query_stats.get()
+        if request_stats is not None:
+            request_stats.record(statement, seconds, error)
+
+        if self.slow_query_ms > 0 and seconds * 1000 >= self.slow_query_ms:
+            self.slow_queries += 1
+            logger.warning(f"느린 쿼리 ({seconds * 1000:.1f}ms): {statement}")
+
+    def top(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """총 실행 시간 기준 상위 지문"""
+        ranked = sorted(self._stats.items(), key=lambda item: item[1][1], reverse=True)[:limit]
+        return [
+            {
+                "fingerprint": statement,
+                "calls": calls,
+                "total_ms": round(total * 1000, 2),
+                "avg_ms": round(total / calls * 1000, 2),
+                "max_ms": round(maximum * 1000, 2),
+                "errors": errors
+            }
+            for statement, (calls, total, maximum, errors) in ranked
+        ]
+
+    def reset(self) -> None:
+        """누적 통계 초기화"""
+        self._stats.clear()
+        self.queries = 0
+        self.slow_queries = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """누적 통계 요약"""
+        return {
+            "queries": self.queries,
+            "slow_queries": self.slow_queries,
+            "slow_query_ms": self.slow_query_ms,
+            "fingerprints": len(self._stats),
+            "top": self.top()
+        }
+
+
+@contextmanager
+def track_queries() -> Iterator[RequestQueryStats]:
+    """
+    블록 안에서 실행된 쿼리 수/시간 수집 (요청 미들웨어, 쿼리 폭주 회귀 테스트용)
+
+    블록 안에서 만든 하위 태스크(asyncio.gather 등)도 같은 카운터에 기록됨.
+
+    Example:
+        with track_queries() as stats:
+            await OrderService.get_orders(...)
+        assert stats.count <= 3
+    """
+    stats = RequestQueryStats()
+    token = _request_query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _request_query_stats.reset(token)
+
+
+def log_query_storm(stats: RequestQueryStats, method: str, path: str) -> None:
+    """요청당 쿼리 수가 SQL_REQUEST_QUERY_WARN_COUNT 를 넘으면 반복 지문과 함께 로그"""
+    threshold = config.settings.SQL_REQUEST_QUERY_WARN_COUNT
+    if threshold <= 0 or stats.count <= threshold:
+        return
+    repeated = ", ".join(f"{count}x {statement}" for statement, count in stats.top_fingerprints())
+    logger.warning(
+        f"요청당 쿼리 과다 {method} {path}: {stats.count}회 "
+        f"({stats.total_seconds * 1000:.1f}ms) - {repeated}"
+    )
+
+
+# 쿼리 지문별 누적 통계
+query_stats = QueryStatsRegistry(
+    slow_query_ms=config.settings.SQL_SLOW_QUERY_MS,
+    max_fingerprints=config.settings.SQL_FINGERPRINT_MAX
+)
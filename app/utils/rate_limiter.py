@@ -0,0 +1,160 @@
+"""
+슬라이딩 윈도우 카운터 Rate Limiter
+요청당 O(1) 갱신, 유휴 키 제거로 메모리 상한 유지, 워커 간 공유 저장소(Redis 호환) 지원
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Tuple
+
+import config
+
+logger = logging.getLogger(__name__)
+
+
+def _window_estimate(previous: int, current: int, elapsed: float, window: float) -> float:
+    """
+    슬라이딩 윈도우 요청 수 추정
+
+    직전 고정 윈도우 카운트를 현재 윈도우 경과 비율만큼 감쇠시켜 더함
+    (타임스탬프 목록 없이 키당 카운터 두 개로 근사)
+    """
+    return previous * (window - elapsed) / window + current
+
+
+class InMemoryRateLimitStore:
+    """
+    프로세스 내 슬라이딩 윈도우 카운터 저장소
+
+    - 키당 (윈도우 번호, 현재 카운트, 직전 카운트, 마지막 접근 시각) 만 보관
+    - 접근 순서(OrderedDict)를 유지해 두 윈도우 이상 유휴한 키를 앞에서부터 제거
+    - max_keys 를 넘으면 가장 오래 유휴한 키부터 제거
+    """
+
+    def __init__(self, max_keys: int = 100_000, clock: Callable[[], float] = time.monotonic):
+        self.max_keys = max_keys
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[int, int, int, float]]" = OrderedDict()
+
+    async def hit(self, key: str, limit: int, window: float) -> bool:
+        """요청 1건 기록 (허용되면 True, 한도 초과면 기록하지 않고 False)"""
+        now = self._clock()
+        window_index = int(now // window)
+        elapsed = now - window_index * window
+
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            current, previous = 0, 0
+        else:
+            entry_window, current, previous, _ = entry
+            if entry_window == window_index - 1:
+                current, previous = 0, current
+            elif entry_window != window_index:
+                current, previous = 0, 0
+
+        allowed = _window_estimate(previous, current, elapsed, window) < limit
+        if allowed:
+            current += 1
+        self._entries[key] = (window_index, current, previous, now)
+
+        self._evict(now - 2 * window)
+        return allowed
+
+    def _evict(self, idle_before: float) -> None:
+        """유휴 키와 상한 초과 키 제거 (가장 오래된 키가 맨 앞)"""
+        while self._entries:
+            oldest_key, (_, _, _, last_seen) = next(iter(self._entries.items()))
+            if last_seen >= idle_before and len(self._entries) <= self.max_keys:
+                break
+            del self._entries[oldest_key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """전체 카운터 초기화"""
+        self._entries.clear()
+
+
+class RedisRateLimitStore:
+    """
+    Redis 호환 저장소 기반 슬라이딩 윈도우 카운터 (워커 간 한도 공유)
+
+    윈도우 번호별 키에 INCR 하고 두 윈도우 뒤 만료되도록 EXPIRE 설정.
+    client 는 비동기 incr/decr/expire/get 을 제공하면 되므로 redis.asyncio 대신
+    로컬 대체 구현을 주입할 수 있음.
+    """
+
+    def __init__(self, client: Any, prefix: str = "ratelimit", clock: Callable[[], float] = time.time):
+        self.client = client
+        self.prefix = prefix
+        self._clock = clock
+
+    async def hit(self, key: str, limit: int, window: float) -> bool:
+        """요청 1건 기록 (허용되면 True, 한도 초과면 카운트를 되돌리고 False)"""
+        now = self._clock()
+        window_index = int(now // window)
+        elapsed = now - window_index * window
+        current_key = f"{self.prefix}:{key}:{window_index}"
+
+        current = await self.client.incr(current_key)
+        if current == 1:
+            await self.client.expire(current_key, int(window * 2) + 1)
+        previous = int(await self.client.get(f"{self.prefix}:{key}:{window_index - 1}") or 0)
+
+        # 증가 후 값 기준이므로 현재 요청을 포함해 limit 이하여야 허용
+        if _window_estimate(previous, current, elapsed, window) <= limit:
+            return True
+
+        await self.client.decr(current_key)
+        return False
+
+
+class RateLimiter:
+    """엔드포인트 유형별 분당 요청 수 제한"""
+
+    def __init__(self, store: Any, limits: Dict[str, int], window: float = 60.0):
+        self.store = store
+        self.limits = limits
+        self.window = window
+        self.rejections: Dict[str, int] = {}
+
+    async def is_allowed(self, client_ip: str, endpoint_type: str = "api") -> bool:
+        """요청 허용 여부 (저장소 오류 시 서비스 가용성을 위해 허용)"""
+        limit = self.limits.get(endpoint_type, self.limits["api"])
+        try:
+            allowed = await self.store.hit(f"{endpoint_type}:{client_ip}", limit, self.window)
+        except Exception as e:
+            logger.warning(f"Rate Limit 저장소 오류 - 요청 허용: {str(e)}")
+            return True
+
+        if not allowed:
+            self.rejections[endpoint_type] = self.rejections.get(endpoint_type, 0) + 1
+        return allowed
+
+
+def create_rate_limit_store() -> Any:
+    """
+    설정에 맞는 저장소 생성
+
+    RATE_LIMIT_REDIS_URL 이 있으면 Redis 공유 저장소, 없거나 redis 패키지가
+    설치되지 않은 경우 프로세스 내 저장소 사용
+    """
+    redis_url = config.settings.RATE_LIMIT_REDIS_URL
+    if redis_url:
+        try:
+            import redis.asyncio as redis_asyncio
+            return RedisRateLimitStore(redis_asyncio.from_url(redis_url, decode_responses=True))
+        except ImportError:
+            logger.warning("redis 패키지가 없어 프로세스 내 Rate Limit 저장소를 사용합니다")
+    return InMemoryRateLimitStore(max_keys=config.settings.RATE_LIMIT_MAX_KEYS)
+
+
+rate_limiter = RateLimiter(
+    create_rate_limit_store(),
+    limits={
+        "api": config.settings.RATE_LIMIT_REQUESTS_PER_MINUTE,
+        "auth": config.settings.RATE_LIMIT_AUTH_REQUESTS_PER_MINUTE
+    }
+)
@@ -0,0 +1,139 @@
+"""
+회사별 스냅샷 캐시
+대시보드처럼 자주 조회되지만 짧은 시간 동안 변하지 않는 집계 결과를 캐시
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import config
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotCache:
+    """
+    회사 ID 단위로 무효화되는 TTL 스냅샷 캐시
+
+    - 항목 키는 (company_id, user_id) 이며 회사 단위로 한꺼번에 무효화됨
+    - 같은 키를 동시에 조회하면 한 번만 적재하고 결과를 공유함
+    - 적재 도중 무효화가 일어나면 결과를 저장하지 않음 (오래된 스냅샷 방지)
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[str, Dict[str, Tuple[float, Any]]] = {}
+        self._generations: Dict[str, int] = {}
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def get(self, company_id: str, user_id: str) -> Optional[Any]:
+        """캐시된 스냅샷 조회 (만료 시 None)"""
+        company_entries = self._entries.get(company_id)
+        if not company_entries or user_id not in company_entries:
+            return None
+
+        expires_at, value = company_entries[user_id]
+        if expires_at <= time.monotonic():
+            del company_entries[user_id]
+            if not company_entries:
+                del self._entries[company_id]
+            return None
+        return value
+
+    def set(self, company_id: str, user_id: str, value: Any) -> None:
+        """스냅샷 저장"""
+        if self.ttl_seconds <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds
+        self._entries.setdefault(company_id, {})[user_id] = (expires_at, value)
+
+    def invalidate(self, *company_ids: Optional[str]) -> None:
+        """회사별 스냅샷 무효화 (주문/재고/채팅 쓰기 후 호출)"""
+        for company_id in company_ids:
+            if not company_id:
+                continue
+            company_id = str(company_id)
+            self._generations[company_id] = self._generations.get(company_id, 0) + 1
+            if self._entries.pop(company_id, None) is not None:
+                self._invalidations += 1
+            self._prune_generation(company_id)
+
+    def _prune_generation(self, company_id: str) -> None:
+        """적재 중인 요청이 없는 회사의 세대 번호 제거 (회사 수만큼 계속 늘어나지 않도록)"""
+        if not any(key[0] == company_id for key in self._inflight):
+            self._generations.pop(company_id, None)
+
+    def clear(self) -> None:
+        """전체 캐시 비우기"""
+        self._entries.clear()
+        self._generations.clear()
+
+    async def get_or_load(self, company_id: str, user_id: str,
+                          loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        캐시 조회 후 없으면 loader 로 적재
+
+        Args:
+            company_id: 회사 ID
+            user_id: 사용자 ID
+            loader: 스냅샷을 생성하는 코루틴 함수
+        """
+        cached = self.get(company_id, user_id)
+        if cached is not None:
+            self._hits += 1
+            return cached
+
+        key = (company_id, user_id)
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self._hits += 1
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # 적재하던 요청이 취소된 경우에만 직접 적재 (자신이 취소된 경우는 그대로 전파)
+                if not inflight.cancelled() or asyncio.current_task().cancelling():
+                    raise
+            return await self.get_or_load(company_id, user_id, loader)
+
+        self._misses += 1
+        generation = self._generations.get(company_id, 0)
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await loader()
+        except Exception as e:
+            future.set_exception(e)
+            # 대기자가 없는 경우에도 "Future exception was never retrieved" 경고 방지
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            if self._generations.get(company_id, 0) == generation:
+                self.set(company_id, user_id, value)
+            return value
+        finally:
+            # 취소 등 Exception 이 아닌 종료에서도 대기자가 멈추지 않도록 정리
+            if not future.done():
+                future.cancel()
+            self._inflight.pop(key, None)
+            self._prune_generation(company_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 조회"""
+        return {
+            "companies": len(self._entries),
+            "entries": sum(len(entries) for entries in self._entries.values()),
+            "hits": self._hits,
+            "misses": self._misses,
+            "invalidations": self._invalidations,
+            "ttl_seconds": self.ttl_seconds
+        }
+
+
+# 대시보드 통계 스냅샷 캐시
+dashboard_cache = SnapshotCache(ttl_seconds=config.settings.DASHBOARD_CACHE_TTL_SECONDS)
@@ -54,6 +54,9 @@ async def execute_sql_query(query: str) -> Optional[List[Dict[str, Any]]]:
         elif isinstance(result, list):
             return result
         elif isinstance(result, dict):
+            # Supabase MCP 호환 형식 {"data": [...]} 처리
+            if isinstance(result.get("data"), list):
+                return result["data"]
             return [result]
         else:
             logger.warning(f"예상치 못한 결과 타입: {type(result)}")
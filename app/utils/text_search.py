@@ -0,0 +1,120 @@
+"""
+바이그램 전문 검색
+띄어쓰기/조사가 불규칙한 한국어 메시지를 두 글자 단위로 색인 (database/chat_message_fts.sql 의 chat_bigrams 와 같은 규칙)
+"""
+
+import html
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_END = "</mark>"
+
+
+def bigrams(text: str) -> List[str]:
+    """
+    단어별 두 글자 토큰 (한 글자 단어는 그대로, 중복 제거, 소문자)
+
+    예) "레이스 원피스" → ["레이", "이스", "원피", "피스"]
+    """
+    tokens: Dict[str, None] = {}
+    for word in _WORD_PATTERN.findall((text or "").lower()):
+        if len(word) == 1:
+            tokens[word] = None
+        else:
+            tokens.update((word[i:i + 2], None) for i in range(len(word) - 1))
+    return list(tokens)
+
+
+def can_use_index(keyword: str) -> bool:
+    """
+    바이그램 색인으로 후보를 좁힐 수 있는 검색어인지
+
+    한 글자 단어는 더 긴 단어의 일부("옷" ⊂ "겉옷")와 토큰이 겹치지 않아 색인으로 찾을 수 없음
+    """
+    words = _WORD_PATTERN.findall(keyword or "")
+    return bool(words) and all(len(word) > 1 for word in words)
+
+
+def highlight_snippet(text: str, keyword: str, width: int = 80) -> str:
+    """
+    검색어 주변 width 글자를 잘라 일치 구간을 <mark> 로 감싼 HTML 조각
+
+    나머지 텍스트는 이스케이프하며, 잘린 앞뒤에는 "…" 를 붙임
+    """
+    text = text or ""
+    lowered, needle = text.lower(), (keyword or "").lower()
+    first = lowered.find(needle) if needle else -1
+    if first < 0:
+        snippet = html.escape(text[:width])
+        return snippet + ("…" if len(text) > width else "")
+
+    start = max(0, min(first - (width - len(needle)) // 2, len(text) - width))
+    end = min(len(text), start + width)
+
+    parts = ["…"] if start > 0 else []
+    position = start
+    while position < end:
+        found = lowered.find(needle, position, end)
+        if found < 0 or found + len(needle) > end:
+            parts.append(html.escape(text[position:end]))
+            break
+        parts.append(html.escape(text[position:found]))
+        parts.append(HIGHLIGHT_START + html.escape(text[found:found + len(needle)]) + HIGHLIGHT_END)
+        position = found + len(needle)
+    if end < len(text):
+        parts.append("…")
+    return "".join(parts)
+
+
+class BigramIndex:
+    """
+    문서 ID → 바이그램 역색인 (로컬 인메모리 백엔드용)
+
+    - 검색어 토큰의 게시 목록을 작은 것부터 교집합해 후보를 좁히고
+      원문 부분 문자열 검사로 확정 (PostgreSQL tsvector @@ + ILIKE 재확인과 같은 결과)
+    - 색인할 수 없는 검색어(can_use_index 가 False)는 전체 문서를 검사
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, Set[Any]] = {}
+        self._docs: Dict[Any, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add(self, doc_id: Any, text: str) -> None:
+        """문서 추가 (이미 있으면 교체)"""
+        self.remove(doc_id)
+        self._docs[doc_id] = (text or "").lower()
+        for token in bigrams(text):
+            self._postings.setdefault(token, set()).add(doc_id)
+
+    def remove(self, doc_id: Any) -> None:
+        """문서 제거"""
+        text = self._docs.pop(doc_id, None)
+        if text is None:
+            return
+        for token in bigrams(text):
+            doc_ids = self._postings.get(token)
+            if doc_ids is not None:
+                doc_ids.discard(doc_id)
+                if not doc_ids:
+                    del self._postings[token]
+
+    def search(self, keyword: str, doc_ids: Optional[Iterable[Any]] = None) -> Set[Any]:
+        """검색어를 포함하는 문서 ID 집합 (doc_ids 를 주면 그 안에서만)"""
+        needle = (keyword or "").lower()
+        if not needle:
+            return set()
+
+        if can_use_index(keyword):
+            postings = sorted((self._postings.get(token, set()) for token in bigrams(keyword)), key=len)
+            candidates = set(postings[0]).intersection(*postings[1:])
+        else:
+            candidates = set(self._docs)
+        if doc_ids is not None:
+            candidates &= set(doc_ids)
+        return {doc_id for doc_id in candidates if needle in self._docs[doc_id]}
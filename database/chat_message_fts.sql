@@ -0,0 +1,20 @@
+-- 마법옷장 채팅 메시지 전문 검색 인덱스
+-- cm.message ILIKE '%검색어%' 를 방 전체 순차 스캔 대신 바이그램 tsvector GIN 인덱스로 후보를 좁힌 뒤 재확인
+-- chat_bigrams 는 app/utils/text_search.py 의 bigrams 와 같은 규칙 (단어별 두 글자 토큰, 한 글자 단어는 그대로)
+
+CREATE OR REPLACE FUNCTION chat_bigrams(content text) RETURNS text
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT coalesce(string_agg(
+        CASE WHEN length(word) = 1 THEN word
+             ELSE (SELECT string_agg(substr(word, i, 2), ' ') FROM generate_series(1, length(word) - 1) AS i)
+        END, ' '), '')
+    FROM regexp_split_to_table(lower(content), '\W+') AS word
+    WHERE word <> ''
+$$;
+
+-- 메시지 INSERT/UPDATE 시 자동 계산되는 검색 컬럼
+ALTER TABLE chat_messages
+    ADD COLUMN IF NOT EXISTS message_tsv tsvector
+    GENERATED ALWAYS AS (to_tsvector('simple', chat_bigrams(message))) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_chat_messages_message_tsv ON chat_messages USING gin (message_tsv);
@@ -0,0 +1,158 @@
+-- 마법옷장 회사별 재고 집계 (InventoryService.get_inventory_stats)
+-- 대시보드마다 회사 전체 상품을 훑던 COUNT/SUM 을 증분 유지되는 집계 행 합계 조회로 대체
+--
+-- - inventory / products 쓰기와 같은 트랜잭션에서 트리거가 변경 전/후 기여분의 차이만 반영
+--   (update_stock_with_lock, bulk_reserve_stock, update_minimum_stock, 상품 활성화/가격 변경 모두 포함)
+-- - 한 회사의 재고 변경이 집계 행 하나에 몰려 직렬화되지 않도록 상품 ID 해시로 16 개 샤드에 분산
+--   (같은 상품의 변경은 이미 inventory 행 락으로 직렬화되므로 샤드 락이 추가 대기를 만들지 않음)
+-- - 드리프트는 InventoryService.reconcile_inventory_stats 가 주기적으로 검사/보정
+-- - 트리거 생성과 초기 적재 사이의 쓰기가 누락되지 않도록 단일 트랜잭션으로 실행 (psql -1 -f)
+
+CREATE TABLE IF NOT EXISTS inventory_stats (
+    company_id UUID NOT NULL,
+    shard SMALLINT NOT NULL,
+    total_products INTEGER NOT NULL DEFAULT 0,
+    active_products INTEGER NOT NULL DEFAULT 0,
+    low_stock_products INTEGER NOT NULL DEFAULT 0,
+    out_of_stock_products INTEGER NOT NULL DEFAULT 0,
+    total_inventory_value BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (company_id, shard)
+);
+
+-- 상품 ID → 샤드 번호 (0~15)
+CREATE OR REPLACE FUNCTION inventory_stats_shard(product_id UUID) RETURNS SMALLINT
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT (hashtext(product_id::text) & 15)::smallint
+$$;
+
+-- 집계 증감 반영 (변화가 없으면 집계 행을 건드리지 않음)
+CREATE OR REPLACE FUNCTION inventory_stats_apply(
+    p_company_id UUID, p_product_id UUID,
+    d_total INTEGER, d_active INTEGER, d_low INTEGER, d_out INTEGER, d_value BIGINT
+) RETURNS VOID LANGUAGE plpgsql AS $$
+BEGIN
+    IF p_company_id IS NULL OR (d_total, d_active, d_low, d_out, d_value) = (0, 0, 0, 0, 0) THEN
+        RETURN;
+    END IF;
+
+    INSERT INTO inventory_stats AS s (
+        company_id, shard, total_products, active_products,
+        low_stock_products, out_of_stock_products, total_inventory_value
+    )
+    VALUES (p_company_id, inventory_stats_shard(p_product_id), d_total, d_active, d_low, d_out, d_value)
+    ON CONFLICT (company_id, shard) DO UPDATE SET
+        total_products = s.total_products + EXCLUDED.total_products,
+        active_products = s.active_products + EXCLUDED.active_products,
+        low_stock_products = s.low_stock_products + EXCLUDED.low_stock_products,
+        out_of_stock_products = s.out_of_stock_products + EXCLUDED.out_of_stock_products,
+        total_inventory_value = s.total_inventory_value + EXCLUDED.total_inventory_value,
+        updated_at = NOW();
+END
+$$;
+
+-- 재고 행 변경: 상품 정보는 그대로, 재고/최소재고 기여분 차이 반영
+CREATE OR REPLACE FUNCTION inventory_stats_on_inventory() RETURNS TRIGGER
+LANGUAGE plpgsql AS $$
+DECLARE
+    product products%ROWTYPE;
+    old_low INTEGER := 0; old_out INTEGER := 0; old_value BIGINT := 0; old_count INTEGER := 0;
+    new_low INTEGER := 0; new_out INTEGER := 0; new_value BIGINT := 0; new_count INTEGER := 0;
+BEGIN
+    SELECT * INTO product FROM products
+    WHERE id = CASE WHEN TG_OP = 'DELETE' THEN OLD.product_id ELSE NEW.product_id END;
+    IF NOT FOUND THEN
+        -- 상품 삭제에 따른 CASCADE 는 products 트리거에서 이미 차감함
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP <> 'INSERT' THEN
+        old_count := 1;
+        old_low := (OLD.current_stock <= OLD.minimum_stock AND OLD.minimum_stock > 0)::int;
+        old_out := (OLD.current_stock = 0)::int;
+        old_value := OLD.current_stock::bigint * COALESCE(product.wholesale_price, 0);
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        new_count := 1;
+        new_low := (NEW.current_stock <= NEW.minimum_stock AND NEW.minimum_stock > 0)::int;
+        new_out := (NEW.current_stock = 0)::int;
+        new_value := NEW.current_stock::bigint * COALESCE(product.wholesale_price, 0);
+    END IF;
+
+    PERFORM inventory_stats_apply(
+        product.company_id, product.id,
+        new_count - old_count,
+        (new_count - old_count) * COALESCE(product.is_active, false)::int,
+        new_low - old_low, new_out - old_out, new_value - old_value
+    );
+    RETURN NULL;
+END
+$$;
+
+-- 상품 변경: 재고 행은 그대로, 활성 여부/도매가/소속 회사 기여분 차이 반영
+-- 동시에 진행 중인 재고 변경과 엇갈리지 않도록 재고 행을 잠근 뒤 최신 재고로 계산
+CREATE OR REPLACE FUNCTION inventory_stats_on_product() RETURNS TRIGGER
+LANGUAGE plpgsql AS $$
+DECLARE
+    stock inventory%ROWTYPE;
+    low INTEGER; out_of_stock INTEGER;
+BEGIN
+    SELECT * INTO stock FROM inventory WHERE product_id = OLD.id FOR UPDATE;
+    IF NOT FOUND THEN
+        RETURN CASE WHEN TG_OP = 'DELETE' THEN OLD ELSE NULL END;
+    END IF;
+
+    low := (stock.current_stock <= stock.minimum_stock AND stock.minimum_stock > 0)::int;
+    out_of_stock := (stock.current_stock = 0)::int;
+
+    PERFORM inventory_stats_apply(
+        OLD.company_id, OLD.id, -1, -COALESCE(OLD.is_active, false)::int, -low, -out_of_stock,
+        -(stock.current_stock::bigint * COALESCE(OLD.wholesale_price, 0))
+    );
+    IF TG_OP = 'DELETE' THEN
+        RETURN OLD;
+    END IF;
+
+    PERFORM inventory_stats_apply(
+        NEW.company_id, NEW.id, 1, COALESCE(NEW.is_active, false)::int, low, out_of_stock,
+        stock.current_stock::bigint * COALESCE(NEW.wholesale_price, 0)
+    );
+    RETURN NULL;
+END
+$$;
+
+DROP TRIGGER IF EXISTS inventory_stats_inventory ON inventory;
+CREATE TRIGGER inventory_stats_inventory
+    AFTER INSERT OR DELETE OR UPDATE OF current_stock, minimum_stock ON inventory
+    FOR EACH ROW EXECUTE FUNCTION inventory_stats_on_inventory();
+
+DROP TRIGGER IF EXISTS inventory_stats_product_update ON products;
+CREATE TRIGGER inventory_stats_product_update
+    AFTER UPDATE OF is_active, wholesale_price, company_id ON products
+    FOR EACH ROW
+    WHEN ((OLD.is_active, OLD.wholesale_price, OLD.company_id) IS DISTINCT FROM (NEW.is_active, NEW.wholesale_price, NEW.company_id))
+    EXECUTE FUNCTION inventory_stats_on_product();
+
+-- 삭제는 CASCADE 로 재고 행이 지워지기 전에 차감
+DROP TRIGGER IF EXISTS inventory_stats_product_delete ON products;
+CREATE TRIGGER inventory_stats_product_delete
+    BEFORE DELETE ON products
+    FOR EACH ROW EXECUTE FUNCTION inventory_stats_on_product();
+
+-- 기존 데이터로 초기 집계 적재
+INSERT INTO inventory_stats (
+    company_id, shard, total_products, active_products,
+    low_stock_products, out_of_stock_products, total_inventory_value
+)
+SELECT
+    p.company_id,
+    inventory_stats_shard(p.id),
+    COUNT(*),
+    COUNT(*) FILTER (WHERE p.is_active = true),
+    COUNT(*) FILTER (WHERE inv.current_stock <= inv.minimum_stock AND inv.minimum_stock > 0),
+    COUNT(*) FILTER (WHERE inv.current_stock = 0),
+    COALESCE(SUM(inv.current_stock::bigint * p.wholesale_price), 0)
+FROM inventory inv
+JOIN products p ON inv.product_id = p.id
+GROUP BY p.company_id, inventory_stats_shard(p.id)
+ON CONFLICT (company_id, shard) DO NOTHING;
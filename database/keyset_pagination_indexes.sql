@@ -0,0 +1,16 @@
+-- 마법옷장 키셋(커서) 페이지네이션 인덱스
+-- ORDER BY created_at DESC, id DESC + (created_at, id) < (커서) 조건을 인덱스 범위 스캔으로 처리
+
+-- 상품 목록 (관리자 전체 / 도매업체별)
+CREATE INDEX IF NOT EXISTS idx_products_created_at_id ON products(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_products_company_created_at_id ON products(company_id, created_at DESC, id DESC);
+
+-- 주문 목록 (도매업체별 / 소매업체별)
+CREATE INDEX IF NOT EXISTS idx_orders_wholesale_created_at_id ON orders(wholesale_company_id, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_orders_retail_created_at_id ON orders(retail_company_id, created_at DESC, id DESC);
+
+-- 채팅방 메시지 목록
+CREATE INDEX IF NOT EXISTS idx_chat_messages_room_created_at_id ON chat_messages(room_id, created_at DESC, id DESC);
+
+-- 공지사항 목록 (중요 공지 우선)
+CREATE INDEX IF NOT EXISTS idx_notices_important_created_at_id ON notices(is_important DESC, created_at DESC, id DESC);
@@ -0,0 +1,22 @@
+-- 마법옷장 일별 주문 번호 카운터 (OrderNumberAllocator)
+-- 주문마다 당일 주문 수를 세던 COUNT(*) ... LIKE 'YYYYMMDD-%' 를 날짜별 카운터 행 UPSERT 로 대체
+--
+-- - 워커는 카운터를 ORDER_NUMBER_BLOCK_SIZE 만큼 올리고 받은 구간 안에서 번호를 발급
+-- - 카운터 갱신은 주문 트랜잭션과 분리된 자동 커밋이므로 행 락은 UPSERT 한 번 동안만 유지
+-- - 기존 주문 번호와 겹치지 않도록 날짜별 최대 번호로 초기값 적재 (재실행 가능)
+
+CREATE TABLE IF NOT EXISTS order_number_counters (
+    order_date DATE PRIMARY KEY,
+    last_value INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+INSERT INTO order_number_counters (order_date, last_value)
+SELECT to_date(split_part(order_number, '-', 1), 'YYYYMMDD'),
+       MAX(split_part(order_number, '-', 2)::integer)
+FROM orders
+WHERE order_number ~ '^[0-9]{8}-[0-9]+$'
+GROUP BY 1
+ON CONFLICT (order_date) DO UPDATE
+    SET last_value = GREATEST(order_number_counters.last_value, EXCLUDED.last_value),
+        updated_at = NOW();
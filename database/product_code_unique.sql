@@ -0,0 +1,9 @@
+-- 마법옷장 상품 코드 유일 인덱스 (ProductImportService 일괄 등록)
+-- 일괄 등록 적재 쿼리의 INSERT ... ON CONFLICT (code) DO NOTHING 이 코드 중복을 원자적으로 거르려면 필요
+-- 동시 상품 등록/일괄 등록 사이의 EXISTS 확인 후 INSERT 경합으로 중복 코드가 생기지 않음
+--
+-- 기존 중복 코드가 있으면 인덱스 생성이 실패하므로 먼저 확인 후 정리:
+--   SELECT code, COUNT(*) FROM products GROUP BY code HAVING COUNT(*) > 1;
+-- CONCURRENTLY 는 트랜잭션 블록 밖에서 실행해야 함
+
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS idx_products_code_unique ON products(code);
@@ -0,0 +1,6 @@
+-- 마법옷장 상품 이미지 변형 URL (ProductService.add_product_image)
+-- images 와 같은 순서로 {"original", "list", "thumbnail"} URL 을 저장해 목록/카드 화면이 작은 WebP 를 사용하도록 함
+-- URL 만 등록된 기존 이미지는 첫 업로드 때 {"original"} 항목으로 채워짐
+
+ALTER TABLE products
+    ADD COLUMN IF NOT EXISTS image_variants JSONB NOT NULL DEFAULT '[]'::jsonb;
@@ -0,0 +1,7 @@
+-- 마법옷장 상품명 트라이그램 검색 인덱스
+-- p.name ILIKE '%검색어%' 와 word_similarity(<%) 조건을 순차 스캔 대신 GIN 인덱스로 처리
+-- GIN 인덱스는 상품 INSERT/UPDATE 시 함께 갱신됨
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_products_name_trgm ON products USING gin (name gin_trgm_ops);
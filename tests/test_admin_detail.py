@@ -41,8 +41,8 @@ class TestAdminDetailService:
             'company_created_at': datetime.now()
         }
         
-        with patch('services.admin_service.real_supabase_service.execute_sql') as mock_execute:
-            mock_execute.return_value = {'data': [mock_user_data]}
+        with patch('services.admin_service.execute_sql', new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = [mock_user_data]
             
             # When
             result = await AdminService.get_user_detail(user_id)
@@ -61,8 +61,8 @@ class TestAdminDetailService:
         # Given
         user_id = str(uuid.uuid4())
         
-        with patch('services.admin_service.real_supabase_service.execute_sql') as mock_execute:
-            mock_execute.return_value = {'data': []}
+        with patch('services.admin_service.execute_sql', new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = []
             
             # When
             result = await AdminService.get_user_detail(user_id)
@@ -96,8 +96,8 @@ class TestAdminDetailService:
             'company_created_at': None
         }
         
-        with patch('services.admin_service.real_supabase_service.execute_sql') as mock_execute:
-            mock_execute.return_value = {'data': [mock_user_data]}
+        with patch('services.admin_service.execute_sql', new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = [mock_user_data]
             
             # When
             result = await AdminService.get_user_detail(user_id)
@@ -114,7 +114,7 @@ class TestAdminDetailService:
         # Given
         user_id = str(uuid.uuid4())
         
-        with patch('services.admin_service.real_supabase_service.execute_sql') as mock_execute:
+        with patch('services.admin_service.execute_sql', new_callable=AsyncMock) as mock_execute:
             mock_execute.side_effect = Exception("Database connection failed")
             
             # When/Then
@@ -127,7 +127,7 @@ class TestAdminDetailService:
         # Given
         invalid_user_id = "invalid-uuid"
         
-        with patch('services.admin_service.real_supabase_service.execute_sql') as mock_execute:
+        with patch('services.admin_service.execute_sql', new_callable=AsyncMock) as mock_execute:
             mock_execute.side_effect = Exception("Invalid UUID format")
             
             # When/Then
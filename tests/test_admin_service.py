@@ -17,8 +17,8 @@ class TestAdminService:
     """AdminService 테스트"""
 
     @pytest.mark.asyncio
-    @patch('services.admin_service.real_supabase_service')
-    async def test_get_pending_users_success(self, mock_supabase):
+    @patch('services.admin_service.execute_sql', new_callable=AsyncMock)
+    async def test_get_pending_users_success(self, mock_execute_sql):
         """승인 대기 사용자 목록 조회 성공 테스트"""
         # Given: Mock DB 응답 데이터
         mock_pending_users = [
@@ -46,7 +46,7 @@ class TestAdminService:
             }
         ]
         
-        mock_supabase.execute_sql = AsyncMock(return_value={"data": mock_pending_users})
+        mock_execute_sql.return_value = mock_pending_users
         
         # When: 승인 대기 사용자 목록 조회
         result = await AdminService.get_pending_users()
@@ -57,41 +57,39 @@ class TestAdminService:
         assert result[1]["email"] == "pending2@example.com"
         
         # execute_sql이 올바른 파라미터로 호출되었는지 확인
-        mock_supabase.execute_sql.assert_called_once()
-        call_args = mock_supabase.execute_sql.call_args
-        assert 'project_id' in call_args.kwargs
-        assert call_args.kwargs['project_id'] == "vrsbmygqyfvvuaixibrh"
-        assert 'query' in call_args.kwargs
-        assert "WHERE u.approved = false" in call_args.kwargs['query']
+        mock_execute_sql.assert_called_once()
+        call_args = mock_execute_sql.call_args
+        assert "WHERE u.approved = false" in call_args.args[0]
 
     @pytest.mark.asyncio
-    @patch('services.admin_service.real_supabase_service')
-    async def test_get_pending_users_empty_result(self, mock_supabase):
+    @patch('services.admin_service.execute_sql', new_callable=AsyncMock)
+    async def test_get_pending_users_empty_result(self, mock_execute_sql):
         """승인 대기 사용자가 없는 경우 테스트"""
         # Given: 빈 결과
-        mock_supabase.execute_sql = AsyncMock(return_value={"data": []})
+        mock_execute_sql.return_value = []
         
         # When: 승인 대기 사용자 목록 조회
         result = await AdminService.get_pending_users()
         
         # Then: 빈 리스트 반환
         assert result == []
-        mock_supabase.execute_sql.assert_called_once()
+        mock_execute_sql.assert_called_once()
 
     @pytest.mark.asyncio
-    @patch('services.admin_service.real_supabase_service')
-    async def test_get_pending_users_database_error(self, mock_supabase):
+    @patch('services.admin_service.execute_sql', new_callable=AsyncMock)
+    async def test_get_pending_users_database_error(self, mock_execute_sql):
         """데이터베이스 오류 시 예외 처리 테스트"""
         # Given: DB 오류 시뮬레이션
-        mock_supabase.execute_sql = AsyncMock(side_effect=Exception("Database connection failed"))
+        mock_execute_sql.side_effect = Exception("Database connection failed")
         
         # When & Then: RuntimeError 발생 확인
         with pytest.raises(RuntimeError, match="사용자 목록 조회에 실패했습니다"):
             await AdminService.get_pending_users()
 
     @pytest.mark.asyncio
-    @patch('services.admin_service.real_supabase_service')
-    async def test_approve_user_success(self, mock_supabase):
+    @patch('services.admin_service.execute_sql', new_callable=AsyncMock)
+    @patch('services.admin_service.AuthService.get_user_by_id', new_callable=AsyncMock)
+    async def test_approve_user_success(self, mock_get_user_by_id, mock_execute_sql):
         """사용자 승인 성공 테스트"""
         # Given: 승인 대기 사용자와 승인 데이터
         user_id = str(uuid.uuid4())
@@ -109,20 +107,27 @@ class TestAdminService:
             reason="적격한 업체입니다"
         )
         
-        mock_supabase.get_user_by_id = AsyncMock(return_value=mock_user)
-        mock_supabase.execute_sql = AsyncMock(return_value={"data": [{"id": user_id}]})
+        mock_get_user_by_id.return_value = mock_user
+        mock_execute_sql.return_value = [{"id": user_id}]
         
         # When: 사용자 승인 처리
         result = await AdminService.approve_user(admin_id, approval_data)
         
         # Then: 성공 결과 반환
         assert result is True
-        mock_supabase.get_user_by_id.assert_called_once_with(user_id)
-        mock_supabase.execute_sql.assert_called_once()
+        mock_get_user_by_id.assert_called_once_with(user_id)
+        mock_execute_sql.assert_called_once()
+        
+        # 승인 값은 쿼리 파라미터로 전달
+        call_args = mock_execute_sql.call_args
+        assert "UPDATE users" in call_args.args[0]
+        assert True in call_args.args
+        assert user_id in call_args.args
+        assert admin_id in call_args.args
 
     @pytest.mark.asyncio
-    @patch('services.admin_service.real_supabase_service')
-    async def test_get_user_statistics_success(self, mock_supabase):
+    @patch('services.admin_service.execute_sql', new_callable=AsyncMock)
+    async def test_get_user_statistics_success(self, mock_execute_sql):
         """사용자 통계 조회 성공 테스트"""
         # Given: Mock 통계 데이터
         mock_stats = {
@@ -134,21 +139,20 @@ class TestAdminService:
             "retail_users": 5
         }
         
-        mock_supabase.execute_sql = AsyncMock(return_value={"data": [mock_stats]})
+        mock_execute_sql.return_value = [mock_stats]
         
         # When: 사용자 통계 조회
         result = await AdminService.get_user_statistics()
         
         # Then: 올바른 통계 반환
         assert result == mock_stats
-        mock_supabase.execute_sql.assert_called_once()
-        call_args = mock_supabase.execute_sql.call_args
-        assert 'project_id' in call_args.kwargs
-        assert call_args.kwargs['project_id'] == "vrsbmygqyfvvuaixibrh"
+        mock_execute_sql.assert_called_once()
+        call_args = mock_execute_sql.call_args
+        assert "FROM users" in call_args.args[0]
 
     @pytest.mark.asyncio
-    @patch('services.admin_service.real_supabase_service')
-    async def test_delete_notice_success(self, mock_supabase):
+    @patch('services.admin_service.execute_sql', new_callable=AsyncMock)
+    async def test_delete_notice_success(self, mock_execute_sql):
         """공지사항 삭제 성공 테스트"""
         # Given: 존재하는 공지사항
         notice_id = str(uuid.uuid4())
@@ -160,7 +164,7 @@ class TestAdminService:
             "content": "테스트 내용"
         }
         
-        mock_supabase.execute_sql = AsyncMock(return_value={"data": [mock_notice]})
+        mock_execute_sql.return_value = [mock_notice]
         
         # When: 공지사항 삭제
         result = await AdminService.delete_notice(admin_id, notice_id)
@@ -168,10 +172,9 @@ class TestAdminService:
         # Then: 성공 결과 반환
         assert result is True
         
-        # execute_sql이 project_id와 함께 호출되었는지 확인
-        calls = mock_supabase.execute_sql.call_args_list
+        # 마지막 호출(DELETE 쿼리)은 공지사항 ID를 파라미터로 전달
+        calls = mock_execute_sql.call_args_list
         assert len(calls) >= 1
-        # 마지막 호출(DELETE 쿼리)에서 project_id 확인
         delete_call = calls[-1]
-        assert 'project_id' in delete_call.kwargs
-        assert delete_call.kwargs['project_id'] == "vrsbmygqyfvvuaixibrh"
\ No newline at end of file
+        assert "DELETE FROM notices WHERE id = $1" in delete_call.args[0]
+        assert delete_call.args[1] == notice_id
\ No newline at end of file
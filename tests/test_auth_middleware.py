@@ -15,6 +15,7 @@ from auth.middleware import (
     get_admin_user_required, get_approved_user_required
 )
 from utils.jwt_utils import create_access_token, create_refresh_token
+from utils.principal_cache import principal_cache
 
 
 def create_mock_request(path: str, auth_header: str = None, cookies: dict = None) -> Request:
@@ -163,6 +164,54 @@ class TestAuthMiddleware:
         assert result is not None
         assert result["email"] == user_data["email"]
 
+    
+    @pytest.mark.asyncio
+    @patch('auth.middleware.AuthService.get_user_by_id')
+    async def test_authenticate_request_caches_user(self, mock_get_user):
+        """같은 사용자의 연속 요청은 사용자 조회 1회만 수행"""
+        user_data = {
+            "user_id": str(uuid.uuid4()),
+            "email": "test@example.com",
+            "role": "user",
+            "company_type": "retail"
+        }
+        mock_get_user.return_value = {"id": user_data["user_id"], "email": user_data["email"], "approved": True}
+        
+        token = create_access_token(user_data)
+        for _ in range(3):
+            request = create_mock_request("/api/products", auth_header=f"Bearer {token}")
+            result = await auth_middleware.authenticate_request(request)
+            assert result["id"] == user_data["user_id"]
+        
+        mock_get_user.assert_called_once_with(user_data["user_id"])
+        
+        # 무효화 후에는 다시 조회
+        principal_cache.invalidate(user_data["user_id"])
+        request = create_mock_request("/api/products", auth_header=f"Bearer {token}")
+        await auth_middleware.authenticate_request(request)
+        assert mock_get_user.call_count == 2
+    
+    @pytest.mark.asyncio
+    @patch('auth.middleware.AuthService.get_user_by_id')
+    async def test_authenticate_request_claims_only(self, mock_get_user):
+        """claims_only 모드는 캐시에 없으면 토큰 클레임만 사용"""
+        user_data = {
+            "user_id": str(uuid.uuid4()),
+            "email": "test@example.com",
+            "role": "admin",
+            "company_type": "wholesale"
+        }
+        
+        token = create_access_token(user_data)
+        request = create_mock_request("/", auth_header=f"Bearer {token}")
+        result = await auth_middleware.authenticate_request(request, claims_only=True)
+        
+        mock_get_user.assert_not_called()
+        assert result["id"] == user_data["user_id"]
+        assert result["role"] == "admin"
+        assert result["company_type"] == "wholesale"
+        assert "approved" not in result
+
 
 class TestAuthDependencies:
     """인증 의존성 함수 테스트"""
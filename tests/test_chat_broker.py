@@ -0,0 +1,273 @@
+"""
+채팅 팬아웃 브로커 테스트
+워커 간 WebSocket 메시지 전달 검증
+"""
+
+import asyncio
+import json
+import sys
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from services.chat_service import ConnectionManager
+from utils.chat_broker import InProcessBroker, PostgresNotifyBroker, RedisBroker
+
+
+class FakeWebSocket:
+    """테스트용 WebSocket (전송된 텍스트 기록)"""
+
+    def __init__(self, fail: bool = False):
+        self.sent = []
+        self.fail = fail
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, data: str):
+        if self.fail:
+            raise RuntimeError("connection closed")
+        self.sent.append(json.loads(data))
+
+
+async def flush():
+    """송신 큐 writer 태스크가 실행되도록 이벤트 루프 양보"""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestConnectionManagerFanout:
+    """ConnectionManager 브로커 팬아웃 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_room_message_reaches_other_worker(self):
+        """같은 브로커를 쓰는 다른 워커의 소켓에도 전달"""
+        broker = InProcessBroker()
+        worker_a, worker_b = ConnectionManager(broker), ConnectionManager(broker)
+        await worker_a.start()
+        await worker_b.start()
+
+        socket_a, socket_b, other_room = FakeWebSocket(), FakeWebSocket(), FakeWebSocket()
+        await worker_a.connect(socket_a, "room-1", "user-a")
+        await worker_b.connect(socket_b, "room-1", "user-b")
+        await worker_b.connect(other_room, "room-2", "user-c")
+
+        await worker_a.send_to_room("room-1", {"type": "message", "timestamp": datetime(2025, 9, 1, 10, 0)})
+        await flush()
+
+        assert socket_a.sent == socket_b.sent == [{"type": "message", "timestamp": "2025-09-01 10:00:00"}]
+        assert other_room.sent == []
+
+    @pytest.mark.asyncio
+    async def test_user_message_and_dead_socket_cleanup(self):
+        """사용자 대상 전달 및 끊어진 소켓 정리"""
+        broker = InProcessBroker()
+        worker_a, worker_b = ConnectionManager(broker), ConnectionManager(broker)
+        await worker_a.start()
+        await worker_b.start()
+
+        alive, dead = FakeWebSocket(), FakeWebSocket(fail=True)
+        await worker_b.connect(alive, "room-1", "user-1")
+        await worker_b.connect(dead, "room-1", "user-2")
+
+        await worker_a.send_to_user("user-1", {"type": "notification"})
+        await worker_a.send_to_room("room-1", {"type": "message"})
+        await flush()
+
+        assert alive.sent == [{"type": "notification"}, {"type": "message"}]
+        assert worker_b.room_connections["room-1"] == [alive]
+
+    @pytest.mark.asyncio
+    async def test_local_delivery_before_start(self):
+        """브로커 시작 전에는 현재 워커 소켓에만 전달"""
+        manager = ConnectionManager(InProcessBroker())
+        websocket = FakeWebSocket()
+        await manager.connect(websocket, "room-1", "user-1")
+
+        await manager.send_to_room("room-1", {"type": "typing"})
+        await flush()
+
+        assert websocket.sent == [{"type": "typing"}]
+
+
+class FakePubSub:
+    """redis.asyncio PubSub 대체 구현 (fail 이 있으면 메시지 전달 후 연결 오류)"""
+
+    def __init__(self, messages, fail: Exception = None):
+        self.messages = messages
+        self.fail = fail
+        self.subscribed = []
+        self.closed = False
+
+    async def subscribe(self, channel):
+        self.subscribed.append(channel)
+
+    async def unsubscribe(self, channel):
+        pass
+
+    async def close(self):
+        self.closed = True
+
+    async def listen(self):
+        yield {"type": "subscribe", "data": 1}
+        for message in self.messages:
+            yield {"type": "message", "data": message}
+        if self.fail is not None:
+            raise self.fail
+        await asyncio.Event().wait()
+
+
+class FakeRedis:
+    """pubsub() 호출마다 준비된 PubSub 를 차례로 반환"""
+
+    def __init__(self, *pubsubs):
+        self.pubsubs = list(pubsubs)
+
+    def pubsub(self):
+        return self.pubsubs.pop(0)
+
+
+async def wait_until(condition):
+    """조건이 참이 될 때까지 이벤트 루프 양보"""
+    for _ in range(100):
+        if condition():
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("조건 미충족")
+
+
+class TestRedisBroker:
+    """RedisBroker 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_listen_dispatches_messages(self):
+        """subscribe 확인 메시지는 건너뛰고 bytes 는 문자열로 전달"""
+        pubsub = FakePubSub([b"room\nroom-1\n\n{}", "user\nuser-1\n\n{}"])
+        broker = RedisBroker(FakeRedis(pubsub), "chat_fanout")
+        received = []
+
+        async def handler(data):
+            received.append(data)
+
+        await broker.start(handler)
+        await wait_until(lambda: len(received) == 2)
+        await broker.stop()
+
+        assert pubsub.subscribed == ["chat_fanout"]
+        assert received == ["room\nroom-1\n\n{}", "user\nuser-1\n\n{}"]
+        assert pubsub.closed
+        assert broker.get_stats()["state"] == "stopped"
+
+    @pytest.mark.asyncio
+    async def test_resubscribes_after_connection_error(self):
+        """수신 중 연결이 끊기면 새 PubSub 로 다시 구독하고 상태를 노출"""
+        first = FakePubSub(["before"], fail=ConnectionError("Connection reset by peer"))
+        second = FakePubSub(["after"])
+        broker = RedisBroker(FakeRedis(first, second), "chat_fanout", retry_initial=0)
+        received = []
+
+        async def handler(data):
+            received.append(data)
+
+        await broker.start(handler)
+        await wait_until(lambda: received == ["before", "after"])
+
+        assert second.subscribed == ["chat_fanout"] and first.closed
+        assert broker.get_stats() == {
+            "type": "redis", "state": "connected", "reconnects": 1, "last_error": "Connection reset by peer"
+        }
+        await broker.stop()
+
+    @pytest.mark.asyncio
+    async def test_start_does_not_raise_when_unavailable(self):
+        """첫 구독이 실패해도 시작은 끝나고 백그라운드에서 재시도"""
+        class Unavailable:
+            def pubsub(self):
+                raise ConnectionError("Connection refused")
+
+        broker = RedisBroker(Unavailable(), "chat_fanout", retry_initial=10)
+
+        await broker.start(lambda data: None)
+
+        assert broker.get_stats()["state"] == "reconnecting"
+        assert broker.get_stats()["last_error"] == "Connection refused"
+        await broker.stop()
+
+
+class FakeConnection:
+    """asyncpg 커넥션 대체 구현 (terminate() 로 서버 측 종료 흉내)"""
+
+    def __init__(self):
+        self.listeners = {}
+        self.termination_listeners = []
+        self.closed = False
+
+    def add_termination_listener(self, callback):
+        self.termination_listeners.append(callback)
+
+    async def add_listener(self, channel, callback):
+        self.listeners[channel] = callback
+
+    async def execute(self, query, *args, timeout=None):
+        return "SELECT 1"
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self, timeout=None):
+        self.closed = True
+
+    def terminate(self):
+        self.closed = True
+        for callback in self.termination_listeners:
+            callback(self)
+
+
+class TestPostgresNotifyBroker:
+    """PostgresNotifyBroker 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_listen_rerun_after_connection_lost(self):
+        """커넥션이 종료되면 새 커넥션에서 LISTEN 을 다시 실행"""
+        connections = [FakeConnection(), FakeConnection()]
+        asyncpg = SimpleNamespace(connect=AsyncMock(side_effect=connections))
+        broker = PostgresNotifyBroker("postgresql://localhost/test", "chat_fanout", retry_initial=0)
+        received = []
+
+        async def handler(data):
+            received.append(data)
+
+        with patch.dict(sys.modules, {"asyncpg": asyncpg}):
+            await broker.start(handler)
+            connections[0].terminate()
+            await wait_until(lambda: "chat_fanout" in connections[1].listeners)
+
+            connections[1].listeners["chat_fanout"](connections[1], 1, "chat_fanout", "room\nroom-1\n\n{}")
+            await wait_until(lambda: received)
+
+        assert received == ["room\nroom-1\n\n{}"]
+        assert broker.get_stats()["reconnects"] == 1
+        await broker.stop()
+        assert connections[1].closed
+
+    @pytest.mark.asyncio
+    async def test_publish_without_connection_raises(self):
+        """재연결 중 발행은 예외 (ConnectionManager 가 현재 워커에만 전달)"""
+        broker = PostgresNotifyBroker("postgresql://localhost/test", "chat_fanout")
+
+        with pytest.raises(ConnectionError):
+            await broker.publish("room\nroom-1\n\n{}")
+
+
+class TestBrokerStats:
+    """/health/chat 브로커 상태 노출 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_connection_manager_stats_include_broker(self):
+        """연결 통계에 브로커 종류와 상태 포함"""
+        manager = ConnectionManager(InProcessBroker())
+        assert manager.get_stats()["broker"] == {"type": "in_process", "state": "stopped"}
+
+        await manager.start()
+        assert manager.get_stats()["broker"]["state"] == "connected"
@@ -0,0 +1,126 @@
+"""
+WebSocket 송신 큐 테스트
+느린 소비자 정책(drop_oldest/coalesce/disconnect)과 큐 통계 검증
+"""
+
+import asyncio
+import json
+import pytest
+
+from services.chat_service import ConnectionManager, OutboundConnection
+
+
+class BlockingWebSocket:
+    """release 전까지 전송이 멈추는 느린 WebSocket"""
+
+    def __init__(self):
+        self.sent = []
+        self.released = asyncio.Event()
+        self.close_code = None
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, data: str):
+        await self.released.wait()
+        self.sent.append(json.loads(data))
+
+    async def close(self, code: int = 1000):
+        self.close_code = code
+
+
+async def flush():
+    """writer 태스크가 실행되도록 이벤트 루프 양보"""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestOutboundConnection:
+    """OutboundConnection 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest(self):
+        """큐가 가득 차면 가장 오래된 프레임을 버림"""
+        websocket = BlockingWebSocket()
+        outbound = OutboundConnection(websocket, max_queue=2, policy="drop_oldest")
+        outbound.enqueue('{"n": 0}')
+        await flush()  # 첫 프레임은 전송 중
+
+        for n in range(1, 4):
+            assert outbound.enqueue(json.dumps({"n": n}))
+
+        assert outbound.depth == 2
+        assert outbound.dropped == 1
+
+        websocket.released.set()
+        await flush()
+        assert websocket.sent == [{"n": 0}, {"n": 2}, {"n": 3}]
+        outbound.close()
+
+    @pytest.mark.asyncio
+    async def test_coalesce(self):
+        """같은 coalesce_key 프레임은 최신 값으로 교체"""
+        websocket = BlockingWebSocket()
+        outbound = OutboundConnection(websocket, max_queue=10, policy="coalesce")
+        outbound.enqueue('{"n": 0}')
+        await flush()
+
+        outbound.enqueue('{"typing": true}', coalesce_key="typing:user-1")
+        outbound.enqueue('{"n": 1}')
+        outbound.enqueue('{"typing": false}', coalesce_key="typing:user-1")
+
+        assert outbound.depth == 2
+        assert outbound.coalesced == 1
+
+        websocket.released.set()
+        await flush()
+        assert websocket.sent == [{"n": 0}, {"typing": False}, {"n": 1}]
+        outbound.close()
+
+    @pytest.mark.asyncio
+    async def test_disconnect(self):
+        """disconnect 정책은 큐가 가득 차면 연결을 끊음"""
+        websocket = BlockingWebSocket()
+        closed = []
+        outbound = OutboundConnection(websocket, max_queue=1, policy="disconnect", on_close=closed.append)
+        outbound.enqueue('{"n": 0}')
+        await flush()
+        outbound.enqueue('{"n": 1}')
+
+        assert outbound.enqueue('{"n": 2}') is False
+        await flush()
+
+        assert outbound.closed is True
+        assert closed == [websocket]
+        assert websocket.close_code == 1013
+
+    def test_invalid_policy(self):
+        """알 수 없는 정책은 ValueError"""
+        with pytest.raises(ValueError):
+            OutboundConnection(BlockingWebSocket(), policy="block")
+
+
+class TestConnectionManagerBackpressure:
+    """ConnectionManager 브로드캐스트 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_block_room(self):
+        """느린 클라이언트가 있어도 브로드캐스트는 즉시 반환되고 다른 클라이언트에 전달"""
+        manager = ConnectionManager(max_queue=10)
+        slow, fast = BlockingWebSocket(), BlockingWebSocket()
+        fast.released.set()
+        await manager.connect(slow, "room-1", "user-slow")
+        await manager.connect(fast, "room-1", "user-fast")
+
+        await asyncio.wait_for(manager.send_to_room("room-1", {"type": "message"}), timeout=1)
+        await flush()
+
+        assert fast.sent == [{"type": "message"}]
+        assert slow.sent == []
+        stats = manager.get_stats()
+        assert stats["connections"] == 2
+        assert stats["queue_depth"] == 0  # 느린 소켓은 전송 중인 프레임 1건을 보유
+
+        manager.disconnect(slow, "room-1", "user-slow")
+        manager.disconnect(fast, "room-1", "user-fast")
+        assert manager.get_stats()["sent_frames"] == 1
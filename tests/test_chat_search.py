@@ -0,0 +1,124 @@
+"""
+채팅 메시지 검색 테스트
+바이그램 토큰화, 강조 스니펫, 전문 검색 쿼리, 인메모리 역색인 검증
+"""
+
+import pytest
+import uuid
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+from utils.text_search import BigramIndex, bigrams, can_use_index, highlight_snippet
+from services.chat_service import ChatService
+from services.real_supabase_service import RealSupabaseService
+
+ROOM_ID = "33333333-4444-5555-6666-777777777777"
+
+
+class TestBigrams:
+    """바이그램 토큰화/스니펫 테스트"""
+
+    def test_bigrams(self):
+        """단어별 두 글자 토큰, 한 글자 단어는 그대로"""
+        assert bigrams("레이스 원피스 S") == ["레이", "이스", "원피", "피스", "s"]
+
+    def test_single_character_word_skips_index(self):
+        """한 글자 단어가 있으면 색인 대신 부분 일치만 사용"""
+        assert can_use_index("원피스") is True
+        assert can_use_index("겉 옷") is False
+
+    def test_highlight_snippet(self):
+        """일치 구간을 <mark> 로 감싸고 나머지는 이스케이프"""
+        assert highlight_snippet("<b>원피스</b> 재입고 원피스", "원피스") == (
+            "&lt;b&gt;<mark>원피스</mark>&lt;/b&gt; 재입고 <mark>원피스</mark>"
+        )
+
+    def test_highlight_snippet_window(self):
+        """긴 메시지는 첫 일치 주변만 잘라 앞뒤에 … 표시"""
+        text = "가" * 100 + "원피스" + "나" * 100
+
+        snippet = highlight_snippet(text, "원피스", width=20)
+
+        assert snippet.startswith("…") and snippet.endswith("…")
+        assert "<mark>원피스</mark>" in snippet
+
+
+class TestBigramIndex:
+    """BigramIndex 테스트"""
+
+    def test_search_rechecks_substring(self):
+        """모든 토큰이 있어도 연속으로 포함되지 않으면 제외"""
+        index = BigramIndex()
+        index.add("m1", "여아 원피스 재입고 됐나요?")
+        index.add("m2", "피스 원피 세트")
+        index.add("m3", "청바지 주문합니다")
+
+        assert index.search("원피스") == {"m1"}
+        assert index.search("원피스", doc_ids=["m2", "m3"]) == set()
+
+    def test_single_character_scans(self):
+        """한 글자 검색어는 단어 중간도 일치"""
+        index = BigramIndex()
+        index.add("m1", "겉옷 문의")
+        index.add("m2", "바지 문의")
+
+        assert index.search("옷") == {"m1"}
+
+        index.remove("m1")
+        assert index.search("옷") == set()
+
+
+class TestSearchMessages:
+    """ChatService.search_messages 테스트"""
+
+    @pytest.mark.asyncio
+    @patch('services.chat_service.execute_sql', new_callable=AsyncMock)
+    @patch.object(ChatService, 'check_room_access', new_callable=AsyncMock, return_value=True)
+    async def test_uses_fulltext_condition_and_snippet(self, mock_access, mock_execute_sql):
+        """tsvector 조건으로 후보를 좁히고 결과에 강조 스니펫 포함"""
+        mock_execute_sql.return_value = [{
+            "id": str(uuid.uuid4()),
+            "room_id": ROOM_ID,
+            "sender_id": str(uuid.uuid4()),
+            "message": "원피스 재입고 문의",
+            "message_type": "text",
+            "order_id": None,
+            "created_at": datetime(2025, 9, 1, 10, 0)
+        }]
+
+        result = await ChatService.search_messages(ROOM_ID, "user", "원피스", size=20, total_mode="none")
+
+        query, *args = mock_execute_sql.call_args.args
+        assert "cm.message_tsv @@ plainto_tsquery('simple', $2)" in query
+        assert "cm.message ILIKE '%' || $3 || '%'" in query
+        assert args[1:3] == ["원피 피스", "원피스"]
+        assert result.messages[0].snippet == "<mark>원피스</mark> 재입고 문의"
+
+
+class TestInMemoryChatSearch:
+    """인메모리 백엔드 메시지 검색 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_inserted_message_is_searchable(self):
+        """메시지 INSERT 시 바이그램 인덱스가 함께 갱신"""
+        service = RealSupabaseService()
+        message_id = str(uuid.uuid4())
+        await service.execute_sql(
+            project_id="test",
+            query="INSERT INTO chat_messages (id, room_id, sender_id, message, message_type, order_id) VALUES ($1, $2, $3, $4, $5, $6)",
+            params=[message_id, ROOM_ID, "7b4590df-10cc-4074-9186-4957ef96bfbb", "여아 원피스 재입고", "text", None]
+        )
+        search_query = (
+            "SELECT cm.id FROM chat_messages cm WHERE cm.room_id = $1 "
+            "AND cm.message_tsv @@ plainto_tsquery('simple', $2) AND cm.message ILIKE '%' || $3 || '%'"
+        )
+
+        found = await service.execute_sql(project_id="test", query=search_query, params=[ROOM_ID, "원피 피스", "원피스"])
+        counted = await service.execute_sql(
+            project_id="test",
+            query="SELECT COUNT(*) as total FROM chat_messages cm WHERE cm.room_id = $1 AND cm.message ILIKE '%' || $2 || '%'",
+            params=[ROOM_ID, "테스트"]
+        )
+
+        assert [row["id"] for row in found["data"]] == [message_id]
+        assert counted["data"] == [{"total": 1}]
@@ -46,7 +46,7 @@ class TestCompanyAPI:
         return create_access_token(user_data)
     
     @pytest.mark.asyncio
-    @patch('services.real_supabase_service.real_supabase_service.execute_sql')
+    @patch('services.company_service.execute_sql')
     async def test_get_companies_list_success(self, mock_execute_sql):
         """회사 목록 조회 성공 테스트"""
         # Mock 데이터 설정
@@ -81,7 +81,7 @@ class TestCompanyAPI:
         assert data["companies"][0]["company_type"] == "wholesale"
     
     @pytest.mark.asyncio
-    @patch('services.real_supabase_service.real_supabase_service.execute_sql')
+    @patch('services.company_service.execute_sql')
     async def test_get_wholesale_companies_success(self, mock_execute_sql):
         """도매업체 목록 조회 성공 테스트 (소매업체가 거래 신청할 때)"""
         # Mock 데이터 설정
@@ -120,7 +120,7 @@ class TestCompanyAPI:
         assert response.status_code == 401
     
     @pytest.mark.asyncio
-    @patch('services.real_supabase_service.real_supabase_service.execute_sql')
+    @patch('services.company_service.execute_sql')
     async def test_create_relationship_success(self, mock_execute_sql):
         """거래 관계 신청 성공 테스트"""
         # Mock 설정 - 중복 확인 + 관계 생성
@@ -155,7 +155,7 @@ class TestCompanyAPI:
         assert data["status"] == "pending"
     
     @pytest.mark.asyncio
-    @patch('services.real_supabase_service.real_supabase_service.execute_sql')
+    @patch('services.company_service.execute_sql')
     async def test_create_relationship_duplicate_error(self, mock_execute_sql):
         """중복 거래 관계 신청 오류 테스트"""
         # Mock 설정 - 중복 관계 존재
@@ -178,7 +178,7 @@ class TestCompanyAPI:
         assert "이미 존재하는 거래 관계" in data["detail"]
     
     @pytest.mark.asyncio
-    @patch('services.real_supabase_service.real_supabase_service.execute_sql')
+    @patch('services.company_service.execute_sql')
     async def test_approve_relationship_success(self, mock_execute_sql):
         """거래 관계 승인 성공 테스트 (도매업체가 승인)"""
         relationship_id = str(uuid.uuid4())
@@ -211,7 +211,7 @@ class TestCompanyAPI:
         assert data["id"] == relationship_id
     
     @pytest.mark.asyncio
-    @patch('services.real_supabase_service.real_supabase_service.execute_sql')
+    @patch('services.company_service.execute_sql')
     async def test_reject_relationship_success(self, mock_execute_sql):
         """거래 관계 거부 성공 테스트 (도매업체가 거부)"""
         relationship_id = str(uuid.uuid4())
@@ -243,7 +243,7 @@ class TestCompanyAPI:
         assert data["status"] == "rejected"
     
     @pytest.mark.asyncio
-    @patch('services.real_supabase_service.real_supabase_service.execute_sql')
+    @patch('services.company_service.execute_sql')
     async def test_get_my_company_success(self, mock_execute_sql):
         """내 회사 정보 조회 성공 테스트"""
         # Mock 설정
@@ -274,7 +274,7 @@ class TestCompanyAPI:
         assert data["user_id"] == self.test_user_id
     
     @pytest.mark.asyncio
-    @patch('services.real_supabase_service.real_supabase_service.execute_sql')
+    @patch('services.company_service.execute_sql')
     async def test_get_company_relationships_wholesale(self, mock_execute_sql):
         """도매업체 거래 관계 목록 조회 테스트"""
         # Mock 설정
@@ -301,7 +301,7 @@ class TestCompanyAPI:
         assert data[0]["status"] == "approved"
     
     @pytest.mark.asyncio
-    @patch('services.real_supabase_service.real_supabase_service.execute_sql')
+    @patch('services.company_service.execute_sql')
     async def test_get_company_relationships_retail(self, mock_execute_sql):
         """소매업체 거래 관계 목록 조회 테스트"""
         # Mock 설정
@@ -328,7 +328,7 @@ class TestCompanyAPI:
         assert data[0]["status"] == "pending"
     
     @pytest.mark.asyncio
-    @patch('services.real_supabase_service.real_supabase_service.execute_sql')
+    @patch('services.company_service.execute_sql')
     async def test_update_company_success(self, mock_execute_sql):
         """회사 정보 수정 성공 테스트"""
         # Mock 설정
@@ -408,7 +408,7 @@ class TestCompanyAPI:
         assert response.status_code == 422
     
     @pytest.mark.asyncio
-    @patch('services.real_supabase_service.real_supabase_service.execute_sql')
+    @patch('services.company_service.execute_sql')
     async def test_company_permission_check_success(self, mock_execute_sql):
         """회사 권한 확인 성공 테스트"""
         # Mock 설정 - 사용자가 해당 회사 소유자
@@ -427,7 +427,7 @@ class TestCompanyAPI:
         assert result is True
     
     @pytest.mark.asyncio
-    @patch('services.real_supabase_service.real_supabase_service.execute_sql')
+    @patch('services.company_service.execute_sql')
     async def test_company_permission_check_failure(self, mock_execute_sql):
         """회사 권한 확인 실패 테스트"""
         # Mock 설정 - 사용자가 해당 회사 소유자가 아님
@@ -446,7 +446,7 @@ class TestCompanyAPI:
         assert result is False
     
     @pytest.mark.asyncio
-    @patch('services.real_supabase_service.real_supabase_service.execute_sql')
+    @patch('services.company_service.execute_sql')
     async def test_trading_relationship_check_approved(self, mock_execute_sql):
         """승인된 거래 관계 확인 테스트"""
         # Mock 설정 - 승인된 관계 존재
@@ -463,7 +463,7 @@ class TestCompanyAPI:
         assert result is True
     
     @pytest.mark.asyncio
-    @patch('services.real_supabase_service.real_supabase_service.execute_sql')
+    @patch('services.company_service.execute_sql')
     async def test_trading_relationship_check_not_approved(self, mock_execute_sql):
         """승인되지 않은 거래 관계 확인 테스트"""
         # Mock 설정 - 승인된 관계 없음
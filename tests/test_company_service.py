@@ -0,0 +1,41 @@
+"""
+회사 서비스 테스트
+database.execute_sql 경유 및 위치 파라미터 전달 검증
+"""
+
+import pytest
+import uuid
+from unittest.mock import AsyncMock, patch
+
+from models.company import CompanySearchFilter
+from services.company_service import CompanyService
+
+
+class TestCompanyQueries:
+    """CompanyService 쿼리 테스트"""
+
+    @pytest.mark.asyncio
+    @patch('services.company_service.execute_sql', new_callable=AsyncMock)
+    async def test_search_companies_uses_params(self, mock_execute_sql):
+        """검색어/유형/페이지는 쿼리 텍스트가 아닌 파라미터로 전달"""
+        mock_execute_sql.return_value = []
+
+        await CompanyService.search_companies(
+            CompanySearchFilter(company_type="wholesale", name="아동'복", page=2, size=10)
+        )
+
+        query, *params = mock_execute_sql.call_args.args
+        assert "아동" not in query
+        assert "company_type = $1" in query and "ILIKE '%' || $2 || '%'" in query
+        assert params == ["wholesale", "아동'복", 10, 10]
+
+    @pytest.mark.asyncio
+    @patch('services.company_service.execute_sql', new_callable=AsyncMock)
+    async def test_check_trading_relationship(self, mock_execute_sql):
+        """승인된 거래 관계가 있을 때만 True"""
+        wholesale_id, retail_id = str(uuid.uuid4()), str(uuid.uuid4())
+        mock_execute_sql.side_effect = [[{"id": "rel-1"}], []]
+
+        assert await CompanyService.check_trading_relationship(wholesale_id, retail_id) is True
+        assert await CompanyService.check_trading_relationship(wholesale_id, retail_id) is False
+        assert mock_execute_sql.call_args.args[1:] == (wholesale_id, retail_id)
@@ -0,0 +1,109 @@
+"""
+대시보드 API 테스트
+소속 회사 조회 및 통계 응답 형식 검증
+"""
+
+import pytest
+import uuid
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+from fastapi.testclient import TestClient
+from main import app
+from auth.middleware import get_current_user_required
+from models.company import CompanyResponse
+from models.dashboard import DashboardStats
+from utils.snapshot_cache import dashboard_cache
+
+
+def _company(company_id: str, user_id: str) -> CompanyResponse:
+    now = datetime.now()
+    return CompanyResponse(
+        id=company_id,
+        user_id=user_id,
+        name="테스트 도매업체",
+        business_number="123-45-67890",
+        company_type="wholesale",
+        status="active",
+        created_at=now,
+        updated_at=now
+    )
+
+
+def _stats() -> DashboardStats:
+    return DashboardStats.model_construct(today_orders=3, low_stock_count=2, unread_messages=1)
+
+
+class TestDashboardAPI:
+    """대시보드 API 테스트"""
+
+    def setup_method(self):
+        self.user_id = str(uuid.uuid4())
+        self.company_id = str(uuid.uuid4())
+        # 토큰 클레임 기반 사용자 정보에는 company_id 가 없음
+        app.dependency_overrides[get_current_user_required] = lambda: {
+            "id": self.user_id,
+            "email": "test@example.com",
+            "role": "user",
+            "company_type": "wholesale"
+        }
+        self.client = TestClient(app)
+
+    def teardown_method(self):
+        app.dependency_overrides.pop(get_current_user_required, None)
+        dashboard_cache.invalidate(self.company_id)
+
+    def test_stats_resolves_company_by_user(self):
+        """사용자 ID로 소속 회사를 찾아 통계를 조회"""
+        loader = AsyncMock(return_value=_stats())
+        with patch("api.dashboard.CompanyService.get_company_by_user_id",
+                   AsyncMock(return_value=_company(self.company_id, self.user_id))) as get_company, \
+                patch("api.dashboard._load_dashboard_stats", loader):
+            response = self.client.get("/api/dashboard/stats")
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "todayOrders": 3,
+            "lowStock": 2,
+            "newMessages": 1,
+            "activePartners": 0,
+            "pendingPartners": 0
+        }
+        get_company.assert_awaited_once_with(self.user_id)
+        loader.assert_awaited_once_with(self.user_id, self.company_id, "wholesale")
+
+    def test_stats_without_company_returns_404(self):
+        """소속 회사가 없으면 404"""
+        with patch("api.dashboard.CompanyService.get_company_by_user_id",
+                   AsyncMock(return_value=None)):
+            response = self.client.get("/api/dashboard/stats")
+
+        assert response.status_code == 404
+
+    def test_sse_sends_snapshot_frame(self):
+        """SSE 연결 직후 snapshot 프레임으로 현재 카운터를 전달"""
+        loader = AsyncMock(return_value=_stats())
+        with patch("api.dashboard.CompanyService.get_company_by_user_id",
+                   AsyncMock(return_value=_company(self.company_id, self.user_id))), \
+                patch("api.dashboard._load_dashboard_stats", loader), \
+                patch("api.dashboard.Request.is_disconnected", AsyncMock(return_value=True)):
+            with self.client.stream("GET", "/sse/dashboard") as response:
+                assert response.status_code == 200
+                assert response.headers["content-type"].startswith("text/event-stream")
+                body = "".join(response.iter_text())
+
+        frames = body.split("\n\n")
+        assert frames[0] == "retry: 5000"
+        assert frames[1] == (
+            'event: snapshot\n'
+            'data: {"todayOrders":3,"lowStock":2,"newMessages":1,"activePartners":0,"pendingPartners":0}'
+        )
+        loader.assert_awaited_once_with(self.user_id, self.company_id, "wholesale")
+
+    def test_sse_without_company_returns_404(self):
+        """소속 회사가 없으면 스트림을 열지 않고 404"""
+        with patch("api.dashboard.CompanyService.get_company_by_user_id",
+                   AsyncMock(return_value=None)):
+            response = self.client.get("/sse/dashboard")
+
+        assert response.status_code == 404
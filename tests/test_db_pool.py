@@ -0,0 +1,340 @@
+"""
+asyncpg 커넥션 풀 실행기 테스트
+풀 설정, health check, 결과 변환 검증
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import asyncpg
+
+import config
+import database
+from utils.db_pool import AsyncpgExecutor
+from services.real_supabase_service import inline_params
+
+
+class MockTransaction:
+    """asyncpg connection.transaction() 대체 (진입/종료 기록)"""
+
+    def __init__(self, events):
+        self.events = events
+
+    async def __aenter__(self):
+        self.events.append("BEGIN")
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.events.append("ROLLBACK" if exc_type else "COMMIT")
+        return False
+
+
+def create_mock_pool(rows=None):
+    """테스트용 Mock 커넥션 풀 생성"""
+    connection = MagicMock()
+    connection.fetch = AsyncMock(return_value=rows or [])
+    connection.execute = AsyncMock(return_value="SELECT 1")
+    connection.get_server_pid = MagicMock(return_value=1234)
+    connection.events = []
+    connection.transaction = MagicMock(side_effect=lambda **kwargs: MockTransaction(connection.events))
+
+    pool = MagicMock()
+    pool.acquire = AsyncMock(return_value=connection)
+    pool.release = AsyncMock()
+    pool.close = AsyncMock()
+    pool.get_size = MagicMock(return_value=2)
+    pool.get_idle_size = MagicMock(return_value=1)
+    return pool, connection
+
+
+class TestAsyncpgExecutor:
+    """AsyncpgExecutor 테스트"""
+
+    def test_invalid_pool_size(self):
+        """최소 크기가 최대 크기보다 크면 예외"""
+        with pytest.raises(ValueError):
+            AsyncpgExecutor("postgresql://localhost/test", min_size=5, max_size=2)
+
+    def test_from_settings_requires_database_url(self):
+        """DATABASE_URL 없이 생성 시 예외"""
+        settings = config.Settings(DATABASE_URL=None)
+        with pytest.raises(ValueError):
+            AsyncpgExecutor.from_settings(settings)
+
+    def test_from_settings(self):
+        """설정값으로 풀 파라미터 구성"""
+        settings = config.Settings(
+            DATABASE_URL="postgresql://localhost/test",
+            DB_POOL_MIN_SIZE=1,
+            DB_POOL_MAX_SIZE=20,
+            DB_STATEMENT_CACHE_SIZE=0
+        )
+        executor = AsyncpgExecutor.from_settings(settings)
+
+        assert executor.dsn == "postgresql://localhost/test"
+        assert executor.min_size == 1
+        assert executor.max_size == 20
+        assert executor.statement_cache_size == 0
+
+    @pytest.mark.asyncio
+    async def test_start_creates_pool_once(self):
+        """풀은 한 번만 생성"""
+        pool, _ = create_mock_pool()
+        executor = AsyncpgExecutor("postgresql://localhost/test", statement_cache_size=50)
+
+        with patch("utils.db_pool.asyncpg.create_pool", AsyncMock(return_value=pool)) as mock_create:
+            await executor.start()
+            await executor.start()
+
+        mock_create.assert_called_once()
+        kwargs = mock_create.call_args.kwargs
+        assert kwargs["statement_cache_size"] == 50
+        assert kwargs["setup"] == executor._health_check
+        assert executor.is_started
+
+    @pytest.mark.asyncio
+    async def test_execute_sql_returns_dicts_and_releases(self):
+        """결과 행을 dict 리스트로 반환하고 커넥션 반납"""
+        pool, connection = create_mock_pool(rows=[{"id": 1, "name": "상품"}])
+        executor = AsyncpgExecutor("postgresql://localhost/test")
+
+        with patch("utils.db_pool.asyncpg.create_pool", AsyncMock(return_value=pool)):
+            result = await executor.execute_sql(project_id="test", query="SELECT id, name FROM products")
+
+        assert result == [{"id": 1, "name": "상품"}]
+        pool.release.assert_called_once_with(connection)
+        assert executor.stats["queries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_execute_sql_passes_params(self):
+        """위치 파라미터는 쿼리 텍스트와 분리하여 전달"""
+        pool, connection = create_mock_pool(rows=[{"id": 1}])
+        executor = AsyncpgExecutor("postgresql://localhost/test")
+
+        with patch("utils.db_pool.asyncpg.create_pool", AsyncMock(return_value=pool)):
+            await executor.execute_sql(
+                project_id="test",
+                query="SELECT id FROM products WHERE code = $1 AND is_active = $2",
+                params=["P-001", True]
+            )
+
+        connection.fetch.assert_called_once_with(
+            "SELECT id FROM products WHERE code = $1 AND is_active = $2", "P-001", True
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_sql_releases_on_error(self):
+        """쿼리 오류 시에도 커넥션 반납"""
+        pool, connection = create_mock_pool()
+        connection.fetch = AsyncMock(side_effect=asyncpg.exceptions.PostgresError("error"))
+        executor = AsyncpgExecutor("postgresql://localhost/test")
+
+        with patch("utils.db_pool.asyncpg.create_pool", AsyncMock(return_value=pool)):
+            with pytest.raises(asyncpg.exceptions.PostgresError):
+                await executor.execute_sql(project_id="test", query="SELECT 1")
+
+        pool.release.assert_called_once_with(connection)
+        assert executor.stats["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_acquire_retries_broken_connection(self):
+        """health check 실패로 끊긴 커넥션은 1회 재시도"""
+        pool, connection = create_mock_pool(rows=[{"count": 3}])
+        pool.acquire = AsyncMock(side_effect=[
+            asyncpg.exceptions.ConnectionDoesNotExistError("closed"),
+            connection
+        ])
+        executor = AsyncpgExecutor("postgresql://localhost/test")
+
+        with patch("utils.db_pool.asyncpg.create_pool", AsyncMock(return_value=pool)):
+            result = await executor.execute_sql(project_id="test", query="SELECT COUNT(*) as count FROM users")
+
+        assert result == [{"count": 3}]
+        assert pool.acquire.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_health_check_skips_recently_checked(self):
+        """최근 확인된 커넥션은 ping 생략"""
+        _, connection = create_mock_pool()
+        executor = AsyncpgExecutor("postgresql://localhost/test", health_check_interval=60)
+
+        await executor._health_check(connection)
+        await executor._health_check(connection)
+
+        connection.execute.assert_called_once_with("SELECT 1")
+
+    @pytest.mark.asyncio
+    async def test_transaction_commits_and_releases(self):
+        """트랜잭션은 커넥션 하나를 고정하고 종료 시 반납"""
+        pool, connection = create_mock_pool()
+        executor = AsyncpgExecutor("postgresql://localhost/test")
+
+        with patch("utils.db_pool.asyncpg.create_pool", AsyncMock(return_value=pool)):
+            async with executor.transaction() as tx_connection:
+                await executor.fetch(tx_connection, "UPDATE inventory SET current_stock = 1")
+                pool.release.assert_not_called()
+
+        assert tx_connection is connection
+        assert connection.events == ["BEGIN", "COMMIT"]
+        pool.acquire.assert_called_once()
+        pool.release.assert_called_once_with(connection)
+        assert executor.stats["transactions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_transaction_rolls_back_on_error(self):
+        """블록 내 예외 발생 시 ROLLBACK 후 전파"""
+        pool, connection = create_mock_pool()
+        executor = AsyncpgExecutor("postgresql://localhost/test")
+
+        with patch("utils.db_pool.asyncpg.create_pool", AsyncMock(return_value=pool)):
+            with pytest.raises(ValueError):
+                async with executor.transaction():
+                    raise ValueError("재고 부족")
+
+        assert connection.events == ["BEGIN", "ROLLBACK"]
+        pool.release.assert_called_once_with(connection)
+        assert executor.stats["rollbacks"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_uses_cursor_in_readonly_snapshot(self):
+        """스트림은 읽기 전용 REPEATABLE READ 트랜잭션 안의 커서로 읽고 종료 시 반납"""
+        pool, connection = create_mock_pool()
+        rows = [{"id": 1}, {"id": 2}, {"id": 3}]
+
+        async def cursor(query, *args, prefetch):
+            for row in rows:
+                yield row
+
+        connection.cursor = MagicMock(side_effect=cursor)
+        executor = AsyncpgExecutor("postgresql://localhost/test")
+
+        with patch("utils.db_pool.asyncpg.create_pool", AsyncMock(return_value=pool)):
+            streamed = [row async for row in executor.stream("SELECT id FROM orders WHERE status = $1", ["pending"], prefetch=2)]
+
+        assert streamed == rows
+        connection.transaction.assert_called_once_with(isolation="repeatable_read", readonly=True)
+        connection.cursor.assert_called_once_with("SELECT id FROM orders WHERE status = $1", "pending", prefetch=2)
+        assert connection.events == ["BEGIN", "COMMIT"]
+        pool.release.assert_called_once_with(connection)
+
+    @pytest.mark.asyncio
+    async def test_close(self):
+        """풀 종료"""
+        pool, _ = create_mock_pool()
+        executor = AsyncpgExecutor("postgresql://localhost/test")
+
+        with patch("utils.db_pool.asyncpg.create_pool", AsyncMock(return_value=pool)):
+            await executor.start()
+            stats = executor.get_stats()
+            await executor.close()
+
+        assert stats["size"] == 2
+        assert stats["idle"] == 1
+        pool.close.assert_called_once()
+        assert not executor.is_started
+
+
+class TestDatabaseExecutorIntegration:
+    """database 모듈 실행기 연동 테스트"""
+
+    def test_normalize_result(self):
+        """실행 함수별 결과 형식 통일"""
+        assert database._normalize_result({"data": [{"id": 1}]}) == [{"id": 1}]
+        assert database._normalize_result({"data": []}) == []
+        assert database._normalize_result([{"id": 1}]) == [{"id": 1}]
+        assert database._normalize_result({"id": 1}) == [{"id": 1}]
+        assert database._normalize_result(None) is None
+
+    @pytest.mark.asyncio
+    async def test_set_database_executor(self):
+        """실행기 주입 후 execute_sql 이 풀을 사용"""
+        executor = MagicMock()
+        executor.execute_sql = AsyncMock(return_value=[{"count": 1}])
+        executor.close = AsyncMock()
+
+        database.set_database_executor(executor)
+        try:
+            assert database.get_database_executor() is executor
+            result = await database.execute_sql("SELECT COUNT(*) as count FROM users")
+            assert result == [{"count": 1}]
+        finally:
+            await database.close_db()
+
+        executor.close.assert_called_once()
+        assert database.get_database_executor() is None
+
+    def test_query_params(self):
+        """동적 조건 파라미터 번호 부여"""
+        params = database.QueryParams("company-1")
+        condition = f"p.name ILIKE '%' || {params.add('원피스')} || '%'"
+
+        assert condition == "p.name ILIKE '%' || $2 || '%'"
+        assert params.add(20) == "$3"
+        assert params.values == ["company-1", "원피스", 20]
+        assert len(params) == 3
+
+    @pytest.mark.asyncio
+    async def test_execute_sql_forwards_params(self):
+        """execute_sql 위치 파라미터를 실행 함수에 전달"""
+        execute_fn = AsyncMock(return_value={"data": [{"id": 1}]})
+        previous = database._supabase_execute_fn
+        database.set_supabase_execute_function(execute_fn)
+        try:
+            result = await database.execute_sql("SELECT id FROM users WHERE email = $1", "a@example.com")
+        finally:
+            database.set_supabase_execute_function(previous)
+
+        assert result == [{"id": 1}]
+        assert execute_fn.call_args.kwargs["params"] == ["a@example.com"]
+
+    def test_inline_params_for_mock_service(self):
+        """Mock 서비스용 파라미터 리터럴 치환 (따옴표 이스케이프 포함)"""
+        query = inline_params(
+            "SELECT * FROM notices WHERE title = $1 AND is_important = $2 LIMIT $3 OFFSET $10",
+            ["공지's", True, 5, None, None, None, None, None, None, 10]
+        )
+
+        assert query == (
+            "SELECT * FROM notices WHERE title = '공지''s' AND is_important = true LIMIT 5 OFFSET 10"
+        )
+
+    @pytest.mark.asyncio
+    async def test_transaction_pins_connection_for_execute_sql(self):
+        """트랜잭션 블록 안의 execute_sql 은 같은 커넥션 사용"""
+        pool, connection = create_mock_pool(rows=[{"current_stock": 5}])
+        executor = AsyncpgExecutor("postgresql://localhost/test")
+        database.set_database_executor(executor)
+        try:
+            with patch("utils.db_pool.asyncpg.create_pool", AsyncMock(return_value=pool)):
+                async with database.transaction():
+                    await database.execute_sql("UPDATE inventory SET current_stock = current_stock - $1", 1)
+                    await database.execute_sql("INSERT INTO inventory_transactions (id) VALUES ($1)", "tx-1")
+
+                    # 중첩 트랜잭션은 같은 커넥션의 SAVEPOINT
+                    async with database.transaction():
+                        await database.execute_sql("SELECT 1")
+        finally:
+            await database.close_db()
+
+        assert pool.acquire.call_count == 1
+        assert connection.fetch.call_count == 3
+        assert connection.events == ["BEGIN", "BEGIN", "COMMIT", "COMMIT"]
+
+    @pytest.mark.asyncio
+    async def test_execute_transaction_rolls_back_on_failure(self):
+        """execute_transaction 쿼리 실패 시 전체 ROLLBACK"""
+        pool, connection = create_mock_pool()
+        connection.fetch = AsyncMock(side_effect=[[], asyncpg.exceptions.PostgresError("error")])
+        executor = AsyncpgExecutor("postgresql://localhost/test")
+        database.set_database_executor(executor)
+        try:
+            with patch("utils.db_pool.asyncpg.create_pool", AsyncMock(return_value=pool)):
+                result = await database.DatabaseHelper.execute_transaction([
+                    {"sql": "UPDATE orders SET status = $1 WHERE id = $2", "params": ("confirmed", "order-1")},
+                    {"sql": "INSERT INTO notifications (id) VALUES ($1)", "params": ("n-1",)},
+                ])
+        finally:
+            await database.close_db()
+
+        assert result is False
+        assert connection.events == ["BEGIN", "ROLLBACK"]
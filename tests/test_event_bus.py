@@ -0,0 +1,97 @@
+"""
+대시보드 이벤트 버스 테스트
+구독 대상 선택, 느린 구독자 처리, SSE 프레임, 서비스 계층 발행 검증
+"""
+
+import pytest
+import uuid
+from unittest.mock import AsyncMock, patch
+
+from utils.event_bus import EventBus, encode_sse
+from services.inventory_service import InventoryService
+
+COMPANY_ID = str(uuid.uuid4())
+OTHER_COMPANY_ID = str(uuid.uuid4())
+
+
+class TestEventBus:
+    """EventBus 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_publish_targets_company_and_user(self):
+        """회사/사용자 대상 구독에만 전달하고 두 조건 모두 해당해도 한 번만 전달"""
+        bus = EventBus(queue_size=10)
+        mine = bus.subscribe("user-1", COMPANY_ID)
+        colleague = bus.subscribe("user-2", COMPANY_ID)
+        other = bus.subscribe("user-3", OTHER_COMPANY_ID)
+
+        delivered = bus.publish("dashboard", {"todayOrders": 1}, company_ids=[COMPANY_ID], user_ids=["user-1"])
+
+        assert delivered == 2
+        assert (await mine.get(0.1))["data"] == {"todayOrders": 1}
+        assert mine.queue.empty()
+        assert (await colleague.get(0.1))["event"] == "dashboard"
+        assert await other.get(0.01) is None
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_oldest(self):
+        """큐가 가득 차면 가장 오래된 이벤트를 버림"""
+        bus = EventBus(queue_size=2)
+        subscription = bus.subscribe("user-1", COMPANY_ID)
+
+        for count in range(3):
+            bus.publish("dashboard", {"todayOrders": count}, company_ids=[COMPANY_ID])
+
+        assert subscription.dropped == 1
+        assert [(await subscription.get(0.1))["data"]["todayOrders"] for _ in range(2)] == [1, 2]
+        assert bus.get_stats()["dropped"] == 1
+
+    def test_close_unsubscribes(self):
+        """구독 해제 후에는 전달되지 않고 색인에서도 제거"""
+        bus = EventBus(queue_size=10)
+        subscription = bus.subscribe("user-1", COMPANY_ID)
+        subscription.close()
+        subscription.close()
+
+        assert bus.publish("order", {"status": "confirmed"}, company_ids=[COMPANY_ID]) == 0
+        assert bus.get_stats()["subscriptions"] == 0
+
+    def test_encode_sse(self):
+        """id/event/data 줄과 빈 줄로 끝나는 SSE 프레임"""
+        frame = encode_sse("notification", {"title": "새 주문"}, event_id=7)
+
+        assert frame == 'id: 7\nevent: notification\ndata: {"title":"새 주문"}\n\n'
+
+
+class TestStockEvents:
+    """재고 변경 이벤트 발행 테스트"""
+
+    def test_low_stock_delta_counts_threshold_crossings(self):
+        """안전재고 경계를 넘을 때만 재고 부족 수가 변함"""
+        assert InventoryService._low_stock_delta(12, 8, 10) == 1
+        assert InventoryService._low_stock_delta(8, 12, 10) == -1
+        assert InventoryService._low_stock_delta(9, 8, 10) == 0
+        assert InventoryService._low_stock_delta(5, 0, 0) == 0
+
+    @pytest.mark.asyncio
+    @patch('services.inventory_service.event_bus', new_callable=lambda: EventBus(queue_size=10))
+    @patch('services.inventory_service.execute_sql', new_callable=AsyncMock)
+    async def test_update_stock_publishes_low_stock(self, mock_execute_sql, mock_bus):
+        """회사 ID 를 넘기면 커밋 후 low_stock 알림과 lowStock 증감 발행"""
+        product_id = str(uuid.uuid4())
+        subscription = mock_bus.subscribe("user-1", COMPANY_ID)
+        mock_execute_sql.side_effect = [
+            [{"previous_stock": 12, "current_stock": 9, "minimum_stock": 10}],
+            []
+        ]
+
+        success, _ = await InventoryService.update_stock_with_lock(
+            product_id=product_id, quantity_change=-3, transaction_type="adjustment",
+            company_id=COMPANY_ID
+        )
+
+        assert success is True
+        alert = await subscription.get(0.1)
+        assert (alert["event"], alert["data"]["product_id"]) == ("low_stock", product_id)
+        delta = await subscription.get(0.1)
+        assert (delta["event"], delta["data"]) == ("dashboard", {"lowStock": 1})
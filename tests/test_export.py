@@ -0,0 +1,110 @@
+"""
+내보내기 테스트
+CSV/NDJSON 청크 인코딩, 주문/재고 거래내역 내보내기 쿼리 검증
+"""
+
+import json
+import pytest
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+from utils.export import csv_chunks, encode_rows, ndjson_chunks
+from services.order_service import OrderService
+from services.inventory_service import InventoryService
+from models.order import OrderSearchFilter
+
+COMPANY_ID = "11111111-2222-3333-4444-555555555555"
+
+
+async def iterate(rows):
+    """리스트를 비동기 행 스트림으로 변환"""
+    for row in rows:
+        yield row
+
+
+async def collect(chunks):
+    """청크 생성기 결과 수집"""
+    return [chunk async for chunk in chunks]
+
+
+class TestEncoders:
+    """CSV/NDJSON 인코더 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_csv_bom_header_and_chunking(self):
+        """첫 청크에만 BOM + 헤더, chunk_rows 행마다 청크 분리"""
+        rows = [
+            {"order_number": f"20250901-00{i}", "total_amount": Decimal("1000") * i, "notes": None}
+            for i in range(1, 4)
+        ]
+
+        chunks = await collect(csv_chunks(iterate(rows), ["order_number", "total_amount", "notes"], chunk_rows=2))
+
+        assert len(chunks) == 2
+        assert chunks[0].startswith(b"\xef\xbb\xbforder_number,total_amount,notes\r\n")
+        assert not chunks[1].startswith(b"\xef\xbb\xbf")
+        assert b"".join(chunks).decode("utf-8-sig").splitlines()[1:] == [
+            "20250901-001,1000,", "20250901-002,2000,", "20250901-003,3000,"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_csv_empty_result_has_header(self):
+        """결과가 없어도 헤더는 포함"""
+        chunks = await collect(csv_chunks(iterate([]), ["id", "status"]))
+
+        assert chunks == ["id,status\r\n".encode("utf-8-sig")]
+
+    @pytest.mark.asyncio
+    async def test_ndjson_lines(self):
+        """한 줄에 한 행, 날짜는 ISO 8601, UUID 는 문자열, 한글은 그대로"""
+        row_id = uuid.uuid4()
+        rows = [{"id": row_id, "notes": "급한 주문", "created_at": datetime(2025, 9, 1, 10, 0), "extra": 1}]
+
+        chunks = await collect(ndjson_chunks(iterate(rows), ["id", "notes", "created_at"]))
+
+        lines = b"".join(chunks).decode("utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"id": str(row_id), "notes": "급한 주문", "created_at": "2025-09-01T10:00:00"}
+        ]
+
+    def test_unknown_format(self):
+        """지원하지 않는 형식은 예외"""
+        with pytest.raises(ValueError):
+            encode_rows(iterate([]), ["id"], "xlsx")
+
+
+class TestExportQueries:
+    """주문/재고 거래내역 내보내기 쿼리 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_export_orders_shares_list_filters(self):
+        """목록 조회와 같은 조건으로 페이지 제한 없이 스트리밍"""
+        stream = MagicMock(return_value=iterate([]))
+        search_filter = OrderSearchFilter(status="pending", start_date=datetime(2025, 9, 1), min_amount=1000)
+
+        with patch("services.order_service.stream_sql", stream):
+            OrderService.export_orders(search_filter, COMPANY_ID, "wholesale", batch_size=500)
+
+        query, *args = stream.call_args.args
+        assert "o.wholesale_company_id = $1" in query
+        assert "o.status = $2" in query
+        assert "o.created_at >= $3" in query
+        assert "o.total_amount >= $4" in query
+        assert "LIMIT" not in query
+        assert args == [COMPANY_ID, "pending", datetime(2025, 9, 1), 1000]
+        assert stream.call_args.kwargs["batch_size"] == 500
+
+    @pytest.mark.asyncio
+    async def test_export_inventory_transactions_scoped_to_company(self):
+        """회사 범위 + 선택 필터 조건"""
+        stream = MagicMock(return_value=iterate([]))
+
+        with patch("services.inventory_service.stream_sql", stream):
+            InventoryService.export_inventory_transactions(COMPANY_ID, transaction_type="in")
+
+        query, *args = stream.call_args.args
+        assert "WHERE p.company_id = $1 AND it.transaction_type = $2" in query
+        assert "ORDER BY it.created_at, it.id" in query
+        assert args == [COMPANY_ID, "in"]
@@ -0,0 +1,245 @@
+"""
+재고 서비스 테스트
+InventoryService 재고 증감 쿼리 검증
+"""
+
+import pytest
+import uuid
+from unittest.mock import AsyncMock, patch
+
+from services.inventory_service import InventoryService
+
+
+class TestUpdateStockWithLock:
+    """InventoryService.update_stock_with_lock 테스트"""
+
+    @pytest.mark.asyncio
+    @patch('services.inventory_service.execute_sql', new_callable=AsyncMock)
+    async def test_update_stock_single_statement(self, mock_execute_sql):
+        """재고 증감은 UPDATE ... RETURNING 한 번 + 거래내역 INSERT"""
+        product_id = str(uuid.uuid4())
+        mock_execute_sql.side_effect = [
+            [{"previous_stock": 10, "current_stock": 7, "minimum_stock": 2}],  # UPDATE
+            []  # INSERT
+        ]
+
+        success, error = await InventoryService.update_stock_with_lock(
+            product_id=product_id,
+            quantity_change=-3,
+            transaction_type="out",
+            reference_type="order",
+            reference_id=str(uuid.uuid4())
+        )
+
+        assert success is True
+        assert error is None
+        assert mock_execute_sql.call_count == 2
+
+        update_call, insert_call = mock_execute_sql.call_args_list
+        assert "UPDATE inventory" in update_call.args[0]
+        assert "RETURNING" in update_call.args[0]
+        assert "FOR UPDATE" not in update_call.args[0]
+        assert update_call.args[1:] == (product_id, -3)
+
+        assert "INSERT INTO inventory_transactions" in insert_call.args[0]
+        # quantity, previous_stock, current_stock
+        assert insert_call.args[4:7] == (3, 10, 7)
+
+    @pytest.mark.asyncio
+    @patch('services.inventory_service.execute_sql', new_callable=AsyncMock)
+    async def test_update_stock_insufficient(self, mock_execute_sql):
+        """재고 부족 시 갱신 없이 실패 사유 반환"""
+        mock_execute_sql.side_effect = [
+            [],  # UPDATE (조건 불충족)
+            [{"current_stock": 2}]  # 실패 사유 조회
+        ]
+
+        success, error = await InventoryService.update_stock_with_lock(
+            product_id=str(uuid.uuid4()),
+            quantity_change=-5,
+            transaction_type="out"
+        )
+
+        assert success is False
+        assert "재고가 부족합니다" in error
+        assert "현재: 2" in error
+        assert not any(
+            "INSERT INTO inventory_transactions" in call.args[0]
+            for call in mock_execute_sql.call_args_list
+        )
+
+    @pytest.mark.asyncio
+    @patch('services.inventory_service.execute_sql', new_callable=AsyncMock)
+    async def test_update_stock_missing_inventory(self, mock_execute_sql):
+        """재고 정보가 없는 상품"""
+        mock_execute_sql.side_effect = [[], []]
+
+        success, error = await InventoryService.update_stock_with_lock(
+            product_id=str(uuid.uuid4()),
+            quantity_change=5,
+            transaction_type="in"
+        )
+
+        assert success is False
+        assert error == "재고 정보를 찾을 수 없습니다"
+
+
+class TestBulkReserveStock:
+    """InventoryService.bulk_reserve_stock 테스트"""
+
+    @pytest.mark.asyncio
+    @patch('services.inventory_service.execute_sql', new_callable=AsyncMock)
+    async def test_bulk_reserve_single_statement(self, mock_execute_sql):
+        """여러 상품을 단일 쿼리로 예약 (중복 상품 수량 합산)"""
+        product_a, product_b = str(uuid.uuid4()), str(uuid.uuid4())
+        order_id = str(uuid.uuid4())
+        mock_execute_sql.return_value = [
+            {"product_id": product_a, "product_name": "A", "product_code": "A-1",
+             "current_stock": 10, "required_quantity": 5, "reserved": True},
+            {"product_id": product_b, "product_name": "B", "product_code": "B-1",
+             "current_stock": 3, "required_quantity": 3, "reserved": True}
+        ]
+
+        reserved, results = await InventoryService.bulk_reserve_stock(
+            [
+                {"product_id": product_a, "quantity": 2},
+                {"product_id": product_b, "quantity": 3},
+                {"product_id": product_a, "quantity": 3}
+            ],
+            order_id
+        )
+
+        assert reserved is True
+        assert [item["is_available"] for item in results] == [True, True]
+        mock_execute_sql.assert_called_once()
+        call_args = mock_execute_sql.call_args
+        assert "FOR UPDATE OF inv" in call_args.args[0]
+        assert call_args.args[1:] == ([product_a, product_b], [5, 3], order_id, None)
+
+    @pytest.mark.asyncio
+    @patch('services.inventory_service.execute_sql', new_callable=AsyncMock)
+    async def test_bulk_reserve_insufficient(self, mock_execute_sql):
+        """한 상품이라도 부족하면 예약 실패"""
+        product_a, product_b = str(uuid.uuid4()), str(uuid.uuid4())
+        mock_execute_sql.return_value = [
+            {"product_id": product_a, "product_name": "A", "product_code": "A-1",
+             "current_stock": 10, "required_quantity": 5, "reserved": False},
+            {"product_id": product_b, "product_name": "B", "product_code": "B-1",
+             "current_stock": 1, "required_quantity": 3, "reserved": False}
+        ]
+
+        reserved, results = await InventoryService.bulk_reserve_stock(
+            [{"product_id": product_a, "quantity": 5}, {"product_id": product_b, "quantity": 3}],
+            str(uuid.uuid4())
+        )
+
+        assert reserved is False
+        assert [item["is_available"] for item in results] == [True, False]
+
+    @pytest.mark.asyncio
+    @patch('services.inventory_service.execute_sql', new_callable=AsyncMock)
+    async def test_bulk_reserve_missing_inventory(self, mock_execute_sql):
+        """재고 정보가 없는 상품이 있으면 예약 실패"""
+        product_a, product_b = str(uuid.uuid4()), str(uuid.uuid4())
+        mock_execute_sql.return_value = [
+            {"product_id": product_a, "product_name": "A", "product_code": "A-1",
+             "current_stock": 10, "required_quantity": 5, "reserved": False}
+        ]
+
+        reserved, results = await InventoryService.bulk_reserve_stock(
+            [{"product_id": product_a, "quantity": 5}, {"product_id": product_b, "quantity": 1}],
+            str(uuid.uuid4())
+        )
+
+        assert reserved is False
+        assert results[1]["product_name"] == "Unknown"
+        assert results[1]["is_available"] is False
+
+    @pytest.mark.asyncio
+    @patch('services.inventory_service.execute_sql', new_callable=AsyncMock)
+    async def test_bulk_reserve_database_error_propagates(self, mock_execute_sql):
+        """쿼리 오류는 재고 부족으로 보고하지 않고 전파 (주문 트랜잭션 롤백)"""
+        mock_execute_sql.side_effect = RuntimeError("deadlock detected")
+
+        with pytest.raises(RuntimeError, match="deadlock detected"):
+            await InventoryService.bulk_reserve_stock(
+                [{"product_id": str(uuid.uuid4()), "quantity": 1}], str(uuid.uuid4())
+            )
+
+        # 트랜잭션 밖에서 execute_sql 이 오류로 None 을 반환한 경우
+        mock_execute_sql.side_effect = None
+        mock_execute_sql.return_value = None
+        with pytest.raises(RuntimeError, match="재고 예약 쿼리 실행에 실패했습니다"):
+            await InventoryService.bulk_reserve_stock(
+                [{"product_id": str(uuid.uuid4()), "quantity": 1}], str(uuid.uuid4())
+            )
+
+
+class TestInventoryStats:
+    """재고 집계 조회/드리프트 보정 테스트"""
+
+    @pytest.mark.asyncio
+    @patch('services.inventory_service.execute_sql', new_callable=AsyncMock)
+    async def test_stats_read_from_aggregate(self, mock_execute_sql):
+        """집계 행이 있으면 샤드 합계만 조회"""
+        mock_execute_sql.return_value = [{
+            "shards": 3, "total_products": 120, "active_products": 100,
+            "low_stock_products": 7, "out_of_stock_products": 2, "total_inventory_value": 5400000
+        }]
+
+        stats = await InventoryService.get_inventory_stats(str(uuid.uuid4()))
+
+        assert mock_execute_sql.call_count == 1
+        assert "FROM inventory_stats" in mock_execute_sql.call_args.args[0]
+        assert stats.total_products == 120
+        assert stats.total_inventory_value == 5400000
+
+    @pytest.mark.asyncio
+    @patch('services.inventory_service.execute_sql', new_callable=AsyncMock)
+    async def test_stats_fallback_without_aggregate(self, mock_execute_sql):
+        """집계 행이 없으면 재고 테이블에서 직접 계산"""
+        mock_execute_sql.side_effect = [
+            [{"shards": 0, "total_products": 0, "active_products": 0, "low_stock_products": 0,
+              "out_of_stock_products": 0, "total_inventory_value": 0}],
+            [{"total_products": 2, "active_products": 2, "low_stock_products": 1,
+              "out_of_stock_products": 0, "total_inventory_value": 30000}]
+        ]
+
+        stats = await InventoryService.get_inventory_stats(str(uuid.uuid4()))
+
+        assert "FROM inventory inv" in mock_execute_sql.call_args.args[0]
+        assert stats.low_stock_products == 1
+
+    @pytest.mark.asyncio
+    @patch('services.inventory_service.execute_sql', new_callable=AsyncMock)
+    async def test_reconcile_rebuilds_drifted_company(self, mock_execute_sql):
+        """드리프트가 있는 회사만 샤드를 잠근 뒤 다시 계산"""
+        company_id = str(uuid.uuid4())
+        columns = ["total_products", "active_products", "low_stock_products",
+                   "out_of_stock_products", "total_inventory_value"]
+        drift_row = {"company_id": company_id}
+        for column in columns:
+            drift_row[f"expected_{column}"] = 5
+            drift_row[f"stored_{column}"] = 5
+        drift_row["stored_low_stock_products"] = 4
+        mock_execute_sql.side_effect = [[drift_row], [], [], []]
+
+        drifts = await InventoryService.reconcile_inventory_stats()
+
+        assert [drift["company_id"] for drift in drifts] == [company_id]
+        assert drifts[0]["stored"]["low_stock_products"] == 4
+
+        _, prepare_call, lock_call, rebuild_call = mock_execute_sql.call_args_list
+        assert "generate_series(0, 15)" in prepare_call.args[0]
+        assert "FOR UPDATE" in lock_call.args[0]
+        assert "ON CONFLICT (company_id, shard) DO UPDATE" in rebuild_call.args[0]
+        assert rebuild_call.args[1] == company_id
+
+    @pytest.mark.asyncio
+    @patch('services.inventory_service.execute_sql', new_callable=AsyncMock)
+    async def test_reconcile_report_only(self, mock_execute_sql):
+        """repair=False 면 검사만 수행"""
+        mock_execute_sql.return_value = []
+
+        assert await InventoryService.reconcile_inventory_stats(repair=False) == []
+        assert mock_execute_sql.call_count == 1
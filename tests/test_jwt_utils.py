@@ -3,10 +3,11 @@ JWT 토큰 유틸리티 함수 테스트
 TDD 기반 JWT 인증 시스템 단위 테스트
 """
 
+import asyncio
 import pytest
 import jwt
 from datetime import datetime, timedelta, timezone
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 import uuid
 
 from utils.jwt_utils import (
@@ -17,7 +18,10 @@ from utils.jwt_utils import (
     is_token_expired,
     get_token_payload,
     revoke_token,
-    TokenValidationError
+    TokenValidationError,
+    RevocationStoreUnavailableError,
+    InMemoryRevocationStore,
+    VerifiedTokenCache
 )
 from models.auth import TokenData
 import config
@@ -132,7 +136,8 @@ class TestJWTTokenCreation:
 class TestJWTTokenVerification:
     """JWT 토큰 검증 테스트"""
     
-    def test_verify_valid_access_token(self):
+    @pytest.mark.asyncio
+    async def test_verify_valid_access_token(self):
         """유효한 Access 토큰 검증"""
         user_data = {
             "user_id": str(uuid.uuid4()),
@@ -142,7 +147,7 @@ class TestJWTTokenVerification:
         }
         
         token = create_access_token(user_data)
-        token_data = verify_token(token, "access")
+        token_data = await verify_token(token, "access")
         
         assert isinstance(token_data, TokenData)
         assert token_data.user_id == user_data["user_id"]
@@ -150,7 +155,8 @@ class TestJWTTokenVerification:
         assert token_data.role == user_data["role"]
         assert token_data.type == "access"
     
-    def test_verify_valid_refresh_token(self):
+    @pytest.mark.asyncio
+    async def test_verify_valid_refresh_token(self):
         """유효한 Refresh 토큰 검증"""
         user_data = {
             "user_id": str(uuid.uuid4()),
@@ -160,13 +166,14 @@ class TestJWTTokenVerification:
         }
         
         token = create_refresh_token(user_data)
-        token_data = verify_token(token, "refresh")
+        token_data = await verify_token(token, "refresh")
         
         assert isinstance(token_data, TokenData)
         assert token_data.user_id == user_data["user_id"]
         assert token_data.type == "refresh"
     
-    def test_verify_expired_token(self):
+    @pytest.mark.asyncio
+    async def test_verify_expired_token(self):
         """만료된 토큰 검증 실패"""
         user_data = {
             "user_id": str(uuid.uuid4()),
@@ -183,16 +190,18 @@ class TestJWTTokenVerification:
             token = create_access_token(user_data)
         
         with pytest.raises(TokenValidationError, match="토큰이 만료되었습니다"):
-            verify_token(token, "access")
+            await verify_token(token, "access")
     
-    def test_verify_invalid_token_format(self):
+    @pytest.mark.asyncio
+    async def test_verify_invalid_token_format(self):
         """잘못된 형식의 토큰 검증 실패"""
         invalid_token = "invalid.token.format"
         
         with pytest.raises(TokenValidationError, match="잘못된 토큰 형식입니다"):
-            verify_token(invalid_token, "access")
+            await verify_token(invalid_token, "access")
     
-    def test_verify_token_wrong_type(self):
+    @pytest.mark.asyncio
+    async def test_verify_token_wrong_type(self):
         """잘못된 토큰 타입 검증 실패"""
         user_data = {
             "user_id": str(uuid.uuid4()),
@@ -204,9 +213,10 @@ class TestJWTTokenVerification:
         access_token = create_access_token(user_data)
         
         with pytest.raises(TokenValidationError, match="토큰 타입이 일치하지 않습니다"):
-            verify_token(access_token, "refresh")
+            await verify_token(access_token, "refresh")
     
-    def test_verify_token_wrong_secret(self):
+    @pytest.mark.asyncio
+    async def test_verify_token_wrong_secret(self):
         """잘못된 시크릿으로 서명된 토큰 검증 실패"""
         # 다른 시크릿으로 토큰 생성
         fake_secret = "fake_secret_key_for_testing"
@@ -222,7 +232,7 @@ class TestJWTTokenVerification:
         fake_token = jwt.encode(payload, fake_secret, algorithm="HS256")
         
         with pytest.raises(TokenValidationError, match="토큰 서명이 유효하지 않습니다"):
-            verify_token(fake_token, "access")
+            await verify_token(fake_token, "access")
 
 
 class TestJWTTokenDecoding:
@@ -328,8 +338,9 @@ class TestJWTTokenPayload:
 class TestJWTTokenRevocation:
     """JWT 토큰 폐기 테스트"""
     
+    @pytest.mark.asyncio
     @patch('utils.jwt_utils.redis_client')
-    def test_revoke_token_success(self, mock_redis):
+    async def test_revoke_token_success(self, mock_redis):
         """토큰 폐기 성공"""
         user_data = {
             "user_id": str(uuid.uuid4()),
@@ -343,17 +354,18 @@ class TestJWTTokenRevocation:
         # Redis 클라이언트 모의 설정
         mock_redis.setex = MagicMock(return_value=True)
         
-        result = revoke_token(token)
+        result = await revoke_token(token)
         
         assert result is True
         mock_redis.setex.assert_called_once()
     
+    @pytest.mark.asyncio
     @patch('utils.jwt_utils.redis_client')
-    def test_revoke_invalid_token(self, mock_redis):
+    async def test_revoke_invalid_token(self, mock_redis):
         """잘못된 토큰 폐기 실패"""
         invalid_token = "invalid.token.format"
         
-        result = revoke_token(invalid_token)
+        result = await revoke_token(invalid_token)
         
         assert result is False
         mock_redis.setex.assert_not_called()
@@ -369,7 +381,8 @@ class TestJWTErrorHandling:
         assert isinstance(error, Exception)
         assert str(error) == "테스트 오류"
     
-    def test_verify_token_with_tampered_payload(self):
+    @pytest.mark.asyncio
+    async def test_verify_token_with_tampered_payload(self):
         """변조된 페이로드를 가진 토큰 검증 실패"""
         user_data = {
             "user_id": str(uuid.uuid4()),
@@ -396,7 +409,7 @@ class TestJWTErrorHandling:
         tampered_token = f"{header}.{tampered_payload}.{signature}"
         
         with pytest.raises(TokenValidationError, match="토큰 서명이 유효하지 않습니다"):
-            verify_token(tampered_token, "access")
+            await verify_token(tampered_token, "access")
 
 
 class TestJWTConfigurationValidation:
@@ -462,4 +475,174 @@ class TestJWTTokenTypes:
         assert refresh_payload["type"] == "refresh"
         
         # 만료 시간이 다른지 확인
-        assert access_payload["exp"] != refresh_payload["exp"]
\ No newline at end of file
+        assert access_payload["exp"] != refresh_payload["exp"]
+
+
+class TestVerifiedTokenCache:
+    """검증된 토큰 캐시 테스트"""
+    
+    def create_user_data(self) -> dict:
+        return {
+            "user_id": str(uuid.uuid4()),
+            "email": "test@example.com",
+            "role": "user",
+            "company_type": "retail"
+        }
+    
+    @pytest.mark.asyncio
+    async def test_second_verify_skips_decode(self):
+        """같은 토큰의 두 번째 검증은 서명 검증 없이 캐시에서 반환"""
+        token = create_access_token(self.create_user_data())
+        
+        with patch('utils.jwt_utils.verified_token_cache', VerifiedTokenCache(max_size=10)), \
+                patch('utils.jwt_utils.jwt.decode', wraps=jwt.decode) as mock_decode:
+            first = await verify_token(token, "access")
+            second = await verify_token(token, "access")
+            
+            assert second == first
+            assert mock_decode.call_count == 1
+            
+            # 캐시 적중이어도 타입은 확인
+            with pytest.raises(TokenValidationError, match="토큰 타입이 일치하지 않습니다"):
+                await verify_token(token, "refresh")
+    
+    @pytest.mark.asyncio
+    async def test_revoked_token_rejected_after_cache_hit(self):
+        """캐시된 토큰도 폐기 후에는 거부"""
+        token = create_access_token(self.create_user_data())
+        
+        with patch('utils.jwt_utils.verified_token_cache', VerifiedTokenCache(max_size=10)), \
+                patch('utils.jwt_utils.redis_client', InMemoryRevocationStore()):
+            await verify_token(token, "access")
+            assert await revoke_token(token) is True
+            
+            with pytest.raises(TokenValidationError, match="폐기된 토큰입니다"):
+                await verify_token(token, "access")
+    
+    def test_cache_bounded_by_size_and_expiry(self):
+        """LRU 상한과 토큰 exp 이후 미조회"""
+        now = [1000.0]
+        cache = VerifiedTokenCache(max_size=2, clock=lambda: now[0])
+        token_data = [
+            TokenData(user_id=str(i), email="a@example.com", role="user", company_type="retail",
+                      exp=1000 + 60 * (i + 1), iat=1000, type="access")
+            for i in range(3)
+        ]
+        for index, data in enumerate(token_data):
+            cache.set(bytes([index]), data)
+        
+        assert cache.get(bytes([0])) is None
+        assert cache.get(bytes([1])) is token_data[1]
+        
+        now[0] = 1000 + 60 * 2
+        assert cache.get(bytes([1])) is None
+        assert cache.get(bytes([2])) is token_data[2]
+
+
+class TestRevocationStoreAccess:
+    """비동기 폐기 저장소(redis.asyncio) 연동 및 장애 시 동작 테스트"""
+    
+    def create_token(self) -> str:
+        return create_access_token({
+            "user_id": str(uuid.uuid4()),
+            "email": "test@example.com",
+            "role": "user",
+            "company_type": "retail"
+        })
+    
+    @pytest.mark.asyncio
+    async def test_async_store_awaited(self):
+        """redis.asyncio 클라이언트의 get/setex 는 await 로 호출"""
+        token = self.create_token()
+        store = MagicMock(get=AsyncMock(return_value=None), setex=AsyncMock(return_value=True))
+        
+        with patch('utils.jwt_utils.verified_token_cache', VerifiedTokenCache(max_size=10)), \
+                patch('utils.jwt_utils.redis_client', store):
+            await verify_token(token, "access")
+            assert await revoke_token(token) is True
+            store.get.return_value = "revoked"
+            
+            with pytest.raises(TokenValidationError, match="폐기된 토큰입니다"):
+                await verify_token(token, "access")
+        
+        store.setex.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_store_unavailable_rejects_token(self):
+        """저장소 장애 시 기본값은 토큰 거부 (TokenValidationError 하위 예외)"""
+        token = self.create_token()
+        store = MagicMock(get=AsyncMock(side_effect=ConnectionError("redis down")),
+                          setex=AsyncMock(side_effect=ConnectionError("redis down")))
+        
+        with patch('utils.jwt_utils.redis_client', store), \
+                patch.object(config.settings, 'TOKEN_REVOCATION_FAIL_OPEN', False):
+            with pytest.raises(RevocationStoreUnavailableError):
+                await verify_token(token, "access")
+            assert await revoke_token(token) is False
+    
+    @pytest.mark.asyncio
+    async def test_store_unavailable_fail_open(self):
+        """TOKEN_REVOCATION_FAIL_OPEN 이면 저장소 장애 시 서명 검증 결과로 통과"""
+        token = self.create_token()
+        store = MagicMock(get=AsyncMock(side_effect=ConnectionError("redis down")))
+        
+        with patch('utils.jwt_utils.redis_client', store), \
+                patch.object(config.settings, 'TOKEN_REVOCATION_FAIL_OPEN', True):
+            token_data = await verify_token(token, "access")
+        
+        assert token_data.type == "access"
+    
+    @pytest.mark.asyncio
+    async def test_slow_store_times_out(self):
+        """응답 없는 저장소는 제한 시간 후 장애로 처리"""
+        async def hang(key):
+            await asyncio.sleep(10)
+        
+        store = MagicMock(get=hang)
+        
+        with patch('utils.jwt_utils.redis_client', store), \
+                patch.object(config.settings, 'TOKEN_REVOCATION_TIMEOUT_SECONDS', 0.01), \
+                patch.object(config.settings, 'TOKEN_REVOCATION_FAIL_OPEN', False):
+            with pytest.raises(RevocationStoreUnavailableError):
+                await verify_token(self.create_token(), "access")
+
+
+class TestInMemoryRevocationStore:
+    """프로세스 내 토큰 폐기 저장소 테스트"""
+    
+    def test_entries_expire_with_ttl(self):
+        """TTL 이 지나면 조회되지 않고 메모리에서도 제거"""
+        now = [0.0]
+        store = InMemoryRevocationStore(clock=lambda: now[0])
+        store.setex("token:a", 10, "revoked")
+        store.setex("token:b", 100, "revoked")
+        
+        assert store.get("token:a") == "revoked"
+        
+        now[0] = 11.0
+        assert store.get("token:a") is None
+        assert len(store) == 1
+        assert store.get("token:b") == "revoked"
+    
+    def test_max_size_evicts_soonest_expiry(self):
+        """상한 초과 시 만료가 가장 가까운 항목부터 제거"""
+        store = InMemoryRevocationStore(max_size=2, clock=lambda: 0.0)
+        store.setex("token:long", 300, "revoked")
+        store.setex("token:short", 10, "revoked")
+        store.setex("token:mid", 100, "revoked")
+        
+        assert len(store) == 2
+        assert store.get("token:short") is None
+        assert store.get("token:long") == "revoked"
+    
+    def test_reset_extends_ttl(self):
+        """같은 키 재저장 시 새 만료 시각 적용"""
+        now = [0.0]
+        store = InMemoryRevocationStore(clock=lambda: now[0])
+        store.setex("token:a", 10, "revoked")
+        store.setex("token:a", 100, "revoked")
+        
+        now[0] = 50.0
+        store.setex("token:b", 10, "revoked")
+        
+        assert store.get("token:a") == "revoked"
@@ -0,0 +1,142 @@
+"""
+인메모리 테이블 엔진 테스트
+인덱스 조회/갱신, 쿼리 분류, RealSupabaseService 테이블 핸들러 검증
+"""
+
+import pytest
+
+from utils.memory_table import MemoryTable, DuplicateKeyError
+from services.real_supabase_service import RealSupabaseService, classify_query
+
+
+class TestMemoryTable:
+    """MemoryTable 테스트"""
+
+    def test_index_follows_updates(self):
+        """update 시 보조 인덱스도 함께 갱신"""
+        table = MemoryTable("companies", indexes=("user_id",))
+        table.insert({"id": "c1", "user_id": "u1", "name": "A"})
+
+        table.update("c1", {"user_id": "u2"})
+
+        assert table.find("user_id", "u1") == []
+        assert table.find_one("user_id", "u2")["name"] == "A"
+        assert table.count("user_id", "u2") == 1
+
+    def test_unique_and_primary_key(self):
+        """기본키/유니크 컬럼 중복은 DuplicateKeyError"""
+        table = MemoryTable("users", unique=("email",))
+        table.insert({"id": "u1", "email": "a@example.com"})
+
+        with pytest.raises(DuplicateKeyError):
+            table.insert({"id": "u1", "email": "b@example.com"})
+        with pytest.raises(DuplicateKeyError):
+            table.insert({"id": "u2", "email": "a@example.com"})
+
+    def test_select_filters_remaining_conditions(self):
+        """인덱스로 후보를 찾은 뒤 나머지 조건으로 필터링"""
+        table = MemoryTable("companies", indexes=("company_type",))
+        table.insert({"id": "c1", "company_type": "wholesale", "status": "active"})
+        table.insert({"id": "c2", "company_type": "wholesale", "status": "inactive"})
+        table.insert({"id": "c3", "company_type": "retail", "status": "active"})
+
+        rows = table.select({"company_type": "wholesale", "status": "active"})
+
+        assert [row["id"] for row in rows] == ["c1"]
+
+    def test_rows_are_copies(self):
+        """반환된 행을 수정해도 저장된 행과 인덱스는 바뀌지 않음"""
+        table = MemoryTable("users", indexes=("role",))
+        table.insert({"id": "u1", "role": "user"})
+
+        table.get("u1")["role"] = "admin"
+
+        assert table.count("role", "admin") == 0
+        assert table.get("u1")["role"] == "user"
+
+    def test_delete(self):
+        """삭제 시 인덱스에서도 제거"""
+        table = MemoryTable("chat_messages", indexes=("room_id",))
+        table.insert({"id": "m1", "room_id": "r1"})
+
+        assert table.delete("m1") is True
+        assert table.delete("m1") is False
+        assert table.find("room_id", "r1") == []
+
+
+class TestClassifyQuery:
+    """쿼리 분류 테스트"""
+
+    @pytest.mark.parametrize("query, expected", [
+        ("SELECT * FROM users WHERE email = $1", ("select", "users", "")),
+        ("SELECT cm.id FROM chat_messages cm LEFT JOIN users u ON cm.sender_id = u.id", ("select", "chat_messages", "cm")),
+        ("SELECT cr.id, (SELECT message FROM chat_messages LIMIT 1) FROM chat_rooms cr", ("select", "chat_rooms", "cr")),
+        ("INSERT INTO notices (id) VALUES ($1)", ("insert", "notices", "")),
+        ("UPDATE users SET approved = $1 WHERE id = $2", ("update", "users", "")),
+        ("DELETE FROM notices WHERE id = $1", ("delete", "notices", "")),
+    ])
+    def test_classify(self, query, expected):
+        """최상위 FROM 기준으로 대상 테이블 분류 (서브쿼리 무시)"""
+        assert classify_query(query) == expected
+
+
+class TestRealSupabaseService:
+    """RealSupabaseService 인메모리 핸들러 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_user_lifecycle(self):
+        """생성한 사용자를 이메일 인덱스로 조회하고 승인 상태 갱신"""
+        service = RealSupabaseService()
+        created = await service.create_user({
+            "id": "u-new", "email": "new@example.com", "password_hash": "hash",
+            "name": "O'Brien", "phone": "010-0000-0000", "company_type": "retail"
+        })
+
+        assert created["name"] == "O'Brien"
+        assert "password_hash" not in created
+        assert (await service.get_user_by_email("new@example.com"))["password_hash"] == "hash"
+
+        approved = await service.approve_user("u-new", True)
+        assert approved["approved"] is True
+        assert service.users.count("approved", True) == 3
+
+    @pytest.mark.asyncio
+    async def test_duplicate_email_fails(self):
+        """이메일 중복 INSERT 는 실패 (None)"""
+        service = RealSupabaseService()
+
+        result = await service.execute_sql(
+            project_id="test",
+            query="INSERT INTO users (id, email, password_hash, name, phone, company_type, approved) VALUES ($1, $2, $3, $4, $5, $6, false)",
+            params=["u-dup", "admin@example.com", "hash", "중복", "010", "retail"]
+        )
+
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_notice_crud(self):
+        """공지사항 생성/수정/삭제가 저장소에 반영"""
+        service = RealSupabaseService()
+        admin_id = "7b4590df-10cc-4074-9186-4957ef96bfbb"
+        await service.execute_sql(
+            project_id="test",
+            query="INSERT INTO notices (id, title, content, is_important, created_by, created_at, updated_at) VALUES ($1, $2, $3, $4, $5, $6, $6)",
+            params=["n1", "제목", "내용", True, admin_id, "2025-09-01T00:00:00"]
+        )
+
+        updated = await service.execute_sql(
+            project_id="test",
+            query="UPDATE notices SET title = $2 WHERE id = $1 RETURNING *",
+            params=["n1", "수정된 제목"]
+        )
+        selected = await service.execute_sql(
+            project_id="test",
+            query="SELECT n.id, u.name as created_by_name FROM notices n LEFT JOIN users u ON n.created_by = u.id WHERE n.id = $1",
+            params=["n1"]
+        )
+
+        assert updated["data"][0]["title"] == "수정된 제목"
+        assert selected["data"][0]["created_by_name"] == "관리자"
+
+        await service.execute_sql(project_id="test", query="DELETE FROM notices WHERE id = $1", params=["n1"])
+        assert len(service.notices) == 0
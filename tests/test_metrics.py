@@ -0,0 +1,185 @@
+"""
+요청 지표 테스트
+히스토그램 버킷, 라우트 템플릿 레이블, 워커 스냅샷 합산, Rate Limit 거부 카운트 검증
+"""
+
+import os
+import time
+import pytest
+from types import SimpleNamespace
+
+from utils.metrics import MetricsRegistry, MetricsMiddleware
+from utils.rate_limiter import RateLimiter, InMemoryRateLimitStore
+
+BUCKETS = (0.1, 0.5, 1.0)
+
+
+class TestMetricsRegistry:
+    """MetricsRegistry 테스트"""
+
+    def test_render_cumulative_histogram(self):
+        """버킷은 누적값으로, 경계값은 해당 버킷에 포함"""
+        registry = MetricsRegistry(buckets=BUCKETS)
+        for seconds in (0.05, 0.1, 0.7, 3.0):
+            registry.observe("GET", "/api/orders/{order_id}", 200, seconds)
+
+        text = registry.render()
+
+        labels = 'method="GET",route="/api/orders/{order_id}",status="200"'
+        assert f"http_requests_total{{{labels}}} 4" in text
+        assert f'http_request_duration_seconds_bucket{{{labels},le="0.1"}} 2' in text
+        assert f'http_request_duration_seconds_bucket{{{labels},le="1.0"}} 3' in text
+        assert f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 4' in text
+        assert f"http_request_duration_seconds_count{{{labels}}} 4" in text
+        assert f"http_request_duration_seconds_sum{{{labels}}} 3.85" in text
+
+    def test_collectors_and_failure_isolation(self):
+        """수집기 표본은 유형 헤더와 함께 출력하고, 실패한 수집기는 건너뜀"""
+        registry = MetricsRegistry(buckets=BUCKETS)
+        registry.register_collector(lambda: [("rate_limit_rejections_total", {"endpoint_type": "auth"}, 3)])
+        registry.register_collector(lambda: 1 / 0)
+
+        text = registry.render()
+
+        assert "# TYPE rate_limit_rejections_total counter" in text
+        assert 'rate_limit_rejections_total{endpoint_type="auth"} 3' in text
+
+    @staticmethod
+    def _worker_file(tmp_path, pid, method="POST", in_flight=0, samples=()):
+        """다른 워커(pid)의 스냅샷 파일 생성"""
+        worker = MetricsRegistry(buckets=BUCKETS, snapshot_dir=str(tmp_path))
+        worker.observe(method, "/api/orders", 201, 0.2)
+        worker.in_flight = in_flight
+        worker.register_collector(lambda: list(samples))
+        worker.write_snapshot()
+        os.replace(tmp_path / f"metrics-{os.getpid()}.json", tmp_path / f"metrics-{pid}.json")
+
+    def test_merge_worker_snapshots(self, tmp_path):
+        """다른 워커 스냅샷 파일과 합산하고, 오래 갱신되지 않은 파일은 카운터만 합산"""
+        self._worker_file(tmp_path, 1, in_flight=2, samples=[("websocket_connections", {}, 5)])
+        self._worker_file(tmp_path, 2, in_flight=3, samples=[("websocket_connections", {}, 7)])
+        old = time.time() - 600
+        os.utime(tmp_path / "metrics-2.json", (old, old))
+
+        registry = MetricsRegistry(buckets=BUCKETS, snapshot_dir=str(tmp_path), stale_seconds=60,
+                                   pid_alive=lambda pid: True)
+        registry.observe("POST", "/api/orders", 201, 0.3)
+        registry.register_collector(lambda: [("websocket_connections", {}, 1)])
+
+        text = registry.render()
+
+        assert "http_requests_in_progress 2" in text
+        assert 'http_requests_total{method="POST",route="/api/orders",status="201"} 3' in text
+        assert "websocket_connections 6" in text
+
+    def test_dead_worker_counters_retained(self, tmp_path):
+        """종료된 워커의 카운터는 보관 합계로 남아 재시작 후에도 줄지 않고, 게이지는 버림"""
+        alive = {1, 2}
+        registry = MetricsRegistry(buckets=BUCKETS, snapshot_dir=str(tmp_path), pid_alive=lambda pid: pid in alive)
+        self._worker_file(tmp_path, 1, in_flight=4, samples=[
+            ("rate_limit_rejections_total", {"endpoint_type": "api"}, 3), ("websocket_connections", {}, 5)
+        ])
+        self._worker_file(tmp_path, 2)
+        labels = 'method="POST",route="/api/orders",status="201"'
+        assert f"http_requests_total{{{labels}}} 2" in registry.render()
+
+        # 워커 1 종료 후 같은 자리에 새 워커 3 시작
+        alive = {2, 3}
+        self._worker_file(tmp_path, 3)
+        text = registry.render()
+
+        assert f"http_requests_total{{{labels}}} 3" in text
+        assert 'rate_limit_rejections_total{endpoint_type="api"} 3' in text
+        assert "websocket_connections" not in text
+        assert "http_requests_in_progress 0" in text
+        assert not (tmp_path / "metrics-1.json").exists()
+
+        # 보관 합계는 한 번만 반영
+        assert f"http_requests_total{{{labels}}} 3" in registry.render()
+
+    def test_retire_snapshot_on_shutdown(self, tmp_path):
+        """정상 종료한 워커의 카운터도 보관 합계로 이전"""
+        worker = MetricsRegistry(buckets=BUCKETS, snapshot_dir=str(tmp_path))
+        worker.observe("GET", "/api/orders", 200, 0.2)
+        worker.write_snapshot()
+        worker.retire_snapshot()
+
+        registry = MetricsRegistry(buckets=BUCKETS, snapshot_dir=str(tmp_path))
+
+        assert not (tmp_path / f"metrics-{os.getpid()}.json").exists()
+        assert 'http_requests_total{method="GET",route="/api/orders",status="200"} 1' in registry.render()
+
+
+class TestMetricsMiddleware:
+    """MetricsMiddleware 테스트"""
+
+    @staticmethod
+    async def _call(middleware, path="/api/orders/123"):
+        scope = {"type": "http", "method": "GET", "path": path}
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        await middleware(scope, None, send)
+        return sent
+
+    @pytest.mark.asyncio
+    async def test_records_route_template_and_status(self):
+        """원시 경로 대신 매칭된 라우트 템플릿으로 기록"""
+        registry = MetricsRegistry(buckets=BUCKETS)
+
+        async def app(scope, receive, send):
+            assert registry.in_flight == 1
+            scope["route"] = SimpleNamespace(path="/api/orders/{order_id}")
+            await send({"type": "http.response.start", "status": 404, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+        sent = await self._call(MetricsMiddleware(app, registry=registry))
+
+        assert len(sent) == 2
+        assert registry.in_flight == 0
+        assert 'route="/api/orders/{order_id}",status="404"} 1' in registry.render()
+
+    @pytest.mark.asyncio
+    async def test_router_prefix_restored(self):
+        """prefix 를 뺀 라우트 경로가 scope 에 있으면 요청 경로에서 prefix 복원"""
+        registry = MetricsRegistry(buckets=BUCKETS)
+
+        async def app(scope, receive, send):
+            scope["route"] = SimpleNamespace(path="/rooms/{room_id}/messages")
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+
+        await self._call(MetricsMiddleware(app, registry=registry), path="/api/chat/rooms/42/messages")
+
+        assert 'route="/api/chat/rooms/{room_id}/messages",status="200"} 1' in registry.render()
+
+    @pytest.mark.asyncio
+    async def test_exception_recorded_as_500_unmatched(self):
+        """응답 전 예외는 500, 라우트 미매칭은 unmatched 로 기록하고 예외는 전파"""
+        registry = MetricsRegistry(buckets=BUCKETS)
+
+        async def app(scope, receive, send):
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await self._call(MetricsMiddleware(app, registry=registry), path="/random/123")
+
+        assert registry.in_flight == 0
+        assert 'http_requests_total{method="GET",route="unmatched",status="500"} 1' in registry.render()
+
+
+class TestRateLimitRejections:
+    """RateLimiter 거부 카운트 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_rejections_counted_by_endpoint_type(self):
+        """한도 초과로 거부된 요청만 엔드포인트 유형별로 집계"""
+        limiter = RateLimiter(InMemoryRateLimitStore(), limits={"api": 10, "auth": 1})
+
+        assert await limiter.is_allowed("1.2.3.4", "auth") is True
+        assert await limiter.is_allowed("1.2.3.4", "auth") is False
+        assert await limiter.is_allowed("1.2.3.4", "auth") is False
+        assert await limiter.is_allowed("1.2.3.4", "api") is True
+
+        assert limiter.rejections == {"auth": 2}
@@ -16,8 +16,8 @@ class TestNoticeService:
     """공지사항 서비스 테스트"""
 
     @pytest.mark.asyncio
-    @patch('services.admin_service.real_supabase_service')
-    async def test_create_notice_success(self, mock_supabase):
+    @patch('services.admin_service.execute_sql', new_callable=AsyncMock)
+    async def test_create_notice_success(self, mock_execute_sql):
         """공지사항 생성 성공 테스트"""
         # Given: 공지사항 생성 데이터
         admin_user_id = str(uuid.uuid4())
@@ -41,10 +41,10 @@ class TestNoticeService:
         }
         
         # execute_sql 호출 순서: INSERT → SELECT
-        mock_supabase.execute_sql = AsyncMock(side_effect=[
-            {"data": []},  # INSERT 결과
-            {"data": [mock_created_notice]}  # SELECT 결과
-        ])
+        mock_execute_sql.side_effect = [
+            [],  # INSERT 결과
+            [mock_created_notice]  # SELECT 결과
+        ]
         
         # When: 공지사항 생성
         result = await AdminService.create_notice(admin_user_id, notice_data)
@@ -57,22 +57,22 @@ class TestNoticeService:
         assert result["created_by"] == admin_user_id
         
         # execute_sql이 2번 호출되었는지 확인 (INSERT + SELECT)
-        assert mock_supabase.execute_sql.call_count == 2
+        assert mock_execute_sql.call_count == 2
         
         # 첫 번째 호출(INSERT) 검증
-        first_call = mock_supabase.execute_sql.call_args_list[0]
-        assert 'project_id' in first_call.kwargs
-        assert first_call.kwargs['project_id'] == "vrsbmygqyfvvuaixibrh"
-        assert "INSERT INTO notices" in first_call.kwargs['query']
+        first_call = mock_execute_sql.call_args_list[0]
+        assert "INSERT INTO notices" in first_call.args[0]
+        assert "테스트 공지사항" in first_call.args
+        assert admin_user_id in first_call.args
         
         # 두 번째 호출(SELECT) 검증
-        second_call = mock_supabase.execute_sql.call_args_list[1]
-        assert "SELECT" in second_call.kwargs['query']
-        assert "LEFT JOIN users" in second_call.kwargs['query']
+        second_call = mock_execute_sql.call_args_list[1]
+        assert "SELECT" in second_call.args[0]
+        assert "LEFT JOIN users" in second_call.args[0]
 
     @pytest.mark.asyncio
-    @patch('services.admin_service.real_supabase_service')
-    async def test_create_notice_important_success(self, mock_supabase):
+    @patch('services.admin_service.execute_sql', new_callable=AsyncMock)
+    async def test_create_notice_important_success(self, mock_execute_sql):
         """중요 공지사항 생성 성공 테스트"""
         # Given: 중요 공지사항 데이터
         admin_user_id = str(uuid.uuid4())
@@ -93,10 +93,10 @@ class TestNoticeService:
             "created_by_name": "관리자"
         }
         
-        mock_supabase.execute_sql = AsyncMock(side_effect=[
-            {"data": []},  # INSERT
-            {"data": [mock_created_notice]}  # SELECT
-        ])
+        mock_execute_sql.side_effect = [
+            [],  # INSERT
+            [mock_created_notice]  # SELECT
+        ]
         
         # When: 중요 공지사항 생성
         result = await AdminService.create_notice(admin_user_id, notice_data)
@@ -106,8 +106,8 @@ class TestNoticeService:
         assert result["title"] == "중요 공지사항"
 
     @pytest.mark.asyncio
-    @patch('services.admin_service.real_supabase_service')
-    async def test_create_notice_database_error(self, mock_supabase):
+    @patch('services.admin_service.execute_sql', new_callable=AsyncMock)
+    async def test_create_notice_database_error(self, mock_execute_sql):
         """공지사항 생성 데이터베이스 오류 테스트"""
         # Given: DB 오류 시뮬레이션
         admin_user_id = str(uuid.uuid4())
@@ -117,15 +117,15 @@ class TestNoticeService:
             is_important=False
         )
         
-        mock_supabase.execute_sql = AsyncMock(side_effect=Exception("Database connection failed"))
+        mock_execute_sql.side_effect = Exception("Database connection failed")
         
         # When & Then: RuntimeError 발생 확인
         with pytest.raises(RuntimeError, match="공지사항 생성에 실패했습니다"):
             await AdminService.create_notice(admin_user_id, notice_data)
 
     @pytest.mark.asyncio
-    @patch('services.admin_service.real_supabase_service')
-    async def test_get_notices_success(self, mock_supabase):
+    @patch('services.admin_service.execute_sql', new_callable=AsyncMock)
+    async def test_get_notices_success(self, mock_execute_sql):
         """공지사항 목록 조회 성공 테스트"""
         # Given: 공지사항 목록 Mock 데이터
         mock_notices = [
@@ -152,10 +152,10 @@ class TestNoticeService:
         ]
         
         # execute_sql 호출 순서: COUNT → SELECT
-        mock_supabase.execute_sql = AsyncMock(side_effect=[
-            {"data": [{"total": 2}]},  # COUNT 결과
-            {"data": mock_notices}  # SELECT 결과
-        ])
+        mock_execute_sql.side_effect = [
+            [{"total": 2}],  # COUNT 결과
+            mock_notices  # SELECT 결과
+        ]
         
         filter_data = NoticeFilter(page=1, per_page=20)
         
@@ -180,14 +180,14 @@ class TestNoticeService:
         assert result["items"][1]["is_important"] == False
 
     @pytest.mark.asyncio  
-    @patch('services.admin_service.real_supabase_service')
-    async def test_get_notices_empty_result(self, mock_supabase):
+    @patch('services.admin_service.execute_sql', new_callable=AsyncMock)
+    async def test_get_notices_empty_result(self, mock_execute_sql):
         """공지사항이 없는 경우 테스트"""
         # Given: 빈 결과
-        mock_supabase.execute_sql = AsyncMock(side_effect=[
-            {"data": [{"total": 0}]},  # COUNT 결과
-            {"data": []}  # SELECT 결과
-        ])
+        mock_execute_sql.side_effect = [
+            [{"total": 0}],  # COUNT 결과
+            []  # SELECT 결과
+        ]
         
         filter_data = NoticeFilter(page=1, per_page=20)
         
@@ -199,8 +199,8 @@ class TestNoticeService:
         assert result["total"] == 0
 
     @pytest.mark.asyncio
-    @patch('services.admin_service.real_supabase_service')
-    async def test_get_notices_with_search_filter(self, mock_supabase):
+    @patch('services.admin_service.execute_sql', new_callable=AsyncMock)
+    async def test_get_notices_with_search_filter(self, mock_execute_sql):
         """검색 필터 적용 공지사항 조회 테스트"""
         # Given: 검색 결과 Mock 데이터
         mock_notices = [
@@ -216,10 +216,10 @@ class TestNoticeService:
             }
         ]
         
-        mock_supabase.execute_sql = AsyncMock(side_effect=[
-            {"data": [{"total": 1}]},  # COUNT 결과
-            {"data": mock_notices}  # SELECT 결과
-        ])
+        mock_execute_sql.side_effect = [
+            [{"total": 1}],  # COUNT 결과
+            mock_notices  # SELECT 결과
+        ]
         
         filter_data = NoticeFilter(search="업데이트", page=1, per_page=20)
         
@@ -231,12 +231,14 @@ class TestNoticeService:
         assert "업데이트" in result["items"][0]["title"]
         
         # 두 번째 호출(SELECT) 쿼리에 검색 조건 포함 확인
-        second_call = mock_supabase.execute_sql.call_args_list[1]
-        assert "ILIKE '%업데이트%'" in second_call.kwargs['query']
+        second_call = mock_execute_sql.call_args_list[1]
+        assert "ILIKE" in second_call.args[0]
+        assert "업데이트" in second_call.args[1:]
+        assert "업데이트" not in second_call.args[0]
 
     @pytest.mark.asyncio
-    @patch('services.admin_service.real_supabase_service')
-    async def test_delete_notice_success(self, mock_supabase):
+    @patch('services.admin_service.execute_sql', new_callable=AsyncMock)
+    async def test_delete_notice_success(self, mock_execute_sql):
         """공지사항 삭제 성공 테스트"""
         # Given: 존재하는 공지사항
         notice_id = str(uuid.uuid4())
@@ -254,10 +256,10 @@ class TestNoticeService:
         }
         
         # execute_sql 호출 순서: SELECT (존재 확인) → DELETE
-        mock_supabase.execute_sql = AsyncMock(side_effect=[
-            {"data": [existing_notice]},  # get_notice_by_id 호출
-            {"data": []}  # DELETE 결과
-        ])
+        mock_execute_sql.side_effect = [
+            [existing_notice],  # get_notice_by_id 호출
+            []  # DELETE 결과
+        ]
         
         # When: 공지사항 삭제
         result = await AdminService.delete_notice(admin_user_id, notice_id)
@@ -266,30 +268,31 @@ class TestNoticeService:
         assert result == True
         
         # execute_sql이 2번 호출되었는지 확인
-        assert mock_supabase.execute_sql.call_count == 2
+        assert mock_execute_sql.call_count == 2
         
         # 두 번째 호출(DELETE) 검증
-        second_call = mock_supabase.execute_sql.call_args_list[1]
-        assert f"DELETE FROM notices WHERE id = '{notice_id}'" in second_call.kwargs['query']
+        second_call = mock_execute_sql.call_args_list[1]
+        assert "DELETE FROM notices WHERE id = $1" in second_call.args[0]
+        assert second_call.args[1] == notice_id
 
     @pytest.mark.asyncio
-    @patch('services.admin_service.real_supabase_service')
-    async def test_delete_notice_not_found(self, mock_supabase):
+    @patch('services.admin_service.execute_sql', new_callable=AsyncMock)
+    async def test_delete_notice_not_found(self, mock_execute_sql):
         """존재하지 않는 공지사항 삭제 테스트"""
         # Given: 존재하지 않는 공지사항
         notice_id = str(uuid.uuid4())
         admin_user_id = str(uuid.uuid4())
         
         # get_notice_by_id가 None 반환
-        mock_supabase.execute_sql = AsyncMock(return_value={"data": []})
+        mock_execute_sql.return_value = []
         
         # When & Then: ValueError 발생 확인
         with pytest.raises(RuntimeError, match="공지사항 삭제에 실패했습니다"):
             await AdminService.delete_notice(admin_user_id, notice_id)
 
     @pytest.mark.asyncio
-    @patch('services.admin_service.real_supabase_service')
-    async def test_update_notice_success(self, mock_supabase):
+    @patch('services.admin_service.execute_sql', new_callable=AsyncMock)
+    async def test_update_notice_success(self, mock_execute_sql):
         """공지사항 수정 성공 테스트"""
         # Given: 수정할 공지사항과 업데이트 데이터
         notice_id = str(uuid.uuid4())
@@ -321,10 +324,10 @@ class TestNoticeService:
         )
         
         # execute_sql 호출 순서: SELECT (존재 확인) → UPDATE
-        mock_supabase.execute_sql = AsyncMock(side_effect=[
-            {"data": [existing_notice]},  # get_notice_by_id 호출
-            {"data": [updated_notice]}  # UPDATE 결과
-        ])
+        mock_execute_sql.side_effect = [
+            [existing_notice],  # get_notice_by_id 호출
+            [updated_notice]  # UPDATE 결과
+        ]
         
         # When: 공지사항 수정
         result = await AdminService.update_notice(admin_user_id, notice_id, notice_update)
@@ -335,11 +338,11 @@ class TestNoticeService:
         assert result["is_important"] == True
         
         # execute_sql이 2번 호출되었는지 확인
-        assert mock_supabase.execute_sql.call_count == 2
+        assert mock_execute_sql.call_count == 2
 
     @pytest.mark.asyncio
-    @patch('services.admin_service.real_supabase_service')
-    async def test_get_notice_by_id_success(self, mock_supabase):
+    @patch('services.admin_service.execute_sql', new_callable=AsyncMock)
+    async def test_get_notice_by_id_success(self, mock_execute_sql):
         """공지사항 상세 조회 성공 테스트"""
         # Given: 존재하는 공지사항
         notice_id = str(uuid.uuid4())
@@ -354,7 +357,7 @@ class TestNoticeService:
             "created_by_name": "관리자"
         }
         
-        mock_supabase.execute_sql = AsyncMock(return_value={"data": [mock_notice]})
+        mock_execute_sql.return_value = [mock_notice]
         
         # When: 공지사항 상세 조회
         result = await AdminService.get_notice_by_id(notice_id)
@@ -366,12 +369,12 @@ class TestNoticeService:
         assert result["created_by_name"] == "관리자"
 
     @pytest.mark.asyncio
-    @patch('services.admin_service.real_supabase_service')
-    async def test_get_notice_by_id_not_found(self, mock_supabase):
+    @patch('services.admin_service.execute_sql', new_callable=AsyncMock)
+    async def test_get_notice_by_id_not_found(self, mock_execute_sql):
         """존재하지 않는 공지사항 조회 테스트"""
         # Given: 존재하지 않는 공지사항
         notice_id = str(uuid.uuid4())
-        mock_supabase.execute_sql = AsyncMock(return_value={"data": []})
+        mock_execute_sql.return_value = []
         
         # When: 공지사항 상세 조회
         result = await AdminService.get_notice_by_id(notice_id)
@@ -380,8 +383,8 @@ class TestNoticeService:
         assert result is None
 
     @pytest.mark.asyncio
-    @patch('services.admin_service.real_supabase_service')
-    async def test_get_notices_pagination(self, mock_supabase):
+    @patch('services.admin_service.execute_sql', new_callable=AsyncMock)
+    async def test_get_notices_pagination(self, mock_execute_sql):
         """공지사항 페이징 테스트"""
         # Given: 페이징된 공지사항 데이터
         mock_notices = [
@@ -395,13 +398,13 @@ class TestNoticeService:
                 "updated_at": f"2025-09-01T1{i}:00:00Z",
                 "created_by_name": "관리자"
             }
-            for i in range(5)  # 5개 공지사항
+            for i in range(6)  # 현재 페이지 5개 + 다음 페이지 확인용 1개
         ]
         
-        mock_supabase.execute_sql = AsyncMock(side_effect=[
-            {"data": [{"total": 25}]},  # 전체 25개
-            {"data": mock_notices}  # 현재 페이지 5개
-        ])
+        mock_execute_sql.side_effect = [
+            [{"total": 25}],  # 전체 25개
+            mock_notices  # per_page + 1 건 조회 결과
+        ]
         
         filter_data = NoticeFilter(page=2, per_page=5)
         
@@ -412,16 +415,18 @@ class TestNoticeService:
         assert result["total"] == 25
         assert result["page"] == 2
         assert result["per_page"] == 5
-        assert result["has_next"] == True  # 25 > 2*5 = 10
+        assert result["has_next"] == True  # per_page + 1 건 조회됨
         assert len(result["items"]) == 5
+        assert result["next_cursor"] is not None
         
-        # LIMIT OFFSET 쿼리 확인
-        second_call = mock_supabase.execute_sql.call_args_list[1]
-        assert "LIMIT 5 OFFSET 5" in second_call.kwargs['query']
+        # LIMIT OFFSET 쿼리 확인 (per_page + 1 건 조회)
+        second_call = mock_execute_sql.call_args_list[1]
+        assert "LIMIT $1 OFFSET $2" in second_call.args[0]
+        assert second_call.args[1:] == (6, 5)
 
     @pytest.mark.asyncio
-    @patch('services.admin_service.real_supabase_service')
-    async def test_get_notices_important_filter(self, mock_supabase):
+    @patch('services.admin_service.execute_sql', new_callable=AsyncMock)
+    async def test_get_notices_important_filter(self, mock_execute_sql):
         """중요 공지사항 필터 테스트"""
         # Given: 중요 공지사항만 Mock 데이터
         mock_important_notices = [
@@ -437,10 +442,10 @@ class TestNoticeService:
             }
         ]
         
-        mock_supabase.execute_sql = AsyncMock(side_effect=[
-            {"data": [{"total": 1}]},  # COUNT 결과
-            {"data": mock_important_notices}  # SELECT 결과
-        ])
+        mock_execute_sql.side_effect = [
+            [{"total": 1}],  # COUNT 결과
+            mock_important_notices  # SELECT 결과
+        ]
         
         filter_data = NoticeFilter(is_important=True, page=1, per_page=20)
         
@@ -452,5 +457,6 @@ class TestNoticeService:
         assert result["items"][0]["is_important"] == True
         
         # WHERE 절에 is_important 조건 포함 확인
-        first_call = mock_supabase.execute_sql.call_args_list[0]
-        assert "n.is_important = True" in first_call.kwargs['query']
\ No newline at end of file
+        first_call = mock_execute_sql.call_args_list[0]
+        assert "n.is_important = $1" in first_call.args[0]
+        assert first_call.args[1] is True
\ No newline at end of file
@@ -0,0 +1,307 @@
+"""
+주문 서비스 테스트
+OrderService 주문 목록 조회 쿼리 검증
+"""
+
+import asyncio
+import pytest
+import uuid
+from datetime import date, datetime
+from unittest.mock import AsyncMock, patch
+
+from services.order_service import OrderNumberAllocator, OrderService
+from services.real_supabase_service import RealSupabaseService
+from models.order import OrderSearchFilter, OrderCreate
+from utils.pagination import encode_cursor, decode_cursor
+
+
+def create_order_row(order_id: str, wholesale_id: str, retail_id: str) -> dict:
+    """테스트용 주문 행 생성"""
+    return {
+        "id": order_id,
+        "order_number": "20250901-001",
+        "wholesale_company_id": wholesale_id,
+        "retail_company_id": retail_id,
+        "status": "pending",
+        "total_amount": 30000,
+        "notes": None,
+        "created_by": str(uuid.uuid4()),
+        "created_at": "2025-09-01T10:00:00Z",
+        "updated_at": "2025-09-01T10:00:00Z",
+        "wholesale_company_name": "테스트도매",
+        "retail_company_name": "테스트소매",
+        "created_by_name": "주문자"
+    }
+
+
+def create_item_row(order_id: str) -> dict:
+    """테스트용 주문 상품 행 생성"""
+    return {
+        "id": str(uuid.uuid4()),
+        "order_id": order_id,
+        "product_id": str(uuid.uuid4()),
+        "quantity": 2,
+        "unit_price": 15000,
+        "total_price": 30000,
+        "created_at": "2025-09-01T10:00:00Z",
+        "product_name": "아동 티셔츠",
+        "product_code": "TS-001"
+    }
+
+
+class TestOrderServiceGetOrders:
+    """OrderService.get_orders 테스트"""
+
+    @pytest.mark.asyncio
+    @patch('services.order_service.execute_sql', new_callable=AsyncMock)
+    async def test_get_orders_batches_items(self, mock_execute_sql):
+        """페이지 전체 주문 상품을 단일 쿼리로 조회"""
+        # Given: 주문 3건, 상품은 2건의 주문에만 존재
+        wholesale_id, retail_id = str(uuid.uuid4()), str(uuid.uuid4())
+        order_ids = [str(uuid.uuid4()) for _ in range(3)]
+        orders = [create_order_row(order_id, wholesale_id, retail_id) for order_id in order_ids]
+        items = [create_item_row(order_ids[0]), create_item_row(order_ids[0]), create_item_row(order_ids[2])]
+
+        mock_execute_sql.side_effect = [
+            [{"total": 3}],  # COUNT
+            orders,  # 주문 목록
+            items  # 주문 상품 일괄 조회
+        ]
+
+        # When
+        result = await OrderService.get_orders(OrderSearchFilter(page=1, size=20), wholesale_id, "wholesale")
+
+        # Then: COUNT + 주문 + 상품 = 3회 쿼리
+        assert mock_execute_sql.call_count == 3
+        items_call = mock_execute_sql.call_args_list[2]
+        assert "oi.order_id = ANY($1::uuid[])" in items_call.args[0]
+        assert items_call.args[1] == order_ids
+
+        assert [len(order.items) for order in result.orders] == [2, 0, 1]
+        assert all(str(item.order_id) == order_ids[0] for item in result.orders[0].items)
+
+    @pytest.mark.asyncio
+    @patch('services.order_service.execute_sql', new_callable=AsyncMock)
+    async def test_get_orders_without_items(self, mock_execute_sql):
+        """include_items=False 이면 상품 조회 생략"""
+        wholesale_id, retail_id = str(uuid.uuid4()), str(uuid.uuid4())
+        orders = [create_order_row(str(uuid.uuid4()), wholesale_id, retail_id)]
+
+        mock_execute_sql.side_effect = [
+            [{"total": 7}],  # COUNT
+            orders  # 주문 목록
+        ]
+
+        result = await OrderService.get_orders(
+            OrderSearchFilter(page=1, size=1), wholesale_id, "wholesale", include_items=False
+        )
+
+        assert mock_execute_sql.call_count == 2
+        assert result.total == 7
+        assert result.orders[0].items == []
+
+
+    @pytest.mark.asyncio
+    @patch('services.order_service.execute_sql', new_callable=AsyncMock)
+    async def test_get_orders_with_cursor(self, mock_execute_sql):
+        """커서 지정 시 COUNT 없이 키셋 조건으로 조회하고 다음 커서 반환"""
+        wholesale_id, retail_id = str(uuid.uuid4()), str(uuid.uuid4())
+        orders = [create_order_row(str(uuid.uuid4()), wholesale_id, retail_id) for _ in range(3)]
+        mock_execute_sql.return_value = orders
+
+        cursor = encode_cursor(datetime(2025, 9, 2, 10, 0), str(uuid.uuid4()))
+        result = await OrderService.get_orders(
+            OrderSearchFilter(size=2, cursor=cursor), wholesale_id, "wholesale", include_items=False
+        )
+
+        # Then: 주문 목록 쿼리 1회 (COUNT 생략), size + 1 건 조회
+        assert mock_execute_sql.call_count == 1
+        query, *args = mock_execute_sql.call_args.args
+        assert "(o.created_at, o.id) < ($2, $3)" in query
+        assert "ORDER BY o.created_at DESC, o.id DESC" in query
+        assert args[3:] == [3, 0]
+
+        assert len(result.orders) == 2
+        assert result.total is None
+        assert result.has_next is True
+        assert decode_cursor(result.next_cursor, 2)[1] == orders[1]["id"]
+
+
+class TestOrderServiceCreateOrder:
+    """OrderService.create_order 테스트"""
+
+    @staticmethod
+    def create_order_data(product_ids: list) -> OrderCreate:
+        """테스트용 주문 생성 데이터"""
+        return OrderCreate(
+            wholesale_company_id=uuid.uuid4(),
+            items=[{"product_id": product_id, "quantity": 2, "unit_price": 15000} for product_id in product_ids]
+        )
+
+    @pytest.mark.asyncio
+    @patch('services.order_service.order_number_allocator.allocate', new_callable=AsyncMock)
+    @patch('services.order_service.InventoryService.bulk_reserve_stock', new_callable=AsyncMock)
+    @patch('services.order_service.CompanyService.check_trading_relationship', new_callable=AsyncMock)
+    @patch('services.order_service.execute_sql', new_callable=AsyncMock)
+    async def test_create_order_batches_items(self, mock_execute_sql, mock_relationship, mock_reserve, mock_allocate):
+        """재고 일괄 예약 후 주문 상품을 단일 INSERT 로 생성"""
+        product_ids = [str(uuid.uuid4()) for _ in range(3)]
+        order_data = self.create_order_data(product_ids)
+        retail_id = str(uuid.uuid4())
+
+        mock_relationship.return_value = True
+        mock_reserve.return_value = (True, [])
+        mock_allocate.return_value = "20250901-0001"
+
+        def insert_items(query, *params):
+            if "INSERT INTO orders" in query:
+                return [create_order_row(params[0], str(order_data.wholesale_company_id), retail_id)]
+            return [
+                {**create_item_row(params[0]), "id": item_id, "product_id": product_id}
+                for item_id, product_id in zip(params[1], params[2])
+            ]
+
+        mock_execute_sql.side_effect = insert_items
+
+        order, error = await OrderService.create_order(order_data, str(uuid.uuid4()), retail_id)
+
+        assert error is None
+        assert len(order.items) == 3
+        mock_reserve.assert_called_once()
+        assert len(mock_reserve.call_args.args[0]) == 3
+
+        # 주문 + 주문 상품 = 2회 쿼리 (주문 번호는 할당기 구간에서 발급)
+        assert mock_execute_sql.call_count == 2
+        assert mock_execute_sql.call_args_list[0].args[2] == "20250901-0001"
+        items_call = mock_execute_sql.call_args_list[1]
+        assert "unnest($2::uuid[], $3::uuid[], $4::int[], $5::int[])" in items_call.args[0]
+        assert items_call.args[3] == product_ids
+
+    @pytest.mark.asyncio
+    @patch('services.order_service.order_number_allocator.allocate', new_callable=AsyncMock)
+    @patch('services.order_service.InventoryService.bulk_reserve_stock', new_callable=AsyncMock)
+    @patch('services.order_service.CompanyService.check_trading_relationship', new_callable=AsyncMock)
+    @patch('services.order_service.execute_sql', new_callable=AsyncMock)
+    async def test_create_order_insufficient_stock(self, mock_execute_sql, mock_relationship, mock_reserve,
+                                                   mock_allocate):
+        """재고 예약 실패 시 주문을 생성하지 않음"""
+        product_id = str(uuid.uuid4())
+        mock_relationship.return_value = True
+        mock_allocate.return_value = "20250901-0001"
+        mock_reserve.return_value = (False, [{
+            "product_id": product_id,
+            "product_name": "아동 티셔츠",
+            "product_code": "TS-001",
+            "current_stock": 1,
+            "required_quantity": 2,
+            "is_available": False
+        }])
+
+        order, error = await OrderService.create_order(
+            self.create_order_data([product_id]), str(uuid.uuid4()), str(uuid.uuid4())
+        )
+
+        assert order is None
+        assert error == "재고 부족: 아동 티셔츠(재고:1, 요청:2)"
+        mock_execute_sql.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch('services.order_service.transaction')
+    @patch('services.order_service.order_number_allocator.allocate', new_callable=AsyncMock)
+    @patch('services.order_service.CompanyService.check_trading_relationship', new_callable=AsyncMock)
+    async def test_number_allocated_before_transaction(self, mock_relationship, mock_allocate, mock_transaction):
+        """주문 번호는 트랜잭션 커넥션을 잡기 전에 발급"""
+        mock_relationship.return_value = True
+        mock_allocate.return_value = "20250901-0001"
+        mock_transaction.side_effect = RuntimeError("트랜잭션 시작 안 됨")
+
+        order, error = await OrderService.create_order(
+            self.create_order_data([str(uuid.uuid4())]), str(uuid.uuid4()), str(uuid.uuid4())
+        )
+
+        assert order is None and "트랜잭션 시작 안 됨" in error
+        mock_allocate.assert_awaited_once()
+
+
+class TestOrderNumberAllocator:
+    """OrderNumberAllocator 테스트"""
+
+    @pytest.mark.asyncio
+    @patch('services.order_service.execute_sql', new_callable=AsyncMock)
+    async def test_block_reserved_once_per_block_size(self, mock_execute_sql):
+        """block_size 개 번호마다 카운터 UPSERT 한 번"""
+        mock_execute_sql.side_effect = [[{"last_value": 3}], [{"last_value": 9}]]
+        allocator = OrderNumberAllocator(block_size=3)
+
+        numbers = [await allocator.allocate(date(2025, 9, 1)) for _ in range(4)]
+
+        assert numbers == ["20250901-0001", "20250901-0002", "20250901-0003", "20250901-0007"]
+        assert mock_execute_sql.call_count == 2
+        query, day, block_size = mock_execute_sql.call_args.args
+        assert "ON CONFLICT (order_date)" in query
+        assert "RETURNING last_value" in query
+        assert (day, block_size) == (date(2025, 9, 1), 3)
+
+    @pytest.mark.asyncio
+    @patch('services.order_service.execute_sql', new_callable=AsyncMock)
+    async def test_new_day_reserves_new_block(self, mock_execute_sql):
+        """날짜가 바뀌면 남은 구간을 버리고 새 날짜 카운터에서 예약"""
+        mock_execute_sql.side_effect = [[{"last_value": 10}], [{"last_value": 10}]]
+        allocator = OrderNumberAllocator(block_size=10)
+
+        first = await allocator.allocate(date(2025, 9, 1))
+        second = await allocator.allocate(date(2025, 9, 2))
+
+        assert (first, second) == ("20250901-0001", "20250902-0001")
+
+    @pytest.mark.asyncio
+    @patch('services.order_service.execute_sql', new_callable=AsyncMock)
+    async def test_reserve_failure_raises(self, mock_execute_sql):
+        """카운터 갱신 실패 시 번호를 만들지 않고 예외"""
+        mock_execute_sql.return_value = None
+        allocator = OrderNumberAllocator(block_size=10)
+
+        with pytest.raises(RuntimeError):
+            await allocator.allocate(date(2025, 9, 1))
+
+    @pytest.mark.asyncio
+    @patch('services.order_service.execute_sql', new_callable=AsyncMock)
+    async def test_concurrent_allocations_share_one_reservation(self, mock_execute_sql):
+        """구간이 빈 상태의 동시 요청은 예약 한 번을 함께 기다림"""
+        async def reserve(query, day, block_size):
+            await asyncio.sleep(0.01)
+            return [{"last_value": block_size}]
+
+        mock_execute_sql.side_effect = reserve
+        allocator = OrderNumberAllocator(block_size=5)
+
+        numbers = await asyncio.gather(*(allocator.allocate(date(2025, 9, 1)) for _ in range(3)))
+
+        assert sorted(numbers) == ["20250901-0001", "20250901-0002", "20250901-0003"]
+        assert mock_execute_sql.call_count == 1
+
+    @pytest.mark.asyncio
+    @patch('services.order_service.execute_sql', new_callable=AsyncMock)
+    async def test_failed_reservation_retried_on_next_allocate(self, mock_execute_sql):
+        """실패한 예약은 다음 발급 때 다시 시도"""
+        mock_execute_sql.side_effect = [None, [{"last_value": 10}]]
+        allocator = OrderNumberAllocator(block_size=10)
+
+        with pytest.raises(RuntimeError):
+            await allocator.allocate(date(2025, 9, 1))
+        assert await allocator.allocate(date(2025, 9, 1)) == "20250901-0001"
+
+    @pytest.mark.asyncio
+    async def test_in_memory_counter_hands_out_disjoint_blocks(self):
+        """인메모리 백엔드에서도 할당기마다 겹치지 않는 구간"""
+        service = RealSupabaseService()
+
+        async def execute(query, *params):
+            return (await service.execute_sql(project_id="test", query=query, params=list(params)))["data"]
+
+        with patch('services.order_service.execute_sql', new=execute):
+            workers = [OrderNumberAllocator(block_size=2), OrderNumberAllocator(block_size=2)]
+            numbers = [await worker.allocate(date(2025, 9, 1)) for worker in workers for _ in range(3)]
+
+        assert len(set(numbers)) == 6
+        assert numbers[:2] == ["20250901-0001", "20250901-0002"]
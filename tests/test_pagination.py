@@ -0,0 +1,102 @@
+"""
+키셋 페이지네이션 유틸리티 테스트
+커서 인코딩/디코딩, 다음 페이지 분리, 총 개수 계산 방식 검증
+"""
+
+import uuid
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+from database import QueryParams
+from utils.pagination import (
+    InvalidCursorError, encode_cursor, decode_cursor, keyset_condition,
+    split_page, resolve_total_mode, count_total
+)
+
+
+class TestCursorEncoding:
+    """커서 인코딩 테스트"""
+
+    def test_round_trip_keeps_datetime(self):
+        """datetime 정렬 키는 타입을 유지한 채 복원"""
+        created_at = datetime(2025, 9, 1, 10, 0, tzinfo=timezone.utc)
+        row_id = uuid.uuid4()
+
+        cursor = encode_cursor(created_at, row_id)
+
+        assert decode_cursor(cursor, 2) == [created_at, str(row_id)]
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor("only-one")])
+    def test_invalid_cursor(self, cursor):
+        """형식 오류나 키 개수 불일치는 InvalidCursorError"""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, 2)
+
+    def test_keyset_condition_appends_params(self):
+        """커서 값은 자리표시자로만 쿼리에 포함"""
+        params = QueryParams("company-1")
+        cursor = encode_cursor(datetime(2025, 9, 1), "order-1")
+
+        condition = keyset_condition(params, ["o.created_at", "o.id"], cursor)
+
+        assert condition == "(o.created_at, o.id) < ($2, $3)"
+        assert params.values == ["company-1", datetime(2025, 9, 1), "order-1"]
+
+
+class TestSplitPage:
+    """split_page 테스트"""
+
+    def test_extra_row_produces_next_cursor(self):
+        """size + 1 건이면 다음 페이지 있음, 마지막 행 기준 커서"""
+        rows = [{"created_at": datetime(2025, 9, 1, 10 - i), "id": f"id-{i}"} for i in range(3)]
+
+        page, has_next, next_cursor = split_page(rows, 2, ["created_at", "id"])
+
+        assert page == rows[:2]
+        assert has_next is True
+        assert decode_cursor(next_cursor, 2) == [rows[1]["created_at"], "id-1"]
+
+    def test_last_page(self):
+        """size 이하이면 다음 커서 없음"""
+        page, has_next, next_cursor = split_page(None, 2, ["created_at", "id"])
+
+        assert page == []
+        assert has_next is False
+        assert next_cursor is None
+
+
+class TestCountTotal:
+    """총 개수 계산 테스트"""
+
+    def test_resolve_total_mode_defaults(self):
+        """page 방식은 exact, 커서 방식은 none 이 기본값"""
+        assert resolve_total_mode(None, None) == "exact"
+        assert resolve_total_mode(None, "cursor") == "none"
+        assert resolve_total_mode("estimate", "cursor") == "estimate"
+
+    @pytest.mark.asyncio
+    async def test_none_skips_query(self):
+        """none 이면 COUNT 쿼리 생략"""
+        execute = AsyncMock()
+
+        assert await count_total(execute, "FROM orders o", [], "none") == (None, False)
+        execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_estimate_uses_plan_rows(self):
+        """estimate 는 실행 계획의 행 수 추정치 사용"""
+        execute = AsyncMock(return_value=[{"QUERY PLAN": '[{"Plan": {"Plan Rows": 1234}}]'}])
+
+        total, estimated = await count_total(execute, "FROM orders o WHERE o.status = $1", ["pending"], "estimate")
+
+        assert (total, estimated) == (1234, True)
+        assert execute.call_args.args == ("EXPLAIN (FORMAT JSON) SELECT 1 FROM orders o WHERE o.status = $1", "pending")
+
+    @pytest.mark.asyncio
+    async def test_estimate_falls_back_to_exact(self):
+        """추정 실패 시 COUNT(*) 로 대체"""
+        execute = AsyncMock(side_effect=[None, [{"total": 7}]])
+
+        assert await count_total(execute, "FROM orders o", [], "estimate") == (7, False)
+        assert execute.await_count == 2
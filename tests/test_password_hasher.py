@@ -0,0 +1,79 @@
+"""
+비밀번호 해싱 실행기 테스트
+스레드 풀 해싱/검증, 비용 변경 시 재해싱, 로그인 재저장 검증
+"""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from utils.password_hasher import PasswordHasher
+from services.auth_service import AuthService
+
+
+class TestPasswordHasher:
+    """PasswordHasher 테스트 (테스트 속도를 위해 최소 비용 사용)"""
+
+    @pytest.mark.asyncio
+    async def test_hash_and_verify(self):
+        """해싱/검증 결과와 대기열 통계"""
+        hasher = PasswordHasher(rounds=4, max_workers=2)
+
+        password_hash = await hasher.hash("secret-1234")
+
+        assert password_hash.startswith("$2b$04$")
+        assert await hasher.verify("secret-1234", password_hash) is True
+        assert await hasher.verify("wrong", password_hash) is False
+
+        stats = hasher.get_stats()
+        assert (stats["completed"], stats["pending"], stats["max_workers"]) == (3, 0, 2)
+        hasher.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_verify_and_update_rehashes_changed_cost(self):
+        """설정과 다른 비용의 해시는 검증 성공 시 새 비용 해시 반환"""
+        old_hasher = PasswordHasher(rounds=5, max_workers=1)
+        hasher = PasswordHasher(rounds=4, max_workers=1)
+        old_hash = await old_hasher.hash("secret-1234")
+        current_hash = await hasher.hash("secret-1234")
+
+        valid, new_hash = await hasher.verify_and_update("secret-1234", old_hash)
+        assert valid is True
+        assert new_hash.startswith("$2b$04$")
+
+        assert await hasher.verify_and_update("secret-1234", current_hash) == (True, None)
+        assert await hasher.verify_and_update("wrong", old_hash) == (False, None)
+        old_hasher.shutdown()
+        hasher.shutdown()
+
+
+class TestAuthenticateRehash:
+    """AuthService.authenticate_user 재해싱 테스트"""
+
+    USER = {"id": "user-1", "email": "a@example.com", "password_hash": "$2b$10$old"}
+
+    @pytest.mark.asyncio
+    @patch('services.auth_service.password_hasher')
+    @patch('services.auth_service.execute_sql', new_callable=AsyncMock)
+    async def test_login_stores_rehashed_password(self, mock_execute_sql, mock_hasher):
+        """비용이 바뀐 해시는 로그인 성공 시 새 해시로 저장"""
+        mock_execute_sql.side_effect = [[dict(self.USER)], [{"id": "user-1"}]]
+        mock_hasher.verify_and_update = AsyncMock(return_value=(True, "$2b$12$new"))
+
+        user = await AuthService.authenticate_user("a@example.com", "secret-1234")
+
+        assert user == {"id": "user-1", "email": "a@example.com"}
+        lookup, update = mock_execute_sql.call_args_list
+        assert lookup.args == ("SELECT * FROM users WHERE email = $1", "a@example.com")
+        assert "UPDATE users SET password_hash = $1" in update.args[0]
+        assert update.args[1:] == ("$2b$12$new", "user-1")
+
+    @pytest.mark.asyncio
+    @patch('services.auth_service.password_hasher')
+    @patch('services.auth_service.execute_sql', new_callable=AsyncMock)
+    async def test_wrong_password_not_rehashed(self, mock_execute_sql, mock_hasher):
+        """검증 실패 시 None, 해시 저장 없음"""
+        mock_execute_sql.return_value = [dict(self.USER)]
+        mock_hasher.verify_and_update = AsyncMock(return_value=(False, None))
+
+        assert await AuthService.authenticate_user("a@example.com", "wrong") is None
+        mock_execute_sql.assert_awaited_once()
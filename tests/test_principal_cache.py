@@ -0,0 +1,64 @@
+"""
+인증 사용자 캐시 테스트
+TTL 만료, LRU 제거, 무효화 검증
+"""
+
+from unittest.mock import patch
+
+from utils.principal_cache import PrincipalCache
+
+
+class TestPrincipalCache:
+    """PrincipalCache 테스트"""
+
+    def test_get_returns_copy(self):
+        """반환값을 수정해도 캐시는 변하지 않음"""
+        cache = PrincipalCache(ttl_seconds=60)
+        cache.set("user-1", {"id": "user-1", "approved": True})
+
+        user = cache.get("user-1")
+        user["approved"] = False
+
+        assert cache.get("user-1") == {"id": "user-1", "approved": True}
+        assert cache.get_stats()["hits"] == 2
+
+    @patch('utils.principal_cache.time.monotonic')
+    def test_ttl_expiry(self, mock_monotonic):
+        """TTL 이 지나면 만료"""
+        mock_monotonic.return_value = 100.0
+        cache = PrincipalCache(ttl_seconds=60)
+        cache.set("user-1", {"id": "user-1"})
+
+        mock_monotonic.return_value = 160.0
+
+        assert cache.get("user-1") is None
+        assert cache.get_stats()["entries"] == 0
+
+    def test_lru_eviction(self):
+        """max_size 초과 시 가장 오래 사용하지 않은 항목 제거"""
+        cache = PrincipalCache(ttl_seconds=60, max_size=2)
+        cache.set("user-1", {"id": "user-1"})
+        cache.set("user-2", {"id": "user-2"})
+        cache.get("user-1")
+        cache.set("user-3", {"id": "user-3"})
+
+        assert cache.get("user-2") is None
+        assert cache.get("user-1") is not None
+        assert cache.get("user-3") is not None
+
+    def test_invalidate(self):
+        """무효화된 사용자는 다시 조회해야 함"""
+        cache = PrincipalCache(ttl_seconds=60)
+        cache.set("user-1", {"id": "user-1"})
+
+        cache.invalidate("user-1", None, "unknown")
+
+        assert cache.get("user-1") is None
+        assert cache.get_stats()["invalidations"] == 1
+
+    def test_disabled_when_ttl_zero(self):
+        """TTL 0 이면 저장하지 않음"""
+        cache = PrincipalCache(ttl_seconds=0)
+        cache.set("user-1", {"id": "user-1"})
+
+        assert cache.get("user-1") is None
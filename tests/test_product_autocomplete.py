@@ -0,0 +1,185 @@
+"""
+상품 자동완성 테스트
+한글 자모/초성 분해, 접두어 트리, 회사별 색인 적재/증분 반영 검증
+"""
+
+import pytest
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from utils.autocomplete_index import (
+    CompanyAutocomplete, ProductAutocomplete, PrefixTrie, chosung, is_chosung_query, jamo
+)
+from services.product_service import ProductService
+
+COMPANY_ID = "11111111-2222-3333-4444-555555555555"
+
+
+def product(name: str, code: str = "CODE001", **extra) -> dict:
+    """테스트용 상품 행 생성"""
+    return {"id": str(uuid.uuid4()), "company_id": COMPANY_ID, "code": code, "name": name, **extra}
+
+
+class TestHangul:
+    """자모/초성 분해 테스트"""
+
+    def test_jamo_splits_compound_letters(self):
+        """겹받침/겹모음을 낱자로 풀어 입력 중인 음절도 접두어가 됨"""
+        assert jamo("닭") == "ㄷㅏㄹㄱ"
+        assert jamo("닭").startswith(jamo("달"))
+        assert jamo("사과").startswith(jamo("삭"))
+
+    def test_chosung(self):
+        """초성 추출 시 공백 제거, 한글 외 문자는 소문자로 유지"""
+        assert chosung("여아 원피스 A") == "ㅇㅇㅇㅍㅅa"
+
+    @pytest.mark.parametrize("query, expected", [
+        ("ㅇㄷㅂ", True),
+        ("ㅇㄷ ㅂ", True),
+        ("아동ㅂ", False),
+        ("ㅇㅏ", False),
+        ("dress", False),
+    ])
+    def test_is_chosung_query(self, query, expected):
+        """자음만으로 된 검색어만 초성 검색"""
+        assert is_chosung_query(query) is expected
+
+
+class TestPrefixTrie:
+    """PrefixTrie 테스트"""
+
+    def test_nearest_completion_first(self):
+        """짧은 완성부터 반환하고 limit 에서 멈춤"""
+        trie = PrefixTrie()
+        trie.insert("abcd", "long")
+        trie.insert("ab", "short")
+        trie.insert("abc", "middle")
+
+        assert trie.search("ab", 2) == [(0, "short"), (1, "middle")]
+
+    def test_remove_prunes_nodes(self):
+        """제거 후 빈 가지는 정리"""
+        trie = PrefixTrie()
+        trie.insert("ab", "p1")
+        trie.insert("abcd", "p2")
+
+        trie.remove("abcd", "p2")
+
+        assert trie.search("abc", 10) == []
+        assert trie.node_count == 3
+
+
+class TestCompanyAutocomplete:
+    """CompanyAutocomplete 테스트"""
+
+    def test_jamo_chosung_and_code(self):
+        """입력 중인 음절, 초성, 상품코드, 단어 중간 모두 완성"""
+        index = CompanyAutocomplete()
+        dress = product("여아 레이스 원피스", code="DRESS001")
+        shirt = product("남아 반팔 티셔츠", code="SHIRT001")
+        index.add(dress)
+        index.add(shirt)
+
+        assert [p["id"] for _, p in index.search("여아 레이ㅅ", 10)] == [dress["id"]]
+        assert [p["id"] for _, p in index.search("ㄴㅇㅂ", 10)] == [shirt["id"]]
+        assert [p["id"] for _, p in index.search("dress", 10)] == [dress["id"]]
+        assert [p["id"] for _, p in index.search("원피", 10)] == [dress["id"]]
+
+    def test_replace_and_remove(self):
+        """같은 ID 로 다시 추가하면 이전 키는 제거"""
+        index = CompanyAutocomplete()
+        item = product("겨울 패딩")
+        index.add(item)
+        index.add({**item, "name": "여름 샌들"})
+
+        assert index.search("패딩", 10) == []
+        assert len(index.search("샌", 10)) == 1
+
+        index.remove(item["id"])
+        assert index.search("샌", 10) == []
+        assert len(index) == 0
+
+
+class TestProductAutocomplete:
+    """ProductAutocomplete 테스트"""
+
+    def test_writes_apply_to_loaded_company(self):
+        """적재된 회사에는 생성/비활성화가 즉시 반영"""
+        store = ProductAutocomplete(ttl_seconds=60)
+        store.load(COMPANY_ID, [], store.begin_load(COMPANY_ID))
+        item = product("아동 바지")
+
+        store.upsert(COMPANY_ID, item)
+        assert [p["id"] for p in store.search([COMPANY_ID], "ㅇㄷ")] == [item["id"]]
+
+        store.upsert(COMPANY_ID, {**item, "is_active": False})
+        assert store.search([COMPANY_ID], "ㅇㄷ") == []
+
+    def test_write_during_load_expires_result(self):
+        """적재 도중 쓰기가 있으면 적재 결과를 바로 만료"""
+        store = ProductAutocomplete(ttl_seconds=60)
+        generation = store.begin_load(COMPANY_ID)
+        store.remove(COMPANY_ID, "p1")
+
+        store.load(COMPANY_ID, [product("아동 바지")], generation)
+
+        assert store.is_fresh(COMPANY_ID) is False
+        assert len(store.search([COMPANY_ID], "아동")) == 1
+
+    def test_lru_eviction(self):
+        """회사 수 상한을 넘으면 가장 오래 사용하지 않은 색인부터 제거"""
+        store = ProductAutocomplete(ttl_seconds=60, max_companies=2)
+        for company_id in ("c1", "c2"):
+            store.load(company_id, [], store.begin_load(company_id))
+        store.search(["c1"], "a")
+        store.load("c3", [], store.begin_load("c3"))
+
+        assert store.is_fresh("c1") and store.is_fresh("c3")
+        assert not store.is_fresh("c2")
+        assert store.get_stats()["evictions"] == 1
+
+
+class TestProductServiceAutocomplete:
+    """ProductService 자동완성 테스트"""
+
+    @pytest.mark.asyncio
+    @patch('services.product_service.execute_sql', new_callable=AsyncMock)
+    @patch('services.product_service.product_autocomplete', new_callable=lambda: ProductAutocomplete(ttl_seconds=60))
+    async def test_loads_company_once(self, mock_index, mock_execute_sql):
+        """회사 색인은 처음 조회 시 한 번만 적재"""
+        item = product("여아 원피스", code="DRESS001")
+        mock_execute_sql.return_value = [item]
+
+        first = await ProductService.autocomplete_products([COMPANY_ID], "ㅇㅇ")
+        second = await ProductService.autocomplete_products([COMPANY_ID], "dre")
+
+        assert mock_execute_sql.call_count == 1
+        assert "is_active = true" in mock_execute_sql.call_args.args[0]
+        assert [str(s.id) for s in first] == [item["id"]]
+        assert [s.code for s in second] == ["DRESS001"]
+
+    @pytest.mark.asyncio
+    @patch('services.product_service.execute_sql', new_callable=AsyncMock)
+    @patch('services.product_service.product_autocomplete', new_callable=MagicMock)
+    async def test_delete_without_orders_removes_from_index(self, mock_index, mock_execute_sql):
+        """주문 이력이 없는 상품은 실제로 삭제한 뒤 색인에서 제거"""
+        product_id = str(uuid.uuid4())
+        mock_execute_sql.side_effect = [[{"id": product_id}], [{"count": 0}], []]
+
+        assert await ProductService.delete_product(product_id, COMPANY_ID) is True
+
+        assert mock_execute_sql.call_args.args[0].startswith("DELETE FROM products")
+        mock_index.remove.assert_called_once_with(COMPANY_ID, product_id)
+
+    @pytest.mark.asyncio
+    @patch('services.product_service.execute_sql', new_callable=AsyncMock)
+    @patch('services.product_service.product_autocomplete', new_callable=MagicMock)
+    async def test_failed_deactivate_keeps_index(self, mock_index, mock_execute_sql):
+        """비활성화 실패 시 색인을 건드리지 않음"""
+        product_id = str(uuid.uuid4())
+        mock_execute_sql.side_effect = [[{"id": product_id}], [{"count": 2}], None]
+
+        assert await ProductService.delete_product(product_id, COMPANY_ID) is False
+
+        assert mock_execute_sql.call_args.args[0].startswith("UPDATE products SET is_active = false")
+        mock_index.remove.assert_not_called()
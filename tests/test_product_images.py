@@ -0,0 +1,159 @@
+"""
+상품 이미지 파이프라인 테스트
+WebP 변형 생성, 스토리지 업로드, 상품 이미지 추가 흐름 검증
+"""
+
+import json
+import pytest
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from utils.image_pipeline import InvalidImageError, process_image
+from utils.object_storage import ObjectStorage
+from services.product_service import ProductService
+
+PRODUCT_ID = str(uuid.uuid4())
+COMPANY_ID = str(uuid.uuid4())
+
+
+def create_storage(client=None) -> ObjectStorage:
+    """테스트용 스토리지 (boto3 대신 Mock 클라이언트)"""
+    storage = ObjectStorage(
+        endpoint="http://localhost:9000", bucket="test-bucket",
+        access_key="key", secret_key="secret", region="ap-northeast-1",
+        client=client or MagicMock()
+    )
+    storage._transfer_config = "transfer-config"
+    return storage
+
+
+class TestProcessImage:
+    """process_image 테스트 (Pillow 필요)"""
+
+    def test_creates_webp_variants(self, tmp_path):
+        """긴 변 기준 축소, 원본보다 큰 크기는 확대하지 않음"""
+        Image = pytest.importorskip("PIL.Image")
+        source = tmp_path / "source"
+        Image.new("RGB", (1200, 800), "pink").save(source, "PNG")
+
+        result = process_image(str(source), str(tmp_path), {"thumbnail": 200, "list": 600, "large": 2000})
+
+        assert (result["extension"], result["content_type"]) == ("png", "image/png")
+        assert [(v["width"], v["height"]) for v in result["variants"].values()] == [(200, 133), (600, 400), (1200, 800)]
+        with Image.open(result["variants"]["list"]["path"]) as variant:
+            assert variant.format == "WEBP"
+
+    def test_rejects_non_image(self, tmp_path):
+        """이미지가 아닌 파일은 InvalidImageError"""
+        pytest.importorskip("PIL")
+        source = tmp_path / "source"
+        source.write_bytes(b"not an image")
+
+        with pytest.raises(InvalidImageError):
+            process_image(str(source), str(tmp_path), {"thumbnail": 200})
+
+    def test_rejects_oversized_resolution(self, tmp_path):
+        """해상도 상한 초과는 디코딩 전에 거부"""
+        Image = pytest.importorskip("PIL.Image")
+        source = tmp_path / "source"
+        Image.new("RGB", (400, 300)).save(source, "JPEG")
+
+        with pytest.raises(InvalidImageError):
+            process_image(str(source), str(tmp_path), {"thumbnail": 200}, max_pixels=100_000)
+
+
+class TestObjectStorage:
+    """ObjectStorage 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_upload_file(self):
+        """공유 클라이언트로 업로드하고 공개 URL 반환"""
+        client = MagicMock()
+        storage = create_storage(client)
+
+        url = await storage.upload_file("/tmp/list.webp", "products/a b/list.webp", "image/webp")
+
+        assert url == "http://localhost:9000/test-bucket/products/a%20b/list.webp"
+        args, kwargs = client.upload_file.call_args
+        assert args == ("/tmp/list.webp", "test-bucket", "products/a b/list.webp")
+        assert kwargs["ExtraArgs"]["ContentType"] == "image/webp"
+        assert kwargs["Config"] == "transfer-config"
+
+    def test_public_base_url(self):
+        """공개 URL 접두어 설정 시 CDN 주소 사용"""
+        storage = ObjectStorage(
+            endpoint="https://s3.wasabisys.com", bucket="b", access_key="k", secret_key="s",
+            region="r", public_base_url="https://cdn.example.com/"
+        )
+
+        assert storage.public_url("products/x.webp") == "https://cdn.example.com/products/x.webp"
+
+
+class TestAddProductImage:
+    """ProductService.add_product_image 테스트"""
+
+    PROCESSED = {
+        "extension": "jpg",
+        "content_type": "image/jpeg",
+        "variants": {
+            "thumbnail": {"path": "/work/thumbnail.webp", "width": 200, "height": 150},
+            "list": {"path": "/work/list.webp", "width": 600, "height": 450}
+        }
+    }
+
+    @pytest.mark.asyncio
+    @patch('services.product_service.object_storage')
+    @patch('services.product_service.image_processor')
+    @patch('services.product_service.execute_sql', new_callable=AsyncMock)
+    async def test_appends_variants_in_image_order(self, mock_execute_sql, mock_processor, mock_storage):
+        """원본/변형을 업로드하고 images 와 같은 순서로 변형 URL 기록"""
+        mock_processor.process = AsyncMock(return_value=self.PROCESSED)
+        mock_storage.upload_file = AsyncMock(side_effect=lambda path, key, content_type: f"https://cdn/{key}")
+        mock_storage.delete_objects = AsyncMock()
+        mock_execute_sql.side_effect = [
+            [{"id": PRODUCT_ID, "images": ["https://old/1.jpg"]}],
+            [{"images": '["https://old/1.jpg"]', "image_variants": "[]"}],
+            []
+        ]
+
+        urls = await ProductService.add_product_image(PRODUCT_ID, COMPANY_ID, "/work/source", "/work")
+
+        assert set(urls) == {"original", "thumbnail", "list"}
+        assert urls["original"].endswith("/original.jpg")
+        assert urls["list"].endswith("/list.webp")
+
+        update_query, images_json, variants_json, product_id = mock_execute_sql.call_args.args
+        assert "image_variants = $2::jsonb" in update_query
+        assert json.loads(images_json) == ["https://old/1.jpg", urls["original"]]
+        assert json.loads(variants_json) == [{"original": "https://old/1.jpg"}, urls]
+        mock_storage.delete_objects.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch('services.product_service.object_storage')
+    @patch('services.product_service.image_processor')
+    @patch('services.product_service.execute_sql', new_callable=AsyncMock)
+    async def test_upload_failure_cleans_up(self, mock_execute_sql, mock_processor, mock_storage):
+        """업로드 하나라도 실패하면 올린 객체 삭제 후 예외 전파, 상품은 갱신하지 않음"""
+        mock_processor.process = AsyncMock(return_value=self.PROCESSED)
+        mock_storage.upload_file = AsyncMock(side_effect=["https://cdn/original.jpg", OSError("timeout"), "https://cdn/list.webp"])
+        mock_storage.delete_objects = AsyncMock()
+        mock_execute_sql.return_value = [{"id": PRODUCT_ID, "images": []}]
+
+        with pytest.raises(OSError):
+            await ProductService.add_product_image(PRODUCT_ID, COMPANY_ID, "/work/source", "/work")
+
+        assert mock_execute_sql.call_count == 1
+        assert len(mock_storage.delete_objects.call_args.args[0]) == 3
+
+    @pytest.mark.asyncio
+    @patch('services.product_service.image_processor')
+    @patch('services.product_service.execute_sql', new_callable=AsyncMock)
+    async def test_rejects_when_image_limit_reached(self, mock_execute_sql, mock_processor):
+        """이미지 수 상한이면 처리 전에 ValueError"""
+        mock_processor.process = AsyncMock()
+        mock_execute_sql.return_value = [{"id": PRODUCT_ID, "images": [f"https://old/{i}.jpg" for i in range(10)]}]
+
+        with pytest.raises(ValueError):
+            await ProductService.add_product_image(PRODUCT_ID, COMPANY_ID, "/work/source", "/work")
+
+        mock_processor.process.assert_not_called()
@@ -0,0 +1,211 @@
+"""
+상품 일괄 등록 테스트
+CSV 행 읽기, ProductCreate 규칙 검증, 배치 적재 쿼리와 작업 결과 검증
+"""
+
+import json
+import pytest
+import threading
+import uuid
+from unittest.mock import AsyncMock, patch
+
+from services.product_import_service import (
+    ProductImportError, ProductImportJobs, ProductImportService, _IMPORT_BATCH_SQL,
+    iter_import_rows, validate_import_row
+)
+from services.real_supabase_service import RealSupabaseService
+
+COMPANY_ID = "11111111-2222-3333-4444-555555555555"
+CATEGORY_ID = "aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee"
+
+CSV_CONTENT = (
+    "상품코드,상품명,카테고리,연령대,성별,도매가,소매가,초기재고\n"
+    "KID-001,여아 레이스 원피스,원피스,3-5y,girls,\"12,000\",18000,30\n"
+    "\n"
+    "KID-002,남아 맨투맨,,6-10y,boys,9000,8000,0\n"
+    "KID-003,유아 바디수트,,0-12m,unisex,7000,,-1\n"
+    "KID-001,중복 코드 상품,,1-2y,unisex,5000,,0\n"
+    "KID-004,아동 점퍼,,6-10y,boys,25000,39000,5\n"
+).encode("utf-8-sig")
+
+
+def create_job(file_name: str = "products.csv") -> dict:
+    """테스트용 작업 생성"""
+    return ProductImportJobs(ttl_seconds=60).create(COMPANY_ID, file_name)
+
+
+class TestImportRows:
+    """파일 읽기/행 검증 테스트"""
+
+    def test_csv_korean_headers_and_blank_rows(self):
+        """한글 헤더 매핑, BOM 제거, 빈 행은 건너뛰고 행 번호는 파일 기준"""
+        rows = list(iter_import_rows(CSV_CONTENT, "products.csv"))
+
+        assert [row_number for row_number, _ in rows] == [2, 4, 5, 6, 7]
+        assert rows[0][1]["code"] == "KID-001"
+        assert rows[0][1]["category"] == "원피스"
+        assert "category" not in rows[1][1]
+
+    def test_missing_required_column(self):
+        """필수 열이 없으면 파일 전체 오류"""
+        with pytest.raises(ProductImportError):
+            list(iter_import_rows("상품코드,상품명\nKID-001,원피스\n".encode(), "products.csv"))
+
+    def test_unsupported_extension(self):
+        """CSV/XLSX 외 형식은 오류"""
+        with pytest.raises(ProductImportError):
+            list(iter_import_rows(b"", "products.xls"))
+
+    def test_validate_row_coerces_spreadsheet_values(self):
+        """천 단위 쉼표, 카테고리명 → ID, 판매여부 표기 변환"""
+        item = validate_import_row({
+            "code": "KID-001", "name": "여아 레이스 원피스", "category": "원피스",
+            "age_group": "3-5y", "gender": "girls", "wholesale_price": "12,000",
+            "retail_price": "18000", "is_active": "N", "initial_stock": "30"
+        }, {"원피스": CATEGORY_ID})
+
+        assert item["wholesale_price"] == 12000
+        assert item["category_id"] == CATEGORY_ID
+        assert item["is_active"] is False
+        assert item["initial_stock"] == 30
+        assert item["minimum_stock"] == 0
+
+    def test_validate_row_applies_product_rules(self):
+        """ProductCreate 규칙(소매가 > 도매가) 위반은 행 오류"""
+        with pytest.raises(ValueError):
+            validate_import_row({
+                "code": "KID-002", "name": "남아 맨투맨", "age_group": "6-10y",
+                "gender": "boys", "wholesale_price": "9000", "retail_price": "8000"
+            }, {})
+
+
+class TestRunImport:
+    """ProductImportService.run_import 테스트"""
+
+    @pytest.mark.asyncio
+    @patch('services.product_import_service.ProductService.get_categories', new_callable=AsyncMock)
+    @patch('services.product_import_service.execute_sql', new_callable=AsyncMock)
+    async def test_valid_rows_loaded_in_one_batch_query(self, mock_execute_sql, mock_categories):
+        """검증 통과 행만 적재 쿼리 하나로 전달하고 행 오류는 행 번호순으로 기록"""
+        mock_categories.return_value = []
+
+        def load(query, payload, company_id, job_id, user_id):
+            rows = json.loads(payload)
+            return [{**row, "error": "duplicate_code" if row["code"] == "KID-004" else None} for row in rows]
+
+        mock_execute_sql.side_effect = load
+        job = create_job()
+
+        await ProductImportService.run_import(job, CSV_CONTENT, "user-1")
+
+        assert mock_execute_sql.call_count == 1
+        query, payload, company_id, job_id, user_id = mock_execute_sql.call_args.args
+        assert query == _IMPORT_BATCH_SQL
+        assert "ON CONFLICT (code) DO NOTHING" in query
+        assert [row["code"] for row in json.loads(payload)] == ["KID-004"]
+        assert (company_id, job_id, user_id) == (COMPANY_ID, job["job_id"], "user-1")
+
+        assert job["status"] == "completed"
+        assert job["total_rows"] == 5
+        assert job["imported_rows"] == 0
+        assert [(error["row"], error["code"]) for error in job["errors"]] == [
+            (2, "KID-001"), (4, "KID-002"), (5, "KID-003"), (6, "KID-001"), (7, "KID-004")
+        ]
+
+    @pytest.mark.asyncio
+    @patch('services.product_import_service.ProductService.get_categories', new_callable=AsyncMock)
+    @patch('services.product_import_service.execute_sql', new_callable=AsyncMock)
+    async def test_batches_split_by_size(self, mock_execute_sql, mock_categories):
+        """batch_size 행마다 적재 쿼리 분리, 배치마다 처리 행 수 갱신"""
+        mock_categories.return_value = []
+        job = create_job()
+        progress = []
+
+        def load(query, payload, *args):
+            progress.append(ProductImportService.job_response(job).processed_rows)
+            return [{**row, "error": None} for row in json.loads(payload)]
+
+        mock_execute_sql.side_effect = load
+        content = "\n".join(
+            ["code,name,age_group,gender,wholesale_price"]
+            + [f"SKU-{i:03d},상품 {i},1-2y,unisex,1000" for i in range(5)]
+            + ["BAD-001,잘못된 행,1-2y,unisex,-1"]
+        ).encode()
+
+        await ProductImportService.run_import(job, content, "user-1", batch_size=2)
+
+        assert mock_execute_sql.call_count == 3
+        assert progress == [1, 3, 5]
+        assert job["processed_rows"] == job["total_rows"] == 6
+        assert job["imported_rows"] == 5
+        assert job["failed_rows"] == 1
+
+    @pytest.mark.asyncio
+    @patch('services.product_import_service.ProductService.get_categories', new_callable=AsyncMock)
+    @patch('services.product_import_service.execute_sql', new_callable=AsyncMock)
+    async def test_parse_and_validate_off_event_loop(self, mock_execute_sql, mock_categories):
+        """파일 읽기와 행 검증은 이벤트 루프 스레드 밖에서 실행"""
+        mock_categories.return_value = []
+        mock_execute_sql.side_effect = lambda query, payload, *args: [
+            {**row, "error": None} for row in json.loads(payload)
+        ]
+        threads = set()
+
+        def validate(row, categories):
+            threads.add(threading.get_ident())
+            return validate_import_row(row, categories)
+
+        with patch('services.product_import_service.validate_import_row', side_effect=validate):
+            job = create_job()
+            await ProductImportService.run_import(job, CSV_CONTENT, "user-1")
+
+        assert job["status"] == "completed"
+        assert threads and threading.get_ident() not in threads
+
+    @pytest.mark.asyncio
+    @patch('services.product_import_service.ProductService.get_categories', new_callable=AsyncMock)
+    @patch('services.product_import_service.execute_sql', new_callable=AsyncMock)
+    async def test_load_failure_marks_job_failed(self, mock_execute_sql, mock_categories):
+        """적재 쿼리 실패 시 작업 실패, 등록 수 0"""
+        mock_categories.return_value = []
+        mock_execute_sql.return_value = None
+        job = create_job()
+
+        await ProductImportService.run_import(job, CSV_CONTENT, "user-1")
+
+        assert job["status"] == "failed"
+        assert job["imported_rows"] == 0
+        assert job["finished_at"] is not None
+
+    def test_jobs_scoped_to_company(self):
+        """다른 회사의 작업은 조회되지 않음"""
+        jobs = ProductImportJobs(ttl_seconds=60)
+        job = jobs.create(COMPANY_ID, "products.csv")
+
+        assert jobs.get(job["job_id"], COMPANY_ID) is job
+        assert jobs.get(job["job_id"], str(uuid.uuid4())) is None
+
+
+class TestInMemoryImport:
+    """인메모리 백엔드 일괄 등록 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_import_rows_inserted_and_duplicates_rejected(self):
+        """새 코드는 등록, 이미 있는 코드는 duplicate_code"""
+        service = RealSupabaseService()
+        rows = [{
+            "row_number": 2, "id": str(uuid.uuid4()), "code": code, "name": f"{code} 상품",
+            "category_id": None, "age_group": "1-2y", "gender": "unisex", "wholesale_price": 1000,
+            "retail_price": None, "description": "", "is_active": True, "initial_stock": 0, "minimum_stock": 0
+        } for code in ("BULK-001", "BULK-002")]
+
+        first = await service.execute_sql(
+            project_id="test", query=_IMPORT_BATCH_SQL, params=[json.dumps(rows[:1]), COMPANY_ID, str(uuid.uuid4()), None]
+        )
+        second = await service.execute_sql(
+            project_id="test", query=_IMPORT_BATCH_SQL, params=[json.dumps(rows), COMPANY_ID, str(uuid.uuid4()), None]
+        )
+
+        assert [row["error"] for row in first["data"]] == [None]
+        assert [row["error"] for row in second["data"]] == ["duplicate_code", None]
+        assert service.products.find_one("code", "BULK-002")["company_id"] == COMPANY_ID
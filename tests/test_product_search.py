@@ -0,0 +1,123 @@
+"""
+상품명 검색 테스트
+n-gram 인덱스, 유사도 정렬 쿼리, 인메모리 백엔드 검색 검증
+"""
+
+import pytest
+import uuid
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+from utils.ngram_index import NgramIndex, ngrams
+from utils.pagination import decode_cursor
+from services.product_service import ProductService
+from services.real_supabase_service import RealSupabaseService
+from models.product import ProductSearchFilter
+
+
+class TestNgramIndex:
+    """NgramIndex 테스트"""
+
+    def test_ngrams_pad_each_word(self):
+        """pg_trgm 과 같이 단어별로 패딩해 분해"""
+        assert ngrams("Baby 셔츠") == {"  b", " ba", "bab", "aby", "by ", "  셔", " 셔츠", "셔츠 "}
+
+    def test_substring_ranks_first(self):
+        """검색어를 그대로 포함한 상품이 오타 유사 상품보다 앞에 정렬"""
+        index = NgramIndex()
+        index.add("p1", "여아 레이스 원피스")
+        index.add("p2", "남아 반팔 티셔츠")
+        index.add("p3", "여아 원피쓰 세트")
+
+        ranked = index.search("원피스")
+
+        assert ranked[0] == ("p1", 1.0)
+        assert "p2" not in dict(ranked)
+
+    def test_short_query_uses_substring(self):
+        """n 글자보다 짧은 검색어도 부분 일치 검색"""
+        index = NgramIndex()
+        index.add("p1", "반팔셔츠")
+        index.add("p2", "청바지")
+
+        assert index.search("팔셔") == [("p1", 1.0)]
+
+    def test_update_and_remove(self):
+        """같은 ID 로 다시 추가하면 교체, 제거 후에는 검색되지 않음"""
+        index = NgramIndex()
+        index.add("p1", "겨울 패딩")
+        index.add("p1", "여름 샌들")
+
+        assert index.search("패딩") == []
+        assert dict(index.search("샌들")) == {"p1": 1.0}
+
+        index.remove("p1")
+        assert index.search("샌들") == []
+        assert len(index) == 0
+
+
+class TestProductNameSearch:
+    """ProductService 상품명 검색 쿼리 테스트"""
+
+    @staticmethod
+    def create_product_row(rank: float) -> dict:
+        """테스트용 상품 행 생성"""
+        return {
+            "id": str(uuid.uuid4()),
+            "company_id": str(uuid.uuid4()),
+            "code": "DRESS001",
+            "name": "여아 원피스",
+            "age_group": "3-5y",
+            "gender": "girls",
+            "wholesale_price": 20000,
+            "retail_price": 35000,
+            "is_active": True,
+            "created_at": datetime(2025, 9, 1, 10, 0),
+            "updated_at": datetime(2025, 9, 1, 10, 0),
+            "search_rank": rank
+        }
+
+    @pytest.mark.asyncio
+    @patch('services.product_service.execute_sql', new_callable=AsyncMock)
+    async def test_name_search_orders_by_similarity(self, mock_execute_sql):
+        """상품명 검색은 트라이그램 조건으로 필터링하고 유사도 순 커서 반환"""
+        rows = [self.create_product_row(rank) for rank in (1.0, 0.8, 0.5)]
+        mock_execute_sql.return_value = rows
+
+        result = await ProductService.get_products(ProductSearchFilter(name="원피스", size=2, total_mode="none"))
+
+        query, *args = mock_execute_sql.call_args.args
+        assert "(p.name ILIKE '%' || $1 || '%' OR $1 <% p.name)" in query
+        assert "word_similarity($1, p.name) AS search_rank" in query
+        assert "ORDER BY word_similarity($1, p.name) DESC, p.created_at DESC, p.id DESC" in query
+        assert args[0] == "원피스"
+
+        assert [product.search_rank for product in result.products] == [1.0, 0.8]
+        assert decode_cursor(result.next_cursor, 3)[0] == 0.8
+
+
+class TestInMemoryProductSearch:
+    """인메모리 백엔드 상품명 검색 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_index_follows_insert_and_update(self):
+        """상품 INSERT/UPDATE 시 n-gram 인덱스가 함께 갱신"""
+        service = RealSupabaseService()
+        product_id = str(uuid.uuid4())
+        await service.execute_sql(
+            project_id="test",
+            query="INSERT INTO products (id, company_id, code, name) VALUES ($1, $2, $3, $4)",
+            params=[product_id, "11111111-2222-3333-4444-555555555555", "NEW001", "여아 원피스"]
+        )
+        search_query = "SELECT p.id FROM products p WHERE (p.name ILIKE '%' || $1 || '%' OR $1 <% p.name)"
+
+        found = await service.execute_sql(project_id="test", query=search_query, params=["원피스"])
+        assert [row["id"] for row in found["data"]] == [product_id]
+
+        await service.execute_sql(
+            project_id="test",
+            query="UPDATE products SET name = $2 WHERE id = $1",
+            params=[product_id, "남아 청바지"]
+        )
+        assert (await service.execute_sql(project_id="test", query=search_query, params=["원피스"]))["data"] == []
+        assert len((await service.execute_sql(project_id="test", query=search_query, params=["청바지"]))["data"]) == 1
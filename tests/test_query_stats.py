@@ -0,0 +1,122 @@
+"""
+SQL 실행 계측 테스트
+쿼리 지문 정규화, 요청 단위 쿼리 카운터, 느린 쿼리 기록, execute_sql 연동 검증
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+
+import database
+from utils.query_stats import QueryStatsRegistry, fingerprint, track_queries
+
+
+class TestFingerprint:
+    """fingerprint 테스트"""
+
+    def test_literals_and_placeholders_normalized(self):
+        """리터럴/자리표시자/IN 목록/공백/주석이 달라도 같은 지문"""
+        first = fingerprint("SELECT * FROM orders  WHERE id = $1 AND status IN ('a', 'b') LIMIT 20 -- list")
+        second = fingerprint("SELECT * FROM orders\n WHERE id = 'x''y' AND status IN ($2, $3, $4) LIMIT 50")
+
+        assert first == second == "SELECT * FROM orders WHERE id = ? AND status IN (?+) LIMIT ?"
+
+    def test_identifiers_with_digits_kept(self):
+        """식별자 안의 숫자와 타입 캐스트는 유지"""
+        assert fingerprint("SELECT col1 FROM t2 WHERE x = $1::int4") == "SELECT col1 FROM t2 WHERE x = ?::int4"
+
+
+class TestQueryStatsRegistry:
+    """QueryStatsRegistry 테스트"""
+
+    def test_track_queries_counts_per_block(self):
+        """track_queries 블록 안 쿼리만 요청 카운터에 기록, 전역 집계는 지문별 누적"""
+        registry = QueryStatsRegistry(slow_query_ms=0)
+        registry.record("SELECT 1", 0.001)
+
+        with track_queries() as stats:
+            for order_id in range(3):
+                registry.record(f"SELECT * FROM order_items WHERE order_id = '{order_id}'", 0.002)
+            registry.record("UPDATE orders SET status = $1", 0.004, error=True)
+
+        assert (stats.count, stats.errors) == (4, 1)
+        assert stats.top_fingerprints(1) == [("SELECT * FROM order_items WHERE order_id = ?", 3)]
+        assert stats.server_timing() == 'db;dur=10.0;desc="4 queries"'
+        top = registry.top()
+        assert (top[0]["fingerprint"], top[0]["calls"], top[0]["total_ms"]) == (
+            "SELECT * FROM order_items WHERE order_id = ?", 3, 6.0
+        )
+        assert registry.get_stats()["queries"] == 5
+
+    def test_slow_query_logged(self, caplog):
+        """기준 이상 걸린 쿼리는 지문과 함께 WARNING 로그"""
+        registry = QueryStatsRegistry(slow_query_ms=100)
+
+        registry.record("SELECT * FROM products WHERE name ILIKE '%코트%'", 0.25)
+        registry.record("SELECT 1", 0.01)
+
+        assert registry.slow_queries == 1
+        assert "SELECT * FROM products WHERE name ILIKE ?" in caplog.text
+
+    def test_fingerprint_limit_overflow(self):
+        """지문 수 상한을 넘으면 새 지문은 overflow 항목에 합산"""
+        registry = QueryStatsRegistry(slow_query_ms=0, max_fingerprints=1)
+
+        registry.record("SELECT * FROM a", 0.001)
+        registry.record("SELECT * FROM b", 0.001)
+        registry.record("SELECT * FROM c", 0.001)
+
+        assert {entry["fingerprint"]: entry["calls"] for entry in registry.top()} == {
+            "SELECT * FROM a": 1, QueryStatsRegistry.OVERFLOW: 2
+        }
+
+
+class TestExecuteSqlInstrumentation:
+    """database.execute_sql 계측 연동 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_execute_sql_recorded_including_gathered_tasks(self):
+        """실패한 쿼리와 하위 태스크(asyncio.gather)의 쿼리도 요청 카운터에 기록"""
+        execute_fn = AsyncMock(side_effect=[[{"id": 1}], [{"id": 2}], RuntimeError("boom")])
+
+        with patch.object(database, "_supabase_execute_fn", execute_fn):
+            with track_queries() as stats:
+                await asyncio.gather(
+                    database.execute_sql("SELECT * FROM orders WHERE id = $1", "a"),
+                    database.execute_sql("SELECT * FROM orders WHERE id = $1", "b")
+                )
+                assert await database.execute_sql("SELECT broken") is None
+
+        assert (stats.count, stats.errors) == (3, 1)
+        assert stats.top_fingerprints(1) == [("SELECT * FROM orders WHERE id = ?", 2)]
+
+    @pytest.mark.asyncio
+    async def test_stream_sql_recorded_once_per_statement(self):
+        """스트리밍 쿼리도 행 수와 무관하게 1건으로 기록되고 커서 오류는 오류로 집계"""
+        class StreamExecutor:
+            async def stream(self, query, params, prefetch=1000):
+                for value in range(3):
+                    yield {"id": value}
+                if "broken" in query:
+                    raise RuntimeError("cursor lost")
+
+        with patch.object(database, "_db_executor", StreamExecutor()):
+            with track_queries() as stats:
+                rows = [row async for row in database.stream_sql("SELECT id FROM orders WHERE company_id = $1", "c")]
+                with pytest.raises(RuntimeError):
+                    async for _ in database.stream_sql("SELECT broken"):
+                        pass
+
+        assert [row["id"] for row in rows] == [0, 1, 2]
+        assert (stats.count, stats.errors) == (2, 1)
+
+    @pytest.mark.asyncio
+    async def test_stream_sql_fallback_raises_on_error(self):
+        """커서가 없는 실행기에서도 실패를 빈 결과로 삼키지 않음"""
+        execute_fn = AsyncMock(side_effect=RuntimeError("boom"))
+
+        with patch.object(database, "_db_executor", None), \
+                patch.object(database, "_supabase_execute_fn", execute_fn):
+            with pytest.raises(RuntimeError):
+                async for _ in database.stream_sql("SELECT * FROM orders"):
+                    pass
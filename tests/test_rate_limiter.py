@@ -0,0 +1,136 @@
+"""
+Rate Limiter 테스트
+슬라이딩 윈도우 카운터, 유휴 키 제거, 공유 저장소 검증
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from utils.rate_limiter import InMemoryRateLimitStore, RedisRateLimitStore, RateLimiter
+
+
+class FakeClock:
+    """테스트용 시계"""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeRedis:
+    """Redis 호환 로컬 대체 구현 (incr/decr/expire/get)"""
+
+    def __init__(self):
+        self.values = {}
+        self.ttls = {}
+
+    async def incr(self, key):
+        self.values[key] = self.values.get(key, 0) + 1
+        return self.values[key]
+
+    async def decr(self, key):
+        self.values[key] = self.values.get(key, 0) - 1
+        return self.values[key]
+
+    async def expire(self, key, seconds):
+        self.ttls[key] = seconds
+        return True
+
+    async def get(self, key):
+        value = self.values.get(key)
+        return None if value is None else str(value)
+
+
+class TestInMemoryRateLimitStore:
+    """InMemoryRateLimitStore 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_limit_within_window(self):
+        """윈도우 내 limit 건까지 허용 후 차단"""
+        store = InMemoryRateLimitStore(clock=FakeClock(0.0))
+
+        results = [await store.hit("api:1.1.1.1", 3, 60) for _ in range(4)]
+
+        assert results == [True, True, True, False]
+
+    @pytest.mark.asyncio
+    async def test_previous_window_decays(self):
+        """직전 윈도우 카운트는 경과 비율만큼 감쇠"""
+        clock = FakeClock(0.0)
+        store = InMemoryRateLimitStore(clock=clock)
+        for _ in range(4):
+            assert await store.hit("ip", 4, 60)
+
+        # 다음 윈도우 15초 경과: 4 * 0.75 = 3 → 1건만 허용
+        clock.now = 75.0
+        assert await store.hit("ip", 4, 60) is True
+        assert await store.hit("ip", 4, 60) is False
+
+        # 다음 윈도우 45초 경과: 4 * 0.25 + 1 = 2 → 2건 더 허용
+        clock.now = 105.0
+        assert [await store.hit("ip", 4, 60) for _ in range(3)] == [True, True, False]
+
+    @pytest.mark.asyncio
+    async def test_idle_keys_evicted(self):
+        """두 윈도우 이상 유휴한 키는 제거"""
+        clock = FakeClock(0.0)
+        store = InMemoryRateLimitStore(clock=clock)
+        await store.hit("idle", 10, 60)
+        await store.hit("active", 10, 60)
+
+        clock.now = 121.0
+        await store.hit("active", 10, 60)
+
+        assert len(store) == 1
+
+    @pytest.mark.asyncio
+    async def test_max_keys(self):
+        """max_keys 초과 시 가장 오래된 키부터 제거"""
+        store = InMemoryRateLimitStore(max_keys=2, clock=FakeClock(0.0))
+        for ip in ["a", "b", "c"]:
+            await store.hit(ip, 10, 60)
+
+        assert len(store) == 2
+        assert "a" not in store._entries
+
+
+class TestRedisRateLimitStore:
+    """RedisRateLimitStore 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_limit_shared_across_instances(self):
+        """같은 저장소를 쓰는 워커들은 한도를 공유"""
+        redis = FakeRedis()
+        clock = FakeClock(30.0)
+        workers = [RedisRateLimitStore(redis, clock=clock) for _ in range(2)]
+
+        results = [await workers[i % 2].hit("api:ip", 3, 60) for i in range(4)]
+
+        assert results == [True, True, True, False]
+        # 거부된 요청은 카운트에서 제외, 첫 증가 시 만료 설정
+        assert redis.values == {"ratelimit:api:ip:0": 3}
+        assert redis.ttls == {"ratelimit:api:ip:0": 121}
+
+
+class TestRateLimiter:
+    """RateLimiter 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_endpoint_type_limits(self):
+        """엔드포인트 유형별 한도와 키 분리"""
+        limiter = RateLimiter(InMemoryRateLimitStore(clock=FakeClock(0.0)), {"api": 2, "auth": 1})
+
+        assert await limiter.is_allowed("ip", "auth") is True
+        assert await limiter.is_allowed("ip", "auth") is False
+        assert await limiter.is_allowed("ip", "api") is True
+
+    @pytest.mark.asyncio
+    async def test_store_error_fails_open(self):
+        """저장소 오류 시 요청 허용"""
+        store = AsyncMock()
+        store.hit.side_effect = ConnectionError("redis down")
+        limiter = RateLimiter(store, {"api": 1})
+
+        assert await limiter.is_allowed("ip") is True
@@ -0,0 +1,116 @@
+"""
+스냅샷 캐시 테스트
+회사별 TTL 캐시 적재/무효화 검증
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+
+from utils.snapshot_cache import SnapshotCache
+
+
+class TestSnapshotCache:
+    """SnapshotCache 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_get_or_load_caches_result(self):
+        """같은 키는 TTL 동안 한 번만 적재"""
+        cache = SnapshotCache(ttl_seconds=30)
+        loader = AsyncMock(return_value={"today_orders": 3})
+
+        first = await cache.get_or_load("company-1", "user-1", loader)
+        second = await cache.get_or_load("company-1", "user-1", loader)
+
+        assert first == second == {"today_orders": 3}
+        loader.assert_awaited_once()
+        assert cache.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_company(self):
+        """회사 단위 무효화 시 해당 회사 사용자 스냅샷 모두 제거"""
+        cache = SnapshotCache(ttl_seconds=30)
+        cache.set("company-1", "user-1", 1)
+        cache.set("company-1", "user-2", 2)
+        cache.set("company-2", "user-3", 3)
+
+        cache.invalidate("company-1", None)
+
+        assert cache.get("company-1", "user-1") is None
+        assert cache.get("company-1", "user-2") is None
+        assert cache.get("company-2", "user-3") == 3
+
+    @pytest.mark.asyncio
+    async def test_expired_entry(self):
+        """TTL 0 이면 저장하지 않음"""
+        cache = SnapshotCache(ttl_seconds=0)
+        cache.set("company-1", "user-1", 1)
+
+        assert cache.get("company-1", "user-1") is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_are_shared(self):
+        """동시 조회는 하나의 적재 결과를 공유"""
+        cache = SnapshotCache(ttl_seconds=30)
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(*[
+            cache.get_or_load("company-1", "user-1", loader) for _ in range(5)
+        ])
+
+        assert results == [1] * 5
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidated_during_load_is_not_stored(self):
+        """적재 중 무효화되면 오래된 결과를 저장하지 않음"""
+        cache = SnapshotCache(ttl_seconds=30)
+
+        async def loader():
+            cache.invalidate("company-1")
+            return "stale"
+
+        assert await cache.get_or_load("company-1", "user-1", loader) == "stale"
+        assert cache.get("company-1", "user-1") is None
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_block_waiters(self):
+        """적재하던 요청이 취소되면 대기자가 멈추지 않고 직접 적재"""
+        cache = SnapshotCache(ttl_seconds=30)
+        started = asyncio.Event()
+
+        async def slow_loader():
+            started.set()
+            await asyncio.sleep(10)
+
+        leader = asyncio.create_task(cache.get_or_load("company-1", "user-1", slow_loader))
+        await started.wait()
+        waiter = asyncio.create_task(cache.get_or_load("company-1", "user-1", AsyncMock(return_value="fresh")))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+        assert await asyncio.wait_for(waiter, timeout=1) == "fresh"
+        assert cache.get("company-1", "user-1") == "fresh"
+
+    @pytest.mark.asyncio
+    async def test_generations_pruned_when_idle(self):
+        """적재 중인 요청이 없으면 무효화 세대 번호를 남기지 않음"""
+        cache = SnapshotCache(ttl_seconds=30)
+
+        async def loader():
+            cache.invalidate("company-1")
+            return "stale"
+
+        await cache.get_or_load("company-1", "user-1", loader)
+        cache.invalidate(*[f"company-{index}" for index in range(100)])
+
+        assert cache._generations == {}